@@ -4,6 +4,7 @@ from django.contrib import admin
 from unfold.admin import ModelAdmin
 
 from apps.ai.models import ChatMessage, ChatSession
+from apps.common.utilities.django.admin_search import SearchableAdminMixin
 
 
 @admin.register(ChatSession)
@@ -42,7 +43,7 @@ class ChatSessionAdmin(ModelAdmin):
 
 
 @admin.register(ChatMessage)
-class ChatMessageAdmin(ModelAdmin):
+class ChatMessageAdmin(SearchableAdminMixin, ModelAdmin):
     """Admin for ChatMessage model."""
 
     list_display = [
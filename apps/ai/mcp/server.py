@@ -9,6 +9,8 @@ from uuid import UUID
 
 from mcp.server.fastmcp import Context, FastMCP
 
+from apps.common.utilities.database.replicas import read_from_replica
+
 # Create the MCP server instance
 mcp = FastMCP(
     "django-chat-mcp",
@@ -26,6 +28,7 @@ mcp = FastMCP(
 
 
 @mcp.tool()
+@read_from_replica
 def get_user_info(user_id: int) -> dict[str, Any]:
     """Get information about a user.
 
@@ -52,6 +55,7 @@ def get_user_info(user_id: int) -> dict[str, Any]:
 
 
 @mcp.tool()
+@read_from_replica
 async def get_chat_history(
     session_id: str, limit: int = 10, ctx: Context | None = None
 ) -> list[dict[str, Any]]:
@@ -94,6 +98,7 @@ async def get_chat_history(
 
 
 @mcp.tool()
+@read_from_replica
 def list_user_sessions(user_id: int, limit: int = 20) -> list[dict[str, Any]]:
     """List all chat sessions for a specific user.
 
@@ -124,6 +129,7 @@ def list_user_sessions(user_id: int, limit: int = 20) -> list[dict[str, Any]]:
 
 
 @mcp.tool()
+@read_from_replica
 def get_session_stats(session_id: str) -> dict[str, Any]:
     """Get statistics about a chat session.
 
@@ -174,6 +180,7 @@ def get_session_stats(session_id: str) -> dict[str, Any]:
 
 
 @mcp.resource("chat://sessions")
+@read_from_replica
 def list_recent_sessions() -> str:
     """List the 20 most recent chat sessions across all users.
 
@@ -195,6 +202,7 @@ def list_recent_sessions() -> str:
 
 
 @mcp.resource("chat://sessions/{session_id}")
+@read_from_replica
 def get_session_details(session_id: str) -> str:
     """Get detailed information about a specific chat session.
 
@@ -228,6 +236,7 @@ def get_session_details(session_id: str) -> str:
 
 
 @mcp.resource("chat://users/{user_id}/sessions")
+@read_from_replica
 def get_user_sessions(user_id: str) -> str:
     """Get all chat sessions for a specific user.
 
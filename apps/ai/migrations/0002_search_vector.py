@@ -0,0 +1,24 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:11
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+from apps.common.utilities.database.search import AddSearchTrigger
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chatmessage",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                blank=True, editable=False, null=True
+            ),
+        ),
+        AddSearchTrigger(model_name="chatmessage", weights={"content": "A"}),
+    ]
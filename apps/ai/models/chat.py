@@ -5,7 +5,7 @@ from typing import Optional
 
 from django.db import models
 
-from apps.common.behaviors import Timestampable
+from apps.common.behaviors import Searchable, SearchableManager, Timestampable
 from apps.common.models import User
 
 
@@ -70,8 +70,10 @@ class ChatSession(Timestampable, models.Model):
         return "New Chat"
 
 
-class ChatMessage(Timestampable, models.Model):
-    """A single message in a chat session."""
+class ChatMessage(Timestampable, Searchable, models.Model):
+    """A single message in a chat session, full-text searchable by content."""
+
+    search_weights = {"content": "A"}
 
     ROLE_CHOICES = [
         ("user", "User"),
@@ -100,6 +102,8 @@ class ChatMessage(Timestampable, models.Model):
         help_text="Whether this message has been processed (useful for async processing)",
     )
 
+    objects = SearchableManager()
+
     class Meta:
         ordering = ["created_at"]
         indexes = [
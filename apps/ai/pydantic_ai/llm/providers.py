@@ -2,7 +2,9 @@
 
 import os
 
+from django.conf import settings
 from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai.providers.openai import OpenAIProvider
 
 
 def get_openai_model(
@@ -27,6 +29,10 @@ def get_openai_model(
             "or pass api_key parameter."
         )
 
+    # e.g. a local fake for load tests (tools/loadtest/)
+    base_url = getattr(settings, "OPENAI_BASE_URL", "")
+    if base_url:
+        return OpenAIModel(model_name, provider=OpenAIProvider(base_url=base_url))
     return OpenAIModel(model_name)
 
 
@@ -0,0 +1,27 @@
+from django.test import TestCase, override_settings
+from pydantic_ai import Agent
+
+from apps.ai.pydantic_ai.llm.providers import get_openai_model
+from tools.loadtest import fakes
+
+
+class OpenAIProviderTest(TestCase):
+    """
+    Test case for the OpenAI model provider.
+    """
+
+    def test_base_url_setting(self):
+        """Test that OPENAI_BASE_URL points the model at another server."""
+        with fakes.running("openai") as urls:
+            with override_settings(OPENAI_BASE_URL=f"{urls['openai']}/v1"):
+                model = get_openai_model("gpt-4o-mini", api_key="sk-test")
+                result = Agent(model).run_sync("Hello")
+
+        self.assertEqual(model.base_url, f"{urls['openai']}/v1/")
+        self.assertTrue(result.output)
+
+    @override_settings(OPENAI_BASE_URL="")
+    def test_default_base_url(self):
+        """Test that the OpenAI API is used when no base URL is set."""
+        model = get_openai_model("gpt-4o-mini", api_key="sk-test")
+        self.assertEqual(model.base_url, "https://api.openai.com/v1/")
@@ -8,6 +8,7 @@ from apps.ai.pydantic_ai.agent.chat import ChatDependencies
 from apps.ai.pydantic_ai.agent.chat import ChatSession as AgentChatSession
 from apps.ai.pydantic_ai.agent.chat import process_chat_message_sync
 from apps.ai.pydantic_ai.llm.providers import get_default_model
+from apps.common.utilities.database.replicas import read_from_replica
 from apps.public.views.helpers import HTMXView, MainContentView
 
 
@@ -32,13 +33,20 @@ class ChatIndexView(MainContentView):
             chat_session = self.create_new_session()
 
         context["chat_session"] = chat_session
-        context["messages"] = chat_session.messages.all().order_by("created_at")
 
-        # Get user's recent sessions if logged in
-        if self.request.user.is_authenticated:
-            context["recent_sessions"] = ChatSession.objects.filter(
-                user=self.request.user
-            ).order_by("-modified_at")[:5]
+        # History can come from a replica; evaluate it inside the block
+        with read_from_replica():
+            context["messages"] = list(
+                chat_session.messages.all().order_by("created_at")
+            )
+
+            # Get user's recent sessions if logged in
+            if self.request.user.is_authenticated:
+                context["recent_sessions"] = list(
+                    ChatSession.objects.filter(user=self.request.user).order_by(
+                        "-modified_at"
+                    )[:5]
+                )
 
         return context
 
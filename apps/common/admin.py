@@ -31,6 +31,7 @@ from apps.common.models import (
     Note,
     Payment,
     Subscription,
+    Tag,
     Team,
     TeamAPIKey,
     TeamMember,
@@ -38,6 +39,8 @@ from apps.common.models import (
     User,
     UserAPIKey,
 )
+from apps.common.utilities.django.admin_search import SearchableAdminMixin
+from apps.common.utilities.reference_data import resolve
 
 # Define which models should be shown in the main admin navigation
 MAIN_NAV_MODELS = ["User", "Team", "BlogPost"]
@@ -83,6 +86,46 @@ class BooleanFilter(SimpleListFilter):
         return queryset
 
 
+class PresignedPreviewMixin:
+    """
+    Presign every file URL on a changelist page in one batch.
+
+    Without this, each row's preview builds an S3 client and signs a URL.
+    Previews link to the generated thumbnail when there is one, so list
+    pages don't load full-size originals. Override `get_preview_upload` when
+    the admin's model is not an Upload.
+    """
+
+    preview_variant = "thumbnail"
+
+    def get_preview_upload(self, obj):
+        return obj
+
+    def get_changelist_instance(self, request):
+        changelist = super().get_changelist_instance(request)
+        if "preview" in changelist.list_display:
+            from apps.integration.aws.presigned_urls import presign_many
+
+            uploads = {}
+            for obj in changelist.result_list:
+                upload = self.get_preview_upload(obj)
+                if upload is not None:
+                    uploads[obj] = upload
+            urls = presign_many(uploads.values(), variant=self.preview_variant)
+            for obj, upload in uploads.items():
+                obj.preview_url = urls.get(upload.pk)
+        return changelist
+
+    def get_preview_url(self, obj):
+        """Return the batch-presigned URL, or presign this object alone."""
+        if getattr(obj, "preview_url", None):
+            return obj.preview_url
+        upload = self.get_preview_upload(obj)
+        if upload is None:
+            return None
+        return upload.get_presigned_url(variant=self.preview_variant)
+
+
 @admin.register(User)
 class UserAdmin(ModelAdmin):
     form = UserChangeForm
@@ -474,7 +517,7 @@ class TeamMemberAdmin(ModelAdmin):
 
 
 @admin.register(BlogPost)
-class BlogPostAdmin(ModelAdmin):
+class BlogPostAdmin(SearchableAdminMixin, ModelAdmin):
     list_display = (
         "title",
         "author_display",
@@ -482,7 +525,7 @@ class BlogPostAdmin(ModelAdmin):
         "publishing_status",
         "expiration_status",
     )
-    list_filter = ("published_at", "expired_at")
+    list_filter = ("category", "published_at", "expired_at")
     search_fields = ("title", "subtitle", "content", "tags")
     date_hierarchy = "created_at"
     readonly_fields = ("created_at", "modified_at", "authored_at")
@@ -497,6 +540,7 @@ class BlogPostAdmin(ModelAdmin):
                     "content",
                     "featured_image",
                     "reading_time_minutes",
+                    "category",
                     "tags",
                 )
             },
@@ -549,6 +593,14 @@ class BlogPostAdmin(ModelAdmin):
         )
 
 
+@admin.register(Tag)
+class TagAdmin(ModelAdmin):
+    list_display = ("name", "post_count")
+    search_fields = ("name",)
+    readonly_fields = ("post_count",)
+    ordering = ("-post_count", "name")
+
+
 @admin.register(UserAPIKey)
 class UserAPIKeyAdmin(APIKeyModelAdmin):
     list_display = ("name", "user", "prefix", "created_at", "revoked")
@@ -569,7 +621,14 @@ class TeamAPIKeyAdmin(APIKeyModelAdmin):
 
 @admin.register(Address)
 class AddressAdmin(ModelAdmin):
-    list_display = ("line_1", "city", "region", "postal_code", "country", "map_link")
+    list_display = (
+        "line_1",
+        "city",
+        "region",
+        "postal_code",
+        "country_display",
+        "map_link",
+    )
     list_filter = ("country",)
     search_fields = ("line_1", "line_2", "city", "region", "postal_code")
     readonly_fields = ("created_at", "modified_at")
@@ -594,6 +653,10 @@ class AddressAdmin(ModelAdmin):
         ("Timestamps", {"fields": ("created_at", "modified_at")}),
     )
 
+    @admin.display(description="Country", ordering="country__name")
+    def country_display(self, obj):
+        return resolve(obj, "country") or "-"
+
     @admin.display(description="Map")
     def map_link(self, obj):
         if obj.google_map_link:
@@ -606,11 +669,16 @@ class AddressAdmin(ModelAdmin):
 
 @admin.register(City)
 class CityAdmin(ModelAdmin):
-    list_display = ("name", "code", "country", "currency_display")
+    list_display = ("name", "code", "country_display", "currency_display")
     list_filter = ("country",)
     search_fields = ("name", "code", "country__name")
     autocomplete_fields = ["country"]
 
+    # Countries and currencies come from the reference data registry
+    @admin.display(description="Country", ordering="country__name")
+    def country_display(self, obj):
+        return resolve(obj, "country")
+
     @admin.display(description="Currency")
     def currency_display(self, obj):
         if obj.currency:
@@ -623,11 +691,16 @@ class CityAdmin(ModelAdmin):
 
 @admin.register(Country)
 class CountryAdmin(ModelAdmin):
-    list_display = ("name", "code", "calling_code_display", "currency")
+    list_display = ("name", "code", "calling_code_display", "currency_display")
     list_filter = ("currency",)
     search_fields = ("name", "code")
     autocomplete_fields = ["currency"]
 
+    # Currencies come from the reference data registry
+    @admin.display(description="Currency", ordering="currency__code")
+    def currency_display(self, obj):
+        return resolve(obj, "currency") or "-"
+
     @admin.display(description="Calling Code")
     def calling_code_display(self, obj):
         if obj.calling_code:
@@ -653,7 +726,7 @@ class CurrencyAdmin(ModelAdmin):
 
 
 @admin.register(Note)
-class NoteAdmin(ModelAdmin):
+class NoteAdmin(SearchableAdminMixin, ModelAdmin):
     list_display = ("id", "text_preview", "author", "created_at")
     search_fields = ("text", "author__username", "author__email")
     readonly_fields = ("created_at", "modified_at")
@@ -667,7 +740,7 @@ class NoteAdmin(ModelAdmin):
 
 
 @admin.register(Email)
-class EmailAdmin(ModelAdmin):
+class EmailAdmin(SearchableAdminMixin, ModelAdmin):
     list_display = (
         "subject",
         "to_address",
@@ -676,9 +749,18 @@ class EmailAdmin(ModelAdmin):
         "sent_status",
         "read_status",
     )
-    list_filter = ("type", "sent_at", "read_at")
+    list_filter = ("type", "status", "sent_at", "read_at")
     search_fields = ("to_address", "from_address", "subject", "body")
-    readonly_fields = ("created_at", "modified_at", "sent_at", "read_at")
+    readonly_fields = (
+        "created_at",
+        "modified_at",
+        "sent_at",
+        "read_at",
+        "status",
+        "attempts",
+        "next_attempt_at",
+        "last_error",
+    )
 
     fieldsets = (
         (
@@ -687,6 +769,10 @@ class EmailAdmin(ModelAdmin):
         ),
         ("Attachments", {"fields": ("attachments",)}),
         ("Status", {"fields": ("sent_at", "read_at")}),
+        (
+            "Outbox",
+            {"fields": ("status", "attempts", "next_attempt_at", "last_error")},
+        ),
         ("Timestamps", {"fields": ("created_at", "modified_at")}),
     )
 
@@ -709,6 +795,10 @@ class EmailAdmin(ModelAdmin):
             return mark_safe(
                 '<span class="unfold-badge bg-green-500 text-white">Sent</span>'
             )
+        if obj.status == Email.STATUS_FAILED:
+            return mark_safe(
+                '<span class="unfold-badge bg-red-500 text-white">Failed</span>'
+            )
         return mark_safe(
             '<span class="unfold-badge bg-yellow-500 text-white">Pending</span>'
         )
@@ -782,7 +872,7 @@ class SMSAdmin(ModelAdmin):
 
 
 @admin.register(Upload)
-class UploadAdmin(ModelAdmin):
+class UploadAdmin(PresignedPreviewMixin, ModelAdmin):
     list_display = (
         "name_display",
         "file_type_display",
@@ -864,21 +954,25 @@ class UploadAdmin(ModelAdmin):
         if obj.is_image and obj.original:
             return format_html(
                 '<img src="{}" style="max-width: 300px; max-height: 200px;" />',
-                obj.original,
+                self.get_preview_url(obj),
             )
         if obj.is_pdf and obj.original:
             return format_html(
                 '<a href="{}" target="_blank" class="unfold-badge bg-red-500 text-white">View PDF</a>',
-                obj.original,
+                self.get_preview_url(obj),
             )
         return "-"
 
 
 @admin.register(Image)
-class ImageAdmin(ModelAdmin):
+class ImageAdmin(PresignedPreviewMixin, ModelAdmin):
     list_display = ("display_name", "dimensions_display", "preview", "created_at")
+    list_select_related = ("upload",)
     search_fields = ("upload__name", "upload__original", "id")
 
+    def get_preview_upload(self, obj):
+        return obj.upload
+
     def get_readonly_fields(self, request, obj=None):
         """Only use timestamp fields if they are available."""
         readonly_fields = ["dimensions_display", "preview"]
@@ -919,7 +1013,7 @@ class ImageAdmin(ModelAdmin):
         if hasattr(obj, "original") and obj.original:
             return format_html(
                 '<img src="{}" style="max-width: 300px; max-height: 200px;" />',
-                obj.original,
+                self.get_preview_url(obj),
             )
         return "-"
 
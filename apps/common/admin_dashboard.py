@@ -12,10 +12,12 @@ from django.utils.translation import gettext_lazy as _
 
 from apps.common.admin import ADMIN_CATEGORIES, MAIN_NAV_MODELS
 from apps.common.models import SMS, Email, Payment, Subscription, Team
+from apps.common.utilities.database.replicas import read_from_replica
 
 User = get_user_model()
 
 
+@read_from_replica
 def get_admin_dashboard(request, context=None):
     """
     Generate dashboard widgets and stats for the admin index page.
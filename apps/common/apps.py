@@ -5,3 +5,12 @@ class CommonConfig(AppConfig):
     name = "apps.common"
     label = "common"
     default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self):
+        # Generate slugs and geohashes on save for Permalinkable and
+        # Locatable models only
+        from apps.common.behaviors.locatable import connect_geohash_signals
+        from apps.common.behaviors.permalinkable import connect_slug_signals
+
+        connect_slug_signals()
+        connect_geohash_signals()
@@ -2,16 +2,32 @@ from .annotatable import Annotatable
 from .authorable import Authorable
 from .expirable import Expirable
 from .locatable import Locatable
+from .managers import (
+    BehaviorManager,
+    BehaviorQuerySet,
+    LocatableManager,
+    LocatableQuerySet,
+    SearchableManager,
+    SearchableQuerySet,
+)
 from .permalinkable import Permalinkable
 from .publishable import Publishable
+from .searchable import Searchable
 from .timestampable import Timestampable
 
 __all__ = [
     "Annotatable",
     "Authorable",
+    "BehaviorManager",
+    "BehaviorQuerySet",
     "Expirable",
     "Locatable",
+    "LocatableManager",
+    "LocatableQuerySet",
     "Permalinkable",
+    "Searchable",
+    "SearchableManager",
+    "SearchableQuerySet",
     "Timestampable",
     "Publishable",
 ]
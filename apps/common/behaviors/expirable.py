@@ -1,5 +1,7 @@
 from django.db import models
 
+from apps.common.behaviors.managers import BehaviorManager
+
 
 class Expirable(models.Model):
     """
@@ -22,6 +24,11 @@ class Expirable(models.Model):
         is_expired (bool): A property that returns True if the object has expired, False otherwise.
             Can be set to True to mark the object as expired, or False to unmark it.
 
+    QuerySet methods (BehaviorManager):
+        expire(): Expires every matching row that hasn't expired yet, in one UPDATE.
+        live(): Rows that are valid and not expired now, filtered in SQL.
+        expiring_within(period): Live rows that expire within `period` from now.
+
     Note:
         This model is abstract and should be used as a mixin in other models.
     """
@@ -29,6 +36,8 @@ class Expirable(models.Model):
     valid_at = models.DateTimeField(null=True, blank=True)
     expired_at = models.DateTimeField(null=True, blank=True)
 
+    objects = BehaviorManager()
+
     @property
     def is_expired(self) -> bool:
         from django.utils.timezone import now
@@ -1,4 +1,9 @@
+from django.apps import apps
 from django.db import models
+from django.db.models.signals import class_prepared, pre_save
+
+from apps.common.behaviors.managers import LocatableManager
+from apps.common.utilities.database.geo import encode_geohash
 
 # from timezone_field import TimeZoneField
 
@@ -22,17 +27,42 @@ class Locatable(models.Model):
         latitude (float, optional): The latitude coordinate of the location.
             Used for mapping and geospatial queries.
 
+        geohash (str): The geohash of the coordinates, set on save (blank
+            without coordinates). Nearby objects share a prefix.
+
+    QuerySet methods (LocatableManager):
+        with_distance(latitude, longitude): Annotates `distance`, the
+            great-circle distance in km from the point.
+        within_radius(latitude, longitude, km): Rows within `km` of the
+            point, with `distance`.
+        nearest(n): The n closest rows of a with_distance() or
+            within_radius() queryset.
+        geohash_clusters(precision): Row counts and centre coordinates per
+            geohash prefix, for maps.
+
     Example:
         ```python
         class Event(Locatable, models.Model):
             name = models.CharField(max_length=100)
             start_time = models.DateTimeField()
 
-            # Can now associate an address and coordinates with the event
+            class Meta:
+                indexes = [
+                    models.Index(
+                        fields=["latitude", "longitude"], name="event_location_idx"
+                    ),
+                ]
+
+        Event.objects.within_radius(48.8566, 2.3522, 10).nearest(5)
         ```
 
     Note:
         This model is abstract and should be used as a mixin in other models.
+        Add the (latitude, longitude) index to the model's Meta, as above;
+        within_radius() filters on it before computing distances. Behaviors
+        listed before it also declare `objects`, so set
+        `objects = LocatableManager()` on the model in that case. Queryset
+        update() of the coordinates doesn't update `geohash`.
         The commented timezone field can be uncommented if timezone information
         is needed for the location.
     """
@@ -44,6 +74,11 @@ class Locatable(models.Model):
 
     longitude = models.FloatField(null=True, blank=True)
     latitude = models.FloatField(null=True, blank=True)
+    geohash = models.CharField(
+        max_length=12, blank=True, default="", editable=False, db_index=True
+    )
+
+    objects = LocatableManager()
 
     @property
     def has_coordinates(self) -> bool:
@@ -70,3 +105,36 @@ class Locatable(models.Model):
 
     class Meta:
         abstract = True
+
+
+def pre_save_geohash(sender, instance, *args, **kwargs):
+    """Signal handler that sets a Locatable's geohash from its coordinates."""
+    if instance.has_coordinates:
+        instance.geohash = encode_geohash(instance.latitude, instance.longitude)
+    else:
+        instance.geohash = ""
+
+
+def connect_geohash_signal(model) -> None:
+    if issubclass(model, Locatable) and not model._meta.abstract:
+        pre_save.connect(
+            pre_save_geohash,
+            sender=model,
+            dispatch_uid=f"locatable_geohash_{model._meta.label_lower}",
+        )
+
+
+def connect_geohash_signals() -> None:
+    """
+    Connect pre_save_geohash for every concrete Locatable model, as
+    connect_slug_signals() does for Permalinkable.
+    """
+    for model in apps.get_models():
+        connect_geohash_signal(model)
+    class_prepared.connect(
+        _connect_prepared_model, dispatch_uid="locatable_class_prepared"
+    )
+
+
+def _connect_prepared_model(sender, **kwargs):
+    connect_geohash_signal(sender)
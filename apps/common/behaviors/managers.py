@@ -0,0 +1,237 @@
+from datetime import timedelta
+
+from django.db import models, router
+from django.db.models import Avg, Count, F, Q
+from django.db.models.functions import Left
+from django.db.models.signals import pre_save
+from django.utils import timezone
+
+
+def prepare_bulk_create(
+    model, objs: list, using: str | None = None, send_signals: bool = True
+) -> None:
+    """
+    Apply save-time normalization to instances about to be bulk inserted.
+
+    Slugs of Permalinkable models are allocated for the whole batch with one
+    query. Then `pre_save` is sent for each instance, so receivers that
+    normalise data (like the lowercase codes of City, Country and Currency)
+    apply as they would in save(). Timestamps are set by bulk_create itself.
+    """
+    from apps.common.behaviors.permalinkable import Permalinkable, allocate_slugs
+
+    if issubclass(model, Permalinkable):
+        allocate_slugs(objs, model=model, using=using)
+    if send_signals:
+        for obj in objs:
+            pre_save.send(
+                sender=model, instance=obj, raw=False, using=using, update_fields=None
+            )
+
+
+def auto_now_fields(model) -> list[str]:
+    """Names of the model's fields that save() sets to now (auto_now)."""
+    return [
+        field.name
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False)
+    ]
+
+
+class BehaviorQuerySet(models.QuerySet):
+    """
+    A QuerySet that keeps the behavior mixins' rules in bulk operations.
+
+    bulk_create() and bulk_update() skip save() and signals, so on their own
+    they leave slugs empty, codes un-normalised and modified_at stale. Here:
+
+    - bulk_create() allocates unique slugs and sends pre_save per instance.
+    - bulk_update() does the same for the updated fields and sets
+      modified_at (any auto_now field).
+    - update() sets modified_at unless it's given.
+    - publish(), unpublish() and expire() change every matching row in one
+      UPDATE, with the same rules as the instance methods.
+    - published(), live() and expiring_within() filter on the is_published
+      and is_expired rules in SQL.
+
+    The bulk operations don't send post_save. Searchable and Locatable
+    models add SearchableQuerySet and LocatableQuerySet to it; a model with
+    both composes its own queryset from the two, as BlogPost does.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        prepare_bulk_create(self.model, objs, using=self._write_db())
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        from apps.common.behaviors.permalinkable import Permalinkable, allocate_slugs
+
+        objs = list(objs)
+        fields = list(fields)
+        using = self._write_db()
+        if issubclass(self.model, Permalinkable) and "slug" in fields:
+            allocate_slugs(objs, model=self.model, using=using)
+        now = timezone.now()
+        stamped = [name for name in auto_now_fields(self.model) if name not in fields]
+        if {"latitude", "longitude"} & set(fields) and "geohash" not in fields:
+            stamped.append("geohash")  # set by Locatable's pre_save
+        for obj in objs:
+            for name in stamped:
+                setattr(obj, name, now)
+            pre_save.send(
+                sender=self.model,
+                instance=obj,
+                raw=False,
+                using=using,
+                update_fields=frozenset(fields),
+            )
+        return super().bulk_update(objs, fields + stamped, *args, **kwargs)
+
+    def update(self, **kwargs):
+        now = timezone.now()
+        for name in auto_now_fields(self.model):
+            kwargs.setdefault(name, now)
+        return super().update(**kwargs)
+
+    def _write_db(self) -> str:
+        return self._db or router.db_for_write(self.model)
+
+    def _require(self, field: str, behavior: str) -> None:
+        if not any(f.name == field for f in self.model._meta.concrete_fields):
+            raise TypeError(f"{self.model.__name__} is not {behavior}")
+
+    def _published(self, now) -> Q:
+        # Matches Publishable.is_published
+        return Q(published_at__lt=now) & (
+            Q(unpublished_at__isnull=True) | Q(unpublished_at__lte=F("published_at"))
+        )
+
+    def published(self):
+        """Rows that are published now (Publishable.is_published, in SQL)."""
+        self._require("published_at", "Publishable")
+        return self.filter(self._published(timezone.now()))
+
+    def live(self):
+        """
+        Rows visible now: published (if Publishable), valid and not expired
+        (if Expirable).
+        """
+        fields = {f.name for f in self.model._meta.concrete_fields}
+        if not fields & {"published_at", "expired_at"}:
+            raise TypeError(f"{self.model.__name__} is not Publishable or Expirable")
+        now = timezone.now()
+        queryset = self
+        if "published_at" in fields:
+            queryset = queryset.filter(self._published(now))
+        if "expired_at" in fields:
+            queryset = queryset.filter(
+                Q(expired_at__isnull=True) | Q(expired_at__gte=now),
+                Q(valid_at__isnull=True) | Q(valid_at__lte=now),
+            )
+        return queryset
+
+    def expiring_within(self, period: timedelta):
+        """Live rows that expire within `period` from now."""
+        self._require("expired_at", "Expirable")
+        now = timezone.now()
+        return self.live().filter(expired_at__gte=now, expired_at__lt=now + period)
+
+    def publish(self) -> int:
+        """Publish every unpublished row now; returns the rows changed."""
+        self._require("published_at", "Publishable")
+        now = timezone.now()
+        return self.exclude(self._published(now)).update(
+            published_at=now, unpublished_at=None
+        )
+
+    def unpublish(self) -> int:
+        """Unpublish every published row now; returns the rows changed."""
+        self._require("published_at", "Publishable")
+        now = timezone.now()
+        return self.filter(self._published(now)).update(unpublished_at=now)
+
+    def expire(self) -> int:
+        """Expire every row that hasn't expired yet; returns the rows changed."""
+        self._require("expired_at", "Expirable")
+        now = timezone.now()
+        return self.filter(Q(expired_at__isnull=True) | Q(expired_at__gte=now)).update(
+            expired_at=now
+        )
+
+
+class SearchableQuerySet(models.QuerySet):
+    """QuerySet methods of Searchable models."""
+
+    def search(self, query: str):
+        """Rows matching `query`, most relevant first (see search.search())."""
+        from apps.common.utilities.database.search import search
+
+        return search(self, query).order_by("-rank", "-pk")
+
+
+class LocatableQuerySet(models.QuerySet):
+    """
+    QuerySet methods of Locatable models, which query by distance (see
+    utilities/database/geo.py).
+    """
+
+    def with_distance(self, latitude: float, longitude: float):
+        """Annotates `distance`: km from (latitude, longitude), by haversine."""
+        from apps.common.utilities.database.geo import distance_km
+
+        return self.annotate(distance=distance_km(latitude, longitude))
+
+    def within_radius(self, latitude: float, longitude: float, km: float):
+        """
+        Rows within `km` of (latitude, longitude), with `distance`.
+
+        A bounding box filter narrows the rows on the (latitude, longitude)
+        index first, so only those get the exact distance computed.
+        """
+        from apps.common.utilities.database.geo import bounding_box_q
+
+        return (
+            self.filter(bounding_box_q(latitude, longitude, km))
+            .with_distance(latitude, longitude)
+            .filter(distance__lte=km)
+        )
+
+    def nearest(self, n: int):
+        """The n rows closest to the point of with_distance()/within_radius()."""
+        if "distance" not in self.query.annotations:
+            raise ValueError("nearest() needs with_distance() or within_radius()")
+        return self.filter(distance__isnull=False).order_by("distance", "pk")[:n]
+
+    def geohash_clusters(self, precision: int = 5):
+        """
+        Rows grouped by the first `precision` characters of their geohash
+        (5 is about 5 km across), with `count`, `center_latitude` and
+        `center_longitude` (the mean coordinates) per `cell`.
+        """
+        return (
+            self.exclude(geohash="")
+            .annotate(cell=Left("geohash", precision))
+            .order_by("cell")
+            .values("cell")
+            .annotate(
+                count=Count("pk"),
+                center_latitude=Avg("latitude"),
+                center_longitude=Avg("longitude"),
+            )
+        )
+
+
+BehaviorManager = models.Manager.from_queryset(BehaviorQuerySet)
+
+
+class SearchableBehaviorQuerySet(SearchableQuerySet, BehaviorQuerySet):
+    """BehaviorQuerySet of Searchable models."""
+
+
+class LocatableBehaviorQuerySet(LocatableQuerySet, BehaviorQuerySet):
+    """BehaviorQuerySet of Locatable models."""
+
+
+SearchableManager = models.Manager.from_queryset(SearchableBehaviorQuerySet)
+LocatableManager = models.Manager.from_queryset(LocatableBehaviorQuerySet)
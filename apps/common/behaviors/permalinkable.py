@@ -1,11 +1,14 @@
 from typing import Any
 
+from django.apps import apps
 from django.core.validators import validate_slug
 from django.db import models
-from django.db.models.signals import pre_save
-from django.dispatch import receiver
+from django.db.models import Q
+from django.db.models.signals import class_prepared, pre_save
 from django.utils.text import slugify
 
+from apps.common.behaviors.managers import BehaviorManager
+
 
 class Permalinkable(models.Model):
     """
@@ -13,7 +16,8 @@ class Permalinkable(models.Model):
 
     This mixin provides a slug field for models that need SEO-friendly URLs
     or human-readable identifiers. It includes automatic slug generation from
-    a designated source field when the object is saved.
+    a designated source field when the object is saved, numbered (-2, -3, ...)
+    when the slug is already taken.
 
     Attributes:
         slug (SlugField): A unique, URL-friendly string derived from the model's content.
@@ -52,6 +56,8 @@ class Permalinkable(models.Model):
         help_text="URL-friendly version of the name. Auto-generated if blank.",
     )
 
+    objects = BehaviorManager()
+
     class Meta:
         abstract = True
 
@@ -77,13 +83,68 @@ class Permalinkable(models.Model):
     #     return (self.url_name, (), url_kwargs)
 
 
-@receiver(pre_save)
+# Room left at the end of a slug for a "-<n>" collision suffix
+SLUG_SUFFIX_LENGTH = 5
+
+
+def unique_slug(base: str, taken: set[str], max_length: int) -> str:
+    """The first of base, base-2, base-3, ... that isn't taken."""
+    slug = base[:max_length].strip("-")
+    number = 1
+    while slug in taken:
+        number += 1
+        suffix = f"-{number}"
+        slug = f"{base[: max_length - len(suffix)].strip('-')}{suffix}"
+    return slug
+
+
+def taken_slugs(model, stems: set[str], using: str | None = None) -> set[str]:
+    """Existing slugs of a model starting with any of the stems, in one query."""
+    prefixes = Q()
+    for stem in stems:
+        prefixes |= Q(slug__startswith=stem)
+    manager = model._default_manager
+    if using:
+        manager = manager.db_manager(using)
+    return set(manager.filter(prefixes).values_list("slug", flat=True))
+
+
+def allocate_slugs(instances: list, model=None, using: str | None = None) -> None:
+    """
+    Set unique slugs on unsaved Permalinkable instances of one model.
+
+    Instances that have a slug or no slug_source are left alone. Existing
+    slugs with the same prefixes are fetched in a single query, so a batch
+    can be allocated before bulk_create without one query per instance.
+    """
+    pending = [
+        instance
+        for instance in instances
+        if not instance.slug and getattr(instance, "slug_source", None)
+    ]
+    if not pending:
+        return
+    model = model or type(pending[0])
+    max_length = model._meta.get_field("slug").max_length
+    bases = [
+        slugify(instance.slug_source)[:max_length].strip("-") or model._meta.model_name
+        for instance in pending
+    ]
+
+    stems = {base[: max_length - SLUG_SUFFIX_LENGTH] for base in bases}
+    taken = taken_slugs(model, stems, using)
+    for instance, base in zip(pending, bases):
+        instance.slug = unique_slug(base, taken, max_length)
+        taken.add(instance.slug)
+
+
 def pre_save_slug(sender, instance, *args, **kwargs):
     """
     Signal handler that automatically generates a slug before saving.
 
     If the model inherits from Permalinkable and has a 'slug_source' attribute
-    but no slug, this handler will generate a slug from the source.
+    but no slug, this handler will generate a unique slug from the source.
+    It is connected for each Permalinkable model by `connect_slug_signals()`.
 
     Args:
         sender: The model class
@@ -92,4 +153,32 @@ def pre_save_slug(sender, instance, *args, **kwargs):
     """
     if hasattr(sender, "mro") and Permalinkable in sender.mro():
         if not instance.slug and hasattr(instance, "slug_source"):
-            instance.slug = slugify(instance.slug_source)
+            allocate_slugs([instance], model=sender, using=kwargs.get("using"))
+
+
+def connect_slug_signal(model) -> None:
+    if issubclass(model, Permalinkable) and not model._meta.abstract:
+        pre_save.connect(
+            pre_save_slug,
+            sender=model,
+            dispatch_uid=f"permalinkable_slug_{model._meta.label_lower}",
+        )
+
+
+def connect_slug_signals() -> None:
+    """
+    Connect pre_save_slug for every concrete Permalinkable model.
+
+    Called when the common app is ready, so saves of other models never
+    run it. Models defined later (e.g. in tests) are connected as they're
+    created.
+    """
+    for model in apps.get_models():
+        connect_slug_signal(model)
+    class_prepared.connect(
+        _connect_prepared_model, dispatch_uid="permalinkable_class_prepared"
+    )
+
+
+def _connect_prepared_model(sender, **kwargs):
+    connect_slug_signal(sender)
@@ -1,6 +1,8 @@
 from django.db import models
 from django.utils import timezone
 
+from apps.common.behaviors.managers import BehaviorManager
+
 
 class Publishable(models.Model):
     """
@@ -28,6 +30,10 @@ class Publishable(models.Model):
         publish(): Marks the content as published by setting the published_at timestamp.
         unpublish(): Marks the content as unpublished by setting the unpublished_at timestamp.
 
+    QuerySet methods (BehaviorManager):
+        publish(), unpublish(): The same transitions for every matching row, in one UPDATE.
+        published(), live(): Rows that are published (and live) now, filtered in SQL.
+
     Example:
         ```python
         class Article(Publishable, models.Model):
@@ -50,6 +56,8 @@ class Publishable(models.Model):
     edited_at = models.DateTimeField(null=True, blank=True)
     unpublished_at = models.DateTimeField(null=True, blank=True)
 
+    objects = BehaviorManager()
+
     class Meta:
         abstract = True
 
@@ -0,0 +1,49 @@
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+
+from apps.common.behaviors.managers import SearchableManager
+
+
+class Searchable(models.Model):
+    """
+    search_vector: tsvector
+
+    A mixin for models searched with PostgreSQL full-text search.
+
+    Set `search_weights` to the text fields to index, each with a weight from
+    "A" (most important) to "D". The `search_vector` column is computed by
+    the database: add it in a migration followed by an AddSearchTrigger
+    operation with the same weights (see
+    apps/common/utilities/database/search.py), which installs the trigger
+    that keeps it current and its GIN index.
+
+    Attributes:
+        search_vector (SearchVectorField): The weighted tsvector of the
+            `search_weights` fields, set by the database
+
+    QuerySet methods (SearchableManager):
+        search(query): Rows matching a web search style query, most relevant
+            first, with a `rank` annotation.
+
+    Example:
+        ```python
+        class Note(Searchable, models.Model):
+            search_weights = {"title": "A", "text": "B"}
+
+        Note.objects.search('invoice -draft')
+        ```
+
+    Note:
+        This model is abstract and should be used as a mixin in other models.
+        Behaviors listed before it also declare `objects`, so set
+        `objects = SearchableManager()` on the model in that case.
+    """
+
+    search_weights: dict[str, str] = {}
+
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
+
+    objects = SearchableManager()
+
+    class Meta:
+        abstract = True
@@ -326,14 +326,18 @@ class TestPermalinkableDirect(unittest.TestCase):
         # Mock a class that has Permalinkable in its MRO (inherited from)
         sender = mock.MagicMock()
         sender.mro.return_value = [mock.MagicMock(), Permalinkable, object]
+        sender._meta.get_field.return_value.max_length = 50
 
         # Mock an instance with a slug_source
         instance = mock.MagicMock()
         instance.slug = None
         instance.slug_source = "Test Title"
 
-        # Call the pre_save_slug handler
-        pre_save_slug(sender, instance)
+        # Call the pre_save_slug handler (with no existing slugs)
+        with mock.patch(
+            "apps.common.behaviors.permalinkable.taken_slugs", return_value=set()
+        ):
+            pre_save_slug(sender, instance)
 
         # Verify slug was set correctly
         self.assertEqual(instance.slug, slugify("Test Title"))
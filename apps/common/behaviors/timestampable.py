@@ -1,5 +1,7 @@
 from django.db import models
 
+from apps.common.behaviors.managers import BehaviorManager
+
 
 class Timestampable(models.Model):
     """
@@ -22,10 +24,13 @@ class Timestampable(models.Model):
     Note:
         This model is abstract and should be used as a mixin in other models.
         The `auto_now_add` and `auto_now` options are used to automatically manage the timestamps.
+        The BehaviorManager also sets modified_at in `update()` and `bulk_update()`.
     """
 
     created_at = models.DateTimeField(auto_now_add=True)
     modified_at = models.DateTimeField(auto_now=True)
 
+    objects = BehaviorManager()
+
     class Meta:
         abstract = True
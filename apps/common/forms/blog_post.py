@@ -16,6 +16,7 @@ class BlogPostForm(BaseModelForm):
             "content",
             "featured_image",
             "reading_time_minutes",
+            "category",
             "tags",
             "address",
             "is_author_anonymous",
@@ -0,0 +1,58 @@
+"""
+Django management command to deliver queued emails from the outbox.
+
+Run it once (e.g. from cron) or with --loop as a long-running worker.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.common.utilities.email import process_email_outbox
+
+
+class Command(BaseCommand):
+    help = "Send queued emails in batches over a single backend connection"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Maximum emails per batch (default: EMAIL_OUTBOX_BATCH_SIZE)",
+        )
+        parser.add_argument(
+            "--loop", action="store_true", help="Keep polling the outbox"
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="Seconds to wait between polls when the outbox is empty",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=0,
+            help="Stop after this many batches (0 = no limit)",
+        )
+
+    def handle(self, *args, **options):
+        batches = 0
+        while True:
+            stats = process_email_outbox(batch_size=options["batch_size"])
+            batches += 1
+
+            if stats.claimed:
+                self.stdout.write(
+                    f"Batch {batches}: sent {stats.sent}, retried {stats.retried}, "
+                    f"failed {stats.failed} in {stats.duration_seconds:.2f}s "
+                    f"({stats.messages_per_second:.1f} msg/s, "
+                    f"{stats.attachment_bytes} attachment bytes)"
+                )
+
+            if options["max_batches"] and batches >= options["max_batches"]:
+                break
+            if not stats.claimed:
+                if not options["loop"]:
+                    break
+                time.sleep(options["interval"])
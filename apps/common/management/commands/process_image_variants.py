@@ -0,0 +1,65 @@
+"""
+Django management command to generate thumbnails and resized variants for
+image uploads queued by complete_upload().
+
+Run it once (e.g. from cron) or with --loop as a long-running worker.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.integration.aws.image_variants import process_image_variants
+
+
+class Command(BaseCommand):
+    help = "Generate image variants in batches using a process pool"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Maximum images per batch (default: IMAGE_VARIANTS_BATCH_SIZE)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Resizing processes (default: IMAGE_VARIANT_WORKERS)",
+        )
+        parser.add_argument("--loop", action="store_true", help="Keep polling")
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="Seconds to wait between polls when nothing is queued",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=0,
+            help="Stop after this many batches (0 = no limit)",
+        )
+
+    def handle(self, *args, **options):
+        batches = 0
+        while True:
+            stats = process_image_variants(
+                batch_size=options["batch_size"], workers=options["workers"]
+            )
+            batches += 1
+
+            if stats.claimed:
+                self.stdout.write(
+                    f"Batch {batches}: {stats.processed} images, {stats.failed} failed, "
+                    f"{stats.variants} variants in {stats.duration_seconds:.2f}s "
+                    f"({stats.images_per_second:.1f} img/s; fetch "
+                    f"{stats.fetch_seconds:.2f}s, render {stats.render_seconds:.2f}s, "
+                    f"store {stats.store_seconds:.2f}s)"
+                )
+
+            if options["max_batches"] and batches >= options["max_batches"]:
+                break
+            if not stats.claimed:
+                if not options["loop"]:
+                    break
+                time.sleep(options["interval"])
@@ -0,0 +1,56 @@
+"""
+Django management command to recount the live blog posts of every tag.
+
+Saving a post keeps its tags' counts current, but posts also go live or
+expire as time passes. Run this periodically (e.g. hourly from cron).
+
+With --sync, the BlogPostTag rows of every post are first rebuilt from its
+`tags` field, for posts written without the manager (seeding.bulk_insert,
+raw SQL).
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.common.models import BlogPost
+from apps.common.models.blog_post import (
+    BLOG_CACHE_NAMESPACE,
+    refresh_tag_counts,
+    sync_post_tags,
+)
+from apps.common.utilities.cache import invalidate_namespace
+
+
+class Command(BaseCommand):
+    help = "Recount the live blog posts of every tag"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sync",
+            action="store_true",
+            help="Rebuild the posts' tag rows from their tags fields first",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Posts synced per batch with --sync (default: 1000)",
+        )
+
+    def handle(self, *args, **options):
+        if options["sync"]:
+            synced = 0
+            posts = BlogPost.objects.only("pk", "tags").order_by("pk")
+            batch = []
+            for post in posts.iterator(chunk_size=options["batch_size"]):
+                batch.append(post)
+                if len(batch) == options["batch_size"]:
+                    sync_post_tags(batch)
+                    synced += len(batch)
+                    batch = []
+            sync_post_tags(batch)
+            synced += len(batch)
+            self.stdout.write(f"Synced the tags of {synced} posts")
+
+        updated = refresh_tag_counts()
+        invalidate_namespace(BLOG_CACHE_NAMESPACE)
+        self.stdout.write(f"Updated the post counts of {updated} tags")
@@ -0,0 +1,332 @@
+"""
+Django management command to seed large volumes of data for load testing.
+
+Rows are built with the test factories and inserted in chunks with
+bulk_create (or COPY on PostgreSQL with --copy), parents before children.
+At --scale 1000 this is 1M users, 100k teams, 2M chat sessions and 10M
+chat messages. Use a dedicated database.
+"""
+
+import random
+import string
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.common.models import Role, TeamMember, User
+from apps.common.tests.factories import (
+    AddressFactory,
+    CityFactory,
+    CountryFactory,
+    CurrencyFactory,
+    TeamFactory,
+    UserFactory,
+)
+from apps.common.utilities.database.seeding import (
+    DEFAULT_BATCH_SIZE,
+    SeedStats,
+    build_batch,
+    bulk_insert,
+    copy_supported,
+    seed,
+)
+
+GROUPS = ("geo", "users", "teams", "chat")
+
+# Rows per unit of --scale (currencies and countries are fixed)
+CURRENCIES = 30
+COUNTRIES = 200
+CITIES_PER_SCALE = 500
+ADDRESSES_PER_SCALE = 1000
+USERS_PER_SCALE = 1000
+TEAMS_PER_SCALE = 100
+SESSIONS_PER_SCALE = 2000
+MESSAGES_PER_SESSION = 5
+MAX_TEAM_SIZE = 19
+# Codes are unique and at most 3 characters
+MAX_CODES = 26**3
+
+PHRASES = (
+    "Can you summarize last month's usage?",
+    "Here is a summary of the usage by team and by day.",
+    "Which plan fits a team of twelve?",
+    "The Pro plan covers up to twenty members.",
+    "Export this as CSV please.",
+    "Done. The export is attached to this conversation.",
+)
+
+
+def letters(i: int) -> str:
+    """A unique three-letter code for 0 <= i < 26**3."""
+    return "".join(string.ascii_lowercase[(i // 26**p) % 26] for p in (2, 1, 0))
+
+
+class Command(BaseCommand):
+    help = "Seed realistic data volumes for load and performance testing"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            type=float,
+            default=1.0,
+            help="Multiplier for row counts (1 = 1000 users, 100 teams, ...)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE * 5,
+            help="Rows per insert batch",
+        )
+        parser.add_argument(
+            "--copy",
+            action="store_true",
+            help="Insert with PostgreSQL COPY instead of bulk_create",
+        )
+        parser.add_argument(
+            "--only",
+            help=f"Comma-separated groups to seed ({', '.join(GROUPS)})",
+        )
+        parser.add_argument(
+            "--prefix",
+            default="perf",
+            help="Prefix of seeded names, used to find them for --clear",
+        )
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Delete previously seeded rows first",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Random seed")
+
+    def handle(self, *args, **options):
+        self.scale = options["scale"]
+        self.batch_size = options["batch_size"]
+        self.use_copy = options["copy"]
+        self.prefix = options["prefix"]
+        self.rng = random.Random(options["seed"])
+        groups = options["only"].split(",") if options["only"] else list(GROUPS)
+        unknown = set(groups) - set(GROUPS)
+        if unknown:
+            raise CommandError(f"Unknown groups: {', '.join(sorted(unknown))}")
+        if self.use_copy and not copy_supported():
+            self.stdout.write(
+                self.style.WARNING("COPY needs PostgreSQL; using bulk_create")
+            )
+
+        if options["clear"]:
+            self.clear()
+        elif "users" in groups and self.seeded_users().exists():
+            raise CommandError(
+                f"Users prefixed '{self.prefix}_' already exist; "
+                "use --clear or another --prefix"
+            )
+
+        started = time.perf_counter()
+        self.stats: list[SeedStats] = []
+        if "geo" in groups:
+            self.seed_geo()
+        if "users" in groups:
+            self.seed_users()
+        else:
+            self.user_ids = list(self.seeded_users().values_list("pk", flat=True))
+        if "teams" in groups:
+            self.seed_teams()
+        if "chat" in groups:
+            self.seed_chat()
+
+        total = sum(stats.rows for stats in self.stats)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {total} rows in {time.perf_counter() - started:.1f}s"
+            )
+        )
+
+    def count(self, per_scale: int, limit: int | None = None) -> int:
+        count = max(int(per_scale * self.scale), 1)
+        return min(count, limit) if limit else count
+
+    def report(self, stats: SeedStats) -> None:
+        self.stats.append(stats)
+        self.stdout.write(
+            f"  {stats.model:<20} {stats.rows:>10} rows "
+            f"{stats.seconds:8.1f}s {stats.rows_per_second:>10.0f} rows/s"
+        )
+
+    def seeded_users(self):
+        return User.objects.filter(username__startswith=f"{self.prefix}_")
+
+    def clear(self) -> None:
+        """Delete seeded rows, children first so each delete is one query."""
+        from apps.ai.models import ChatMessage, ChatSession
+
+        prefix = self.prefix
+        querysets = [
+            ChatMessage.objects.filter(session__metadata__seed=prefix),
+            ChatSession.objects.filter(metadata__seed=prefix),
+            TeamMember.objects.filter(team__slug__startswith=f"{prefix}-team-"),
+            TeamFactory.model_class.objects.filter(slug__startswith=f"{prefix}-team-"),
+            self.seeded_users(),
+            AddressFactory.model_class.objects.filter(line_1__startswith=prefix),
+            CityFactory.model_class.objects.filter(name__startswith=prefix),
+            CountryFactory.model_class.objects.filter(name__startswith=prefix),
+            CurrencyFactory.model_class.objects.filter(name__startswith=prefix),
+        ]
+        for queryset in querysets:
+            deleted, _ = queryset.delete()
+            if deleted:
+                self.stdout.write(f"  Deleted {deleted} {queryset.model._meta.label}")
+
+    # Currency -> Country -> City -> Address
+
+    def seed_geo(self) -> None:
+        prefix, rng = self.prefix, self.rng
+        options = {"batch_size": self.batch_size, "use_copy": self.use_copy}
+
+        currencies = []
+        self.report(
+            seed(
+                CurrencyFactory,
+                CURRENCIES,
+                name=lambda i: f"{prefix} Currency {i}",
+                code=letters,
+                on_batch=currencies.extend,
+                **options,
+            )
+        )
+        countries = []
+        self.report(
+            seed(
+                CountryFactory,
+                COUNTRIES,
+                name=lambda i: f"{prefix} Country {i}",
+                code=letters,
+                calling_code=lambda i: str(i % 999 + 1),
+                currency=lambda i: currencies[i % len(currencies)],
+                on_batch=countries.extend,
+                **options,
+            )
+        )
+        self.report(
+            seed(
+                CityFactory,
+                self.count(CITIES_PER_SCALE, limit=MAX_CODES),
+                name=lambda i: f"{prefix} City {i}",
+                code=letters,
+                country=lambda i: rng.choice(countries),
+                **options,
+            )
+        )
+        self.report(
+            seed(
+                AddressFactory,
+                self.count(ADDRESSES_PER_SCALE),
+                line_1=lambda i: f"{prefix} {i} Main Street",
+                line_2="",
+                city=lambda i: f"City {i % 500}",
+                postal_code=lambda i: f"{i % 100000:05d}",
+                country=lambda i: rng.choice(countries),
+                **options,
+            )
+        )
+
+    # User -> Team -> TeamMember
+
+    def seed_users(self) -> None:
+        prefix = self.prefix
+        password = make_password("perf-password")
+        self.user_ids = []
+        self.report(
+            seed(
+                UserFactory,
+                self.count(USERS_PER_SCALE),
+                batch_size=self.batch_size,
+                use_copy=self.use_copy,
+                username=lambda i: f"{prefix}_{i}",
+                email=lambda i: f"{prefix}_{i}@example.com",
+                password=password,
+                on_batch=lambda batch: self.user_ids.extend(u.pk for u in batch),
+            )
+        )
+
+    def seed_teams(self) -> None:
+        if not self.user_ids:
+            raise CommandError("Seed users before teams")
+        prefix, rng = self.prefix, self.rng
+        members = SeedStats(TeamMember._meta.label)
+
+        def add_members(teams):
+            started = time.perf_counter()
+            memberships = []
+            for team in teams:
+                size = min(rng.randint(1, MAX_TEAM_SIZE), len(self.user_ids))
+                for position, user_id in enumerate(rng.sample(self.user_ids, size)):
+                    role = Role.OWNER if position == 0 else Role.MEMBER
+                    memberships.append((team, user_id, role.value))
+            members.rows += bulk_insert(
+                build_batch(
+                    TeamMember,
+                    len(memberships),
+                    team=lambda i: memberships[i][0],
+                    user_id=lambda i: memberships[i][1],
+                    role=lambda i: memberships[i][2],
+                ),
+                batch_size=self.batch_size,
+                use_copy=self.use_copy,
+            )
+            members.seconds += time.perf_counter() - started
+
+        self.report(
+            seed(
+                TeamFactory,
+                self.count(TEAMS_PER_SCALE),
+                batch_size=self.batch_size,
+                use_copy=self.use_copy,
+                name=lambda i: f"{prefix} team {i}",
+                slug=lambda i: f"{prefix}-team-{i}",
+                on_batch=add_members,
+            )
+        )
+        self.report(members)
+
+    # ChatSession -> ChatMessage
+
+    def seed_chat(self) -> None:
+        from apps.ai.models import ChatMessage, ChatSession
+
+        if not self.user_ids:
+            raise CommandError("Seed users before chat sessions")
+        prefix, rng = self.prefix, self.rng
+        messages = SeedStats(ChatMessage._meta.label)
+
+        def add_messages(sessions):
+            started = time.perf_counter()
+            count = len(sessions) * MESSAGES_PER_SESSION
+            messages.rows += bulk_insert(
+                build_batch(
+                    ChatMessage,
+                    count,
+                    session=lambda i: sessions[i // MESSAGES_PER_SESSION],
+                    role=lambda i: "user" if i % 2 == 0 else "assistant",
+                    content=lambda i: PHRASES[i % len(PHRASES)],
+                    metadata=lambda i: {"tokens": rng.randint(10, 500)},
+                ),
+                batch_size=self.batch_size,
+                use_copy=self.use_copy,
+            )
+            messages.seconds += time.perf_counter() - started
+
+        self.report(
+            seed(
+                ChatSession,
+                self.count(SESSIONS_PER_SCALE),
+                batch_size=self.batch_size,
+                use_copy=self.use_copy,
+                # One in ten sessions is anonymous
+                user_id=lambda i: None if i % 10 == 0 else rng.choice(self.user_ids),
+                title=lambda i: f"Session {i}",
+                metadata={"seed": prefix},
+                on_batch=add_messages,
+            )
+        )
+        self.report(messages)
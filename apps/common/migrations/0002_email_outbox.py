@@ -0,0 +1,58 @@
+# Generated by Django 6.0.2 on 2026-10-18 21:46
+
+from django.db import migrations, models
+
+
+def backfill_sent_status(apps, schema_editor):
+    """Mark emails sent before the outbox existed as sent, not draft."""
+    Email = apps.get_model("common", "Email")
+    db = schema_editor.connection.alias
+    Email.objects.using(db).filter(sent_at__isnull=False).update(status="sent")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="email",
+            name="attempts",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="email",
+            name="last_error",
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="email",
+            name="next_attempt_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="email",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("draft", "Draft"),
+                    ("queued", "Queued"),
+                    ("sending", "Sending"),
+                    ("sent", "Sent"),
+                    ("failed", "Failed"),
+                ],
+                default="draft",
+                max_length=20,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="email",
+            index=models.Index(
+                fields=["status", "next_attempt_at"],
+                name="common_emai_status_88357c_idx",
+            ),
+        ),
+        migrations.RunPython(backfill_sent_status, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0002_email_outbox"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogpost",
+            name="category",
+            field=models.CharField(blank=True, default="", max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name="blogpost",
+            index=models.Index(
+                condition=models.Q(("published_at__isnull", False)),
+                fields=["-published_at", "-id"],
+                name="blogpost_published_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="blogpost",
+            index=models.Index(
+                condition=models.Q(("unpublished_at__isnull", False)),
+                fields=["unpublished_at"],
+                name="blogpost_unpublished_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="blogpost",
+            index=models.Index(
+                condition=models.Q(("expired_at__isnull", False)),
+                fields=["expired_at"],
+                name="blogpost_expired_idx",
+            ),
+        ),
+    ]
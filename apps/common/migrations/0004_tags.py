@@ -0,0 +1,136 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:03
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+
+def backfill_tags(apps, schema_editor):
+    """Create Tag/BlogPostTag rows from the comma-separated tags, with counts."""
+    BlogPost = apps.get_model("common", "BlogPost")
+    Tag = apps.get_model("common", "Tag")
+    BlogPostTag = apps.get_model("common", "BlogPostTag")
+    db = schema_editor.connection.alias
+
+    post_tags = {
+        post_id: {tag.strip().lower() for tag in tags.split(",") if tag.strip()}
+        for post_id, tags in BlogPost.objects.using(db)
+        .exclude(tags="")
+        .values_list("id", "tags")
+        .iterator()
+    }
+    names = set().union(*post_tags.values())
+    Tag.objects.using(db).bulk_create(
+        [Tag(name=name) for name in names], batch_size=1000
+    )
+    tag_ids = dict(Tag.objects.using(db).values_list("name", "id"))
+    BlogPostTag.objects.using(db).bulk_create(
+        [
+            BlogPostTag(post_id=post_id, tag_id=tag_ids[name])
+            for post_id, post_names in post_tags.items()
+            for name in post_names
+        ],
+        batch_size=1000,
+    )
+
+    # Live posts, as in BehaviorQuerySet.live()
+    now = timezone.now()
+    live = BlogPost.objects.using(db).filter(
+        Q(published_at__lt=now),
+        Q(unpublished_at__isnull=True) | Q(unpublished_at__lte=F("published_at")),
+        Q(expired_at__isnull=True) | Q(expired_at__gte=now),
+        Q(valid_at__isnull=True) | Q(valid_at__lte=now),
+    )
+    counts = (
+        BlogPostTag.objects.using(db)
+        .filter(post__in=live)
+        .values("tag")
+        .annotate(count=Count("pk"))
+    )
+    Tag.objects.using(db).bulk_update(
+        [Tag(id=row["tag"], post_count=row["count"]) for row in counts],
+        ["post_count"],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0003_blogpost_category_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tag",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("name", models.CharField(max_length=255, unique=True)),
+                ("post_count", models.PositiveIntegerField(default=0, editable=False)),
+            ],
+            options={
+                "ordering": ["name"],
+                "indexes": [
+                    models.Index(fields=["-post_count", "name"], name="tag_popular_idx")
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="BlogPostTag",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "post",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="post_tags",
+                        to="common.blogpost",
+                    ),
+                ),
+                (
+                    "tag",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="post_tags",
+                        to="common.tag",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="blogpost",
+            name="tag_set",
+            field=models.ManyToManyField(
+                blank=True,
+                related_name="posts",
+                through="common.BlogPostTag",
+                to="common.tag",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="blogposttag",
+            constraint=models.UniqueConstraint(
+                fields=("tag", "post"), name="unique_blog_post_tag"
+            ),
+        ),
+        migrations.RunPython(backfill_tags, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:11
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+from apps.common.utilities.database.search import AddSearchTrigger
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0004_tags"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogpost",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                blank=True, editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="email",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                blank=True, editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="note",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                blank=True, editable=False, null=True
+            ),
+        ),
+        AddSearchTrigger(
+            model_name="blogpost",
+            weights={"title": "A", "subtitle": "B", "tags": "B", "content": "C"},
+        ),
+        AddSearchTrigger(
+            model_name="email",
+            weights={
+                "subject": "A",
+                "to_address": "B",
+                "from_address": "B",
+                "body": "C",
+            },
+        ),
+        AddSearchTrigger(model_name="note", weights={"text": "A"}),
+    ]
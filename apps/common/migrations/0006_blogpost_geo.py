@@ -0,0 +1,44 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:19
+
+from django.db import migrations, models
+
+from apps.common.utilities.database.geo import encode_geohash
+
+
+def backfill_geohash(apps, schema_editor):
+    """Set the geohash of existing posts with coordinates."""
+    BlogPost = apps.get_model("common", "BlogPost")
+    db = schema_editor.connection.alias
+
+    posts = list(
+        BlogPost.objects.using(db)
+        .filter(latitude__isnull=False, longitude__isnull=False)
+        .only("id", "latitude", "longitude")
+    )
+    for post in posts:
+        post.geohash = encode_geohash(post.latitude, post.longitude)
+    BlogPost.objects.using(db).bulk_update(posts, ["geohash"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0005_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogpost",
+            name="geohash",
+            field=models.CharField(
+                blank=True, db_index=True, default="", editable=False, max_length=12
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="blogpost",
+            index=models.Index(
+                fields=["latitude", "longitude"], name="blogpost_location_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_geohash, migrations.RunPython.noop),
+    ]
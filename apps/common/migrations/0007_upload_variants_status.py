@@ -0,0 +1,53 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:50
+
+from datetime import UTC, datetime
+
+from django.db import migrations, models
+
+
+def move_variants_status(apps, schema_editor):
+    """Move the variant queue state out of meta_data into its own columns."""
+    Upload = apps.get_model("common", "Upload")
+    db = schema_editor.connection.alias
+
+    uploads = list(
+        Upload.objects.using(db).filter(meta_data__has_key="variants_status")
+    )
+    for upload in uploads:
+        upload.variants_status = upload.meta_data.pop("variants_status")
+        claimed_at = upload.meta_data.pop("variants_claimed_at", None)
+        if claimed_at is not None:
+            upload.variants_claimed_at = datetime.fromtimestamp(claimed_at, tz=UTC)
+    Upload.objects.using(db).bulk_update(
+        uploads,
+        ["meta_data", "variants_status", "variants_claimed_at"],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0006_blogpost_geo"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="upload",
+            name="variants_claimed_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="upload",
+            name="variants_status",
+            field=models.CharField(blank=True, default="", max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name="upload",
+            index=models.Index(
+                fields=["variants_status", "variants_claimed_at"],
+                name="common_uplo_variant_8dbf87_idx",
+            ),
+        ),
+        migrations.RunPython(move_variants_status, migrations.RunPython.noop),
+    ]
@@ -12,6 +12,7 @@ from .note import Note
 from .payment import Payment
 from .sms import SMS
 from .subscription import Subscription
+from .tag import BlogPostTag, Tag
 from .team import Role, Team, TeamMember
 from .upload import Upload
 from .user import User
@@ -30,6 +31,8 @@ __all__ = [
     "Role",
     "City",
     "BlogPost",
+    "Tag",
+    "BlogPostTag",
     "Email",
     "SMS",
     "UserAPIKey",
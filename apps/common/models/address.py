@@ -5,6 +5,7 @@ from django.db.models.base import ModelBase
 from django.forms import ModelForm
 
 from apps.common.behaviors.timestampable import Timestampable
+from apps.common.utilities.reference_data import resolve
 
 
 class Address(Timestampable, models.Model):
@@ -106,6 +107,8 @@ class Address(Timestampable, models.Model):
         """
         Get a multi-line formatted address string.
 
+        The country comes from the reference data registry, without a query.
+
         Returns:
             str: A formatted address string with line breaks
         """
@@ -128,8 +131,9 @@ class Address(Timestampable, models.Model):
         if city_region_postal:
             lines.append(", ".join(city_region_postal))
 
-        if self.country:
-            lines.append(str(self.country))
+        country = resolve(self, "country")
+        if country:
+            lines.append(str(country))
 
         return "\n".join(lines)
 
@@ -1,6 +1,10 @@
 import uuid
 
 from django.db import models
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from apps.common.behaviors import (
     Annotatable,
@@ -9,8 +13,96 @@ from apps.common.behaviors import (
     Locatable,
     Permalinkable,
     Publishable,
+    Searchable,
     Timestampable,
 )
+from apps.common.behaviors.managers import (
+    BehaviorQuerySet,
+    LocatableQuerySet,
+    SearchableQuerySet,
+)
+from apps.common.models.tag import BlogPostTag, Tag
+from apps.common.utilities.cache import invalidate_namespace
+
+# Cache namespace of everything derived from blog posts (pages, sidebar)
+BLOG_CACHE_NAMESPACE = "blog"
+
+# Fields that decide whether a post is live, and so counts for its tags
+LIVE_FIELDS = {"published_at", "unpublished_at", "expired_at"}
+
+
+class BlogPostQuerySet(LocatableQuerySet, SearchableQuerySet, BehaviorQuerySet):
+    """
+    BehaviorQuerySet that keeps tags in step with the bulk operations, with
+    the Locatable and Searchable methods.
+
+    bulk_create() and bulk_update() of `tags` sync the posts' BlogPostTag
+    rows, and they, bulk_update() of the publishing fields, publish(),
+    unpublish() and expire() recount the affected tags (see
+    `refresh_tag_counts`). update() does neither.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        if objs:
+            # Read the posts back: with ignore_conflicts, some weren't inserted
+            posts = self.model._default_manager.using(self._write_db()).filter(
+                pk__in=[obj.pk for obj in objs]
+            )
+            self._refresh_tags(sync_post_tags(posts.only("pk", "tags")))
+        return objs
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        fields = list(fields)
+        if "tags" in fields:
+            updated = super().bulk_update(objs, fields, *args, **kwargs)
+            self._refresh_tags(sync_post_tags(objs))
+        elif LIVE_FIELDS & set(fields):
+            tags = self._tag_ids(objs)
+            updated = super().bulk_update(objs, fields, *args, **kwargs)
+            self._refresh_tags(tags)
+        else:
+            updated = super().bulk_update(objs, fields, *args, **kwargs)
+        return updated
+
+    def publish(self) -> int:
+        tags = self._tag_ids(self)
+        changed = super().publish()
+        if changed:
+            self._refresh_tags(tags)
+        return changed
+
+    def unpublish(self) -> int:
+        tags = self._tag_ids(self)
+        changed = super().unpublish()
+        if changed:
+            self._refresh_tags(tags)
+        return changed
+
+    def expire(self) -> int:
+        tags = self._tag_ids(self)
+        changed = super().expire()
+        if changed:
+            self._refresh_tags(tags)
+        return changed
+
+    def _tag_ids(self, posts) -> set:
+        # Read before the change, which may take the posts out of `posts`
+        return set(
+            BlogPostTag.objects.using(self._write_db())
+            .filter(post__in=posts)
+            .values_list("tag_id", flat=True)
+            .distinct()
+        )
+
+    def _refresh_tags(self, tags: set) -> None:
+        if tags:
+            refresh_tag_counts(tags)
+            invalidate_namespace(BLOG_CACHE_NAMESPACE)
+
+
+BlogPostManager = models.Manager.from_queryset(BlogPostQuerySet)
 
 
 class BlogPost(
@@ -21,6 +113,7 @@ class BlogPost(
     Locatable,
     Permalinkable,
     Annotatable,
+    Searchable,
     models.Model,
 ):
     """
@@ -36,7 +129,10 @@ class BlogPost(
         content (str): The main content of the blog post
         featured_image (ForeignKey): An optional featured image for the blog post
         reading_time_minutes (int): Estimated reading time in minutes
+        category (str): Optional category, used to group posts on the blog
         tags (str): Comma-separated tags for the blog post
+        tag_set (ManyToManyField): The tags as Tag rows (through BlogPostTag),
+            synced from `tags` on save
 
     Behaviors:
         Timestampable: Tracks creation and modification dates
@@ -46,14 +142,19 @@ class BlogPost(
         Locatable: Associates the post with a geographical location
         Permalinkable: Provides a slug field for SEO-friendly URLs
         Annotatable: Allows notes to be attached to the blog post
+        Searchable: Full-text search over the title, subtitle, tags and content
 
     Properties:
         summary (str): Returns a shortened version of the content for previews
+        excerpt (str): The subtitle, or the summary if there is none
+        tag_list (list): The tags as a list
         is_featured (bool): Indicates if this is a featured post based on tag
         reading_time_display (str): Human-readable representation of reading time
         slug_source (str): Source field for generating the permalink slug
     """
 
+    search_weights = {"title": "A", "subtitle": "B", "tags": "B", "content": "C"}
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField(max_length=255)
     subtitle = models.CharField(max_length=255, blank=True, default="")
@@ -66,7 +167,16 @@ class BlogPost(
         related_name="featured_blog_posts",
     )
     reading_time_minutes = models.PositiveIntegerField(default=3)
+    category = models.CharField(max_length=100, blank=True, default="")
     tags = models.CharField(max_length=255, blank=True, default="")
+    tag_set = models.ManyToManyField(
+        "common.Tag",
+        through="common.BlogPostTag",
+        related_name="posts",
+        blank=True,
+    )
+
+    objects = BlogPostManager()
 
     # MODEL PROPERTIES
     @property
@@ -76,6 +186,16 @@ class BlogPost(
             return self.content
         return f"{self.content[:197]}..."
 
+    @property
+    def excerpt(self):
+        """Returns the subtitle, or the summary if there is none."""
+        return self.subtitle or self.summary
+
+    @property
+    def tag_list(self):
+        """Returns the tags as a list."""
+        return [tag.strip() for tag in self.tags.split(",") if tag.strip()]
+
     @property
     def is_featured(self):
         """Determines if this is a featured post based on tags."""
@@ -107,21 +227,157 @@ class BlogPost(
 
     def add_tag(self, tag):
         """Adds a tag to the blog post."""
-        tag = tag.strip().lower()
-        tags = self.tags.split(",") if self.tags else []
-        if tag not in tags:
-            tags.append(tag)
-            self.tags = ",".join(filter(None, tags))
+        tag = Tag.normalize(tag)
+        if tag not in {Tag.normalize(name) for name in self.tag_list}:
+            self.tags = ",".join(filter(None, self.tag_list + [tag]))
 
     def remove_tag(self, tag):
         """Removes a tag from the blog post."""
-        tag = tag.strip().lower()
-        tags = self.tags.split(",") if self.tags else []
-        if tag in tags:
-            tags.remove(tag)
-            self.tags = ",".join(filter(None, tags))
+        tag = Tag.normalize(tag)
+        self.tags = ",".join(
+            name for name in self.tag_list if Tag.normalize(name) != tag
+        )
+
+    def sync_tags(self) -> set:
+        """
+        Makes the post's BlogPostTag rows match its `tags` field.
+
+        Returns the ids of the tags the post had or now has, whose live
+        post counts may have changed.
+        """
+        return sync_post_tags([self])
 
     class Meta:
         verbose_name = "Blog Post"
         verbose_name_plural = "Blog Posts"
         ordering = ["-published_at", "-created_at"]
+        indexes = [
+            # Listing live posts, newest first (BlogPost.objects.live())
+            models.Index(
+                fields=["-published_at", "-id"],
+                condition=Q(published_at__isnull=False),
+                name="blogpost_published_idx",
+            ),
+            models.Index(
+                fields=["unpublished_at"],
+                condition=Q(unpublished_at__isnull=False),
+                name="blogpost_unpublished_idx",
+            ),
+            models.Index(
+                fields=["expired_at"],
+                condition=Q(expired_at__isnull=False),
+                name="blogpost_expired_idx",
+            ),
+            # Bounding box prefilter of within_radius()
+            models.Index(
+                fields=["latitude", "longitude"], name="blogpost_location_idx"
+            ),
+        ]
+
+
+def sync_post_tags(posts) -> set:
+    """
+    Makes the BlogPostTag rows of saved posts match their `tags` fields,
+    with a fixed number of queries however many posts there are.
+
+    Returns the ids of the tags the posts had or now have, whose live post
+    counts may have changed.
+    """
+    names = {post.pk: {Tag.normalize(tag) for tag in post.tag_list} for post in posts}
+    if not names:
+        return set()
+
+    all_names = set().union(*names.values())
+    if all_names:
+        Tag.objects.bulk_create(
+            [Tag(name=name) for name in all_names], ignore_conflicts=True
+        )
+    tag_ids = dict(Tag.objects.filter(name__in=all_names).values_list("name", "id"))
+    wanted = {
+        (pk, tag_ids[name]) for pk, post_names in names.items() for name in post_names
+    }
+
+    current = {
+        (post_id, tag_id): pk
+        for pk, post_id, tag_id in BlogPostTag.objects.filter(
+            post__in=names.keys()
+        ).values_list("pk", "post_id", "tag_id")
+    }
+    stale = [pk for pair, pk in current.items() if pair not in wanted]
+    if stale:
+        BlogPostTag.objects.filter(pk__in=stale).delete()
+    added = wanted - current.keys()
+    if added:
+        BlogPostTag.objects.bulk_create(
+            [BlogPostTag(post_id=post_id, tag_id=tag_id) for post_id, tag_id in added],
+            ignore_conflicts=True,
+        )
+
+    return {tag_id for _, tag_id in wanted | current.keys()}
+
+
+def refresh_tag_counts(tags=None) -> int:
+    """
+    Recounts the live posts of the given tags (ids or a Tag queryset), or of
+    every tag, in one UPDATE. Returns the number of tags updated.
+
+    These keep the counts current on their own:
+
+    - saving or deleting a post,
+    - BlogPost.objects.bulk_create() and bulk_update(), which also sync the
+      posts' BlogPostTag rows when `tags` changes,
+    - BlogPost.objects.publish(), unpublish() and expire().
+
+    These don't, and need `manage.py refresh_tag_counts` afterwards:
+
+    - posts going live or expiring as time passes (run it periodically),
+    - queryset update() of the publishing fields,
+    - seeding.bulk_insert() and raw SQL, which skip the manager; run it with
+      `--sync` to also rebuild the BlogPostTag rows from `tags`.
+    """
+    live_posts = (
+        BlogPostTag.objects.filter(tag=OuterRef("pk"), post__in=BlogPost.objects.live())
+        .order_by()
+        .values("tag")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    queryset = Tag.objects.all() if tags is None else Tag.objects.filter(pk__in=tags)
+    return queryset.update(post_count=Coalesce(Subquery(live_posts), 0))
+
+
+@receiver(post_save, sender=BlogPost)
+def update_tags(sender, instance, raw=False, **kwargs):
+    """
+    Signal handler that syncs a saved blog post's tags and their counts.
+
+    Fixture loading (raw saves) is skipped; fixtures include the
+    BlogPostTag rows.
+    """
+    if raw:
+        return
+    refresh_tag_counts(instance.sync_tags())
+
+
+@receiver(post_delete, sender=BlogPost)
+def update_tag_counts(sender, instance, **kwargs):
+    """
+    Signal handler that recounts a deleted blog post's tags.
+
+    Its BlogPostTag rows are already deleted (cascade) by now.
+    """
+    names = [Tag.normalize(tag) for tag in instance.tag_list]
+    if names:
+        refresh_tag_counts(Tag.objects.filter(name__in=names))
+
+
+# Connected after the tag handlers, so the cache is invalidated once the
+# tag counts are up to date
+@receiver(post_save, sender=BlogPost)
+@receiver(post_delete, sender=BlogPost)
+def invalidate_blog_cache(sender, instance, **kwargs):
+    """
+    Signal handler that invalidates the cached blog sidebar and pages
+    when a blog post is saved or deleted.
+    """
+    invalidate_namespace(BLOG_CACHE_NAMESPACE)
@@ -1,9 +1,12 @@
 import uuid
 
-from django.db import models
-from django.db.models.signals import pre_save
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
+from apps.common.behaviors import BehaviorManager
+from apps.common.utilities.reference_data import invalidate_reference_data, resolve
+
 
 class City(models.Model):
     """
@@ -22,6 +25,9 @@ class City(models.Model):
     Properties:
         currency (Currency): The currency used in this city, inherited from the country
 
+    The country and currency are read from the reference data registry
+    (apps/common/utilities/reference_data.py), so they don't query per city.
+
     Note:
         The code field is automatically converted to lowercase before saving.
 
@@ -46,6 +52,9 @@ class City(models.Model):
         "common.Country", related_name="cities", null=False, on_delete=models.PROTECT
     )
 
+    # Lowercases codes in bulk_create/bulk_update too
+    objects = BehaviorManager()
+
     # MODEL PROPERTIES
     @property
     def currency(self):
@@ -58,7 +67,7 @@ class City(models.Model):
         Returns:
             Currency: The currency used in this city
         """
-        return self.country.currency
+        return resolve(resolve(self, "country"), "currency")
 
     # MODEL FUNCTIONS
     def __str__(self) -> str:
@@ -68,7 +77,7 @@ class City(models.Model):
         Returns:
             str: A formatted string with city name, country name, and code
         """
-        return f"{self.name}, {self.country.name} ({self.code})"
+        return f"{self.name}, {resolve(self, 'country').name} ({self.code})"
 
     class Meta:
         verbose_name_plural = "cities"
@@ -89,3 +98,15 @@ def lowercase_code(sender, instance, **kwargs):
     """
     if instance.code:
         instance.code = instance.code.lower()
+
+
+@receiver(post_save, sender=City)
+@receiver(post_delete, sender=City)
+def invalidate_reference_data_cache(sender, using=None, **kwargs):
+    """
+    Signal handler that makes every process reload the reference data
+    registry: now in this process, and again once the change is committed,
+    so other processes don't reload before they can see it.
+    """
+    invalidate_reference_data()
+    transaction.on_commit(invalidate_reference_data, using=using)
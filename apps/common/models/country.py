@@ -1,9 +1,12 @@
 import uuid
 
-from django.db import models
-from django.db.models.signals import pre_save
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
+from apps.common.behaviors import BehaviorManager
+from apps.common.utilities.reference_data import invalidate_reference_data
+
 
 class Country(models.Model):
     """
@@ -57,6 +60,9 @@ class Country(models.Model):
         on_delete=models.SET_NULL,
     )
 
+    # Lowercases codes in bulk_create/bulk_update too
+    objects = BehaviorManager()
+
     # MODEL PROPERTIES
 
     # MODEL FUNCTIONS
@@ -100,3 +106,15 @@ def lowercase_code(sender, instance, **kwargs):
     """
     if instance.code:
         instance.code = instance.code.lower()
+
+
+@receiver(post_save, sender=Country)
+@receiver(post_delete, sender=Country)
+def invalidate_reference_data_cache(sender, using=None, **kwargs):
+    """
+    Signal handler that makes every process reload the reference data
+    registry: now in this process, and again once the change is committed,
+    so other processes don't reload before they can see it.
+    """
+    invalidate_reference_data()
+    transaction.on_commit(invalidate_reference_data, using=using)
@@ -1,10 +1,11 @@
 import uuid
 
-from django.db import models
-from django.db.models.signals import pre_save
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
 from apps.common.behaviors import Timestampable
+from apps.common.utilities.reference_data import invalidate_reference_data
 
 
 class Currency(Timestampable, models.Model):
@@ -98,3 +99,15 @@ def lowercase_code(sender, instance, **kwargs):
     """
     if instance.code:
         instance.code = instance.code.lower()
+
+
+@receiver(post_save, sender=Currency)
+@receiver(post_delete, sender=Currency)
+def invalidate_reference_data_cache(sender, using=None, **kwargs):
+    """
+    Signal handler that makes every process reload the reference data
+    registry: now in this process, and again once the change is committed,
+    so other processes don't reload before they can see it.
+    """
+    invalidate_reference_data()
+    transaction.on_commit(invalidate_reference_data, using=using)
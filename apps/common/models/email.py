@@ -1,20 +1,26 @@
 # No need for datetime import as we use timezone.now() instead
-import urllib.request
-
 from django.core.mail import EmailMessage
 from django.db import models
 from django.utils import timezone
 
-from apps.common.behaviors import timestampable
+from apps.common.behaviors import SearchableManager, searchable, timestampable
 from apps.common.models.upload import Upload
 
 
-class Email(timestampable.Timestampable, models.Model):
+class Email(timestampable.Timestampable, searchable.Searchable, models.Model):
     """
     Email model for storing email messages and their metadata.
     Used for sending emails, tracking delivery status, and logging.
+    Subjects, addresses and bodies are full-text searchable.
     """
 
+    search_weights = {
+        "subject": "A",
+        "to_address": "B",
+        "from_address": "B",
+        "body": "C",
+    }
+
     to_address = models.CharField(max_length=140)
     from_address = models.CharField(
         max_length=140, default="Support <support@example.com>"
@@ -36,10 +42,40 @@ class Email(timestampable.Timestampable, models.Model):
         choices=TYPE_CHOICES, null=True, blank=True, default=NOTIFICATION
     )
 
+    # Outbox statuses
+    STATUS_DRAFT = "draft"
+    STATUS_QUEUED = "queued"
+    STATUS_SENDING = "sending"
+    STATUS_SENT = "sent"
+    STATUS_FAILED = "failed"
+
+    STATUS_CHOICES = [
+        (STATUS_DRAFT, "Draft"),
+        (STATUS_QUEUED, "Queued"),
+        (STATUS_SENDING, "Sending"),
+        (STATUS_SENT, "Sent"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
     # Tracking fields
     sent_at = models.DateTimeField(null=True, blank=True)
     read_at = models.DateTimeField(null=True, blank=True)
 
+    # Outbox fields
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default=STATUS_DRAFT
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(null=True, blank=True)
+
+    objects = SearchableManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"]),
+        ]
+
     def __str__(self):
         """String representation of the Email."""
         return f"Email to {self.to_address}: {self.subject}"
@@ -65,6 +101,38 @@ class Email(timestampable.Timestampable, models.Model):
         self.to_address = user_object.email
         return self.send()
 
+    def build_message(self, attachment_files=None):
+        """
+        Configures the Django EmailMessage object for this email.
+
+        Args:
+            attachment_files: Optional list of (file_name, content) tuples that
+                              were already fetched. When omitted, attachments
+                              are fetched concurrently from S3 or their URL.
+
+        Returns:
+            EmailMessage: The configured message
+        """
+        # Create message object if not already created
+        if not hasattr(self, "email"):
+            self.email = self.createMessageObject()
+
+        # Configure email message
+        self.email.subject = self.subject
+        self.email.body = self.body
+        self.email.from_email = self.from_address
+        self.email.to = [self.to_address]
+
+        # Add attachments if any
+        if attachment_files is None:
+            from apps.common.utilities.email import fetch_attachments
+
+            attachment_files = fetch_attachments(self.attachments.all())
+        for file_name, content in attachment_files:
+            self.email.attach(file_name, content)
+
+        return self.email
+
     def send(self, require_confirmation=False):
         """
         Prepares and sends the email.
@@ -83,23 +151,8 @@ class Email(timestampable.Timestampable, models.Model):
         # Save before sending
         self.save()
 
-        # Create message object if not already created
-        if not hasattr(self, "email"):
-            self.email = self.createMessageObject()
-
-        # Configure email message
-        self.email.subject = self.subject
-        self.email.body = self.body
-        self.email.from_email = self.from_address
-        self.email.to = [self.to_address]
-
-        # Add attachments if any
-        for attachment in self.attachments.all():
-            file_name = f"{attachment.name or 'attachment'}{attachment.file_extension}"
-            file_via_url = urllib.request.urlopen(attachment.original)
-            self.email.attach(file_name, file_via_url.read())
-
         if require_confirmation:
+            self.build_message()
             return self.send_now()
         else:
             self.send_later()
@@ -115,16 +168,23 @@ class Email(timestampable.Timestampable, models.Model):
         try:
             self.email.send(fail_silently=False)
             self.sent_at = timezone.now()
-            self.save(update_fields=["sent_at"])
+            self.status = self.STATUS_SENT
+            self.save(update_fields=["sent_at", "status"])
             return True
         except Exception:
             return False
 
     def send_later(self):
-        """Queues the email for sending later (e.g., via Celery task)."""
-        # In a real implementation, this would add the email to a queue
-        # For now, we'll just simulate sending
-        self.send_now()
+        """
+        Queues the email in the outbox.
+
+        Queued emails are delivered in batches by
+        `apps.common.utilities.email.process_email_outbox`
+        (see the `process_email_outbox` management command).
+        """
+        self.status = self.STATUS_QUEUED
+        self.next_attempt_at = timezone.now()
+        self.save(update_fields=["status", "next_attempt_at"])
 
     def mark_as_read(self):
         """Marks the email as having been read by the recipient."""
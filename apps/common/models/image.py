@@ -188,3 +188,23 @@ class Image(models.Model):
             return title
 
         return ""
+
+    def get_thumbnail_url(self, expiration=3600):
+        """
+        Get a URL for the image's thumbnail.
+
+        A generated "thumbnail" variant (see apps.integration.aws.image_variants)
+        is private like the original, so it is linked with a cached pre-signed
+        URL. Otherwise the stored thumbnail_url is returned.
+
+        Args:
+            expiration: URL expiration time in seconds (default: 1 hour)
+
+        Returns:
+            str or None: The thumbnail URL, or None if there is none
+        """
+        if self.upload and self.upload.variant_key("thumbnail"):
+            return self.upload.get_presigned_url(
+                expiration=expiration, variant="thumbnail"
+            )
+        return self.thumbnail_url or None
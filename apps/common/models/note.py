@@ -2,16 +2,22 @@ import uuid
 
 from django.db import models
 
-from apps.common.behaviors import Authorable, Timestampable
+from apps.common.behaviors import (
+    Authorable,
+    Searchable,
+    SearchableManager,
+    Timestampable,
+)
 
 
-class Note(Timestampable, Authorable, models.Model):
+class Note(Timestampable, Authorable, Searchable, models.Model):
     """
     A model representing a text note or comment.
 
     This model provides a versatile way to add notes to various entities through
     the Annotatable behavior. It includes author tracking via the Authorable behavior
-    and timestamps via the Timestampable behavior.
+    and timestamps via the Timestampable behavior. The text is full-text
+    searchable (Searchable behavior).
 
     Attributes:
         id (UUID): Unique identifier for the note
@@ -33,9 +39,13 @@ class Note(Timestampable, Authorable, models.Model):
         ```
     """
 
+    search_weights = {"text": "A"}
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     text = models.TextField(default="", blank=True)
 
+    objects = SearchableManager()
+
     # MODEL PROPERTIES
     @property
     def summary(self) -> str:
@@ -0,0 +1,67 @@
+import uuid
+
+from django.db import models
+
+
+class Tag(models.Model):
+    """
+    A normalized tag, attached to blog posts through BlogPostTag.
+
+    BlogPost keeps its comma-separated `tags` field as the editable value;
+    saving a post syncs its BlogPostTag rows from it (see
+    `BlogPost.sync_tags()`), so "posts tagged X" and tag counts are indexed
+    queries instead of string parsing.
+
+    Attributes:
+        id (UUID): Unique identifier for the tag
+        name (str): The tag, lowercased (unique)
+        post_count (int): Number of live posts with this tag, kept up to date
+            by `refresh_tag_counts()`
+
+    Example:
+        ```python
+        popular = Tag.objects.filter(post_count__gt=0).order_by("-post_count")[:10]
+        posts = BlogPost.objects.live().filter(post_tags__tag__name="python")
+        ```
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    name = models.CharField(max_length=255, unique=True)
+    post_count = models.PositiveIntegerField(default=0, editable=False)
+
+    def __str__(self):
+        return self.name
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Returns the stored form of a tag name."""
+        return name.strip().lower()
+
+    class Meta:
+        ordering = ["name"]
+        indexes = [
+            # Popular tags (the blog sidebar)
+            models.Index(fields=["-post_count", "name"], name="tag_popular_idx"),
+        ]
+
+
+class BlogPostTag(models.Model):
+    """A tag on a blog post (the through model of BlogPost.tag_set)."""
+
+    post = models.ForeignKey(
+        "common.BlogPost", on_delete=models.CASCADE, related_name="post_tags"
+    )
+    tag = models.ForeignKey(
+        "common.Tag", on_delete=models.CASCADE, related_name="post_tags"
+    )
+
+    def __str__(self):
+        return f"{self.post} #{self.tag}"
+
+    class Meta:
+        constraints = [
+            # Also the index for finding the posts with a tag
+            models.UniqueConstraint(
+                fields=["tag", "post"], name="unique_blog_post_tag"
+            ),
+        ]
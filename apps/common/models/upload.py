@@ -29,6 +29,8 @@ class Upload(Timestampable, models.Model):
         size (int): The size of the file in bytes.
         status (str): The status of the upload (pending, processing, complete, error).
         error (str): Error message if upload failed.
+        variants_status (str): Image variant generation status, blank if none.
+        variants_claimed_at (datetime): When a worker claimed the upload's variants.
 
     Properties:
         file_type (str): The type of the file, extracted from the metadata.
@@ -77,6 +79,10 @@ class Upload(Timestampable, models.Model):
     )
     error = models.TextField(blank=True, null=True)
 
+    # Image variant queue (see apps.integration.aws.image_variants)
+    variants_status = models.CharField(max_length=20, blank=True, default="")
+    variants_claimed_at = models.DateTimeField(blank=True, null=True)
+
     class Meta:
         verbose_name = "Upload"
         verbose_name_plural = "Uploads"
@@ -84,6 +90,7 @@ class Upload(Timestampable, models.Model):
         indexes = [
             models.Index(fields=["status"]),
             models.Index(fields=["s3_bucket", "s3_key"]),
+            models.Index(fields=["variants_status", "variants_claimed_at"]),
         ]
 
     def __str__(self):
@@ -200,12 +207,29 @@ class Upload(Timestampable, models.Model):
             return f"https://{self.s3_bucket}.s3.amazonaws.com/{self.s3_key}"
         return self.original
 
-    def get_presigned_url(self, expiration=3600):
+    @property
+    def variants(self):
+        """Generated image variants by name (see apps.integration.aws.image_variants)."""
+        if self.meta_data and "variants" in self.meta_data:
+            return self.meta_data["variants"]
+        return {}
+
+    def variant_key(self, name):
+        """Get the S3 key of a generated variant, or None if it doesn't exist."""
+        variant = self.variants.get(name)
+        return variant.get("key") if variant else None
+
+    def get_presigned_url(self, expiration=3600, variant=None):
         """
         Generate a pre-signed URL for accessing the file.
 
+        URLs are cached per expiry bucket (see apps.integration.aws.presigned_urls),
+        so repeated calls do not build a client or sign again.
+
         Args:
             expiration: URL expiration time in seconds (default: 1 hour)
+            variant: Name of a generated variant (e.g. "thumbnail") to link to
+                     instead of the original, if it exists
 
         Returns:
             str: Pre-signed URL or original URL if not in S3
@@ -214,18 +238,13 @@ class Upload(Timestampable, models.Model):
             return self.original
 
         try:
-            from apps.integration.aws.s3 import S3Client
+            from apps.integration.aws.presigned_urls import presign
 
-            client = S3Client(aws_s3_bucket_name=self.s3_bucket)
-
-            result = client.generate_presigned_url(
-                object_key=self.s3_key, expiration=expiration
-            )
-
-            if result.get("success"):
-                return result.get("url")
+            key = (variant and self.variant_key(variant)) or self.s3_key
+            url = presign(self.s3_bucket, key, expiration=expiration)
+            if url:
+                return url
 
-            logger.error(f"Failed to generate pre-signed URL: {result.get('error')}")
             return self.s3_url
 
         except Exception as e:
@@ -251,6 +270,8 @@ class Upload(Timestampable, models.Model):
             client = S3Client(aws_s3_bucket_name=self.s3_bucket)
 
             result = client.delete_object(object_key=self.s3_key)
+            for variant in self.variants.values():
+                client.delete_object(object_key=variant["key"])
 
             if result.get("success"):
                 logger.info(f"Deleted file from S3: {self.s3_bucket}/{self.s3_key}")
@@ -28,6 +28,7 @@ from apps.common.models import (
     TeamMember,
     Upload,
 )
+from apps.common.utilities.database import seeding
 
 User = get_user_model()
 T = TypeVar("T", bound=models.Model)
@@ -55,6 +56,25 @@ class ModelFactory:
         data.update(kwargs)
         return cls.model_class(**data)
 
+    @classmethod
+    def build_batch(cls, count: int, start: int = 0, **kwargs) -> list[T]:
+        """
+        Build `count` unsaved instances.
+
+        Values may be callables taking the row index, e.g.
+        `username=lambda i: f"user_{i}"`.
+        """
+        return seeding.build_batch(cls, count, start=start, **kwargs)
+
+    @classmethod
+    def create_batch(
+        cls, count: int, batch_size: int = 1000, use_copy: bool = False, **kwargs
+    ) -> list[T]:
+        """Create `count` instances with chunked bulk inserts (no post_save)."""
+        instances = cls.build_batch(count, **kwargs)
+        seeding.bulk_insert(instances, batch_size=batch_size, use_copy=use_copy)
+        return instances
+
 
 class UserFactory(ModelFactory):
     """Factory for User model."""
@@ -3,12 +3,15 @@ Tests for the Django admin customizations.
 """
 
 import warnings
+from unittest import mock
 
+from django.contrib import admin
 from django.contrib.auth import get_user_model
-from django.test import Client, TestCase, override_settings
+from django.test import Client, RequestFactory, TestCase, override_settings
 from django.utils import timezone
 
-from apps.common.models import Role, Team, TeamMember
+from apps.common.admin import ImageAdmin
+from apps.common.models import Image, Role, Team, TeamMember, Upload
 from apps.common.tests.factories import UserFactory
 
 # Override settings for testing
@@ -102,3 +105,41 @@ class AdminTestCase(TestCase):
         # Check for modules that should be in the admin
         self.assertContains(response, "Common")
         self.assertContains(response, "Users")
+
+
+class PresignedPreviewAdminTestCase(TestCase):
+    """Test cases for batch-presigned previews on admin list pages."""
+
+    def setUp(self):
+        self.superuser = get_user_model().objects.create_superuser(
+            username="preview_admin", email="preview_admin@example.com"
+        )
+        self.uploads = [
+            Upload.objects.create(
+                s3_bucket="test-bucket",
+                s3_key=f"images/{i}.jpg",
+                content_type="image/jpeg",
+            )
+            for i in range(3)
+        ]
+        for upload in self.uploads:
+            Image.objects.create(upload=upload)
+
+    @mock.patch("apps.integration.aws.presigned_urls.presign_many")
+    def test_image_changelist_presigns_in_one_batch(self, mock_presign_many):
+        """Test that the changelist presigns all rows with one call."""
+        mock_presign_many.return_value = {
+            upload.pk: f"https://signed/{upload.s3_key}" for upload in self.uploads
+        }
+        request = RequestFactory().get("/admin/common/image/")
+        request.user = self.superuser
+        model_admin = ImageAdmin(Image, admin.site)
+
+        changelist = model_admin.get_changelist_instance(request)
+
+        mock_presign_many.assert_called_once()
+        previews = [model_admin.preview(obj) for obj in changelist.result_list]
+        for upload in self.uploads:
+            self.assertTrue(
+                any(f"https://signed/{upload.s3_key}" in p for p in previews)
+            )
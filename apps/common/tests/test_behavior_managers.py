@@ -0,0 +1,160 @@
+"""
+Tests for BehaviorQuerySet (apps/common/behaviors/managers.py).
+"""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.common.models import BlogPost, City, Country, Currency, Team
+from apps.common.tests.factories import UserFactory
+
+
+class BehaviorQuerySetTestCase(TestCase):
+    """Test cases for behavior rules in bulk operations and querysets."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory.create()
+
+    def test_bulk_create_normalises(self):
+        """Test that bulk_create lowercases codes and allocates slugs."""
+        currency = Currency.objects.create(code="THB", name="Baht")
+        Country.objects.bulk_create(
+            [Country(name="Thailand", code="TH", currency=currency)]
+        )
+        City.objects.bulk_create(
+            [City(name="Bangkok", code="BKK", country=Country.objects.get())]
+        )
+        BlogPost.objects.create(title="Hello", author=self.user)
+        BlogPost.objects.bulk_create(
+            [BlogPost(title="Hello", author=self.user) for _ in range(2)]
+        )
+
+        self.assertEqual(Country.objects.get().code, "th")
+        self.assertEqual(City.objects.get().code, "bkk")
+        self.assertEqual(
+            sorted(BlogPost.objects.values_list("slug", flat=True)),
+            ["hello", "hello-2", "hello-3"],
+        )
+
+    def test_bulk_update_normalises_and_stamps(self):
+        """Test that bulk_update lowercases codes and sets modified_at."""
+        currency = Currency.objects.create(code="usd", name="US Dollar")
+        before = currency.modified_at
+        currency.code = "EUR"
+
+        Currency.objects.bulk_update([currency], ["code"])
+
+        currency.refresh_from_db()
+        self.assertEqual(currency.code, "eur")
+        self.assertGreater(currency.modified_at, before)
+
+    def test_update_sets_modified_at(self):
+        """Test that update() sets modified_at unless it's given."""
+        team = Team.objects.create(name="Team", slug="team")
+        yesterday = timezone.now() - timedelta(days=1)
+
+        Team.objects.filter(pk=team.pk).update(modified_at=yesterday)
+        team.refresh_from_db()
+        self.assertEqual(team.modified_at, yesterday)
+
+        Team.objects.filter(pk=team.pk).update(name="Renamed")
+        team.refresh_from_db()
+        self.assertGreater(team.modified_at, yesterday)
+
+    def test_publish_and_unpublish(self):
+        """Test that publish() and unpublish() change rows in one UPDATE."""
+        # BlogPost also reads the posts' tags first, to recount them
+        draft = BlogPost.objects.create(title="Draft", author=self.user)
+        live = BlogPost.objects.create(title="Live", author=self.user)
+        live.publish()
+        live.save()
+        published_at = live.published_at
+
+        with self.assertNumQueries(2):
+            self.assertEqual(BlogPost.objects.all().publish(), 1)
+        draft.refresh_from_db()
+        live.refresh_from_db()
+        self.assertTrue(draft.is_published)
+        self.assertEqual(live.published_at, published_at)
+
+        with self.assertNumQueries(2):
+            self.assertEqual(BlogPost.objects.filter(pk=live.pk).unpublish(), 1)
+        live.refresh_from_db()
+        self.assertFalse(live.is_published)
+        self.assertEqual(live.publication_status, "Unpublished")
+
+    def test_expire(self):
+        """Test that expire() only expires rows that haven't expired."""
+        expired_at = timezone.now() - timedelta(days=1)
+        old = BlogPost.objects.create(
+            title="Old", author=self.user, expired_at=expired_at
+        )
+        current = BlogPost.objects.create(title="Current", author=self.user)
+
+        # One UPDATE, after reading the posts' tags (see test above)
+        with self.assertNumQueries(2):
+            self.assertEqual(BlogPost.objects.expire(), 1)
+        old.refresh_from_db()
+        current.refresh_from_db()
+        self.assertEqual(old.expired_at, expired_at)
+        self.assertTrue(current.is_expired)
+
+    def test_published_and_live(self):
+        """Test that published() and live() match the instance properties."""
+        now = timezone.now()
+        posts = {
+            "draft": {},
+            "live": {"published_at": now - timedelta(days=1)},
+            "scheduled": {"published_at": now + timedelta(days=1)},
+            "unpublished": {
+                "published_at": now - timedelta(days=2),
+                "unpublished_at": now - timedelta(days=1),
+            },
+            "expired": {
+                "published_at": now - timedelta(days=2),
+                "expired_at": now - timedelta(days=1),
+            },
+            "not yet valid": {
+                "published_at": now - timedelta(days=2),
+                "valid_at": now + timedelta(days=1),
+            },
+        }
+        for title, fields in posts.items():
+            BlogPost.objects.create(title=title, author=self.user, **fields)
+
+        published = BlogPost.objects.published().values_list("title", flat=True)
+        self.assertEqual(sorted(published), ["expired", "live", "not yet valid"])
+        self.assertEqual(
+            sorted(published),
+            sorted(post.title for post in BlogPost.objects.all() if post.is_published),
+        )
+        self.assertEqual(
+            list(BlogPost.objects.live().values_list("title", flat=True)), ["live"]
+        )
+
+    def test_expiring_within(self):
+        """Test that expiring_within() finds live rows expiring soon."""
+        now = timezone.now()
+        for days in (1, 10):
+            BlogPost.objects.create(
+                title=f"In {days} days",
+                author=self.user,
+                published_at=now - timedelta(days=1),
+                expired_at=now + timedelta(days=days),
+            )
+        BlogPost.objects.create(
+            title="Draft", author=self.user, expired_at=now + timedelta(days=1)
+        )
+
+        expiring = BlogPost.objects.expiring_within(timedelta(days=2))
+        self.assertEqual(list(expiring.values_list("title", flat=True)), ["In 1 days"])
+
+    def test_transitions_need_the_behavior(self):
+        """Test that publish() fails on models that aren't Publishable."""
+        with self.assertRaises(TypeError):
+            Currency.objects.publish()
+        with self.assertRaises(TypeError):
+            Currency.objects.live()
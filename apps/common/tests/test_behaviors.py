@@ -520,8 +520,11 @@ class TestPermalinkableDirect(unittest.TestCase):
         instance = TestPermalinkable()
         instance.slug = None  # Ensure slug is None
 
-        # Call the pre_save_slug handler
-        pre_save_slug(TestPermalinkable, instance)
+        # Call the pre_save_slug handler (with no existing slugs)
+        with mock.patch(
+            "apps.common.behaviors.permalinkable.taken_slugs", return_value=set()
+        ):
+            pre_save_slug(TestPermalinkable, instance)
 
         # Verify slug was set correctly
         self.assertEqual(instance.slug, slugify("Test Title"))
@@ -0,0 +1,175 @@
+"""
+Tests for the read-through cache utilities.
+"""
+
+import time
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from apps.common.utilities import cache as cache_utils
+from apps.common.utilities.cache import (
+    cached,
+    get_cache_stats,
+    get_or_compute,
+    invalidate_namespace,
+    make_key,
+    reset_cache_stats,
+)
+
+LOCMEM_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "test-read-through-cache",
+    }
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class GetOrComputeTestCase(SimpleTestCase):
+    """Tests for get_or_compute."""
+
+    def setUp(self):
+        cache.clear()
+        reset_cache_stats()
+        self.calls = 0
+
+    def compute(self):
+        self.calls += 1
+        return {"value": self.calls}
+
+    def test_computes_once_then_hits(self):
+        """Test that the value is computed on a miss and then served from cache."""
+        first = get_or_compute("key", self.compute, namespace="tests")
+        second = get_or_compute("key", self.compute, namespace="tests")
+
+        self.assertEqual(first, {"value": 1})
+        self.assertEqual(second, {"value": 1})
+        self.assertEqual(self.calls, 1)
+
+        counters = get_cache_stats()["tests"]
+        self.assertEqual(counters["hits"], 1)
+        self.assertEqual(counters["misses"], 1)
+        self.assertEqual(counters["hit_ratio"], 0.5)
+
+    def test_none_is_cached(self):
+        """Test that None results are cached too."""
+        compute = []
+        get_or_compute("none", lambda: compute.append(1), namespace="tests")
+        get_or_compute("none", lambda: compute.append(1), namespace="tests")
+
+        self.assertEqual(len(compute), 1)
+
+    def test_invalidate_namespace(self):
+        """Test that bumping the namespace version invalidates its keys."""
+        get_or_compute("key", self.compute, namespace="tests")
+        get_or_compute("other", self.compute, namespace="other")
+        old_key = make_key("key", "tests")
+
+        invalidate_namespace("tests")
+
+        self.assertNotEqual(make_key("key", "tests"), old_key)
+        self.assertEqual(
+            get_or_compute("key", self.compute, namespace="tests"), {"value": 3}
+        )
+        self.assertEqual(
+            get_or_compute("other", self.compute, namespace="other"), {"value": 2}
+        )
+
+    def test_early_refresh_near_expiry(self):
+        """Test that an entry close to expiry is refreshed ahead of time."""
+        get_or_compute("key", self.compute, ttl=60, namespace="tests")
+
+        # Pretend the computation is slow relative to the time left
+        full_key = make_key("key", "tests")
+        value, _, _ = cache.get(full_key)
+        cache.set(full_key, (value, 1000.0, time.time() + 1), 60)
+
+        with patch.object(cache_utils.random, "random", return_value=0.5):
+            result = get_or_compute("key", self.compute, ttl=60, namespace="tests")
+
+        self.assertEqual(result, {"value": 2})
+        self.assertEqual(get_cache_stats()["tests"]["early_refreshes"], 1)
+
+    def test_failed_early_refresh_serves_cached_value(self):
+        """Test that an error during an early refresh returns the cached value."""
+        get_or_compute("key", self.compute, ttl=60, namespace="tests")
+        full_key = make_key("key", "tests")
+        value, _, _ = cache.get(full_key)
+        cache.set(full_key, (value, 1000.0, time.time() + 1), 60)
+
+        def fail():
+            raise RuntimeError("database down")
+
+        with patch.object(cache_utils.random, "random", return_value=0.5):
+            with self.assertLogs(cache_utils.logger, "ERROR"):
+                result = get_or_compute("key", fail, ttl=60, namespace="tests")
+
+        self.assertEqual(result, {"value": 1})
+        self.assertIsNone(cache.get(f"{full_key}:lock"))
+        # A miss has no value to fall back on
+        with self.assertRaises(RuntimeError):
+            get_or_compute("missing", fail, namespace="tests")
+
+    def test_locked_key_serves_stale_value(self):
+        """Test that readers keep the old value while another process refreshes."""
+        get_or_compute("key", self.compute, ttl=60, namespace="tests")
+        full_key = make_key("key", "tests")
+        value, _, _ = cache.get(full_key)
+        cache.set(full_key, (value, 1000.0, time.time() + 1), 60)
+        cache.add(f"{full_key}:lock", 1)
+
+        result = get_or_compute("key", self.compute, ttl=60, namespace="tests")
+
+        self.assertEqual(result, {"value": 1})
+        self.assertEqual(self.calls, 1)
+
+    def test_waits_for_concurrent_compute_on_miss(self):
+        """Test that a miss on a locked key waits for the other process's value."""
+        full_key = make_key("key", "tests")
+        cache.add(f"{full_key}:lock", 1)
+
+        def fill_cache(seconds):
+            cache.set(full_key, ("from other process", 0.1, time.time() + 60), 60)
+
+        with patch.object(cache_utils.time, "sleep", side_effect=fill_cache):
+            result = get_or_compute("key", self.compute, namespace="tests")
+
+        self.assertEqual(result, "from other process")
+        self.assertEqual(self.calls, 0)
+        self.assertEqual(get_cache_stats()["tests"]["lock_waits"], 1)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CachedDecoratorTestCase(SimpleTestCase):
+    """Tests for the cached decorator."""
+
+    def setUp(self):
+        cache.clear()
+        self.calls = []
+
+        @cached(lambda x, y=0: f"add:{x}:{y}", ttl=60, namespace="math")
+        def add(x, y=0):
+            self.calls.append((x, y))
+            return x + y
+
+        self.add = add
+
+    def test_caches_per_key(self):
+        """Test that results are cached per key_fn value."""
+        self.assertEqual(self.add(1, y=2), 3)
+        self.assertEqual(self.add(1, y=2), 3)
+        self.assertEqual(self.add(2), 2)
+
+        self.assertEqual(self.calls, [(1, 2), (2, 0)])
+
+    def test_invalidate(self):
+        """Test that invalidate removes a single entry."""
+        self.add(1)
+        self.add(2)
+        self.add.invalidate(1)
+        self.add(1)
+        self.add(2)
+
+        self.assertEqual(self.calls, [(1, 0), (2, 0), (1, 0)])
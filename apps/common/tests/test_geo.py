@@ -0,0 +1,131 @@
+"""
+Tests for distance queries on Locatable models (utilities/database/geo.py
+and the BehaviorQuerySet methods). They only use SQL math functions, so
+they run on PostgreSQL without PostGIS as well as on SQLite.
+"""
+
+from django.test import SimpleTestCase, TestCase
+
+from apps.common.models import BlogPost, Currency
+from apps.common.tests.factories import UserFactory
+from apps.common.utilities.database.geo import (
+    bounding_box,
+    encode_geohash,
+    haversine_km,
+)
+
+LONDON = (51.5074, -0.1278)
+PARIS = (48.8566, 2.3522)
+OXFORD = (51.7520, -1.2577)
+
+
+class GeoFunctionsTestCase(SimpleTestCase):
+    """Test cases for the distance and geohash functions."""
+
+    def test_haversine(self):
+        """Test the great-circle distance between known points."""
+        self.assertAlmostEqual(haversine_km(*LONDON, *PARIS), 343.6, delta=0.5)
+        self.assertEqual(haversine_km(*LONDON, *LONDON), 0)
+
+    def test_bounding_box_contains_the_circle(self):
+        """Test that points at the radius fall inside the box."""
+        (min_lat, max_lat), [(min_lon, max_lon)] = bounding_box(*LONDON, 100)
+        self.assertLess(min_lat, 51.5074 - 0.89)
+        self.assertGreater(max_lat, 51.5074 + 0.89)
+        # A degree of longitude is shorter away from the equator
+        self.assertGreater(max_lon - min_lon, max_lat - min_lat)
+
+    def test_bounding_box_edges(self):
+        """Test the antimeridian and the poles."""
+        _, longitudes = bounding_box(0, 179.9, 50)
+        self.assertEqual(len(longitudes), 2)
+        self.assertEqual(longitudes[0][1], 180)
+        self.assertEqual(longitudes[1][0], -180)
+
+        latitudes, longitudes = bounding_box(89.9, 0, 50)
+        self.assertEqual(latitudes[1], 90)
+        self.assertEqual(longitudes, [(-180, 180)])
+
+    def test_encode_geohash(self):
+        """Test geohashes against known values."""
+        self.assertEqual(encode_geohash(57.64911, 10.40744, 11), "u4pruydqqvj")
+        self.assertEqual(encode_geohash(*LONDON, 5), "gcpvj")
+
+
+class LocatableQuerySetTestCase(TestCase):
+    """Test cases for within_radius(), nearest() and geohash_clusters()."""
+
+    @classmethod
+    def setUpTestData(cls):
+        author = UserFactory.create()
+
+        def create_post(title, coordinates):
+            latitude, longitude = coordinates or (None, None)
+            return BlogPost.objects.create(
+                title=title,
+                content="Content",
+                author=author,
+                latitude=latitude,
+                longitude=longitude,
+            )
+
+        cls.london = create_post("London", LONDON)
+        cls.oxford = create_post("Oxford", OXFORD)
+        cls.paris = create_post("Paris", PARIS)
+        cls.nowhere = create_post("Nowhere", None)
+
+    def test_geohash_is_set_on_save(self):
+        """Test that saving sets or clears the geohash."""
+        self.assertEqual(self.london.geohash, encode_geohash(*LONDON))
+        self.assertEqual(self.nowhere.geohash, "")
+
+        self.london.latitude = None
+        self.london.save()
+        self.assertEqual(self.london.geohash, "")
+
+    def test_within_radius(self):
+        """Test that only rows within the radius match, with their distance."""
+        results = BlogPost.objects.within_radius(*LONDON, 100)
+        self.assertEqual(set(results), {self.london, self.oxford})
+
+        oxford = results.get(pk=self.oxford.pk)
+        self.assertAlmostEqual(
+            oxford.distance, haversine_km(*LONDON, *OXFORD), places=3
+        )
+        self.assertEqual(
+            set(BlogPost.objects.within_radius(*LONDON, 400)),
+            {self.london, self.oxford, self.paris},
+        )
+
+    def test_nearest(self):
+        """Test that nearest() lists the closest rows first."""
+        self.assertEqual(
+            list(BlogPost.objects.with_distance(*PARIS).nearest(2)),
+            [self.paris, self.london],
+        )
+        self.assertEqual(
+            list(BlogPost.objects.within_radius(*OXFORD, 500).nearest(5)),
+            [self.oxford, self.london, self.paris],
+        )
+        with self.assertRaises(ValueError):
+            BlogPost.objects.nearest(1)
+
+    def test_geohash_clusters(self):
+        """Test that rows are counted per geohash prefix."""
+        clusters = list(BlogPost.objects.geohash_clusters(1))
+        self.assertEqual([cluster["cell"] for cluster in clusters], ["g", "u"])
+        self.assertEqual(clusters[0]["count"], 2)
+        self.assertEqual(clusters[1]["count"], 1)
+        self.assertAlmostEqual(clusters[1]["center_latitude"], PARIS[0])
+
+    def test_bulk_update_sets_geohash(self):
+        """Test that bulk_update() of coordinates updates the geohash."""
+        self.nowhere.latitude, self.nowhere.longitude = PARIS
+        BlogPost.objects.bulk_update([self.nowhere], ["latitude", "longitude"])
+        self.nowhere.refresh_from_db()
+        self.assertEqual(self.nowhere.geohash, encode_geohash(*PARIS))
+
+    def test_distance_needs_the_behavior(self):
+        """Test that distance queries aren't available on other models."""
+        with self.assertRaises(AttributeError):
+            Currency.objects.within_radius(*LONDON, 10)
@@ -1,8 +1,12 @@
 from datetime import timedelta
 
+from django.apps import apps
+from django.db.models.signals import pre_save
 from django.test import TestCase
 from django.utils import timezone
 
+from apps.ai.models import ChatMessage
+from apps.common.behaviors.permalinkable import allocate_slugs, pre_save_slug
 from apps.common.models import Address, BlogPost
 from apps.common.tests.factories import UserFactory
 
@@ -175,6 +179,38 @@ class BlogPostModelTestCase(TestCase):
         self.blog_post.save()
         self.assertEqual(self.blog_post.slug, "updated-title")
 
+    def test_slug_collisions_are_numbered(self):
+        """Test that a taken slug gets the next free number."""
+        second = BlogPost.objects.create(title="Test Blog Post", author=self.user)
+        third = BlogPost.objects.create(title="Test Blog Post!", author=self.user)
+
+        self.assertEqual(second.slug, "test-blog-post-2")
+        self.assertEqual(third.slug, "test-blog-post-3")
+
+    def test_allocate_slugs_for_a_batch(self):
+        """Test that a batch gets unique slugs from a single query."""
+        posts = [BlogPost(title="Test Blog Post", author=self.user) for _ in range(3)]
+        posts.append(BlogPost(title="Other", slug="kept", author=self.user))
+
+        with self.assertNumQueries(1):
+            allocate_slugs(posts)
+
+        self.assertEqual(
+            [post.slug for post in posts],
+            ["test-blog-post-2", "test-blog-post-3", "test-blog-post-4", "kept"],
+        )
+
+    def test_slug_signal_is_only_connected_to_permalinkable_models(self):
+        """Test that saving other models doesn't run the slug handler."""
+        receivers = {
+            model
+            for model in apps.get_models()
+            if pre_save_slug in pre_save._live_receivers(model)[0]
+        }
+        self.assertIn(BlogPost, receivers)
+        self.assertNotIn(Address, receivers)
+        self.assertNotIn(ChatMessage, receivers)
+
     # Testing Annotatable behavior
     def test_annotatable_behavior(self):
         """Test the annotatable behavior."""
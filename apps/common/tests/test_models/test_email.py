@@ -1,10 +1,13 @@
 from unittest.mock import MagicMock, patch
 
-from django.core.mail import EmailMessage
-from django.test import TestCase
+from django.core import mail
+from django.core.mail import EmailMessage, get_connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
 
 from apps.common.models.email import Email
 from apps.common.tests.factories import UploadFactory
+from apps.common.utilities.email import process_email_outbox
 
 
 class EmailModelTestCase(TestCase):
@@ -120,7 +123,7 @@ class EmailModelTestCase(TestCase):
         self.assertIsNone(self.email.sent_at)
         mock_send.assert_called_once_with(fail_silently=False)
 
-    @patch("apps.common.models.email.urllib.request.urlopen")
+    @patch("apps.common.utilities.email.urllib.request.urlopen")
     @patch("apps.common.models.email.EmailMessage")
     def test_send_with_attachments(self, mock_email_message, mock_urlopen):
         """Test sending email with attachments."""
@@ -138,10 +141,132 @@ class EmailModelTestCase(TestCase):
         mock_email_message.return_value = mock_instance
 
         mock_urlopen_instance = MagicMock()
-        mock_urlopen_instance.read.return_value = b"file content"
+        mock_urlopen_instance.headers = {}
+        mock_urlopen_instance.read.side_effect = [b"file content", b""]
         mock_urlopen.return_value = mock_urlopen_instance
 
-        self.email.send(require_confirmation=False)
+        self.email.send(require_confirmation=True)
 
         # Check if attach was called
-        mock_instance.attach.assert_called_once()
+        mock_instance.attach.assert_called_once_with("test.jpg.pdf", b"file content")
+
+    def test_send_later_queues_email(self):
+        """Test that sending later only queues the email."""
+        self.email.send(require_confirmation=False)
+
+        self.email.refresh_from_db()
+        self.assertEqual(self.email.status, Email.STATUS_QUEUED)
+        self.assertIsNotNone(self.email.next_attempt_at)
+        self.assertIsNone(self.email.sent_at)
+        self.assertEqual(len(mail.outbox), 0)
+
+
+class EmailOutboxTestCase(TestCase):
+    """Test case for the email outbox worker."""
+
+    def setUp(self):
+        self.emails = [
+            Email.objects.create(
+                to_address=f"user{i}@example.com",
+                from_address="sender@example.com",
+                subject=f"Queued {i}",
+                body="Body",
+            )
+            for i in range(3)
+        ]
+        for email in self.emails:
+            email.send_later()
+
+    def test_batch_is_sent_over_one_connection(self):
+        """Test that a batch is sent and marked as sent."""
+        connection = get_connection()
+        with patch.object(connection, "open", wraps=connection.open) as mock_open:
+            stats = process_email_outbox(batch_size=10, connection=connection)
+
+        mock_open.assert_called_once()
+        self.assertEqual(stats.claimed, 3)
+        self.assertEqual(stats.sent, 3)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(
+            Email.objects.filter(
+                status=Email.STATUS_SENT, sent_at__isnull=False
+            ).count(),
+            3,
+        )
+
+    def test_batch_size_limits_claimed_emails(self):
+        """Test that only batch_size emails are sent per batch."""
+        stats = process_email_outbox(batch_size=2)
+
+        self.assertEqual(stats.sent, 2)
+        self.assertEqual(Email.objects.filter(status=Email.STATUS_QUEUED).count(), 1)
+
+    def test_failed_send_is_retried_with_backoff(self):
+        """Test that a failed send is rescheduled with a backoff."""
+        connection = get_connection()
+        with patch.object(
+            connection, "send_messages", side_effect=Exception("SMTP down")
+        ):
+            stats = process_email_outbox(batch_size=10, connection=connection)
+
+        self.assertEqual(stats.retried, 3)
+        email = Email.objects.get(pk=self.emails[0].pk)
+        self.assertEqual(email.status, Email.STATUS_QUEUED)
+        self.assertEqual(email.attempts, 1)
+        self.assertEqual(email.last_error, "SMTP down")
+        self.assertGreater(email.next_attempt_at, timezone.now())
+
+        # Not due yet, so nothing is claimed
+        self.assertEqual(process_email_outbox(batch_size=10).claimed, 0)
+
+    @override_settings(EMAIL_OUTBOX_MAX_ATTEMPTS=1)
+    def test_email_fails_after_max_attempts(self):
+        """Test that an email is marked failed after the last attempt."""
+        connection = get_connection()
+        with patch.object(
+            connection, "send_messages", side_effect=Exception("SMTP down")
+        ):
+            stats = process_email_outbox(batch_size=10, connection=connection)
+
+        self.assertEqual(stats.failed, 3)
+        self.assertEqual(Email.objects.filter(status=Email.STATUS_FAILED).count(), 3)
+
+    @override_settings(EMAIL_ATTACHMENT_MAX_SIZE=4)
+    @patch("apps.common.utilities.email.urllib.request.urlopen")
+    def test_oversized_attachment_fails_without_retry(self, mock_urlopen):
+        """Test that an attachment over the size cap fails the email."""
+        self.emails[0].attachments.add(UploadFactory.create())
+        mock_response = MagicMock()
+        mock_response.headers = {}
+        mock_response.read.side_effect = [b"too large", b""]
+        mock_urlopen.return_value = mock_response
+
+        stats = process_email_outbox(batch_size=10)
+
+        self.assertEqual(stats.sent, 2)
+        self.assertEqual(stats.failed, 1)
+        email = Email.objects.get(pk=self.emails[0].pk)
+        self.assertEqual(email.status, Email.STATUS_FAILED)
+        self.assertIn("byte limit", email.last_error)
+
+    @override_settings(
+        EMAIL_ATTACHMENT_MAX_SIZE=1000, EMAIL_ATTACHMENTS_MAX_TOTAL_SIZE=20
+    )
+    @patch("apps.common.utilities.email.urllib.request.urlopen")
+    def test_attachments_stop_downloading_over_total_size(self, mock_urlopen):
+        """Test that an email's downloads stop once they pass the total cap."""
+        self.emails[0].attachments.add(*UploadFactory.create_batch(3))
+        mock_response = MagicMock()
+        mock_response.headers = {}
+        mock_response.read.return_value = b"x" * 8
+        mock_urlopen.return_value = mock_response
+
+        stats = process_email_outbox(batch_size=10)
+
+        self.assertEqual(stats.sent, 2)
+        self.assertEqual(stats.failed, 1)
+        # Each attachment alone would read 125 chunks before its own cap
+        self.assertLess(mock_response.read.call_count, 10)
+        email = Email.objects.get(pk=self.emails[0].pk)
+        self.assertEqual(email.status, Email.STATUS_FAILED)
+        self.assertIn("total", email.last_error)
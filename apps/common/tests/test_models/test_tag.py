@@ -0,0 +1,113 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.common.models import BlogPost, BlogPostTag, Tag
+from apps.common.tests.factories import BlogPostFactory, UserFactory
+
+
+class TagModelTestCase(TestCase):
+    """Test case for Tag and the tags of blog posts."""
+
+    def setUp(self):
+        self.user = UserFactory.create()
+        self.published_at = timezone.now() - timedelta(days=1)
+
+    def create_post(self, tags, **kwargs):
+        kwargs.setdefault("published_at", self.published_at)
+        return BlogPost.objects.create(
+            title="Post", content="Content", author=self.user, tags=tags, **kwargs
+        )
+
+    def counts(self):
+        return dict(Tag.objects.values_list("name", "post_count"))
+
+    def test_saving_syncs_tags(self):
+        """Test that saving a post creates, links and unlinks tags."""
+        post = self.create_post("Python, django,python")
+        self.assertEqual(
+            sorted(post.tag_set.values_list("name", flat=True)), ["django", "python"]
+        )
+
+        post.remove_tag("django")
+        post.add_tag("News")
+        post.save()
+
+        self.assertEqual(
+            sorted(post.tag_set.values_list("name", flat=True)), ["news", "python"]
+        )
+        # Unused tags are kept, with no posts
+        self.assertEqual(self.counts(), {"django": 0, "news": 1, "python": 1})
+
+    def test_counts_only_live_posts(self):
+        """Test that post_count follows publishing, expiry and deletion."""
+        live = self.create_post("python")
+        draft = self.create_post("python", published_at=None)
+        self.assertEqual(self.counts(), {"python": 1})
+
+        draft.published_at = self.published_at
+        draft.save()
+        self.assertEqual(self.counts(), {"python": 2})
+
+        live.expired_at = timezone.now() - timedelta(minutes=1)
+        live.save()
+        self.assertEqual(self.counts(), {"python": 1})
+
+        draft.delete()
+        self.assertEqual(self.counts(), {"python": 0})
+        self.assertEqual(BlogPostTag.objects.get().post, live)
+
+    def test_refresh_tag_counts_command(self):
+        """Test that the command recounts posts that went live with time."""
+        self.create_post("python", published_at=timezone.now() + timedelta(hours=1))
+        BlogPost.objects.update(published_at=self.published_at)
+        self.assertEqual(self.counts(), {"python": 0})
+
+        out = StringIO()
+        call_command("refresh_tag_counts", stdout=out)
+
+        self.assertEqual(self.counts(), {"python": 1})
+        self.assertIn("1 tags", out.getvalue())
+
+    def test_bulk_operations_keep_tags_in_step(self):
+        """Test that the manager's bulk operations sync tags and recount."""
+        posts = BlogPost.objects.bulk_create(
+            [
+                BlogPost(title=f"Post {i}", content="Content", author=self.user)
+                for i in range(2)
+            ]
+        )
+        posts[0].tags = "python"
+        posts[1].tags = "python, django"
+        BlogPost.objects.bulk_update(posts, ["tags"])
+        self.assertEqual(self.counts(), {"django": 0, "python": 0})
+
+        BlogPost.objects.publish()
+        self.assertEqual(self.counts(), {"django": 1, "python": 2})
+
+        posts[1].tags = "django"
+        BlogPost.objects.bulk_update(posts, ["tags"])
+        self.assertEqual(self.counts(), {"django": 1, "python": 1})
+
+        BlogPost.objects.filter(pk=posts[1].pk).expire()
+        self.assertEqual(self.counts(), {"django": 0, "python": 1})
+
+        BlogPost.objects.unpublish()
+        self.assertEqual(self.counts(), {"django": 0, "python": 0})
+
+    def test_refresh_tag_counts_command_sync(self):
+        """Test that --sync rebuilds the tag rows of posts inserted in bulk."""
+        posts = BlogPostFactory.create_batch(
+            3, author=self.user, tags="python", published_at=self.published_at
+        )
+        self.assertFalse(BlogPostTag.objects.exists())
+
+        call_command(
+            "refresh_tag_counts", "--sync", "--batch-size=2", stdout=StringIO()
+        )
+
+        self.assertEqual(self.counts(), {"python": 3})
+        self.assertEqual(BlogPostTag.objects.count(), len(posts))
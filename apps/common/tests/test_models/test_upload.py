@@ -4,6 +4,7 @@ Tests for the Upload model and related functionality.
 
 from unittest import mock
 
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 
 from ...models import Upload
@@ -255,6 +256,7 @@ class UploadModelTestCase(TimestampableTest, TestCase):
     )
     def test_get_presigned_url(self):
         """Test the get_presigned_url method returns the correct value."""
+        cache.clear()
         # Mock S3Client
         with mock.patch("apps.integration.aws.s3.S3Client") as mock_s3_client_cls:
             mock_client = mock.MagicMock()
@@ -268,11 +270,17 @@ class UploadModelTestCase(TimestampableTest, TestCase):
             url = self.s3_upload.get_presigned_url()
             self.assertEqual(url, "https://presigned-url/test")
 
+            # Test that the URL is cached instead of signed again
+            url = self.s3_upload.get_presigned_url()
+            self.assertEqual(url, "https://presigned-url/test")
+            mock_client.generate_presigned_url.assert_called_once()
+
             # Test with no S3 bucket or key
             url = self.image_upload.get_presigned_url()
             self.assertEqual(url, self.image_upload.original)
 
             # Test with S3 client error
+            cache.clear()
             mock_client.generate_presigned_url.return_value = {
                 "success": False,
                 "error": "Test error",
@@ -0,0 +1,289 @@
+"""
+Tests for request performance instrumentation.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import urllib3
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.http import HttpResponse
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase, override_settings
+
+from apps.common.utilities.cache import get_or_compute
+from apps.common.utilities.database.pooling import all_pool_stats, pool_stats
+from apps.common.utilities.django.middleware import PerformanceMiddleware
+from apps.common.utilities.performance import (
+    current_metrics,
+    service_for_host,
+    track_external,
+)
+
+User = get_user_model()
+
+
+class QuietHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+def busy_view(request):
+    """Touches every instrumented subsystem once (twice for the cache)."""
+    User.objects.count()
+    User.objects.filter(username="x").exists()
+    html = Template("{% for i in items %}{{ i }}{% endfor %}").render(
+        Context({"items": range(3)})
+    )
+    get_or_compute("perf-test", lambda: 1, namespace="perf-tests")
+    get_or_compute("perf-test", lambda: 1, namespace="perf-tests")
+    with track_external("stripe"):
+        pass
+    return HttpResponse(html)
+
+
+@override_settings(
+    PERFORMANCE_SERVER_TIMING=True,
+    PERFORMANCE_PROFILE_SAMPLE_RATE=0.0,
+    PERFORMANCE_SLOW_REQUEST_MS=10_000,
+)
+class PerformanceMiddlewareTestCase(TestCase):
+    """Test cases for PerformanceMiddleware."""
+
+    def setUp(self):
+        self.request = RequestFactory().get("/busy/")
+
+    def test_server_timing_and_log(self):
+        """Test that a request reports DB, template, cache and API usage."""
+        middleware = PerformanceMiddleware(busy_view)
+
+        with self.assertLogs(
+            "apps.common.utilities.django.middleware", level="INFO"
+        ) as logs:
+            response = middleware(self.request)
+
+        self.assertEqual(response.content, b"012")
+        timing = response["Server-Timing"]
+        self.assertIn('desc="2 queries"', timing)
+        self.assertIn("tpl;dur=", timing)
+        self.assertIn('desc="1 hits, 1 misses"', timing)
+        self.assertIn('ext-stripe;dur=0.0;desc="1 calls"', timing)
+        self.assertIn("total;dur=", timing)
+
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record["path"], "/busy/")
+        self.assertEqual(record["status"], 200)
+        self.assertEqual(record["db_queries"], 2)
+        self.assertEqual(record["cache_misses"], 1)
+        self.assertEqual(record["external"]["stripe"]["calls"], 1)
+        self.assertEqual(logs.records[0].levelname, "INFO")
+        self.assertIsNone(current_metrics())
+
+    def test_outgoing_http_is_attributed(self):
+        """Test that urllib3 requests are timed as external calls."""
+        server = HTTPServer(("127.0.0.1", 0), QuietHandler)
+        threading.Thread(target=server.handle_request, daemon=True).start()
+        self.addCleanup(server.server_close)
+
+        def view(request):
+            urllib3.PoolManager().request(
+                "GET", f"http://127.0.0.1:{server.server_port}/"
+            )
+            return HttpResponse("ok")
+
+        middleware = PerformanceMiddleware(view)
+        with self.assertLogs(
+            "apps.common.utilities.django.middleware", level="INFO"
+        ) as logs:
+            response = middleware(self.request)
+
+        self.assertIn("ext-http;dur=", response["Server-Timing"])
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record["external"]["http"]["calls"], 1)
+
+    @override_settings(PERFORMANCE_INSTRUMENTATION_ENABLED=False)
+    def test_disabled(self):
+        """Test that the middleware can be switched off."""
+        from django.core.exceptions import MiddlewareNotUsed
+
+        with self.assertRaises(MiddlewareNotUsed):
+            PerformanceMiddleware(busy_view)
+
+    def test_slow_request_profile(self):
+        """Test that sampled slow requests are logged and profiled."""
+        profile_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, profile_dir)
+
+        with override_settings(
+            PERFORMANCE_PROFILE_SAMPLE_RATE=1.0,
+            PERFORMANCE_SLOW_REQUEST_MS=0,
+            PERFORMANCE_PROFILE_DIR=profile_dir,
+        ):
+            middleware = PerformanceMiddleware(busy_view)
+            with self.assertLogs(
+                "apps.common.utilities.django.middleware", level="WARNING"
+            ) as logs:
+                middleware(self.request)
+
+        record = json.loads(logs.records[0].getMessage())
+        self.assertTrue(record["profile"].startswith(profile_dir))
+        self.assertTrue(os.path.exists(record["profile"]))
+        self.assertIn("GET-busy", os.path.basename(record["profile"]))
+
+    def test_concurrent_requests_profile_one_at_a_time(self):
+        """Test that a sampled request isn't profiled while another one is."""
+        profile_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, profile_dir)
+        entered, release = threading.Event(), threading.Event()
+
+        def view(request):
+            if request.path == "/first/":
+                entered.set()
+                release.wait(5)
+            return HttpResponse("ok")
+
+        with override_settings(
+            PERFORMANCE_PROFILE_SAMPLE_RATE=1.0,
+            PERFORMANCE_SLOW_REQUEST_MS=0,
+            PERFORMANCE_PROFILE_DIR=profile_dir,
+        ):
+            middleware = PerformanceMiddleware(view)
+            with self.assertLogs(
+                "apps.common.utilities.django.middleware", level="WARNING"
+            ) as logs:
+                first = threading.Thread(
+                    target=middleware, args=(RequestFactory().get("/first/"),)
+                )
+                first.start()
+                self.assertTrue(entered.wait(5))
+                response = middleware(RequestFactory().get("/second/"))
+                release.set()
+                first.join(5)
+
+        self.assertEqual(response.status_code, 200)
+        records = {
+            record["path"]: record
+            for record in (json.loads(log.getMessage()) for log in logs.records)
+        }
+        self.assertIn("profile", records["/first/"])
+        self.assertNotIn("profile", records["/second/"])
+
+        # The profiler is free again afterwards
+        with override_settings(
+            PERFORMANCE_PROFILE_SAMPLE_RATE=1.0,
+            PERFORMANCE_SLOW_REQUEST_MS=0,
+            PERFORMANCE_PROFILE_DIR=profile_dir,
+        ):
+            with self.assertLogs(
+                "apps.common.utilities.django.middleware", level="WARNING"
+            ) as logs:
+                PerformanceMiddleware(view)(RequestFactory().get("/second/"))
+        self.assertIn("profile", json.loads(logs.records[0].getMessage()))
+
+    def test_service_for_host(self):
+        """Test that outgoing HTTP hosts map to services."""
+        self.assertEqual(service_for_host("my-bucket.s3.amazonaws.com"), "s3")
+        self.assertEqual(service_for_host("api.stripe.com"), "stripe")
+        self.assertEqual(service_for_host("api.openai.com"), "openai")
+        self.assertEqual(service_for_host("notstripe.com"), "http")
+
+    def test_db_connect_time(self):
+        """Test that opening a DB connection during a request is timed."""
+
+        def view(request):
+            connection = connections.create_connection("default")
+            connection.connect()
+            connection.close()
+            return HttpResponse("ok")
+
+        middleware = PerformanceMiddleware(view)
+        with self.assertLogs(
+            "apps.common.utilities.django.middleware", level="INFO"
+        ) as logs:
+            response = middleware(self.request)
+
+        self.assertIn('desc="1 connects"', response["Server-Timing"])
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record["db_connects"], 1)
+        self.assertNotIn("db_pool", record)
+
+    def test_pool_usage_is_logged(self):
+        """Test that pooled databases' usage is added to the log line."""
+        stats = [{"alias": "default", "in_use": 3, "waiting": 1, "size": 4}]
+        middleware = PerformanceMiddleware(lambda request: HttpResponse("ok"))
+        with patch(
+            "apps.common.utilities.django.middleware.all_pool_stats",
+            return_value=stats,
+        ):
+            with self.assertLogs(
+                "apps.common.utilities.django.middleware", level="INFO"
+            ) as logs:
+                middleware(self.request)
+
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record["db_pool"], {"default": {"in_use": 3, "waiting": 1}})
+
+
+class PoolStatsTestCase(TestCase):
+    """Test cases for connection pool metrics."""
+
+    def pooled(self, **stats):
+        pool = MagicMock(min_size=2, max_size=10)
+        pool.get_stats.return_value = pool.pop_stats.return_value = stats
+        connection = SimpleNamespace(
+            settings_dict={"OPTIONS": {"pool": {"max_size": 10}}}, pool=pool
+        )
+        unpooled = SimpleNamespace(settings_dict={"OPTIONS": {}})
+        return patch(
+            "apps.common.utilities.database.pooling.connections",
+            {"default": connection, "other": unpooled},
+        )
+
+    def test_pool_stats(self):
+        """Test that psycopg_pool stats are summarised."""
+        with self.pooled(
+            pool_min=2,
+            pool_max=10,
+            pool_size=6,
+            pool_available=2,
+            requests_waiting=3,
+            requests_num=40,
+            requests_wait_ms=200,
+            requests_errors=1,
+        ):
+            stats = pool_stats()
+            self.assertIsNone(pool_stats("other"))
+            self.assertEqual(len(all_pool_stats()), 1)
+
+        self.assertEqual(stats["in_use"], 4)
+        self.assertEqual(stats["available"], 2)
+        self.assertEqual(stats["waiting"], 3)
+        self.assertEqual(stats["acquire_ms"], 5.0)
+        self.assertEqual(stats["timeouts"], 1)
+        self.assertEqual(stats["max_size"], 10)
+
+    def test_pool_stats_reset(self):
+        """Test that reset=True pops the counters and an idle pool is zero."""
+        with self.pooled(pool_size=2, pool_available=2) as connections:
+            stats = pool_stats(reset=True)
+            connections["default"].pool.pop_stats.assert_called_once()
+
+        self.assertEqual(stats["in_use"], 0)
+        self.assertEqual(stats["acquire_ms"], 0.0)
+
+    def test_unpooled_database(self):
+        """Test that databases without DB_POOL have no pool stats."""
+        self.assertIsNone(pool_stats())
+        self.assertEqual(all_pool_stats(), [])
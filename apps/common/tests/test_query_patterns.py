@@ -0,0 +1,89 @@
+"""
+Tests for N+1 query detection.
+"""
+
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from apps.common.utilities.database.query_patterns import (
+    QueryPatternDetector,
+    normalize_sql,
+)
+from apps.common.utilities.django.middleware import PerformanceMiddleware
+
+User = get_user_model()
+
+
+def per_row_view(request):
+    """Looks up each user's username separately (an N+1)."""
+    for pk in User.objects.values_list("pk", flat=True):
+        User.objects.get(pk=pk).username
+    return HttpResponse("ok")
+
+
+class QueryPatternDetectorTestCase(TestCase):
+    """Test cases for QueryPatternDetector."""
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(5):
+            User.objects.create_user(username=f"user{i}", email=f"u{i}@example.com")
+
+    def test_normalize_sql(self):
+        """Test that literals and parameter lists are collapsed."""
+        self.assertEqual(
+            normalize_sql("SELECT * FROM t WHERE id = 12 AND name = 'o''neil'"),
+            "SELECT * FROM t WHERE id = ? AND name = ?",
+        )
+        self.assertEqual(
+            normalize_sql('SELECT "t2"."id" FROM "t2" WHERE "id" IN (%s, %s,\n %s)'),
+            normalize_sql('SELECT "t2"."id" FROM "t2" WHERE "id" IN (%s)'),
+        )
+
+    def test_detects_repeated_shape(self):
+        """Test that per-row queries are grouped and traced to their caller."""
+        with QueryPatternDetector(threshold=3) as detector:
+            per_row_view(None)
+
+        self.assertEqual(detector.total, 6)
+        [pattern] = detector.repeated()
+        self.assertEqual(pattern.count, 5)
+        self.assertIn("WHERE", pattern.sql)
+        self.assertTrue(
+            any("test_query_patterns.py" in frame for frame in pattern.stack)
+        )
+        self.assertIn("5x SELECT", detector.report())
+
+    def test_no_repeats(self):
+        """Test that a single bulk query is not flagged."""
+        with QueryPatternDetector(threshold=3) as detector:
+            list(User.objects.all())
+
+        self.assertEqual(detector.repeated(), [])
+
+    @override_settings(
+        PERFORMANCE_N_PLUS_ONE_THRESHOLD=3, PERFORMANCE_PROFILE_SAMPLE_RATE=0.0
+    )
+    def test_middleware_logs_repeats(self):
+        """Test that PerformanceMiddleware logs repeated shapes per request."""
+        middleware = PerformanceMiddleware(per_row_view)
+
+        with self.assertLogs(
+            "apps.common.utilities.django.middleware", level="WARNING"
+        ) as logs:
+            middleware(RequestFactory().get("/users/"))
+
+        [record] = [json.loads(r.getMessage()) for r in logs.records]
+        self.assertEqual(record["event"], "n_plus_one")
+        self.assertEqual(record["path"], "/users/")
+        self.assertEqual(record["count"], 5)
+
+    @pytest.mark.max_queries(2, max_repeats=1)
+    def test_max_queries_marker(self):
+        """Test that a test within its query budget passes the marker."""
+        User.objects.count()
+        list(User.objects.filter(username__startswith="user"))
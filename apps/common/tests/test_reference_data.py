@@ -0,0 +1,89 @@
+"""
+Tests for the reference data registry (utilities/reference_data.py).
+"""
+
+from django.contrib import admin
+from django.test import TestCase, override_settings
+
+from apps.common.admin import CityAdmin, CountryAdmin
+from apps.common.models import Address, City, Country, Currency
+from apps.common.utilities.cache import invalidate_namespace
+from apps.common.utilities.reference_data import (
+    REFERENCE_DATA_NAMESPACE,
+    get_by_code,
+    get_object,
+    get_reference_data,
+    invalidate_reference_data,
+)
+
+
+class ReferenceDataTestCase(TestCase):
+    """Test cases for the reference data registry."""
+
+    def setUp(self):
+        self.baht = Currency.objects.create(name="Thai Baht", code="THB")
+        self.thailand = Country.objects.create(
+            name="Thailand", code="TH", calling_code="66", currency=self.baht
+        )
+        self.bangkok = City.objects.create(
+            name="Bangkok", code="BKK", country=self.thailand
+        )
+        Address.objects.create(line_1="1 Sukhumvit Rd", country=self.thailand)
+        invalidate_reference_data()
+
+    def test_resolving_needs_no_queries(self):
+        """Test that related reference data is read from the registry."""
+        get_reference_data()
+        city = City.objects.get()
+        address = Address.objects.get()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(city.currency, self.baht)
+            self.assertEqual(str(city), "Bangkok, Thailand (bkk)")
+            self.assertIn("Thailand", address.formatted_address)
+
+    def test_admin_list_displays(self):
+        """Test that the admin's currency columns don't query per row."""
+        city_admin = CityAdmin(City, admin.site)
+        country_admin = CountryAdmin(Country, admin.site)
+        get_reference_data()
+        city = City.objects.get()
+        country = Country.objects.get()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(city_admin.country_display(city), self.thailand)
+            self.assertIn("THB", city_admin.currency_display(city))
+            self.assertEqual(country_admin.currency_display(country), self.baht)
+
+    def test_lookups(self):
+        """Test lookups by id and by code, in any case."""
+        self.assertEqual(get_by_code(Country, "TH"), self.thailand)
+        self.assertEqual(get_by_code(City, "bkk"), self.bangkok)
+        self.assertIsNone(get_by_code(Currency, "usd"))
+        self.assertEqual(get_object(Currency, self.baht.pk), self.baht)
+        self.assertIsNone(get_object(Country, None))
+
+    def test_saving_reloads(self):
+        """Test that saved changes are visible in the registry."""
+        address = Address.objects.get()
+        self.assertIn("Thailand", address.formatted_address)
+
+        self.thailand.name = "Kingdom of Thailand"
+        self.thailand.save()
+
+        self.assertIn("Kingdom of Thailand", address.formatted_address)
+
+    def test_new_rows_are_found(self):
+        """Test that an id added without signals reloads the registry."""
+        get_reference_data()
+        (euro,) = Currency.objects.bulk_create([Currency(name="Euro", code="eur")])
+        self.assertEqual(get_object(Currency, euro.pk), euro)
+
+    @override_settings(REFERENCE_DATA_CHECK_INTERVAL=0)
+    def test_version_change_reloads(self):
+        """Test that a version bumped by another process reloads the registry."""
+        registry = get_reference_data()
+        self.assertIs(get_reference_data(), registry)
+
+        invalidate_namespace(REFERENCE_DATA_NAMESPACE)
+        self.assertIsNot(get_reference_data(), registry)
@@ -0,0 +1,278 @@
+"""
+Tests for read replica routing (utilities/database/replicas.py).
+
+ReplicaQueryTestCase reads from `replica_1`, a copy of the test database
+that conftest.py's django_db_setup creates for the session.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from apps.common.utilities.database import replicas
+from apps.common.utilities.database.replicas import (
+    ReplicaRouter,
+    measure_lag,
+    read_from_replica,
+)
+from apps.common.utilities.django.middleware import ReplicaStickinessMiddleware
+
+User = get_user_model()
+
+REPLICA_SETTINGS = {
+    "DATABASE_REPLICAS": ["replica_1", "replica_2"],
+    "DATABASE_REPLICA_MAX_LAG": 5,
+    "DATABASE_REPLICA_LAG_CHECK_INTERVAL": 60,
+    "DATABASE_REPLICA_STICKY_SECONDS": 5,
+}
+
+REPLICA_ROUTERS = ["apps.common.utilities.database.replicas.ReplicaRouter"]
+
+
+class ReplicaTestMixin:
+    """Start each test with no recent writes and no measured lag."""
+
+    def setUp(self):
+        super().setUp()
+        replicas._lag_cache.clear()
+        self.addCleanup(replicas._lag_cache.clear)
+        self.addCleanup(replicas.end_request, replicas.start_request())
+
+
+@override_settings(**REPLICA_SETTINGS)
+class ReplicaRouterTestCase(ReplicaTestMixin, SimpleTestCase):
+    """Test cases for choosing the database of a read."""
+
+    def setUp(self):
+        super().setUp()
+        self.router = ReplicaRouter()
+        self.lags = {"replica_1": 0.0, "replica_2": 0.0}
+        patcher = patch.object(replicas, "measure_lag", side_effect=self.lags.get)
+        self.measure_lag = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reads_use_primary_by_default(self):
+        """Test that reads outside read_from_replica() aren't routed."""
+        self.assertIsNone(self.router.db_for_read(User))
+        self.measure_lag.assert_not_called()
+
+    def test_reads_in_block_use_replica(self):
+        """Test that reads inside the context manager go to a replica."""
+        with read_from_replica():
+            self.assertIn(self.router.db_for_read(User), ["replica_1", "replica_2"])
+        self.assertIsNone(self.router.db_for_read(User))
+
+    def test_decorator(self):
+        """Test that decorated sync and async functions read from replicas."""
+
+        @read_from_replica
+        def read():
+            return self.router.db_for_read(User)
+
+        @read_from_replica
+        async def read_async():
+            return self.router.db_for_read(User)
+
+        self.assertIsNotNone(read())
+        self.assertIsNotNone(asyncio.run(read_async()))
+        self.assertEqual(read_async.__name__, "read_async")
+
+    def test_write_pins_reads_to_primary(self):
+        """Test that reads after a write go to the primary for a while."""
+        self.assertEqual(self.router.db_for_write(User), "default")
+        with read_from_replica():
+            self.assertIsNone(self.router.db_for_read(User))
+            with override_settings(DATABASE_REPLICA_STICKY_SECONDS=0):
+                self.assertIsNotNone(self.router.db_for_read(User))
+
+    def test_lagging_replica_is_skipped(self):
+        """Test that replicas behind by more than the maximum lag are unused."""
+        self.lags["replica_1"] = 30.0
+        with read_from_replica():
+            for _ in range(10):
+                self.assertEqual(self.router.db_for_read(User), "replica_2")
+
+            replicas._lag_cache.clear()
+            self.lags["replica_2"] = float("inf")
+            self.assertIsNone(self.router.db_for_read(User))
+
+    def test_lag_is_cached(self):
+        """Test that lag is measured at most once per check interval."""
+        with read_from_replica():
+            self.router.db_for_read(User)
+            self.router.db_for_read(User)
+            self.assertEqual(self.measure_lag.call_count, 2)
+
+            with override_settings(DATABASE_REPLICA_LAG_CHECK_INTERVAL=0):
+                self.router.db_for_read(User)
+            self.assertEqual(self.measure_lag.call_count, 4)
+
+    def test_no_migrations_on_replicas(self):
+        """Test that replicas are never migrated."""
+        self.assertFalse(self.router.allow_migrate("replica_1", "common"))
+        self.assertIsNone(self.router.allow_migrate("default", "common"))
+        self.assertTrue(self.router.allow_relation(User(), User()))
+
+
+@override_settings(**REPLICA_SETTINGS)
+class ReplicaStickinessMiddlewareTestCase(ReplicaTestMixin, SimpleTestCase):
+    """Test cases for keeping a client on the primary after it writes."""
+
+    def setUp(self):
+        super().setUp()
+        self.factory = RequestFactory()
+        patcher = patch.object(replicas, "measure_lag", return_value=0.0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_write_sets_cookie(self):
+        """Test that a request that writes pins the client with a cookie."""
+
+        def view(request):
+            ReplicaRouter().db_for_write(User)
+            return HttpResponse()
+
+        response = ReplicaStickinessMiddleware(view)(self.factory.post("/"))
+
+        cookie = response.cookies[ReplicaStickinessMiddleware.cookie_name]
+        self.assertEqual(cookie["max-age"], 5)
+        self.assertFalse(replicas.pinned_to_primary())
+
+    def test_read_sets_no_cookie(self):
+        """Test that requests that only read aren't pinned."""
+        response = ReplicaStickinessMiddleware(lambda request: HttpResponse())(
+            self.factory.get("/")
+        )
+        self.assertNotIn(ReplicaStickinessMiddleware.cookie_name, response.cookies)
+
+    def test_cookie_pins_reads(self):
+        """Test that a pinned client's reads go to the primary."""
+        routed = []
+
+        def view(request):
+            with read_from_replica():
+                routed.append(ReplicaRouter().db_for_read(User))
+            return HttpResponse()
+
+        middleware = ReplicaStickinessMiddleware(view)
+        middleware(self.factory.get("/"))
+        request = self.factory.get("/")
+        request.COOKIES[ReplicaStickinessMiddleware.cookie_name] = "1"
+        middleware(request)
+
+        self.assertIsNotNone(routed[0])
+        self.assertIsNone(routed[1])
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_unused_without_replicas(self):
+        """Test that the middleware is skipped when there are no replicas."""
+        with self.assertRaises(MiddlewareNotUsed):
+            ReplicaStickinessMiddleware(lambda request: HttpResponse())
+
+
+class MeasureLagTestCase(TestCase):
+    """Test cases for measuring replication lag."""
+
+    def test_primary_has_no_lag(self):
+        """Test that a database that isn't a standby is never behind."""
+        self.assertEqual(measure_lag("default"), 0.0)
+
+
+@override_settings(DATABASE_REPLICAS=["replica_1"], DATABASE_ROUTERS=REPLICA_ROUTERS)
+class ReplicaQueryTestCase(ReplicaTestMixin, TestCase):
+    """Test cases for routing real queries to a second database."""
+
+    databases = {"default", "replica_1"}
+
+    @classmethod
+    def setUpClass(cls):
+        if "replica_1" not in connections.settings:
+            raise unittest.SkipTest("No replica_1 test database")
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user(
+            username="replica-test", email="replica-test@example.com"
+        )
+        # Forget the write above, as if this were a later request
+        self.addCleanup(replicas.end_request, replicas.start_request())
+
+    def assertReadsFrom(self, alias):
+        """Run a read and check which connection it went to."""
+        users = User.objects.filter(pk=self.user.pk)
+        with CaptureQueriesContext(connections["replica_1"]) as replica_queries:
+            with CaptureQueriesContext(connections["default"]) as primary_queries:
+                list(users)
+        self.assertEqual(users.db, alias)
+        queries = replica_queries if alias == "replica_1" else primary_queries
+        self.assertTrue(
+            any(
+                User._meta.db_table in query["sql"]
+                for query in queries.captured_queries
+            )
+        )
+
+    def test_reads_go_to_replica(self):
+        """Test that reads in the block run on the replica connection."""
+        with read_from_replica():
+            self.assertReadsFrom("replica_1")
+        self.assertReadsFrom("default")
+
+    def test_reads_after_write_go_to_primary(self):
+        """Test that a write in the same context pins reads to the primary."""
+        self.user.save()
+        with read_from_replica():
+            self.assertReadsFrom("default")
+
+    def test_lagging_replica_falls_back_to_primary(self):
+        """Test that reads use the primary when the replica is too far behind."""
+        with override_settings(DATABASE_REPLICA_MAX_LAG=-1):
+            with read_from_replica():
+                self.assertReadsFrom("default")
+
+
+@override_settings(**REPLICA_SETTINGS)
+class ReplicaViewTestCase(ReplicaTestMixin, TestCase):
+    """Test cases for views that read from replicas."""
+
+    @override_settings(
+        DATABASE_ROUTERS=REPLICA_ROUTERS,
+        STORAGES={
+            **settings.STORAGES,
+            "staticfiles": {
+                "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+            },
+        },
+    )
+    def test_team_list_reads_inside_the_block(self):
+        """Test that the team list runs all its queries in the replica block."""
+        from apps.public.views.teams.team_views import TeamListView
+
+        request = RequestFactory().get("/team/")
+        request.user = User.objects.create_user(
+            username="replica-view", email="replica-view@example.com"
+        )
+        request.session = {}
+        in_block = []
+
+        def choose_replica():
+            in_block.append(replicas._replica_reads.get())
+
+        with patch.object(replicas, "choose_replica", side_effect=choose_replica):
+            response = TeamListView.as_view()(request)
+            if hasattr(response, "render"):
+                response.render()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"team", response.content.lower())
+        self.assertTrue(in_block)
+        self.assertTrue(all(in_block))
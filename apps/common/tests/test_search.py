@@ -0,0 +1,133 @@
+"""
+Tests for full-text search (utilities/database/search.py and
+utilities/django/admin_search.py).
+
+FullTextSearchTestCase needs PostgreSQL, where the migrations install the
+search triggers and GIN indexes; on other databases it is skipped and
+search() falls back to icontains matching.
+"""
+
+import unittest
+
+from django.contrib import admin
+from django.contrib.admin.views.main import ORDER_VAR, SEARCH_VAR
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+
+from apps.common.admin import NoteAdmin
+from apps.common.models import BlogPost, Currency, Note
+from apps.common.tests.factories import UserFactory
+from apps.common.utilities.django.admin_search import (
+    DjangoSearchBackend,
+    FullTextSearchBackend,
+    get_search_backend,
+)
+
+
+class SearchTestCase(TestCase):
+    """Test cases for search() on any database."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.invoice = Note.objects.create(text="Invoice for March is overdue")
+        cls.reminder = Note.objects.create(text="Reminder: send the invoice")
+        cls.other = Note.objects.create(text="Lunch on Friday")
+
+    def test_search_matches_every_word(self):
+        """Test that search() finds rows containing all the words, with a rank."""
+        results = Note.objects.search("invoice overdue")
+        self.assertEqual(list(results), [self.invoice])
+        self.assertIsNotNone(results[0].rank)
+
+        self.assertEqual(
+            set(Note.objects.search("invoice")), {self.invoice, self.reminder}
+        )
+
+    def test_search_needs_the_behavior(self):
+        """Test that search() isn't available on models that aren't Searchable."""
+        with self.assertRaises(AttributeError):
+            Currency.objects.search("euro")
+
+    def test_admin_search(self):
+        """Test that SearchableAdminMixin admins search with the backend."""
+        model_admin = NoteAdmin(Note, admin.site)
+        request = RequestFactory().get("/admin/common/note/", {SEARCH_VAR: "lunch"})
+
+        queryset, may_have_duplicates = model_admin.get_search_results(
+            request, Note.objects.all(), "lunch"
+        )
+        self.assertEqual(list(queryset), [self.other])
+
+    def test_ids_use_django_search(self):
+        """Test that id-like terms skip full-text search."""
+        backend = FullTextSearchBackend()
+        queryset = Note.objects.all()
+        self.assertFalse(backend.uses_full_text_search(queryset, str(self.invoice.pk)))
+        self.assertFalse(backend.uses_full_text_search(queryset, "  "))
+
+    @override_settings(
+        ADMIN_SEARCH_BACKEND=(
+            "apps.common.utilities.django.admin_search.DjangoSearchBackend"
+        )
+    )
+    def test_backend_is_configurable(self):
+        """Test that ADMIN_SEARCH_BACKEND selects the backend."""
+        self.assertIsInstance(get_search_backend(), DjangoSearchBackend)
+        self.assertNotIsInstance(get_search_backend(), FullTextSearchBackend)
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "Needs PostgreSQL")
+class FullTextSearchTestCase(TestCase):
+    """Test cases for the search triggers and ranked results."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory.create(is_staff=True, is_superuser=True)
+
+    def test_trigger_keeps_vector_current(self):
+        """Test that inserts and updates, including update(), set search_vector."""
+        note = Note.objects.create(text="Quarterly invoices")
+        self.assertEqual(list(Note.objects.search("invoice")), [note])
+
+        Note.objects.filter(pk=note.pk).update(text="Team offsite")
+        self.assertFalse(Note.objects.search("invoice").exists())
+        self.assertEqual(list(Note.objects.search("offsite")), [note])
+
+    def test_results_are_ranked_by_weight(self):
+        """Test that title matches rank above content matches."""
+        in_content = BlogPost.objects.create(
+            title="Weekly notes", content="Some thoughts on postgres", author=self.user
+        )
+        in_title = BlogPost.objects.create(
+            title="Postgres tips", content="Indexes", author=self.user
+        )
+
+        results = list(BlogPost.objects.search("postgres"))
+        self.assertEqual(results, [in_title, in_content])
+        self.assertGreater(results[0].rank, results[1].rank)
+
+    def test_web_search_syntax(self):
+        """Test quoted phrases and excluded words."""
+        paid = Note.objects.create(text="The invoice was paid")
+        Note.objects.create(text="The invoice is overdue")
+
+        self.assertEqual(list(Note.objects.search("invoice -overdue")), [paid])
+        self.assertEqual(list(Note.objects.search('"invoice was paid"')), [paid])
+
+    def test_admin_changelist_orders_by_rank(self):
+        """Test that admin search results are ordered by rank unless sorted."""
+        model_admin = NoteAdmin(Note, admin.site)
+        Note.objects.create(text="invoice")
+        request = RequestFactory().get("/admin/common/note/", {SEARCH_VAR: "invoice"})
+        request.user = self.user
+
+        changelist = model_admin.get_changelist_instance(request)
+        self.assertEqual(changelist.queryset.query.order_by, ("-rank", "-pk"))
+
+        # Sorted by created_at (column 4, after the action checkbox), with the pk tie-breaker
+        request = RequestFactory().get(
+            "/admin/common/note/", {SEARCH_VAR: "invoice", ORDER_VAR: "4"}
+        )
+        request.user = self.user
+        changelist = model_admin.get_changelist_instance(request)
+        self.assertEqual(changelist.queryset.query.order_by, ("created_at", "-pk"))
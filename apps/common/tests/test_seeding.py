@@ -0,0 +1,122 @@
+"""
+Tests for the bulk seeding engine and the seed_perf_data command.
+"""
+
+import uuid
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db.models.signals import pre_save
+from django.test import TestCase
+
+from apps.ai.models import ChatMessage, ChatSession
+from apps.common.models import City, Country, Currency, Team, TeamMember, User
+from apps.common.tests.factories import CountryFactory, CurrencyFactory, UserFactory
+from apps.common.utilities.database.seeding import copy_rows, seed
+
+
+class SeedingTestCase(TestCase):
+    """Test cases for build_batch, bulk_insert and seed."""
+
+    def test_build_batch_calls_field_callables_with_row_index(self):
+        """Test that callables get the row index and constants are shared."""
+        users = UserFactory.build_batch(
+            3, start=10, username=lambda i: f"seed_{i}", last_name="Seeded"
+        )
+        self.assertEqual([u.username for u in users], ["seed_10", "seed_11", "seed_12"])
+        self.assertEqual({u.last_name for u in users}, {"Seeded"})
+        self.assertTrue(all(u.pk is None for u in users))
+
+    def test_create_batch_sends_pre_save(self):
+        """Test that pre_save receivers run, e.g. lowercasing codes."""
+        currencies = CurrencyFactory.create_batch(
+            3, batch_size=2, code=lambda i: f"X{i}", name=lambda i: f"Cur {i}"
+        )
+        self.assertEqual(Currency.objects.count(), 3)
+        self.assertEqual(
+            sorted(Currency.objects.values_list("code", flat=True)),
+            ["x0", "x1", "x2"],
+        )
+        self.assertFalse(currencies[0]._state.adding)
+
+    def test_create_batch_prepares_once(self):
+        """Test that pre_save is sent once per instance, not again by the manager."""
+        sent = []
+
+        def receiver(sender, instance, **kwargs):
+            sent.append(instance.code)
+
+        pre_save.connect(receiver, sender=Currency)
+        self.addCleanup(pre_save.disconnect, receiver, sender=Currency)
+
+        CurrencyFactory.create_batch(
+            3, code=lambda i: f"Y{i}", name=lambda i: f"Cur {i}"
+        )
+        self.assertEqual(len(sent), 3)
+
+    def test_seed_calls_on_batch_with_saved_rows(self):
+        """Test that seed() streams batches and children can use their pks."""
+        currency = CurrencyFactory.create(code="ABC", name="Test")
+        batches = []
+        stats = seed(
+            CountryFactory,
+            5,
+            batch_size=2,
+            name=lambda i: f"Country {i}",
+            code=lambda i: f"c{i}",
+            currency=currency,
+            on_batch=batches.append,
+        )
+        self.assertEqual(stats.rows, 5)
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        self.assertEqual(Country.objects.filter(currency=currency).count(), 5)
+        self.assertEqual(stats.as_dict()["model"], "common.Country")
+
+    def test_copy_rows_text_format(self):
+        """Test that values are escaped for COPY and nulls are \\N."""
+        session = ChatSession(
+            id=uuid.UUID(int=1), title="tab\there\nnew", metadata={"a": 1}
+        )
+        columns, data = copy_rows([session], connection)
+        row = dict(zip(columns, data.rstrip("\n").split("\t")))
+        self.assertEqual(row["title"], "tab\\there\\nnew")
+        self.assertEqual(row["user_id"], r"\N")
+        self.assertEqual(row["metadata"], '{"a": 1}')
+        self.assertEqual(row["is_active"], "t")
+
+
+class SeedPerfDataCommandTestCase(TestCase):
+    """Test cases for the seed_perf_data management command."""
+
+    def call(self, **options):
+        out = StringIO()
+        call_command("seed_perf_data", scale=0.01, batch_size=7, stdout=out, **options)
+        return out.getvalue()
+
+    def test_seeds_related_rows(self):
+        """Test that every model is seeded with valid foreign keys."""
+        output = self.call()
+
+        self.assertIn("Seeded", output)
+        self.assertEqual(User.objects.filter(username__startswith="perf_").count(), 10)
+        self.assertEqual(Team.objects.count(), 1)
+        self.assertEqual(City.objects.count(), 5)
+        self.assertEqual(ChatSession.objects.count(), 20)
+        self.assertEqual(ChatMessage.objects.count(), 100)
+        self.assertTrue(TeamMember.objects.filter(role="owner").exists())
+        self.assertFalse(
+            TeamMember.objects.exclude(user__username__startswith="perf_").exists()
+        )
+        self.assertEqual(Currency.objects.filter(countries__isnull=True).count(), 0)
+
+    def test_refuses_to_reseed_without_clear(self):
+        """Test that seeding twice requires --clear, which replaces the rows."""
+        self.call(only="users")
+        with self.assertRaises(CommandError):
+            self.call(only="users")
+
+        self.call(clear=True)
+        self.assertEqual(User.objects.filter(username__startswith="perf_").count(), 10)
+        self.assertEqual(ChatMessage.objects.count(), 100)
@@ -0,0 +1,106 @@
+"""
+Tests for the session engine (utilities/django/sessions.py).
+"""
+
+from datetime import timedelta
+
+from django.contrib.sessions.models import Session
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.common.utilities.django import sessions
+from apps.common.utilities.django.sessions import SessionStore, flush_touches
+
+DUMMY_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "sessions": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+}
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "sessions": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "sessions-test",
+    },
+}
+
+
+@override_settings(
+    CACHES=DUMMY_CACHES,
+    SESSION_CACHE_ALIAS="sessions",
+    SESSION_TOUCH_INTERVAL=300,
+    SESSION_TOUCH_FLUSH_INTERVAL=3600,
+    SESSION_TOUCH_BATCH_SIZE=3,
+)
+class SessionStoreTestCase(TestCase):
+    """Test cases for skipping unchanged session writes."""
+
+    def setUp(self):
+        flush_touches()
+        self.addCleanup(flush_touches)
+
+    def create_session(self, **data) -> str:
+        session = SessionStore()
+        session.update(data)
+        session.save()
+        return session.session_key
+
+    def test_same_value_is_not_a_change(self):
+        """Test that re-setting a key to its value doesn't modify the session."""
+        session = SessionStore(self.create_session(team_id=1))
+        session["team_id"] = 1
+        self.assertFalse(session.modified)
+        session["team_id"] = 2
+        self.assertTrue(session.modified)
+
+    def test_unchanged_session_is_not_written(self):
+        """Test that saving an unchanged, recently extended session is free."""
+        session = SessionStore(self.create_session(team_id=1))
+        session["team_id"] = 1
+        with CaptureQueriesContext(connection) as queries:
+            session.save()
+        self.assertEqual(len(queries), 0)
+
+    def test_changed_session_is_written(self):
+        """Test that changed data, including in-place changes, is saved."""
+        key = self.create_session(team_id=1, recent=[1])
+        session = SessionStore(key)
+        session["recent"].append(2)
+        session["recent"] = session["recent"]
+        session.save()
+
+        row = Session.objects.get(session_key=key)
+        self.assertEqual(row.get_decoded(), {"team_id": 1, "recent": [1, 2]})
+
+    def test_touches_are_batched(self):
+        """Test that expiry-only updates are written together in one UPDATE."""
+        keys = [self.create_session(team_id=i) for i in range(3)]
+        soon = timezone.now() + timedelta(hours=1)
+        Session.objects.update(expire_date=soon)
+
+        for key in keys[:2]:
+            session = SessionStore(key)
+            session.get("team_id")
+            session.save()
+        self.assertEqual(Session.objects.filter(expire_date=soon).count(), 3)
+
+        session = SessionStore(keys[2])
+        session.get("team_id")
+        with CaptureQueriesContext(connection) as queries:
+            session.save()
+
+        self.assertEqual(len(queries), 1)
+        self.assertTrue(queries[0]["sql"].startswith("UPDATE"))
+        self.assertFalse(Session.objects.filter(expire_date__lte=soon).exists())
+        self.assertEqual(sessions._pending_touches, {})
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_cached_session_loads_without_queries(self):
+        """Test that sessions are read from the cache when it has them."""
+        key = self.create_session(team_id=1)
+        with CaptureQueriesContext(connection) as queries:
+            session = SessionStore(key)
+            self.assertEqual(session["team_id"], 1)
+            session.save()
+        self.assertEqual(len(queries), 0)
@@ -0,0 +1,78 @@
+"""
+Tests for balancing test shards (tools/testing/sharding.py).
+"""
+
+import os
+import tempfile
+
+from django.test import SimpleTestCase
+
+from tools.testing.sharding import (
+    balance,
+    group_key,
+    load_durations,
+    parse_shard,
+    save_durations,
+    select_shard,
+)
+
+MODULE = "apps/x/tests/test_x.py"
+
+
+class ShardingTestCase(SimpleTestCase):
+    """Test cases for splitting node ids into shards."""
+
+    def test_parse_shard(self):
+        """Test that shards are 1-based "index/count" strings."""
+        self.assertEqual(parse_shard("2/4"), (2, 4))
+        for value in ("0/4", "5/4", "2", "a/b"):
+            with self.assertRaises(ValueError):
+                parse_shard(value)
+
+    def test_group_key(self):
+        """Test that class tests group by class and functions by module."""
+        self.assertEqual(group_key(f"{MODULE}::Case::test_a"), f"{MODULE}::Case")
+        self.assertEqual(group_key(f"{MODULE}::Case::test_a[1]"), f"{MODULE}::Case")
+        self.assertEqual(group_key(f"{MODULE}::test_a"), MODULE)
+
+    def test_balance_uses_durations(self):
+        """Test that groups go longest first to the least loaded shard."""
+        nodeids = [f"{MODULE}::{case}::test_{i}" for case in "ABCD" for i in range(2)]
+        durations = {nodeid: 1.0 for nodeid in nodeids}
+        durations[f"{MODULE}::A::test_0"] = 10.0
+
+        shards = balance(nodeids, 2, durations)
+
+        self.assertEqual(shards[0], [f"{MODULE}::A::test_0", f"{MODULE}::A::test_1"])
+        self.assertEqual(len(shards[1]), 6)
+
+    def test_balance_keeps_classes_together(self):
+        """Test that every test of a class lands in the same shard."""
+        nodeids = [f"{MODULE}::Case{c}::test_{i}" for c in range(5) for i in range(3)]
+        shards = balance(nodeids, 3, {})
+
+        self.assertEqual(sorted(sum(shards, [])), sorted(nodeids))
+        for shard in shards:
+            groups = {group_key(nodeid) for nodeid in shard}
+            for group in groups:
+                members = [n for n in nodeids if group_key(n) == group]
+                self.assertTrue(set(members) <= set(shard))
+
+    def test_select_shard_is_deterministic(self):
+        """Test that every worker computes the same, disjoint shards."""
+        nodeids = [
+            f"apps/m{m}/tests/test_m.py::test_{i}" for m in range(7) for i in range(2)
+        ]
+        shards = [select_shard(nodeids, index, 3, {}) for index in (1, 2, 3)]
+
+        self.assertEqual(shards, [select_shard(nodeids, i, 3, {}) for i in (1, 2, 3)])
+        self.assertEqual(sum(len(shard) for shard in shards), len(nodeids))
+        self.assertEqual(set().union(*shards), set(nodeids))
+
+    def test_durations_round_trip(self):
+        """Test that timings are saved and loaded, and missing files are empty."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "durations.json")
+            self.assertEqual(load_durations(path), {})
+            save_durations({f"{MODULE}::test_a": 0.5}, path)
+            self.assertEqual(load_durations(path), {f"{MODULE}::test_a": 0.5})
@@ -0,0 +1,299 @@
+"""
+Read-through caching helpers built on Django's cache framework.
+
+Works with any configured backend (Redis in production, locmem locally).
+
+- `get_or_compute()` returns a cached value or computes and stores it. Values
+  are refreshed probabilistically shortly before they expire ("XFetch"
+  early expiration), and only one process recomputes a key at a time, so a
+  popular key expiring does not cause a stampede of identical computations.
+- `cached()` wraps a function with `get_or_compute()`.
+- Namespaces are versioned: `invalidate_namespace()` bumps the version, which
+  makes every key in the group unreachable at once without deleting them.
+- Hit/miss/latency counters per namespace are available from
+  `get_cache_stats()`.
+
+Example:
+    ```python
+    from apps.common.utilities.cache import cached, invalidate_namespace
+
+    @cached(lambda team_id: f"members:{team_id}", ttl=600, namespace="teams")
+    def get_member_ids(team_id):
+        return list(TeamMember.objects.filter(team_id=team_id).values_list("user_id", flat=True))
+
+    # When any team changes
+    invalidate_namespace("teams")
+    ```
+"""
+
+import logging
+import math
+import random
+import threading
+import time
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+from django.core.cache import caches
+
+from apps.common.utilities.performance import record_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 300  # 5 minutes
+DEFAULT_NAMESPACE = "default"
+KEY_PREFIX = "rtc"  # read-through cache
+LOCK_TIMEOUT = 30  # seconds a recompute lock is held at most
+LOCK_WAIT = 2.0  # seconds to wait for another process to fill a missing key
+LOCK_POLL_INTERVAL = 0.05
+
+
+class CacheStats:
+    """Thread-safe hit/miss/latency counters, grouped by namespace."""
+
+    FIELDS = (
+        "hits",
+        "misses",
+        "early_refreshes",
+        "lock_waits",
+        "computes",
+        "compute_seconds",
+        "lookup_seconds",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[str, float]] = {}
+
+    def incr(self, namespace: str, field: str, amount: float = 1) -> None:
+        with self._lock:
+            counters = self._counters.setdefault(
+                namespace, dict.fromkeys(self.FIELDS, 0)
+            )
+            counters[field] += amount
+        if field in ("hits", "misses"):
+            record_cache_lookup(field == "hits")
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Copy of all counters with a hit ratio per namespace."""
+        with self._lock:
+            data = {ns: dict(counters) for ns, counters in self._counters.items()}
+        for counters in data.values():
+            lookups = counters["hits"] + counters["misses"]
+            counters["hit_ratio"] = counters["hits"] / lookups if lookups else 0.0
+        return data
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+
+stats = CacheStats()
+
+
+def get_cache_stats() -> dict[str, dict[str, float]]:
+    """Get hit/miss/latency counters for every namespace used in this process."""
+    return stats.snapshot()
+
+
+def reset_cache_stats() -> None:
+    """Reset all counters (useful in tests and benchmarks)."""
+    stats.reset()
+
+
+def _version_key(namespace: str) -> str:
+    return f"{KEY_PREFIX}:ns:{namespace}"
+
+
+def namespace_version(namespace: str, cache_alias: str = "default") -> int:
+    """Get the current version of a namespace, creating it if needed."""
+    cache = caches[cache_alias]
+    version = cache.get(_version_key(namespace))
+    if version is None:
+        # add() keeps a version another process created in the meantime
+        cache.add(_version_key(namespace), 1, timeout=None)
+        version = cache.get(_version_key(namespace), 1)
+    return version
+
+
+def invalidate_namespace(namespace: str, cache_alias: str = "default") -> int:
+    """
+    Invalidate every key in a namespace by bumping its version.
+
+    Old entries are never read again and simply expire.
+
+    Returns:
+        int: The new namespace version
+    """
+    cache = caches[cache_alias]
+    try:
+        return cache.incr(_version_key(namespace))
+    except ValueError:
+        # Version key missing or evicted: start a new version that cannot
+        # collide with ones already in use
+        version = int(time.time())
+        cache.set(_version_key(namespace), version, timeout=None)
+        return version
+
+
+def make_key(
+    key: str,
+    namespace: str = DEFAULT_NAMESPACE,
+    cache_alias: str = "default",
+    version: int | None = None,
+) -> str:
+    """
+    Build the versioned cache key for `key` in `namespace`.
+
+    Pass `version` (from `namespace_version()`) when building many keys at
+    once to avoid one version lookup per key.
+    """
+    if version is None:
+        version = namespace_version(namespace, cache_alias)
+    return f"{KEY_PREFIX}:{namespace}:v{version}:{key}"
+
+
+def _store(cache, full_key: str, value: Any, compute_seconds: float, ttl: int):
+    # The compute time and expiry are stored alongside the value so readers
+    # can decide when to refresh early
+    cache.set(full_key, (value, compute_seconds, time.time() + ttl), ttl)
+
+
+def _compute(cache, full_key, compute, ttl, namespace):
+    started = time.perf_counter()
+    value = compute()
+    compute_seconds = time.perf_counter() - started
+    stats.incr(namespace, "computes")
+    stats.incr(namespace, "compute_seconds", compute_seconds)
+    _store(cache, full_key, value, compute_seconds, ttl)
+    return value
+
+
+def get_or_compute(
+    key: str,
+    compute: Callable[[], Any],
+    ttl: int = DEFAULT_TTL,
+    namespace: str = DEFAULT_NAMESPACE,
+    beta: float = 1.0,
+    cache_alias: str = "default",
+) -> Any:
+    """
+    Get a value from the cache, computing and storing it if needed.
+
+    Args:
+        key: Cache key, unique within the namespace
+        compute: Zero-argument callable producing the value
+        ttl: Time to live in seconds
+        namespace: Versioned namespace used for group invalidation
+        beta: Early expiration aggressiveness; higher values refresh earlier,
+              0 disables early refresh
+        cache_alias: Django cache to use
+
+    Returns:
+        The cached or freshly computed value (None is a valid cached value)
+    """
+    started = time.perf_counter()
+    cache = caches[cache_alias]
+    full_key = make_key(key, namespace, cache_alias)
+    lock_key = f"{full_key}:lock"
+
+    try:
+        entry = cache.get(full_key)
+        if entry is not None:
+            value, compute_seconds, expires_at = entry
+            # XFetch: the closer the expiry and the slower the computation,
+            # the likelier one reader refreshes the value ahead of time
+            jitter = -compute_seconds * beta * math.log(1.0 - random.random())
+            if time.time() + jitter < expires_at:
+                stats.incr(namespace, "hits")
+                return value
+
+            # Only one process refreshes; the others keep serving the old value
+            stats.incr(namespace, "hits")
+            if cache.add(lock_key, 1, LOCK_TIMEOUT):
+                stats.incr(namespace, "early_refreshes")
+                try:
+                    return _compute(cache, full_key, compute, ttl, namespace)
+                except Exception as e:
+                    # The cached value is still valid, so serve it
+                    logger.exception(
+                        f"Early refresh of cache key {full_key} failed: {e}"
+                    )
+                    return value
+                finally:
+                    cache.delete(lock_key)
+            return value
+
+        stats.incr(namespace, "misses")
+        if cache.add(lock_key, 1, LOCK_TIMEOUT):
+            try:
+                return _compute(cache, full_key, compute, ttl, namespace)
+            finally:
+                cache.delete(lock_key)
+
+        # Another process is computing this key: wait briefly for its result
+        stats.incr(namespace, "lock_waits")
+        deadline = time.monotonic() + LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(LOCK_POLL_INTERVAL)
+            entry = cache.get(full_key)
+            if entry is not None:
+                return entry[0]
+
+        logger.warning(f"Timed out waiting for cache key {full_key}, computing")
+        return _compute(cache, full_key, compute, ttl, namespace)
+    finally:
+        stats.incr(namespace, "lookup_seconds", time.perf_counter() - started)
+
+
+def delete(
+    key: str, namespace: str = DEFAULT_NAMESPACE, cache_alias: str = "default"
+) -> None:
+    """Delete a single key from a namespace."""
+    caches[cache_alias].delete(make_key(key, namespace, cache_alias))
+
+
+def cached(
+    key_fn: Callable[..., str],
+    ttl: int = DEFAULT_TTL,
+    namespace: str | None = None,
+    beta: float = 1.0,
+    cache_alias: str = "default",
+):
+    """
+    Decorator that caches a function's result with `get_or_compute()`.
+
+    Args:
+        key_fn: Called with the function's arguments, returns the cache key
+        ttl: Time to live in seconds
+        namespace: Versioned namespace (defaults to the function's module and name)
+        beta: Early expiration aggressiveness (see `get_or_compute`)
+        cache_alias: Django cache to use
+
+    The wrapped function gains an `invalidate(*args, **kwargs)` method that
+    deletes the entry for those arguments.
+    """
+
+    def decorator(func):
+        func_namespace = namespace or f"{func.__module__}.{func.__qualname__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return get_or_compute(
+                key_fn(*args, **kwargs),
+                lambda: func(*args, **kwargs),
+                ttl=ttl,
+                namespace=func_namespace,
+                beta=beta,
+                cache_alias=cache_alias,
+            )
+
+        def invalidate(*args, **kwargs):
+            delete(key_fn(*args, **kwargs), func_namespace, cache_alias)
+
+        wrapper.invalidate = invalidate
+        wrapper.namespace = func_namespace
+        return wrapper
+
+    return decorator
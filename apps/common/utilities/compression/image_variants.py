@@ -0,0 +1,141 @@
+"""
+Resize an image into a set of variants (thumbnails, responsive sizes).
+
+`render_variants` works on bytes in and bytes out and does not touch Django,
+so it can run in a worker process. The source is decoded once: for JPEGs,
+Pillow's draft mode decodes straight to the smallest DCT scale that is still
+large enough for the biggest variant, which is much faster than decoding the
+full image and resizing it down.
+
+A variant spec is a dict:
+    {"width": 480, "height": 480, "crop": False, "format": "WEBP", "quality": 80}
+
+`height` is optional. Without `crop` the image is fitted inside the box,
+keeping its aspect ratio and never upscaling; with `crop` it is resized and
+center-cropped to exactly width x height.
+"""
+
+import io
+import math
+
+from PIL import Image, ImageOps
+
+# EXIF orientations that swap width and height
+ROTATED_ORIENTATIONS = {5, 6, 7, 8}
+EXIF_ORIENTATION = 0x0112
+
+CONTENT_TYPES = {"WEBP": "image/webp", "JPEG": "image/jpeg", "PNG": "image/png"}
+
+
+def _box(spec: dict) -> tuple[int, int]:
+    width = spec["width"]
+    return width, spec.get("height") or width * 100
+
+
+def _scale_for(spec: dict, width: int, height: int) -> float:
+    """Scale factor of the source needed to produce this variant."""
+    box_width, box_height = _box(spec)
+    if spec.get("crop"):
+        scale = max(box_width / width, box_height / height)
+    else:
+        scale = min(box_width / width, box_height / height)
+    return min(scale, 1.0)
+
+
+def _encode(image: Image.Image, spec: dict) -> tuple[bytes, str]:
+    image_format = spec.get("format", "WEBP").upper()
+    if image_format == "JPEG" and image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    buffer = io.BytesIO()
+    image.save(
+        buffer,
+        format=image_format,
+        quality=spec.get("quality", 80),
+        method=spec.get("method", 4),  # WebP speed/size trade-off, ignored otherwise
+        optimize=image_format != "WEBP",
+    )
+    return buffer.getvalue(), image_format
+
+
+def render_variants(data: bytes, specs: dict[str, dict]) -> dict:
+    """
+    Decode an image once and render every variant in `specs`.
+
+    Args:
+        data: Encoded source image
+        specs: {variant name: spec}
+
+    Returns:
+        dict: {
+            "meta": {"width", "height", "format"},  # of the (rotated) source
+            "variants": {name: {"data", "width", "height", "format", "content_type"}},
+        }
+    """
+    with Image.open(io.BytesIO(data)) as source:
+        source_format = source.format
+        stored_width, stored_height = source.size
+        rotated = source.getexif().get(EXIF_ORIENTATION) in ROTATED_ORIENTATIONS
+        width, height = (
+            (stored_height, stored_width) if rotated else (stored_width, stored_height)
+        )
+
+        scale = max(
+            (_scale_for(spec, width, height) for spec in specs.values()), default=1
+        )
+        if scale < 1:
+            # JPEG only: decode at a reduced scale no smaller than needed
+            target = (
+                math.ceil(stored_width * scale),
+                math.ceil(stored_height * scale),
+            )
+            source.draft("RGB", target)
+
+        image = ImageOps.exif_transpose(source)
+        if image.mode not in ("RGB", "RGBA", "L", "LA"):
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+        image.load()
+
+    variants = {}
+    # Largest first, so each variant can be resized from the one before it
+    ordered = sorted(
+        specs.items(),
+        key=lambda item: _scale_for(item[1], width, height),
+        reverse=True,
+    )
+    previous = image
+    for name, spec in ordered:
+        size = _box(spec)
+        if spec.get("crop"):
+            resized = ImageOps.fit(image, size, Image.Resampling.LANCZOS)
+        else:
+            # Later fitted variants need a smaller scale, so this one can be
+            # the (cheaper) source for the next
+            resized = previous.copy()
+            resized.thumbnail(size, Image.Resampling.LANCZOS)
+            previous = resized
+        content, image_format = _encode(resized, spec)
+        variants[name] = {
+            "data": content,
+            "width": resized.width,
+            "height": resized.height,
+            "format": image_format,
+            "content_type": CONTENT_TYPES.get(image_format, "application/octet-stream"),
+        }
+
+    return {
+        "meta": {"width": width, "height": height, "format": source_format},
+        "variants": variants,
+    }
+
+
+def render_job(job: tuple[bytes, dict]):
+    """
+    Process pool entry point: `render_variants(*job)`.
+
+    Returns the exception instead of raising it, so one bad image doesn't
+    fail the rest of the batch.
+    """
+    try:
+        return render_variants(*job)
+    except Exception as e:
+        return e
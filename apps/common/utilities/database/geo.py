@@ -0,0 +1,142 @@
+"""
+Distance queries on plain latitude/longitude columns.
+
+Locatable models store coordinates as two floats, so these work on any
+database (PostgreSQL without PostGIS, SQLite) using only SQL math
+functions:
+
+- `bounding_box_q()` limits a query to the rectangle around a circle. It's
+  a cheap range filter on the (latitude, longitude) index, and handles the
+  poles and the antimeridian.
+- `distance_km()` is the exact haversine (great-circle) distance as a SQL
+  expression, evaluated only for the rows left by the bounding box.
+- `encode_geohash()` gives the geohash of a point, stored by Locatable so
+  that nearby rows share a prefix and can be grouped with a prefix index.
+
+`Model.objects.within_radius(lat, lon, km)` and `.nearest(n)` (see
+LocatableQuerySet) combine them.
+
+Example:
+    ```python
+    BlogPost.objects.live().within_radius(51.5074, -0.1278, 25).nearest(5)
+    ```
+"""
+
+import math
+
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.expressions import ExpressionWrapper
+from django.db.models.functions import ASin, Cos, Least, Power, Radians, Sin, Sqrt
+
+# Mean radius (IUGG)
+EARTH_RADIUS_KM = 6371.0088
+
+GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+# 9 characters is a cell of about 5 m x 5 m
+GEOHASH_PRECISION = 9
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """The great-circle distance between two points, in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (
+        math.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(
+    latitude: float, longitude: float, km: float
+) -> tuple[tuple[float, float], list[tuple[float, float]]]:
+    """
+    The latitude range and longitude ranges of the smallest rectangle
+    containing every point within `km` of (latitude, longitude).
+
+    There are two longitude ranges when the box crosses the antimeridian,
+    and the longitude range is the whole circle when it contains a pole.
+    """
+    angle = km / EARTH_RADIUS_KM
+    min_lat = latitude - math.degrees(angle)
+    max_lat = latitude + math.degrees(angle)
+    if min_lat <= -90 or max_lat >= 90:
+        return (max(min_lat, -90.0), min(max_lat, 90.0)), [(-180.0, 180.0)]
+
+    # The widest point of the circle is north or south of its centre
+    ratio = math.sin(angle) / math.cos(math.radians(latitude))
+    if ratio >= 1:
+        return (min_lat, max_lat), [(-180.0, 180.0)]
+    delta = math.degrees(math.asin(ratio))
+    min_lon, max_lon = longitude - delta, longitude + delta
+    if min_lon < -180:
+        return (min_lat, max_lat), [(min_lon + 360, 180.0), (-180.0, max_lon)]
+    if max_lon > 180:
+        return (min_lat, max_lat), [(min_lon, 180.0), (-180.0, max_lon - 360)]
+    return (min_lat, max_lat), [(min_lon, max_lon)]
+
+
+def bounding_box_q(
+    latitude: float,
+    longitude: float,
+    km: float,
+    latitude_field: str = "latitude",
+    longitude_field: str = "longitude",
+) -> Q:
+    """A filter for the rows inside bounding_box(); it can use an index."""
+    latitudes, longitude_ranges = bounding_box(latitude, longitude, km)
+    condition = Q()
+    for longitudes in longitude_ranges:
+        condition |= Q(**{f"{longitude_field}__range": longitudes})
+    return Q(**{f"{latitude_field}__range": latitudes}) & condition
+
+
+def distance_km(
+    latitude: float,
+    longitude: float,
+    latitude_field: str = "latitude",
+    longitude_field: str = "longitude",
+):
+    """
+    A SQL expression for the haversine distance in kilometres from
+    (latitude, longitude) to each row, null if the row has no coordinates.
+    """
+    phi = Radians(F(latitude_field))
+
+    def radians(value):
+        return Value(math.radians(value), output_field=FloatField())
+
+    a = Power(Sin((phi - radians(latitude)) / 2), 2) + Value(
+        math.cos(math.radians(latitude)), output_field=FloatField()
+    ) * Cos(phi) * Power(Sin((Radians(F(longitude_field)) - radians(longitude)) / 2), 2)
+    # Least() guards asin() against rounding just above 1
+    return ExpressionWrapper(
+        2 * EARTH_RADIUS_KM * ASin(Least(Sqrt(a), Value(1.0))),
+        output_field=FloatField(),
+    )
+
+
+def encode_geohash(
+    latitude: float, longitude: float, precision: int = GEOHASH_PRECISION
+) -> str:
+    """The geohash of a point, `precision` characters long."""
+    latitudes, longitudes = [-90.0, 90.0], [-180.0, 180.0]
+    chars = []
+    bits = value = 0
+    even = True
+    while len(chars) < precision:
+        interval, coordinate = (
+            (longitudes, longitude) if even else (latitudes, latitude)
+        )
+        middle = (interval[0] + interval[1]) / 2
+        value <<= 1
+        if coordinate >= middle:
+            value |= 1
+            interval[0] = middle
+        else:
+            interval[1] = middle
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(GEOHASH_ALPHABET[value])
+            bits = value = 0
+    return "".join(chars)
@@ -0,0 +1,54 @@
+"""
+Database connection pool metrics.
+
+With DB_POOL (settings/database.py), Django's PostgreSQL backend keeps a
+psycopg_pool.ConnectionPool per database in each process. `pool_stats()`
+summarises it:
+
+- size, in_use, available: connections open, lent out and idle
+- waiting: requests queued for a connection right now
+- requests, acquire_ms, timeouts: connections handed out, their average
+  wait and the requests that gave up after DB_POOL_TIMEOUT, since the pool
+  started or since the last `pool_stats(reset=True)`
+
+PerformanceMiddleware logs in_use and waiting with every request. The time
+each request spends getting a connection is `db_connect_ms` in the request
+metrics (utilities/performance.py).
+"""
+
+from django.db import connections
+
+
+def is_pooled(alias: str = "default") -> bool:
+    return bool(connections[alias].settings_dict.get("OPTIONS", {}).get("pool"))
+
+
+def pool_stats(alias: str = "default", reset: bool = False) -> dict | None:
+    """Usage of a database's connection pool, or None if it isn't pooled."""
+    if not is_pooled(alias):
+        return None
+    pool = getattr(connections[alias], "pool", None)
+    if pool is None:
+        return None
+    stats = pool.pop_stats() if reset else pool.get_stats()
+    size = stats.get("pool_size", 0)
+    available = stats.get("pool_available", 0)
+    requests = stats.get("requests_num", 0)
+    wait_ms = stats.get("requests_wait_ms", 0)
+    return {
+        "alias": alias,
+        "min_size": stats.get("pool_min", pool.min_size),
+        "max_size": stats.get("pool_max", pool.max_size),
+        "size": size,
+        "in_use": size - available,
+        "available": available,
+        "waiting": stats.get("requests_waiting", 0),
+        "requests": requests,
+        "acquire_ms": round(wait_ms / requests, 2) if requests else 0.0,
+        "timeouts": stats.get("requests_errors", 0),
+    }
+
+
+def all_pool_stats(reset: bool = False) -> list[dict]:
+    """pool_stats() of every pooled database."""
+    return [stats for alias in connections if (stats := pool_stats(alias, reset=reset))]
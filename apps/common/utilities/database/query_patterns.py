@@ -0,0 +1,142 @@
+"""
+N+1 query detection.
+
+`QueryPatternDetector` groups the SQL run while it is active by shape: the
+statement with literals and parameter lists collapsed, so `WHERE id = 1` and
+`WHERE id = 2` (or `IN (%s, %s)` and `IN (%s)`) count as the same query.
+Transaction control statements are ignored. A shape that runs `threshold`
+times or more is reported, together with the project stack frames that
+issued it.
+
+It is used per request by PerformanceMiddleware
+(PERFORMANCE_N_PLUS_ONE_THRESHOLD) and per test by the `max_queries` pytest
+marker in conftest.py:
+
+    @pytest.mark.max_queries(5)
+    def test_team_page(client): ...
+
+    @pytest.mark.max_queries(20, max_repeats=3)
+    class TeamViewsTestCase(TestCase): ...
+"""
+
+import os
+import re
+import sys
+import traceback
+from collections import Counter
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import connections
+
+STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+PARAMETER_LIST = re.compile(r"\(\s*(?:%s|\?|\.\.\.)(?:\s*,\s*(?:%s|\?|\.\.\.))*\s*\)")
+WHITESPACE = re.compile(r"\s+")
+# Transaction control and constraint checks (TestCase savepoints and
+# teardown) aren't counted
+TRANSACTION_CONTROL = re.compile(
+    r"^\s*(?:SAVEPOINT|RELEASE SAVEPOINT|ROLLBACK|BEGIN|COMMIT|SET CONSTRAINTS"
+    r"|PRAGMA foreign_key_check)\b",
+    re.IGNORECASE,
+)
+STACK_DEPTH = 8
+
+
+def normalize_sql(sql: str) -> str:
+    """The shape of a statement: literals and parameter lists collapsed."""
+    shape = STRING_LITERAL.sub("?", sql)
+    shape = NUMBER_LITERAL.sub("?", shape)
+    shape = shape.replace("%s", "?")
+    shape = PARAMETER_LIST.sub("(...)", shape)
+    return WHITESPACE.sub(" ", shape).strip()
+
+
+def _is_project_frame(filename: str) -> bool:
+    base_dir = str(settings.BASE_DIR)
+    return (
+        filename.startswith(base_dir)
+        and f"{os.sep}site-packages{os.sep}" not in filename
+        and filename != __file__
+    )
+
+
+def project_stack(limit: int = STACK_DEPTH) -> list[str]:
+    """The innermost project (non-library) frames of the current stack."""
+    frames = [
+        frame
+        for frame in traceback.extract_stack(sys._getframe(1))
+        if _is_project_frame(frame.filename)
+    ]
+    base_dir = str(settings.BASE_DIR)
+    return [
+        f"{os.path.relpath(frame.filename, base_dir)}:{frame.lineno} in {frame.name}"
+        for frame in frames[-limit:]
+    ]
+
+
+@dataclass
+class QueryPattern:
+    """A query shape and how often it ran."""
+
+    sql: str
+    count: int
+    stack: list[str] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        return {"sql": self.sql, "count": self.count, "stack": self.stack}
+
+
+class QueryPatternDetector:
+    """
+    Context manager counting query shapes on every database connection.
+
+    The stack is captured once per shape, when it reaches `threshold`, so
+    the cost of detection stays low for queries that don't repeat.
+    """
+
+    def __init__(self, threshold: int = 5):
+        self.threshold = max(threshold, 2)
+        self.counts: Counter[str] = Counter()
+        self.stacks: dict[str, list[str]] = {}
+        self._stack: ExitStack | None = None
+
+    def __enter__(self) -> "QueryPatternDetector":
+        self._stack = ExitStack()
+        for connection in connections.all():
+            self._stack.enter_context(connection.execute_wrapper(self))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stack.close()
+        self._stack = None
+
+    def __call__(self, execute, sql, params, many, context):
+        if TRANSACTION_CONTROL.match(sql):
+            return execute(sql, params, many, context)
+        shape = normalize_sql(sql)
+        self.counts[shape] += 1
+        if self.counts[shape] == self.threshold:
+            self.stacks[shape] = project_stack()
+        return execute(sql, params, many, context)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def repeated(self, threshold: int | None = None) -> list[QueryPattern]:
+        """Shapes run at least `threshold` times, most frequent first."""
+        threshold = self.threshold if threshold is None else threshold
+        return [
+            QueryPattern(shape, count, self.stacks.get(shape, []))
+            for shape, count in self.counts.most_common()
+            if count >= threshold
+        ]
+
+    def report(self, threshold: int | None = None) -> str:
+        lines = [f"{self.total} queries, {len(self.counts)} distinct shapes"]
+        for pattern in self.repeated(threshold):
+            lines.append(f"  {pattern.count}x {pattern.sql}")
+            lines.extend(f"      {frame}" for frame in pattern.stack)
+        return "\n".join(lines)
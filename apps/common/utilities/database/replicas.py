@@ -0,0 +1,191 @@
+"""
+Read replica routing.
+
+All queries go to `default` unless they run inside `read_from_replica()`,
+which marks code that can tolerate slightly stale data (dashboards,
+listings, chat history). It works as a context manager or a decorator, on
+sync and async functions:
+
+    with read_from_replica():
+        teams = list(Team.objects.filter(...))
+
+    @read_from_replica
+    def get_admin_dashboard(request, context=None): ...
+
+Querysets are routed when they're evaluated, so evaluate them inside the
+block (e.g. with `list()`) rather than passing them lazily to a template.
+
+Stickiness: after a write, reads go to `default` for
+DATABASE_REPLICA_STICKY_SECONDS, so code (and, with
+ReplicaStickinessMiddleware, the same browser's next requests) reads its
+own writes.
+
+Lag: a replica more than DATABASE_REPLICA_MAX_LAG seconds behind is
+skipped, and if no replica is usable reads fall back to `default`. Lag is
+measured at most every DATABASE_REPLICA_LAG_CHECK_INTERVAL seconds per
+process and replica.
+
+Replicas are configured with DATABASE_REPLICA_URLS (settings/database.py).
+"""
+
+import functools
+import inspect
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+# SQL for how far behind the primary a PostgreSQL standby is, in seconds.
+# A standby that has replayed everything it received is up to date, even if
+# the last replayed transaction is old (an idle primary).
+POSTGRES_LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+"""
+
+_replica_reads: ContextVar[bool] = ContextVar("replica_reads", default=False)
+# time.monotonic() of the last write in this context
+_last_write: ContextVar[float | None] = ContextVar("last_write", default=None)
+
+_lag_lock = threading.Lock()
+# alias -> (checked at, lag in seconds)
+_lag_cache: dict[str, tuple[float, float]] = {}
+
+
+def replica_aliases() -> list[str]:
+    return list(getattr(settings, "DATABASE_REPLICAS", []))
+
+
+def sticky_seconds() -> float:
+    return getattr(settings, "DATABASE_REPLICA_STICKY_SECONDS", 5.0)
+
+
+def record_write() -> None:
+    """Pin reads in this context to the primary for a while."""
+    _last_write.set(time.monotonic())
+
+
+def last_write() -> float | None:
+    return _last_write.get()
+
+
+def start_request(pinned: bool = False):
+    """Start a request's stickiness, pinned if the client wrote recently."""
+    return _last_write.set(time.monotonic() if pinned else None)
+
+
+def end_request(token) -> None:
+    _last_write.reset(token)
+
+
+def pinned_to_primary() -> bool:
+    last_write = _last_write.get()
+    return last_write is not None and time.monotonic() - last_write < sticky_seconds()
+
+
+def measure_lag(alias: str) -> float:
+    """Replication lag of a database in seconds (inf if it can't be reached)."""
+    connection = connections[alias]
+    if connection.vendor != "postgresql":
+        return 0.0
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(POSTGRES_LAG_SQL)
+            return float(cursor.fetchone()[0])
+    except DatabaseError as e:
+        logger.warning(f"Could not measure lag of replica {alias}: {str(e)}")
+        return float("inf")
+
+
+def replica_lag(alias: str) -> float:
+    """Replication lag of a replica, measured at most once per check interval."""
+    interval = getattr(settings, "DATABASE_REPLICA_LAG_CHECK_INTERVAL", 5.0)
+    now = time.monotonic()
+    with _lag_lock:
+        cached = _lag_cache.get(alias)
+        if cached and now - cached[0] < interval:
+            return cached[1]
+    lag = measure_lag(alias)
+    with _lag_lock:
+        _lag_cache[alias] = (now, lag)
+    return lag
+
+
+def healthy_replicas() -> list[str]:
+    max_lag = getattr(settings, "DATABASE_REPLICA_MAX_LAG", 5.0)
+    return [alias for alias in replica_aliases() if replica_lag(alias) <= max_lag]
+
+
+def choose_replica() -> str | None:
+    """A usable replica for reads in this context, or None for the primary."""
+    if not _replica_reads.get() or pinned_to_primary():
+        return None
+    replicas = healthy_replicas()
+    return random.choice(replicas) if replicas else None
+
+
+@contextmanager
+def _replica_block():
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def read_from_replica(func=None):
+    """Send reads to a replica, as a context manager or decorator."""
+    if func is None:
+        return _replica_block()
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with _replica_block():
+                return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _replica_block():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+class ReplicaRouter:
+    """
+    Route reads in read_from_replica() blocks to a healthy replica.
+
+    Everything else, including all writes, goes to `default`.
+    """
+
+    def db_for_read(self, model, **hints):
+        return choose_replica()
+
+    def db_for_write(self, model, **hints):
+        record_write()
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in replica_aliases():
+            return False
+        return None
@@ -0,0 +1,180 @@
+"""
+PostgreSQL full-text search.
+
+Models with the Searchable behavior have a stored `search_vector` column
+holding the weighted tsvector of their `search_weights` fields, e.g. for
+BlogPost {"title": "A", "subtitle": "B", "tags": "B", "content": "C"}.
+
+- The column is computed by the database: the AddSearchTrigger migration
+  operation installs a BEFORE INSERT/UPDATE trigger that sets it, a GIN
+  index on it, and fills it for existing rows. Saves, bulk_create() and
+  queryset update() all keep it current.
+- `search(queryset, query)` filters with the index and annotates the
+  relevance as `rank`, leaving the ordering to the caller;
+  `Model.objects.search(query)` also orders by it. The query uses web
+  search syntax: `django orm`, `"exact phrase"`, `-excluded`,
+  `this or that`.
+- On other databases (SQLite in local development) the triggers aren't
+  installed and search() falls back to matching every word with
+  icontains, unranked.
+
+The text search configuration is SEARCH_CONFIG (default "english"). It is
+also baked into the triggers, so changing it needs a migration that
+re-adds them.
+"""
+
+import operator
+from functools import reduce
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.migrations.operations.base import Operation
+from django.db.models import F, FloatField, Q, QuerySet, Value
+
+DEFAULT_CONFIG = "english"
+
+
+def search_config() -> str:
+    return getattr(settings, "SEARCH_CONFIG", DEFAULT_CONFIG)
+
+
+def supports_full_text_search(using: str = "default") -> bool:
+    """Whether the database has the search triggers and indexes."""
+    return connections[using].vendor == "postgresql"
+
+
+def search(queryset: QuerySet, query: str) -> QuerySet:
+    """
+    Rows of a Searchable queryset matching `query`, in the queryset's order.
+
+    Every row gets a `rank` annotation (always 0 without full-text search);
+    order by "-rank" for the most relevant first.
+    """
+    if supports_full_text_search(queryset.db):
+        search_query = SearchQuery(
+            query, search_type="websearch", config=search_config()
+        )
+        return queryset.filter(search_vector=search_query).annotate(
+            rank=SearchRank(F("search_vector"), search_query)
+        )
+
+    fields = queryset.model.search_weights
+    words = query.split()
+    if not words:
+        return queryset.none()
+    condition = reduce(
+        operator.and_,
+        (
+            reduce(
+                operator.or_, (Q(**{f"{field}__icontains": word}) for field in fields)
+            )
+            for word in words
+        ),
+    )
+    return queryset.filter(condition).annotate(
+        rank=Value(0.0, output_field=FloatField())
+    )
+
+
+def vector_sql(columns: dict[str, str], config: str, row: str) -> str:
+    """SQL for the weighted tsvector of a row's columns ({column: weight})."""
+    return " || ".join(
+        f"setweight(to_tsvector('{config}'::regconfig, coalesce({row}.\"{column}\", '')), '{weight}')"
+        for column, weight in columns.items()
+    )
+
+
+class AddSearchTrigger(Operation):
+    """
+    Migration operation that maintains a model's search_vector in the
+    database: a trigger computing it on insert and update, a GIN index, and
+    a backfill of existing rows. Does nothing on databases other than
+    PostgreSQL.
+
+    The weights are passed explicitly, because migrations see historical
+    models without their `search_weights`:
+
+        AddSearchTrigger("blogpost", {"title": "A", "content": "C"})
+    """
+
+    reversible = True
+
+    def __init__(
+        self, model_name: str, weights: dict[str, str], config: str = DEFAULT_CONFIG
+    ):
+        self.model_name = model_name
+        self.weights = weights
+        self.config = config
+
+    def deconstruct(self):
+        kwargs = {"model_name": self.model_name, "weights": self.weights}
+        if self.config != DEFAULT_CONFIG:
+            kwargs["config"] = self.config
+        return (self.__class__.__qualname__, [], kwargs)
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def _applies(self, app_label, schema_editor, state):
+        model = state.apps.get_model(app_label, self.model_name)
+        connection = schema_editor.connection
+        if connection.vendor != "postgresql" or not self.allow_migrate_model(
+            connection.alias, model
+        ):
+            return None
+        return model
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = self._applies(app_label, schema_editor, to_state)
+        if model is None:
+            return
+        qn = schema_editor.quote_name
+        table = model._meta.db_table
+        name = qn(f"{table}_search_vector")
+        columns = {
+            model._meta.get_field(field).column: weight
+            for field, weight in self.weights.items()
+        }
+        column_list = ", ".join(qn(column) for column in columns)
+
+        schema_editor.execute(
+            f"""
+            CREATE FUNCTION {name}() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector := {vector_sql(columns, self.config, "NEW")};
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+            """
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER {name} BEFORE INSERT OR UPDATE OF {column_list} "
+            f"ON {qn(table)} FOR EACH ROW EXECUTE FUNCTION {name}()"
+        )
+        schema_editor.execute(
+            f"UPDATE {qn(table)} SET search_vector = "
+            f"{vector_sql(columns, self.config, qn(table))}"
+        )
+        schema_editor.execute(
+            f"CREATE INDEX {qn(f'{table}_search_idx')} ON {qn(table)} "
+            f"USING gin (search_vector)"
+        )
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = self._applies(app_label, schema_editor, from_state)
+        if model is None:
+            return
+        qn = schema_editor.quote_name
+        table = model._meta.db_table
+        name = qn(f"{table}_search_vector")
+        schema_editor.execute(f"DROP INDEX IF EXISTS {qn(f'{table}_search_idx')}")
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {name} ON {qn(table)}")
+        schema_editor.execute(f"DROP FUNCTION IF EXISTS {name}()")
+
+    def describe(self):
+        return f"Add full-text search trigger and index to {self.model_name}"
+
+    @property
+    def migration_name_fragment(self):
+        return f"{self.model_name.lower()}_search"
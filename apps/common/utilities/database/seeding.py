@@ -0,0 +1,229 @@
+"""
+Bulk insertion for seeding large volumes of data.
+
+- `build_batch()` builds unsaved instances from a model or a test factory
+  (apps/common/tests/factories.py), with per-row values from callables.
+- `bulk_insert()` saves them in chunks with `bulk_create`, or with
+  PostgreSQL `COPY` when `use_copy=True`. Before inserting, it sends
+  `pre_save` for each instance, so receivers that normalise data (lowercase
+  codes, slugs) still apply. `post_save` is not sent, and the model's
+  manager is bypassed, so nothing it does after inserting (like syncing
+  BlogPost tags, see `refresh_tag_counts`) happens. Slugs of
+  Permalinkable models are allocated for the whole batch first.
+- `seed()` streams build + insert in chunks, so memory use doesn't grow
+  with the row count.
+
+Parents must be inserted before their children (Currency → Country → City
+→ Address, User → Team → TeamMember, ChatSession → ChatMessage); see the
+seed_perf_data management command.
+"""
+
+import io
+import json
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from django.db import connections, models, router, transaction
+
+from apps.common.behaviors.managers import prepare_bulk_create
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+@dataclass
+class SeedStats:
+    """Rows inserted for one model and how long it took."""
+
+    model: str
+    rows: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "model": self.model,
+            "rows": self.rows,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+def _resolve(source) -> tuple[type[models.Model], dict[str, Any]]:
+    """A model class and its default field values, from a model or factory."""
+    if hasattr(source, "model_class"):
+        return source.model_class, dict(source.default_data)
+    return source, {}
+
+
+def build_batch(source, count: int, start: int = 0, **fields) -> list[models.Model]:
+    """
+    Build `count` unsaved instances of a model or factory.
+
+    Field values may be constants or callables taking the row index
+    (`start` to `start + count - 1`), e.g. `username=lambda i: f"user_{i}"`.
+    A factory's zero-argument callable defaults are called once per row.
+    """
+    model, defaults = _resolve(source)
+    defaults = {k: v for k, v in defaults.items() if k not in fields}
+    instances = []
+    for i in range(start, start + count):
+        data = {k: v() if callable(v) else v for k, v in defaults.items()}
+        data.update({k: v(i) if callable(v) else v for k, v in fields.items()})
+        instances.append(model(**data))
+    return instances
+
+
+def copy_supported(using: str = "default") -> bool:
+    """Whether `COPY` can be used on this database connection."""
+    return connections[using].vendor == "postgresql"
+
+
+def allocate_ids(model: type[models.Model], count: int, using: str) -> list[int]:
+    """Reserve `count` values from an auto-increment primary key's sequence."""
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence(%s, %s)) "
+            "FROM generate_series(1, %s)",
+            [model._meta.db_table, model._meta.pk.column, count],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _copy_value(field: models.Field, instance: models.Model, connection) -> str:
+    """A field value in PostgreSQL's COPY text format."""
+    value = field.pre_save(instance, add=True)
+    if value is not None:
+        if isinstance(field, models.JSONField):
+            value = json.dumps(value, cls=field.encoder)
+        else:
+            value = field.get_db_prep_save(value, connection)
+    if value is None:
+        return r"\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (bytes, memoryview)):
+        return "\\\\x" + bytes(value).hex()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_rows(instances: list[models.Model], connection) -> tuple[list[str], str]:
+    """Column names and COPY text-format data for instances of one model."""
+    fields = instances[0]._meta.concrete_fields
+    lines = [
+        "\t".join(_copy_value(field, instance, connection) for field in fields)
+        for instance in instances
+    ]
+    return [field.column for field in fields], "\n".join(lines) + "\n"
+
+
+def copy_insert(instances: list[models.Model], using: str) -> int:
+    """Insert instances with COPY ... FROM STDIN (PostgreSQL)."""
+    if not instances:
+        return 0
+    model = type(instances[0])
+    connection = connections[using]
+    pk = model._meta.pk
+    if isinstance(pk, models.AutoField):
+        missing = [instance for instance in instances if instance.pk is None]
+        for instance, pk_value in zip(
+            missing, allocate_ids(model, len(missing), using)
+        ):
+            instance.pk = pk_value
+
+    columns, data = copy_rows(instances, connection)
+    quoted = ", ".join(connection.ops.quote_name(column) for column in columns)
+    sql = (
+        f"COPY {connection.ops.quote_name(model._meta.db_table)} ({quoted}) FROM STDIN"
+    )
+    with connection.cursor() as cursor:
+        raw = cursor.cursor
+        if hasattr(raw, "copy_expert"):  # psycopg2
+            raw.copy_expert(sql, io.StringIO(data))
+        else:  # psycopg 3
+            with raw.copy(sql) as copy:
+                copy.write(data)
+    for instance in instances:
+        instance._state.adding = False
+        instance._state.db = using
+    return len(instances)
+
+
+def bulk_insert(
+    instances: list[models.Model],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    use_copy: bool = False,
+    send_signals: bool = True,
+    using: str | None = None,
+) -> int:
+    """
+    Insert instances of one model in chunks of `batch_size`.
+
+    Primary keys are set on the instances afterwards, so children can
+    reference them. Falls back to bulk_create if COPY isn't available.
+    """
+    if not instances:
+        return 0
+    model = type(instances[0])
+    using = using or router.db_for_write(model)
+    prepare_bulk_create(model, instances, using=using, send_signals=send_signals)
+
+    use_copy = use_copy and copy_supported(using)
+    for offset in range(0, len(instances), batch_size):
+        chunk = instances[offset : offset + batch_size]
+        with transaction.atomic(using=using):
+            if use_copy:
+                copy_insert(chunk, using)
+            else:
+                # A plain QuerySet: BehaviorQuerySet.bulk_create() would
+                # prepare the instances a second time
+                models.QuerySet(model, using=using).bulk_create(
+                    chunk, batch_size=batch_size
+                )
+    return len(instances)
+
+
+def seed(
+    source,
+    count: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    use_copy: bool = False,
+    on_batch: Callable[[list[models.Model]], None] | None = None,
+    start: int = 0,
+    **fields,
+) -> SeedStats:
+    """
+    Build and insert `count` rows, one batch at a time.
+
+    `on_batch` is called with each inserted batch (primary keys set), which
+    is where children of those rows can be seeded.
+    """
+    model, _ = _resolve(source)
+    stats = SeedStats(model._meta.label)
+    for offset in range(start, start + count, batch_size):
+        started = time.perf_counter()
+        size = min(batch_size, start + count - offset)
+        batch = build_batch(source, size, start=offset, **fields)
+        stats.rows += bulk_insert(batch, batch_size=batch_size, use_copy=use_copy)
+        stats.seconds += time.perf_counter() - started
+        if on_batch:
+            on_batch(batch)
+    logger.info(
+        f"Seeded {stats.rows} {stats.model} rows in {stats.seconds:.1f}s "
+        f"({stats.rows_per_second:.0f} rows/s)"
+    )
+    return stats
@@ -0,0 +1,84 @@
+"""
+Pluggable search for admin changelists.
+
+ModelAdmins with SearchableAdminMixin hand their search box to the backend
+named by ADMIN_SEARCH_BACKEND (a dotted path, default
+FullTextSearchBackend):
+
+- FullTextSearchBackend searches Searchable models' `search_vector` on
+  PostgreSQL, using its GIN index, and lists results by relevance unless a
+  column is sorted. Terms that look like ids (numbers, UUIDs), models that
+  aren't Searchable and other databases use Django's search.
+- DjangoSearchBackend is Django's own: `search_fields` lookups, i.e.
+  ILIKE '%term%' on every field.
+
+Example:
+    ```python
+    @admin.register(Note)
+    class NoteAdmin(SearchableAdminMixin, ModelAdmin):
+        search_fields = ("text",)  # used by DjangoSearchBackend
+    ```
+"""
+
+import re
+
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.admin.views.main import ORDER_VAR
+from django.utils.module_loading import import_string
+
+from apps.common.utilities.database.search import search, supports_full_text_search
+
+DEFAULT_BACKEND = "apps.common.utilities.django.admin_search.FullTextSearchBackend"
+ID_PATTERN = re.compile(r"^(\d+|[0-9a-f]{8}-?([0-9a-f]{4}-?){3}[0-9a-f]{12})$", re.I)
+
+
+class DjangoSearchBackend:
+    """Django's admin search over `search_fields`."""
+
+    def get_search_results(self, model_admin, request, queryset, search_term):
+        return admin.ModelAdmin.get_search_results(
+            model_admin, request, queryset, search_term
+        )
+
+
+class FullTextSearchBackend(DjangoSearchBackend):
+    """Ranked full-text search for Searchable models on PostgreSQL."""
+
+    def uses_full_text_search(self, queryset, search_term) -> bool:
+        term = search_term.strip()
+        return (
+            bool(term)
+            and not ID_PATTERN.match(term)
+            and any(
+                field.name == "search_vector"
+                for field in queryset.model._meta.concrete_fields
+            )
+            and supports_full_text_search(queryset.db)
+        )
+
+    def get_search_results(self, model_admin, request, queryset, search_term):
+        if not self.uses_full_text_search(queryset, search_term):
+            return super().get_search_results(
+                model_admin, request, queryset, search_term
+            )
+        queryset = search(queryset, search_term.strip())
+        # The changelist has already ordered the queryset; a sorted column
+        # is kept, otherwise the most relevant results come first
+        if ORDER_VAR not in request.GET:
+            queryset = queryset.order_by("-rank", "-pk")
+        return queryset, False
+
+
+def get_search_backend():
+    """The configured admin search backend."""
+    return import_string(getattr(settings, "ADMIN_SEARCH_BACKEND", DEFAULT_BACKEND))()
+
+
+class SearchableAdminMixin:
+    """ModelAdmin mixin that searches with the configured search backend."""
+
+    def get_search_results(self, request, queryset, search_term):
+        return get_search_backend().get_search_results(
+            self, request, queryset, search_term
+        )
@@ -1,4 +1,27 @@
+import cProfile
+import json
+import logging
 import os
+import random
+import re
+import threading
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from apps.common.utilities import performance
+from apps.common.utilities.database import replicas
+from apps.common.utilities.database.pooling import all_pool_stats
+from apps.common.utilities.database.query_patterns import QueryPatternDetector
+
+logger = logging.getLogger(__name__)
+
+# cProfile allows one active profiler per process (sys.monitoring on Python
+# 3.12+), so only one request at a time is profiled
+_profiler_lock = threading.Lock()
 
 
 def show_debug_toolbar(request):
@@ -21,3 +44,165 @@ class APIHeaderMiddleware:
             "Required-Main-Build", "unknown"
         )
         return response
+
+
+class ReplicaStickinessMiddleware:
+    """
+    Keeps a client's reads on the primary database right after it writes.
+
+    A request that writes sets a short-lived cookie; while it's there, that
+    client's read_from_replica() blocks use `default`, so people see their
+    own changes before the replicas catch up (see
+    utilities/database/replicas.py). Unused without DATABASE_REPLICAS.
+    """
+
+    cookie_name = "db_primary"
+
+    def __init__(self, get_response):
+        if not getattr(settings, "DATABASE_REPLICAS", []):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = replicas.start_request(pinned=self.cookie_name in request.COOKIES)
+        before = replicas.last_write()
+        try:
+            response = self.get_response(request)
+            wrote = replicas.last_write() != before
+        finally:
+            replicas.end_request(token)
+        if wrote:
+            response.set_cookie(
+                self.cookie_name,
+                "1",
+                max_age=int(replicas.sticky_seconds()) or 1,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+
+class PerformanceMiddleware:
+    """
+    Records where each request's time goes (see utilities/performance.py).
+
+    Every response gets a Server-Timing header (PERFORMANCE_SERVER_TIMING)
+    and one JSON log line; requests slower than PERFORMANCE_SLOW_REQUEST_MS
+    are logged as warnings. A sample of requests
+    (PERFORMANCE_PROFILE_SAMPLE_RATE) runs under cProfile, and the profile is
+    written to PERFORMANCE_PROFILE_DIR if the request turns out to be slow.
+
+    With DB_POOL on, the log line also has each pool's connections in use
+    and requests waiting for one (see utilities/database/pooling.py).
+
+    With PERFORMANCE_N_PLUS_ONE_THRESHOLD set, query shapes repeated that
+    many times within a request are logged as warnings with their call site.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "PERFORMANCE_INSTRUMENTATION_ENABLED", True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.server_timing = getattr(settings, "PERFORMANCE_SERVER_TIMING", True)
+        self.slow_ms = getattr(settings, "PERFORMANCE_SLOW_REQUEST_MS", 1000)
+        self.sample_rate = getattr(settings, "PERFORMANCE_PROFILE_SAMPLE_RATE", 0.0)
+        self.profile_dir = getattr(settings, "PERFORMANCE_PROFILE_DIR", None)
+        self.n_plus_one_threshold = getattr(
+            settings, "PERFORMANCE_N_PLUS_ONE_THRESHOLD", 0
+        )
+        performance.install_instrumentation()
+
+    def __call__(self, request):
+        metrics, token = performance.start_request()
+        profiler = detector = None
+        if self.n_plus_one_threshold:
+            detector = QueryPatternDetector(self.n_plus_one_threshold)
+        sampled = self.profile_dir and random.random() < self.sample_rate
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(
+                        connection.execute_wrapper(performance.db_execute_wrapper)
+                    )
+                if detector is not None:
+                    stack.enter_context(detector)
+                if sampled:
+                    profiler = self.start_profiler()
+                try:
+                    response = self.get_response(request)
+                finally:
+                    if profiler is not None:
+                        profiler.disable()
+                        _profiler_lock.release()
+        finally:
+            performance.end_request(token)
+
+        data = metrics.as_dict()
+        pools = all_pool_stats()
+        if pools:
+            data["db_pool"] = {
+                stats["alias"]: {"in_use": stats["in_use"], "waiting": stats["waiting"]}
+                for stats in pools
+            }
+        if self.server_timing:
+            response["Server-Timing"] = metrics.server_timing()
+        if profiler is not None and data["wall_ms"] >= self.slow_ms:
+            data["profile"] = self.dump_profile(profiler, request)
+        self.log(request, response, data)
+        if detector is not None:
+            self.log_repeated_queries(request, detector)
+        return response
+
+    def start_profiler(self) -> cProfile.Profile | None:
+        """
+        Start profiling this request, unless another request in the process
+        is being profiled or another profiling tool is active.
+        """
+        if not _profiler_lock.acquire(blocking=False):
+            return None
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # "Another profiling tool is already active", e.g. a debugger
+            _profiler_lock.release()
+            return None
+        return profiler
+
+    def dump_profile(self, profiler: cProfile.Profile, request) -> str | None:
+        path_slug = re.sub(r"[^A-Za-z0-9]+", "-", request.path).strip("-") or "root"
+        filename = os.path.join(
+            self.profile_dir,
+            f"{time.strftime('%Y%m%d-%H%M%S')}-{request.method}-{path_slug[:80]}"
+            f"-{os.getpid()}.prof",
+        )
+        try:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            profiler.dump_stats(filename)
+        except OSError as e:
+            logger.error(f"Could not write profile {filename}: {str(e)}")
+            return None
+        return filename
+
+    def log(self, request, response, data: dict) -> None:
+        record = {
+            "event": "request",
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            **data,
+        }
+        if data["wall_ms"] >= self.slow_ms:
+            logger.warning(json.dumps(record))
+        else:
+            logger.info(json.dumps(record))
+
+    def log_repeated_queries(self, request, detector: QueryPatternDetector) -> None:
+        for pattern in detector.repeated():
+            record = {
+                "event": "n_plus_one",
+                "method": request.method,
+                "path": request.path,
+                **pattern.as_dict(),
+            }
+            logger.warning(json.dumps(record))
@@ -0,0 +1,176 @@
+"""
+Session engine that only writes sessions when something changed.
+
+Use it with SESSION_ENGINE = "apps.common.utilities.django.sessions". It is
+Django's cached_db engine (sessions are read from SESSION_CACHE_ALIAS, e.g.
+Redis, and fall back to the database) with fewer writes:
+
+- Setting a key to the (string, number, bool or None) value it already
+  has doesn't mark the session modified, so views can re-set e.g.
+  `team_id` on every request for free.
+- save() compares the data with what was loaded and skips the write when
+  it's unchanged, so SESSION_SAVE_EVERY_REQUEST can stay on to keep
+  sessions sliding.
+- Extending an unchanged session's expiry ("touching" it) happens at most
+  once per SESSION_TOUCH_INTERVAL seconds. The cache is updated right away;
+  the database's expire_date is updated for many sessions in one UPDATE,
+  every SESSION_TOUCH_FLUSH_INTERVAL seconds or SESSION_TOUCH_BATCH_SIZE
+  touches, whichever comes first.
+
+The database's expire_date can therefore lag by up to
+SESSION_TOUCH_INTERVAL + SESSION_TOUCH_FLUSH_INTERVAL, which only matters
+for `clearsessions` and sessions that have dropped out of the cache.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.contrib.sessions.backends.cached_db import SessionStore as CachedDBStore
+from django.db import DatabaseError, router
+from django.db.models import Case, DateTimeField, Value, When
+
+logger = logging.getLogger(__name__)
+
+IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+_MISSING = object()
+
+_touch_lock = threading.Lock()
+# session key -> new expire_date, waiting to be written
+_pending_touches: dict[str, datetime] = {}
+_last_flush = time.monotonic()
+
+
+def queue_touch(session_key: str, expire_date: datetime) -> None:
+    """Queue a session's new expiry, flushing the queue when it's due."""
+    flush_interval = getattr(settings, "SESSION_TOUCH_FLUSH_INTERVAL", 60)
+    batch_size = getattr(settings, "SESSION_TOUCH_BATCH_SIZE", 500)
+    with _touch_lock:
+        _pending_touches[session_key] = expire_date
+        due = (
+            len(_pending_touches) >= batch_size
+            or time.monotonic() - _last_flush >= flush_interval
+        )
+    if due:
+        flush_touches()
+
+
+def flush_touches() -> int:
+    """Write queued session expiries in one UPDATE; returns the rows updated."""
+    global _last_flush
+    with _touch_lock:
+        pending = dict(_pending_touches)
+        _pending_touches.clear()
+        _last_flush = time.monotonic()
+    if not pending:
+        return 0
+
+    model = SessionStore.get_model_class()
+    try:
+        return (
+            model.objects.using(router.db_for_write(model))
+            .filter(session_key__in=pending)
+            .update(
+                expire_date=Case(
+                    *[
+                        When(session_key=key, then=Value(expire_date))
+                        for key, expire_date in pending.items()
+                    ],
+                    output_field=DateTimeField(),
+                )
+            )
+        )
+    except DatabaseError as e:
+        logger.warning(f"Could not extend {len(pending)} sessions: {str(e)}")
+        return 0
+
+
+atexit.register(flush_touches)
+
+
+class SessionStore(CachedDBStore):
+    """cached_db sessions that skip writes when nothing changed."""
+
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        # Serialized data and expiry as last loaded or saved
+        self._saved_data = None
+        self._saved_expiry = None
+
+    @property
+    def expiry_cache_key(self):
+        return f"{self.cache_key}:expiry"
+
+    def __setitem__(self, key, value):
+        # Only for immutable values: a list changed in place and set again
+        # is equal to itself but still has to be saved
+        if (
+            isinstance(value, IMMUTABLE_TYPES)
+            and self._session.get(key, _MISSING) == value
+        ):
+            return
+        super().__setitem__(key, value)
+
+    def _serialize(self, data) -> bytes:
+        return self.serializer().dumps(data)
+
+    def load(self):
+        try:
+            cached = self._cache.get_many([self.cache_key, self.expiry_cache_key])
+        except Exception:
+            # As in cached_db: invalid keys on some backends reset the session
+            cached = {}
+        data = cached.get(self.cache_key)
+        expiry = cached.get(self.expiry_cache_key)
+
+        if data is None:
+            s = self._get_session_from_db()
+            if s:
+                data = self.decode(s.session_data)
+                expiry = s.expire_date
+                self._cache_session(data, expiry)
+            else:
+                data = {}
+
+        self._saved_data = self._serialize(data)
+        self._saved_expiry = expiry
+        return data
+
+    def save(self, must_create=False):
+        if self.session_key is None:
+            return self.create()
+        data = self._get_session(no_load=must_create)
+        expiry = self.get_expiry_date()
+
+        if (
+            not must_create
+            and self._saved_data is not None
+            and self._serialize(data) == self._saved_data
+        ):
+            interval = timedelta(
+                seconds=getattr(settings, "SESSION_TOUCH_INTERVAL", 300)
+            )
+            if self._saved_expiry and expiry - self._saved_expiry < interval:
+                return
+            self._saved_expiry = expiry
+            self._cache_session(data, expiry)
+            queue_touch(self.session_key, expiry)
+            return
+
+        # A full write, as in the db engine
+        super(CachedDBStore, self).save(must_create)
+        self._saved_data = self._serialize(data)
+        self._saved_expiry = expiry
+        self._cache_session(data, expiry)
+
+    def _cache_session(self, data, expiry) -> None:
+        timeout = self.get_expiry_age(expiry=expiry)
+        try:
+            self._cache.set_many(
+                {self.cache_key: data, self.expiry_cache_key: expiry}, timeout
+            )
+        except Exception:
+            logger.exception(f"Error saving session to cache ({self._cache})")
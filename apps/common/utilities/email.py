@@ -1,3 +1,64 @@
+"""
+Email helpers, including the outbound email queue (outbox).
+
+`Email.send_later()` only marks an email as queued. `process_email_outbox()`
+drains the queue in batches: it claims due emails, fetches each email's
+attachments concurrently (streamed from S3 when possible, with size caps)
+while the previous email is sent, sends every message over one reused
+backend connection and schedules failed emails for retry with exponential
+backoff.
+"""
+
+import logging
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.db import transaction
+from django.db.models import prefetch_related_objects
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+ATTACHMENT_CHUNK_SIZE = 64 * 1024
+
+
+class AttachmentTooLargeError(ValueError):
+    """Raised when an attachment exceeds the configured size cap."""
+
+
+@dataclass
+class OutboxBatchStats:
+    """Throughput metrics for one outbox batch."""
+
+    claimed: int = 0
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+    attachments: int = 0
+    attachment_bytes: int = 0
+    fetch_seconds: float = 0.0
+    send_seconds: float = 0.0
+    duration_seconds: float = 0.0
+
+    @property
+    def messages_per_second(self) -> float:
+        """Sent messages per second of total batch time."""
+        if not self.duration_seconds:
+            return 0.0
+        return self.sent / self.duration_seconds
+
+    def as_dict(self) -> dict:
+        data = asdict(self)
+        data["messages_per_second"] = round(self.messages_per_second, 2)
+        return data
+
+
 def email_to_string(e):
     # type: (EmailMessage) -> str
     def n(x):
@@ -22,3 +83,367 @@ Attachments: {}
         n(e.body),
         n(str(e.attachments)),
     )
+
+
+def attachment_file_name(upload) -> str:
+    """Build the file name used when attaching an Upload to an email."""
+    file_name = upload.name or "attachment"
+    ext = upload.file_extension
+    if ext and not file_name.lower().endswith(f".{ext.lower()}"):
+        file_name = f"{file_name}.{ext}"
+    return file_name
+
+
+class _ByteBudget:
+    """A byte allowance shared by the concurrent fetches of one email."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def charge(self, size: int) -> None:
+        with self._lock:
+            self.used += size
+            if self.used > self.max_bytes:
+                raise AttachmentTooLargeError(
+                    f"Attachments total over the {self.max_bytes} byte limit"
+                )
+
+
+def _read_capped(chunks, max_bytes: int, label: str, budget=None) -> bytes:
+    """
+    Join an iterator of byte chunks, failing as soon as it exceeds max_bytes,
+    or the shared budget is used up.
+    """
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        if len(buffer) > max_bytes:
+            raise AttachmentTooLargeError(
+                f"Attachment {label} exceeds the {max_bytes} byte limit"
+            )
+        if budget is not None:
+            budget.charge(len(chunk))
+    return bytes(buffer)
+
+
+def fetch_attachment(upload, max_bytes: int | None = None, s3_client=None, budget=None):
+    """
+    Fetch the content of one Upload for attaching to an email.
+
+    Files stored in S3 are streamed from the bucket in chunks; anything else is
+    streamed from `upload.original`. Reading stops as soon as `max_bytes` is
+    exceeded, so an oversized file is never fully loaded into memory.
+
+    Args:
+        upload: The Upload to fetch
+        max_bytes: Size cap (defaults to settings.EMAIL_ATTACHMENT_MAX_SIZE)
+        s3_client: Optional S3Client to reuse for the upload's bucket
+        budget: Optional byte budget shared with other fetches (the total cap)
+
+    Returns:
+        tuple: (file_name, content bytes)
+
+    Raises:
+        AttachmentTooLargeError: If the file is larger than max_bytes
+    """
+    if max_bytes is None:
+        max_bytes = getattr(settings, "EMAIL_ATTACHMENT_MAX_SIZE", 10 * 1024 * 1024)
+    file_name = attachment_file_name(upload)
+
+    if upload.s3_bucket and upload.s3_key:
+        if s3_client is None:
+            from apps.integration.aws.s3 import S3Client
+
+            s3_client = S3Client(aws_s3_bucket_name=upload.s3_bucket)
+
+        result = s3_client.open_object(object_key=upload.s3_key)
+        if result.get("success"):
+            if (result.get("content_length") or 0) > max_bytes:
+                raise AttachmentTooLargeError(
+                    f"Attachment {file_name} exceeds the {max_bytes} byte limit"
+                )
+            body = result["body"]
+            try:
+                content = _read_capped(
+                    body.iter_chunks(ATTACHMENT_CHUNK_SIZE),
+                    max_bytes,
+                    file_name,
+                    budget,
+                )
+            finally:
+                body.close()
+            return file_name, content
+
+        logger.warning(
+            f"Could not stream attachment {upload.s3_key} from S3, "
+            f"falling back to URL: {result.get('error')}"
+        )
+
+    response = urllib.request.urlopen(upload.original, timeout=30)
+    try:
+        content_length = response.headers.get("Content-Length")
+        if content_length and int(content_length) > max_bytes:
+            raise AttachmentTooLargeError(
+                f"Attachment {file_name} exceeds the {max_bytes} byte limit"
+            )
+        content = _read_capped(
+            iter(lambda: response.read(ATTACHMENT_CHUNK_SIZE), b""),
+            max_bytes,
+            file_name,
+            budget,
+        )
+    finally:
+        response.close()
+    return file_name, content
+
+
+def _fetch_many(
+    uploads, max_bytes=None, max_workers=None, max_total_bytes=None, s3_clients=None
+) -> list:
+    """
+    Fetch many uploads concurrently.
+
+    With `max_total_bytes`, every fetch stops once their combined size goes
+    over it. `s3_clients` ({bucket: S3Client}) is reused and filled in.
+
+    Returns a list in the same order as `uploads` holding either a
+    (file_name, content) tuple or the exception raised for that upload.
+    """
+    uploads = list(uploads)
+    if not uploads:
+        return []
+
+    # boto3 clients are thread-safe, so build one per bucket and share it
+    if s3_clients is None:
+        s3_clients = {}
+    buckets = {u.s3_bucket for u in uploads if u.s3_bucket and u.s3_key}
+    if buckets - s3_clients.keys():
+        from apps.integration.aws.s3 import S3Client
+
+        for bucket in buckets - s3_clients.keys():
+            s3_clients[bucket] = S3Client(aws_s3_bucket_name=bucket)
+    budget = _ByteBudget(max_total_bytes) if max_total_bytes is not None else None
+
+    def fetch(upload):
+        try:
+            return fetch_attachment(
+                upload,
+                max_bytes=max_bytes,
+                s3_client=s3_clients.get(upload.s3_bucket),
+                budget=budget,
+            )
+        except Exception as e:
+            return e
+
+    if max_workers is None:
+        max_workers = getattr(settings, "EMAIL_ATTACHMENT_FETCH_WORKERS", 8)
+    max_workers = max(1, min(max_workers, len(uploads)))
+    if max_workers == 1:
+        return [fetch(upload) for upload in uploads]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(fetch, uploads))
+
+
+def _total_size_cap(max_total_bytes=None) -> int:
+    if max_total_bytes is None:
+        max_total_bytes = getattr(
+            settings, "EMAIL_ATTACHMENTS_MAX_TOTAL_SIZE", 25 * 1024 * 1024
+        )
+    return max_total_bytes
+
+
+def _check_total_size(files, max_total_bytes=None):
+    max_total_bytes = _total_size_cap(max_total_bytes)
+    total = sum(len(content) for _, content in files)
+    if total > max_total_bytes:
+        raise AttachmentTooLargeError(
+            f"Attachments total {total} bytes, over the {max_total_bytes} byte limit"
+        )
+    return total
+
+
+def fetch_attachments(uploads, max_bytes=None, max_total_bytes=None, max_workers=None):
+    """
+    Fetch the content of several Uploads concurrently.
+
+    Args:
+        uploads: Iterable of Upload objects
+        max_bytes: Per-file size cap (defaults to settings.EMAIL_ATTACHMENT_MAX_SIZE)
+        max_total_bytes: Cap on the combined size
+                         (defaults to settings.EMAIL_ATTACHMENTS_MAX_TOTAL_SIZE)
+        max_workers: Thread pool size
+                     (defaults to settings.EMAIL_ATTACHMENT_FETCH_WORKERS)
+
+    Returns:
+        list: (file_name, content) tuples in the same order as `uploads`
+
+    Raises:
+        AttachmentTooLargeError: If a file or the total exceeds its cap
+        Exception: The first error raised while fetching
+    """
+    files = []
+    for result in _fetch_many(
+        uploads,
+        max_bytes=max_bytes,
+        max_workers=max_workers,
+        max_total_bytes=_total_size_cap(max_total_bytes),
+    ):
+        if isinstance(result, Exception):
+            raise result
+        files.append(result)
+    _check_total_size(files, max_total_bytes)
+    return files
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff delay before the next delivery attempt."""
+    base = getattr(settings, "EMAIL_OUTBOX_RETRY_BACKOFF", 60)
+    cap = getattr(settings, "EMAIL_OUTBOX_MAX_BACKOFF", 3600)
+    return timedelta(seconds=min(base * 2 ** max(attempts - 1, 0), cap))
+
+
+def claim_outbox_batch(batch_size: int) -> list:
+    """
+    Claim up to `batch_size` due emails by moving them to the sending status.
+
+    Rows are locked with SKIP LOCKED so several workers can drain the
+    outbox at the same time without sending an email twice. Emails left in
+    the sending status by a crashed worker are put back in the queue once
+    settings.EMAIL_OUTBOX_SENDING_TIMEOUT seconds have passed.
+    """
+    from apps.common.models import Email
+
+    now = timezone.now()
+    timeout = getattr(settings, "EMAIL_OUTBOX_SENDING_TIMEOUT", 600)
+    Email.objects.filter(
+        status=Email.STATUS_SENDING, modified_at__lt=now - timedelta(seconds=timeout)
+    ).update(status=Email.STATUS_QUEUED, modified_at=now)
+
+    with transaction.atomic():
+        emails = list(
+            Email.objects.select_for_update(skip_locked=True)
+            .filter(status=Email.STATUS_QUEUED, next_attempt_at__lte=now)
+            .order_by("next_attempt_at")[:batch_size]
+        )
+        Email.objects.filter(pk__in=[email.pk for email in emails]).update(
+            status=Email.STATUS_SENDING, modified_at=now
+        )
+    for email in emails:
+        email.status = Email.STATUS_SENDING
+    return emails
+
+
+def process_email_outbox(batch_size: int | None = None, connection=None):
+    """
+    Send one batch of queued emails.
+
+    Args:
+        batch_size: Maximum emails to send (defaults to settings.EMAIL_OUTBOX_BATCH_SIZE)
+        connection: Optional email backend connection to reuse
+
+    Returns:
+        OutboxBatchStats: Throughput metrics for the batch
+    """
+    from apps.common.models import Email
+
+    started = time.perf_counter()
+    stats = OutboxBatchStats()
+    if batch_size is None:
+        batch_size = getattr(settings, "EMAIL_OUTBOX_BATCH_SIZE", 50)
+    max_attempts = getattr(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 5)
+
+    emails = claim_outbox_batch(batch_size)
+    stats.claimed = len(emails)
+    if not emails:
+        return stats
+
+    prefetch_related_objects(emails, "attachments")
+    uploads_by_email = [list(email.attachments.all()) for email in emails]
+    max_total_bytes = _total_size_cap()
+    s3_clients = {}
+
+    def fetch(uploads):
+        # One email's attachments, stopped at the email's total cap, so at
+        # most two emails' attachments (this one and the next) are in memory
+        fetch_started = time.perf_counter()
+        results = _fetch_many(
+            uploads, max_total_bytes=max_total_bytes, s3_clients=s3_clients
+        )
+        return results, time.perf_counter() - fetch_started
+
+    send_started = time.perf_counter()
+    connection = connection or get_connection()
+    connection_error = None
+    try:
+        connection.open()
+    except Exception as e:
+        # Every email in the batch is retried later
+        connection_error = e
+    prefetcher = ThreadPoolExecutor(max_workers=1)
+    try:
+        if not connection_error:
+            next_fetch = prefetcher.submit(fetch, uploads_by_email[0])
+        for index, email in enumerate(emails):
+            results = []
+            if not connection_error:
+                results, seconds = next_fetch.result()
+                stats.fetch_seconds += seconds
+                # Fetch the next email's attachments while this one is sent
+                if index + 1 < len(emails):
+                    next_fetch = prefetcher.submit(fetch, uploads_by_email[index + 1])
+            now = timezone.now()
+            try:
+                if connection_error:
+                    raise connection_error
+                errors = [r for r in results if isinstance(r, Exception)]
+                if errors:
+                    raise errors[0]
+                stats.attachment_bytes += _check_total_size(results)
+                stats.attachments += len(results)
+
+                message = email.build_message(attachment_files=results)
+                message.connection = connection
+                if not connection.send_messages([message]):
+                    raise RuntimeError("Email backend did not accept the message")
+
+                email.status = Email.STATUS_SENT
+                email.sent_at = now
+                email.last_error = None
+                stats.sent += 1
+            except Exception as e:
+                email.attempts += 1
+                email.last_error = str(e)
+                if isinstance(e, AttachmentTooLargeError) or (
+                    email.attempts >= max_attempts
+                ):
+                    email.status = Email.STATUS_FAILED
+                    stats.failed += 1
+                else:
+                    email.status = Email.STATUS_QUEUED
+                    email.next_attempt_at = now + retry_delay(email.attempts)
+                    stats.retried += 1
+                logger.warning(f"Failed to send email {email.pk}: {str(e)}")
+            email.modified_at = now
+    finally:
+        prefetcher.shutdown(cancel_futures=True)
+        connection.close()
+    stats.send_seconds = time.perf_counter() - send_started
+
+    Email.objects.bulk_update(
+        emails,
+        [
+            "status",
+            "sent_at",
+            "attempts",
+            "next_attempt_at",
+            "last_error",
+            "modified_at",
+        ],
+    )
+
+    stats.duration_seconds = time.perf_counter() - started
+    logger.info(f"Email outbox batch: {stats.as_dict()}")
+    return stats
@@ -0,0 +1,267 @@
+"""
+Per-request performance metrics, collected by PerformanceMiddleware.
+
+While a request is being handled, a `RequestMetrics` for it is available from
+`current_metrics()` (a context variable, so it follows the request through
+sync and async code). It accumulates:
+
+- DB queries and their time, through `connection.execute_wrapper`
+- Time spent opening DB connections, or getting them from the pool
+  (DB_POOL), which shows whether requests pay for connection setup
+- Template render time (outermost `Template.render` calls only, so includes
+  aren't counted twice)
+- Read-through cache hits and misses (apps.common.utilities.cache)
+- External API calls and their time per service. Outgoing HTTP from
+  urllib3 (boto3, requests: S3, Stripe, Twilio, Loops) and httpx (OpenAI)
+  is attributed to a service by host. `track_external()` covers anything
+  else.
+
+Work done in other threads (e.g. S3 multipart upload workers) is not
+attributed to the request.
+"""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from functools import wraps
+
+# Host suffix -> service name for outgoing HTTP calls
+HOST_SERVICES = (
+    ("amazonaws.com", "s3"),
+    ("stripe.com", "stripe"),
+    ("twilio.com", "twilio"),
+    ("openai.com", "openai"),
+    ("anthropic.com", "anthropic"),
+    ("loops.so", "loops"),
+)
+
+_metrics: ContextVar["RequestMetrics | None"] = ContextVar(
+    "request_metrics", default=None
+)
+_install_lock = threading.Lock()
+_installed = False
+
+
+@dataclass
+class RequestMetrics:
+    """Timings and counters for one request."""
+
+    started: float = field(default_factory=time.perf_counter)
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    db_connects: int = 0
+    db_connect_seconds: float = 0.0
+    template_seconds: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    external_calls: dict[str, int] = field(default_factory=dict)
+    external_seconds: dict[str, float] = field(default_factory=dict)
+    # Nesting depth, so nested renders/retries are only timed once
+    template_depth: int = field(default=0, repr=False)
+    external_depth: int = field(default=0, repr=False)
+
+    @property
+    def wall_seconds(self) -> float:
+        return time.perf_counter() - self.started
+
+    def record_external(self, service: str, seconds: float) -> None:
+        self.external_calls[service] = self.external_calls.get(service, 0) + 1
+        self.external_seconds[service] = (
+            self.external_seconds.get(service, 0.0) + seconds
+        )
+
+    def as_dict(self) -> dict:
+        return {
+            "wall_ms": round(self.wall_seconds * 1000, 2),
+            "db_queries": self.db_queries,
+            "db_ms": round(self.db_seconds * 1000, 2),
+            "db_connects": self.db_connects,
+            "db_connect_ms": round(self.db_connect_seconds * 1000, 2),
+            "template_ms": round(self.template_seconds * 1000, 2),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "external": {
+                service: {
+                    "calls": calls,
+                    "ms": round(self.external_seconds[service] * 1000, 2),
+                }
+                for service, calls in self.external_calls.items()
+            },
+        }
+
+    def server_timing(self) -> str:
+        """Value for the Server-Timing response header."""
+        entries = [
+            f'db;dur={self.db_seconds * 1000:.1f};desc="{self.db_queries} queries"',
+            f"dbconn;dur={self.db_connect_seconds * 1000:.1f};"
+            f'desc="{self.db_connects} connects"',
+            f"tpl;dur={self.template_seconds * 1000:.1f}",
+            f'cache;desc="{self.cache_hits} hits, {self.cache_misses} misses"',
+        ]
+        for service, calls in self.external_calls.items():
+            entries.append(
+                f"ext-{service};dur={self.external_seconds[service] * 1000:.1f};"
+                f'desc="{calls} calls"'
+            )
+        entries.append(f"total;dur={self.wall_seconds * 1000:.1f}")
+        return ", ".join(entries)
+
+
+def current_metrics() -> RequestMetrics | None:
+    """Metrics of the request being handled, if any."""
+    return _metrics.get()
+
+
+def start_request() -> tuple[RequestMetrics, Token]:
+    metrics = RequestMetrics()
+    return metrics, _metrics.set(metrics)
+
+
+def end_request(token: Token) -> None:
+    _metrics.reset(token)
+
+
+def record_cache_lookup(hit: bool) -> None:
+    metrics = _metrics.get()
+    if metrics is None:
+        return
+    if hit:
+        metrics.cache_hits += 1
+    else:
+        metrics.cache_misses += 1
+
+
+@contextmanager
+def track_external(service: str) -> Iterator[None]:
+    """Time a block as an external API call to `service`."""
+    metrics = _metrics.get()
+    if metrics is None or metrics.external_depth:
+        yield
+        return
+    metrics.external_depth += 1
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.external_depth -= 1
+        metrics.record_external(service, time.perf_counter() - started)
+
+
+def service_for_host(host: str) -> str:
+    host = (host or "").lower()
+    for suffix, service in HOST_SERVICES:
+        if host == suffix or host.endswith(f".{suffix}"):
+            return service
+    return "http"
+
+
+def db_execute_wrapper(execute, sql, params, many, context):
+    """`connection.execute_wrapper` hook counting queries and their time."""
+    metrics = _metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db_queries += 1
+        metrics.db_seconds += time.perf_counter() - started
+
+
+def _instrument_db_connect() -> None:
+    from django.db.backends.base.base import BaseDatabaseWrapper
+
+    original = BaseDatabaseWrapper.connect
+
+    @wraps(original)
+    def connect(self):
+        metrics = _metrics.get()
+        if metrics is None:
+            return original(self)
+        started = time.perf_counter()
+        try:
+            return original(self)
+        finally:
+            metrics.db_connects += 1
+            metrics.db_connect_seconds += time.perf_counter() - started
+
+    BaseDatabaseWrapper.connect = connect
+
+
+def _instrument_templates() -> None:
+    from django.template.base import Template
+
+    original = Template.render
+
+    @wraps(original)
+    def render(self, context):
+        metrics = _metrics.get()
+        if metrics is None or metrics.template_depth:
+            return original(self, context)
+        metrics.template_depth += 1
+        started = time.perf_counter()
+        try:
+            return original(self, context)
+        finally:
+            metrics.template_depth -= 1
+            metrics.template_seconds += time.perf_counter() - started
+
+    Template.render = render
+
+
+def _instrument_urllib3() -> None:
+    from urllib3.connectionpool import HTTPConnectionPool
+
+    original = HTTPConnectionPool.urlopen
+
+    @wraps(original)
+    def urlopen(self, *args, **kwargs):
+        if _metrics.get() is None:
+            return original(self, *args, **kwargs)
+        with track_external(service_for_host(self.host)):
+            return original(self, *args, **kwargs)
+
+    HTTPConnectionPool.urlopen = urlopen
+
+
+def _instrument_httpx() -> None:
+    try:
+        import httpx
+    except ImportError:
+        return
+
+    original_send = httpx.Client.send
+    original_async_send = httpx.AsyncClient.send
+
+    @wraps(original_send)
+    def send(self, request, *args, **kwargs):
+        if _metrics.get() is None:
+            return original_send(self, request, *args, **kwargs)
+        with track_external(service_for_host(request.url.host)):
+            return original_send(self, request, *args, **kwargs)
+
+    @wraps(original_async_send)
+    async def async_send(self, request, *args, **kwargs):
+        if _metrics.get() is None:
+            return await original_async_send(self, request, *args, **kwargs)
+        with track_external(service_for_host(request.url.host)):
+            return await original_async_send(self, request, *args, **kwargs)
+
+    httpx.Client.send = send
+    httpx.AsyncClient.send = async_send
+
+
+def install_instrumentation() -> None:
+    """Hook DB connections, template rendering and HTTP clients (once)."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        _instrument_db_connect()
+        _instrument_templates()
+        _instrument_urllib3()
+        _instrument_httpx()
+        _installed = True
@@ -0,0 +1,161 @@
+"""
+In-process registry of reference data: currencies, countries and cities.
+
+These tables are small and almost never change, yet list pages and
+addresses read them row by row (`city.country.currency`,
+`address.country`), one query per foreign key. The registry loads all
+three tables once per process, in three queries, and serves them from
+memory by id and by code:
+
+- `resolve(instance, "country")` is `instance.country` without a query.
+  Countries come with their currency and cities with their country.
+- `get_object(Country, pk)` and `get_by_code(Country, "th")` look rows up.
+- Saving or deleting a Currency, Country or City bumps the version key of
+  the `reference_data` cache namespace. Each process compares its copy's
+  version at most every REFERENCE_DATA_CHECK_INTERVAL seconds and reloads
+  when it changed, and reloads anyway after REFERENCE_DATA_MAX_AGE seconds
+  (for per-process caches, and queryset update()s, which send no signals).
+- Looking up an id that isn't loaded (a row added since) reloads once.
+
+The objects are shared by every thread of the process: treat them as
+read-only and fetch a fresh instance to change one.
+
+Example:
+    ```python
+    from apps.common.utilities.reference_data import resolve
+
+    for city in City.objects.all():
+        print(city.name, resolve(city, "country").currency)  # no queries
+    ```
+"""
+
+import threading
+import time
+
+from django.conf import settings
+
+from apps.common.utilities.cache import invalidate_namespace, namespace_version
+
+REFERENCE_DATA_NAMESPACE = "reference_data"
+
+_lock = threading.Lock()
+_registry = None
+
+
+class ReferenceData:
+    """Currencies, countries and cities by id and by code, for one version."""
+
+    def __init__(self, rows: dict, version: int):
+        self.version = version
+        self.loaded_at = self.checked_at = time.monotonic()
+        self.by_id = {
+            model: {obj.pk: obj for obj in objs} for model, objs in rows.items()
+        }
+        self.by_code = {
+            model: {obj.code: obj for obj in objs if obj.code}
+            for model, objs in rows.items()
+        }
+
+    @classmethod
+    def load(cls) -> "ReferenceData":
+        from apps.common.models import City, Country, Currency
+
+        # Read the version first: a change made while loading then
+        # triggers another reload
+        version = namespace_version(REFERENCE_DATA_NAMESPACE)
+        currencies = {obj.pk: obj for obj in Currency.objects.all()}
+        countries = {obj.pk: obj for obj in Country.objects.all()}
+        cities = list(City.objects.all())
+
+        # Attach the related objects, so following them doesn't query
+        for country in countries.values():
+            country.currency = currencies.get(country.currency_id)
+        for city in cities:
+            if city.country_id in countries:
+                city.country = countries[city.country_id]
+
+        return cls(
+            {
+                Currency: list(currencies.values()),
+                Country: list(countries.values()),
+                City: cities,
+            },
+            version,
+        )
+
+    def get(self, model, pk):
+        return self.by_id.get(model, {}).get(pk)
+
+    def get_by_code(self, model, code: str):
+        return self.by_code.get(model, {}).get(code.lower())
+
+
+def _is_current(registry: ReferenceData) -> bool:
+    now = time.monotonic()
+    if now - registry.loaded_at > getattr(settings, "REFERENCE_DATA_MAX_AGE", 300):
+        return False
+    if now - registry.checked_at < getattr(
+        settings, "REFERENCE_DATA_CHECK_INTERVAL", 5
+    ):
+        return True
+    if namespace_version(REFERENCE_DATA_NAMESPACE) != registry.version:
+        return False
+    registry.checked_at = now
+    return True
+
+
+def get_reference_data(reload: bool = False) -> ReferenceData:
+    """The registry, loaded or reloaded if it's missing or out of date."""
+    global _registry
+    registry = _registry
+    if registry is not None and not reload and _is_current(registry):
+        return registry
+    with _lock:
+        # Another thread may have reloaded it while this one waited
+        if _registry is registry:
+            _registry = ReferenceData.load()
+        return _registry
+
+
+def invalidate_reference_data() -> None:
+    """Make every process reload the registry on its next use."""
+    global _registry
+    _registry = None
+    invalidate_namespace(REFERENCE_DATA_NAMESPACE)
+
+
+def get_object(model, pk):
+    """The Currency, Country or City with this id, or None."""
+    if pk is None:
+        return None
+    previous = _registry
+    registry = get_reference_data()
+    obj = registry.get(model, pk)
+    if obj is None and registry is previous:
+        # Possibly added since the registry was loaded
+        obj = get_reference_data(reload=True).get(model, pk)
+    return obj
+
+
+def get_by_code(model, code: str | None):
+    """The Currency, Country or City with this code (any case), or None."""
+    if not code:
+        return None
+    return get_reference_data().get_by_code(model, code)
+
+
+def resolve(instance, field_name: str):
+    """
+    The Currency, Country or City that `instance.<field_name>` refers to,
+    from the registry.
+
+    An object already on the instance (select_related, or assigned) is
+    returned as is, and one missing from the registry is fetched as usual.
+    """
+    field = instance._meta.get_field(field_name)
+    if field.is_cached(instance):
+        return getattr(instance, field_name)
+    pk = getattr(instance, field.attname)
+    if pk is None:
+        return getattr(instance, field_name)
+    return get_object(field.related_model, pk) or getattr(instance, field_name)
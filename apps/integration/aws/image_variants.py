@@ -0,0 +1,323 @@
+"""
+Background generation of thumbnails and resized WebP variants for image uploads.
+
+`complete_upload()` marks finished image uploads as pending
+(`Upload.variants_status`), and the `process_image_variants`
+management command works through them in batches:
+
+1. Originals are fetched from S3 concurrently (threads, I/O bound).
+2. Each image is decoded once and every variant rendered in a process pool
+   (see `apps.common.utilities.compression.image_variants`).
+3. Variants are written back to S3 next to the original, e.g.
+   `uploads/abc123_photo_thumbnail.webp`.
+4. Dimensions and variant keys are stored in `meta_data` with one
+   `bulk_update`, so `Upload.width`/`height` never need to decode the file.
+
+Variants are private like their originals: link to them with pre-signed
+URLs, e.g. `upload.get_presigned_url(variant="thumbnail")` or
+`Image.get_thumbnail_url()`.
+
+Variants are configured with settings.IMAGE_VARIANTS:
+    IMAGE_VARIANTS = {
+        "thumbnail": {"width": 200, "height": 200, "crop": True},
+        "medium": {"width": 1024},
+    }
+"""
+
+import io
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.common.models import Upload
+from apps.common.utilities.compression.image_variants import render_job
+
+logger = logging.getLogger(__name__)
+
+VARIANTS_PENDING = "pending"
+VARIANTS_PROCESSING = "processing"
+VARIANTS_COMPLETE = "complete"
+VARIANTS_ERROR = "error"
+
+DEFAULT_IMAGE_VARIANTS = {
+    "thumbnail": {"width": 200, "height": 200, "crop": True, "quality": 75},
+    "small": {"width": 480},
+    "medium": {"width": 1024},
+    "large": {"width": 1920},
+}
+
+# Variants are never modified once written, so clients may cache them forever
+VARIANT_CACHE_CONTROL = "max-age=31536000, immutable"
+
+
+@dataclass
+class VariantBatchStats:
+    """Throughput metrics for one batch of images."""
+
+    claimed: int = 0
+    processed: int = 0
+    failed: int = 0
+    variants: int = 0
+    source_bytes: int = 0
+    variant_bytes: int = 0
+    fetch_seconds: float = 0.0
+    render_seconds: float = 0.0
+    store_seconds: float = 0.0
+    duration_seconds: float = 0.0
+
+    @property
+    def images_per_second(self) -> float:
+        if not self.duration_seconds:
+            return 0.0
+        return self.processed / self.duration_seconds
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "images_per_second": self.images_per_second}
+
+
+def get_variant_specs() -> dict[str, dict]:
+    """Get the configured variant specs (settings.IMAGE_VARIANTS)."""
+    return getattr(settings, "IMAGE_VARIANTS", DEFAULT_IMAGE_VARIANTS)
+
+
+def variant_object_key(s3_key: str, name: str, image_format: str) -> str:
+    """Build the S3 key of a variant, next to its original."""
+    base, _ = os.path.splitext(s3_key)
+    extension = "jpg" if image_format == "JPEG" else image_format.lower()
+    return f"{base}_{name}.{extension}"
+
+
+def queue_variants(upload) -> bool:
+    """
+    Mark an image upload as needing variants. The caller saves the upload.
+
+    Returns:
+        bool: True if the upload was queued
+    """
+    if not (upload.is_image and upload.s3_bucket and upload.s3_key):
+        return False
+    upload.variants_status = VARIANTS_PENDING
+    return True
+
+
+def requeue_stale_variants(timeout: int | None = None) -> int:
+    """Put uploads left in processing by a crashed worker back in the queue."""
+    if timeout is None:
+        timeout = getattr(settings, "IMAGE_VARIANTS_PROCESSING_TIMEOUT", 600)
+    cutoff = timezone.now() - timedelta(seconds=timeout)
+    return Upload.objects.filter(
+        variants_status=VARIANTS_PROCESSING, variants_claimed_at__lt=cutoff
+    ).update(variants_status=VARIANTS_PENDING, variants_claimed_at=None)
+
+
+def claim_variant_batch(batch_size: int) -> list:
+    """
+    Claim up to `batch_size` pending uploads by moving them to processing.
+
+    Rows are locked with SKIP LOCKED so several workers can run at once
+    without processing an image twice.
+    """
+    with transaction.atomic():
+        uploads = list(
+            Upload.objects.select_for_update(skip_locked=True)
+            .filter(variants_status=VARIANTS_PENDING)
+            .order_by("modified_at")[:batch_size]
+        )
+        if uploads:
+            now = timezone.now()
+            for upload in uploads:
+                upload.variants_status = VARIANTS_PROCESSING
+                upload.variants_claimed_at = now
+            Upload.objects.bulk_update(
+                uploads, ["variants_status", "variants_claimed_at"]
+            )
+    return uploads
+
+
+def _read_original(upload, client, max_bytes: int) -> bytes:
+    result = client.open_object(object_key=upload.s3_key)
+    if not result.get("success"):
+        raise OSError(result.get("error", "Could not read original from S3"))
+    if (result.get("content_length") or 0) > max_bytes:
+        raise ValueError(f"Image is larger than {max_bytes} bytes")
+    body = result["body"]
+    try:
+        return body.read()
+    finally:
+        body.close()
+
+
+def _store_variants(upload, client, rendered: dict) -> dict:
+    """Write rendered variants to S3 and return their metadata."""
+    stored = {}
+    for name, variant in rendered["variants"].items():
+        key = variant_object_key(upload.s3_key, name, variant["format"])
+        result = client.upload_fileobj(
+            io.BytesIO(variant["data"]),
+            key,
+            public=False,
+            extra_args={
+                "ContentType": variant["content_type"],
+                "CacheControl": VARIANT_CACHE_CONTROL,
+            },
+        )
+        if not result.get("success"):
+            raise OSError(result.get("error", f"Could not store variant {name}"))
+        stored[name] = {
+            "key": key,
+            "width": variant["width"],
+            "height": variant["height"],
+            "size": len(variant["data"]),
+            "content_type": variant["content_type"],
+        }
+    return stored
+
+
+def _thread_map(fn, items, max_workers):
+    """Run fn over items in threads, returning results or the exceptions raised."""
+
+    def call(item):
+        try:
+            return fn(item)
+        except Exception as e:
+            return e
+
+    if max_workers <= 1 or len(items) <= 1:
+        return [call(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(call, items))
+
+
+def _process_context():
+    # Forking a process that runs threads (DB connections, S3 client pools)
+    # can deadlock; workers start from a clean server process instead and
+    # only import Pillow and the renderer
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+
+
+def generate_variants(uploads, specs=None, workers=None) -> VariantBatchStats:
+    """
+    Generate and store variants for a list of image uploads.
+
+    Args:
+        uploads: Upload objects stored in S3
+        specs: Variant specs (defaults to settings.IMAGE_VARIANTS)
+        workers: Processes used for decoding and resizing
+                 (defaults to settings.IMAGE_VARIANT_WORKERS; 1 runs inline)
+
+    Returns:
+        VariantBatchStats: Throughput metrics for the batch
+    """
+    from apps.integration.aws.s3 import S3Client
+
+    started = time.perf_counter()
+    uploads = list(uploads)
+    stats = VariantBatchStats(claimed=len(uploads))
+    if not uploads:
+        return stats
+
+    specs = specs or get_variant_specs()
+    if workers is None:
+        workers = getattr(settings, "IMAGE_VARIANT_WORKERS", os.cpu_count() or 1)
+    io_workers = getattr(settings, "IMAGE_VARIANT_IO_WORKERS", 8)
+    max_bytes = getattr(settings, "IMAGE_VARIANT_MAX_SOURCE_SIZE", 50 * 1024 * 1024)
+
+    # boto3 clients are thread-safe, so build one per bucket and share it
+    clients = {}
+    for upload in uploads:
+        if upload.s3_bucket not in clients:
+            clients[upload.s3_bucket] = S3Client(aws_s3_bucket_name=upload.s3_bucket)
+
+    phase = time.perf_counter()
+    originals = _thread_map(
+        lambda upload: _read_original(upload, clients[upload.s3_bucket], max_bytes),
+        uploads,
+        io_workers,
+    )
+    stats.fetch_seconds = time.perf_counter() - phase
+
+    phase = time.perf_counter()
+    jobs = [(data, specs) for data in originals if isinstance(data, bytes)]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(jobs)), mp_context=_process_context()
+        ) as executor:
+            results = iter(list(executor.map(render_job, jobs)))
+    else:
+        results = iter([render_job(job) for job in jobs])
+    rendered = [
+        next(results) if isinstance(data, bytes) else data for data in originals
+    ]
+    stats.render_seconds = time.perf_counter() - phase
+
+    phase = time.perf_counter()
+    stored = _thread_map(
+        lambda pair: (
+            pair[1]
+            if isinstance(pair[1], Exception)
+            else _store_variants(pair[0], clients[pair[0].s3_bucket], pair[1])
+        ),
+        list(zip(uploads, rendered)),
+        io_workers,
+    )
+    stats.store_seconds = time.perf_counter() - phase
+
+    for upload, data, result, variants in zip(uploads, originals, rendered, stored):
+        meta_data = dict(upload.meta_data or {})
+        upload.variants_claimed_at = None
+        if isinstance(variants, Exception):
+            logger.error(
+                f"Failed to generate variants for upload {upload.id}: {variants}"
+            )
+            meta_data["variants_error"] = str(variants)
+            upload.variants_status = VARIANTS_ERROR
+            stats.failed += 1
+        else:
+            meta_data.pop("variants_error", None)
+            meta_data.update(
+                meta={**meta_data.get("meta", {}), **result["meta"]},
+                variants=variants,
+            )
+            upload.variants_status = VARIANTS_COMPLETE
+            stats.processed += 1
+            stats.variants += len(variants)
+            stats.source_bytes += len(data)
+            stats.variant_bytes += sum(v["size"] for v in variants.values())
+        upload.meta_data = meta_data
+
+    Upload.objects.bulk_update(
+        uploads, ["meta_data", "variants_status", "variants_claimed_at"]
+    )
+
+    stats.duration_seconds = time.perf_counter() - started
+    logger.info(f"Image variant batch: {stats.as_dict()}")
+    return stats
+
+
+def process_image_variants(batch_size: int | None = None, workers=None):
+    """
+    Generate variants for one batch of pending image uploads.
+
+    Args:
+        batch_size: Maximum images per batch (defaults to settings.IMAGE_VARIANTS_BATCH_SIZE)
+        workers: Processes used for resizing (defaults to settings.IMAGE_VARIANT_WORKERS)
+
+    Returns:
+        VariantBatchStats: Throughput metrics for the batch
+    """
+    if batch_size is None:
+        batch_size = getattr(settings, "IMAGE_VARIANTS_BATCH_SIZE", 20)
+    requeue_stale_variants()
+    uploads = claim_variant_batch(batch_size)
+    return generate_variants(uploads, workers=workers)
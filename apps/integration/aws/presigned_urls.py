@@ -0,0 +1,156 @@
+"""
+Cached pre-signed URLs for S3 objects.
+
+Signing a URL needs an S3 client and an HMAC signature. Pages that render
+many files (admin list pages, galleries) would otherwise do both once per
+row. URLs are cached per (bucket, key, expiry bucket): the requested
+expiration is rounded up to a multiple of AWS_PRESIGNED_URL_EXPIRY_STEP, and
+a cached URL is only served while it remains valid for at least
+AWS_PRESIGNED_URL_MIN_VALIDITY seconds.
+
+Example:
+    ```python
+    from apps.integration.aws.presigned_urls import presign_many
+
+    urls = presign_many(uploads)  # {upload.pk: url}
+    ```
+"""
+
+import logging
+import math
+
+from django.conf import settings
+from django.core.cache import caches
+
+from apps.common.utilities.cache import make_key, namespace_version, stats
+
+logger = logging.getLogger(__name__)
+
+NAMESPACE = "presigned_urls"
+
+
+def expiry_bucket(expiration: int) -> int:
+    """Round an expiration in seconds up to the configured step."""
+    step = getattr(settings, "AWS_PRESIGNED_URL_EXPIRY_STEP", 300)
+    return max(step, math.ceil(expiration / step) * step)
+
+
+def _cache_timeout(expires_in: int) -> int:
+    # Stop serving a URL once it has less than the minimum validity left
+    return expires_in - getattr(settings, "AWS_PRESIGNED_URL_MIN_VALIDITY", 300)
+
+
+def _sign(client, bucket: str, key: str, expires_in: int) -> str | None:
+    result = client.generate_presigned_url(object_key=key, expiration=expires_in)
+    if result.get("success"):
+        return result.get("url")
+    logger.error(f"Failed to generate pre-signed URL: {result.get('error')}")
+    return None
+
+
+def presign(bucket: str, key: str, expiration: int = 3600) -> str | None:
+    """
+    Get a pre-signed GET URL for an S3 object, reusing a cached one if possible.
+
+    Args:
+        bucket: S3 bucket name
+        key: S3 object key
+        expiration: Requested validity in seconds
+
+    Returns:
+        str or None: The URL, or None if signing failed
+    """
+    return presign_keys([(bucket, key)], expiration).get((bucket, key))
+
+
+def presign_keys(
+    bucket_keys, expiration: int = 3600, cache_alias: str = "default"
+) -> dict[tuple[str, str], str]:
+    """
+    Get pre-signed URLs for many (bucket, key) pairs.
+
+    Cached URLs are read with one `get_many`. Missing ones are signed with a
+    single S3 client per bucket and written back with one `set_many`.
+
+    Returns:
+        dict: {(bucket, key): url} for every pair that could be signed
+    """
+    bucket_keys = list(dict.fromkeys(bucket_keys))
+    if not bucket_keys:
+        return {}
+
+    cache = caches[cache_alias]
+    expires_in = expiry_bucket(expiration)
+    timeout = _cache_timeout(expires_in)
+    version = namespace_version(NAMESPACE, cache_alias)
+    cache_keys = {
+        pair: make_key(f"{pair[0]}:{pair[1]}:{expires_in}", NAMESPACE, version=version)
+        for pair in bucket_keys
+    }
+
+    urls = {}
+    if timeout > 0:
+        cached = cache.get_many(list(cache_keys.values()))
+        for pair, cache_key in cache_keys.items():
+            if cache_key in cached:
+                urls[pair] = cached[cache_key]
+    stats.incr(NAMESPACE, "hits", len(urls))
+    stats.incr(NAMESPACE, "misses", len(bucket_keys) - len(urls))
+
+    missing = [pair for pair in bucket_keys if pair not in urls]
+    if not missing:
+        return urls
+
+    from apps.integration.aws.s3 import S3Client
+
+    clients = {}
+    signed = {}
+    for bucket, key in missing:
+        if bucket not in clients:
+            clients[bucket] = S3Client(aws_s3_bucket_name=bucket)
+        try:
+            url = _sign(clients[bucket], bucket, key, expires_in)
+        except Exception as e:
+            logger.error(f"Error generating pre-signed URL: {str(e)}")
+            url = None
+        if url:
+            urls[(bucket, key)] = url
+            signed[cache_keys[(bucket, key)]] = url
+    stats.incr(NAMESPACE, "computes", len(missing))
+
+    if signed and timeout > 0:
+        cache.set_many(signed, timeout)
+    return urls
+
+
+def presign_many(uploads, expiration: int = 3600, variant: str | None = None) -> dict:
+    """
+    Get display URLs for many Upload objects at once.
+
+    Uploads stored in S3 get a (cached) pre-signed URL, falling back to
+    `s3_url` if signing fails. Other uploads use their `original` URL.
+    With `variant` (e.g. "thumbnail"), uploads that have that generated
+    variant link to it instead of the original.
+
+    Returns:
+        dict: {upload.pk: url}
+    """
+    uploads = list(uploads)
+    keys = {
+        upload.pk: (variant and upload.variant_key(variant)) or upload.s3_key
+        for upload in uploads
+    }
+    signed = presign_keys(
+        [(u.s3_bucket, keys[u.pk]) for u in uploads if u.s3_bucket and u.s3_key],
+        expiration,
+    )
+
+    urls = {}
+    for upload in uploads:
+        if upload.s3_bucket and upload.s3_key:
+            urls[upload.pk] = signed.get((upload.s3_bucket, keys[upload.pk])) or (
+                upload.s3_url
+            )
+        else:
+            urls[upload.pk] = upload.original
+    return urls
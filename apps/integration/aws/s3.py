@@ -8,17 +8,27 @@ It also provides utilities for generating pre-signed URLs for direct browser upl
 import logging
 import mimetypes
 import os
+import re
 import uuid
 from typing import Any
-from urllib.parse import urlparse
+from urllib.parse import quote, unquote, urlparse
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from django.conf import settings
 from django.utils import timezone
 
+from apps.integration.aws.transfer import StreamingUploader, get_transfer_config
+
 logger = logging.getLogger(__name__)
 
+# Hosts of AWS S3 URLs: bucket.s3.amazonaws.com, s3.amazonaws.com,
+# bucket.s3.<region>.amazonaws.com, s3.<region>.amazonaws.com (and s3-<region>)
+S3_HOST_PATTERN = re.compile(
+    r"(?:(?P<bucket>.+)\.)?s3(?:[.-](?P<region>[a-z0-9-]+))?\.amazonaws\.com"
+)
+
 
 class S3Client:
     """Client for AWS S3 operations."""
@@ -57,20 +67,19 @@ class S3Client:
         self.s3_client = None
         self.s3_resource = None
         if self.enabled:
+            options = {
+                "aws_access_key_id": self.aws_access_key_id,
+                "aws_secret_access_key": self.aws_secret_access_key,
+                "region_name": self.region_name,
+            }
+            # A custom endpoint (e.g. a local fake) only serves path-style URLs
+            endpoint_url = getattr(settings, "AWS_S3_ENDPOINT_URL", "")
+            if endpoint_url:
+                options["endpoint_url"] = endpoint_url
+                options["config"] = Config(s3={"addressing_style": "path"})
             try:
-                self.s3_client = boto3.client(
-                    "s3",
-                    aws_access_key_id=self.aws_access_key_id,
-                    aws_secret_access_key=self.aws_secret_access_key,
-                    region_name=self.region_name,
-                )
-
-                self.s3_resource = boto3.resource(
-                    "s3",
-                    aws_access_key_id=self.aws_access_key_id,
-                    aws_secret_access_key=self.aws_secret_access_key,
-                    region_name=self.region_name,
-                )
+                self.s3_client = boto3.client("s3", **options)
+                self.s3_resource = boto3.resource("s3", **options)
 
                 self.bucket = self.s3_resource.Bucket(self.bucket_name)
             except Exception as e:
@@ -95,6 +104,8 @@ class S3Client:
         object_key: str | None = None,
         public: bool = True,
         extra_args: dict[str, Any] | None = None,
+        transfer_config=None,
+        progress=None,
     ) -> dict[str, Any]:
         """
         Upload a file to S3.
@@ -104,6 +115,8 @@ class S3Client:
             object_key: S3 object key to use (defaults to the file name)
             public: Whether the file should be publicly accessible
             extra_args: Additional arguments to pass to boto3's upload_file
+            transfer_config: boto3 TransferConfig (defaults to get_transfer_config())
+            progress: Callable receiving bytes sent, e.g. an UploadProgress
 
         Returns:
             dict: Response data including success flag and URL
@@ -139,10 +152,12 @@ class S3Client:
                 Bucket=self.bucket_name,
                 Key=object_key,
                 ExtraArgs=extra_args,
+                Config=transfer_config or get_transfer_config(),
+                Callback=progress,
             )
 
             # Generate the URL
-            url = f"https://{self.bucket_name}.s3.amazonaws.com/{object_key}"
+            url = self.get_public_url(object_key)
 
             return {
                 "success": True,
@@ -161,6 +176,8 @@ class S3Client:
         object_key: str,
         public: bool = True,
         extra_args: dict[str, Any] | None = None,
+        transfer_config=None,
+        progress=None,
     ) -> dict[str, Any]:
         """
         Upload a file-like object to S3.
@@ -170,6 +187,8 @@ class S3Client:
             object_key: S3 object key to use
             public: Whether the file should be publicly accessible
             extra_args: Additional arguments to pass to boto3's upload_fileobj
+            transfer_config: boto3 TransferConfig (defaults to get_transfer_config())
+            progress: Callable receiving bytes sent, e.g. an UploadProgress
 
         Returns:
             dict: Response data including success flag and URL
@@ -198,10 +217,12 @@ class S3Client:
                 Bucket=self.bucket_name,
                 Key=object_key,
                 ExtraArgs=extra_args,
+                Config=transfer_config or get_transfer_config(),
+                Callback=progress,
             )
 
             # Generate the URL
-            url = f"https://{self.bucket_name}.s3.amazonaws.com/{object_key}"
+            url = self.get_public_url(object_key)
 
             return {
                 "success": True,
@@ -214,6 +235,50 @@ class S3Client:
             logger.error(f"Failed to upload file object to S3: {str(e)}")
             return {"success": False, "error": str(e)}
 
+    def upload_stream(
+        self,
+        chunks,
+        object_key: str,
+        public: bool = True,
+        extra_args: dict[str, Any] | None = None,
+        upload=None,
+        **uploader_options,
+    ) -> dict[str, Any]:
+        """
+        Upload an iterator of bytes to S3 without buffering it in memory.
+
+        Parts are uploaded in parallel and the upload can be resumed; see
+        `apps.integration.aws.transfer.StreamingUploader`.
+
+        Args:
+            chunks: Iterable of bytes (e.g. a generator)
+            object_key: S3 object key to use
+            public: Whether the file should be publicly accessible
+            extra_args: Additional arguments for the multipart upload
+            upload: Optional Upload row to record progress and resume state on
+            **uploader_options: part_size, max_concurrency, progress_interval_ms,
+                                on_progress
+
+        Returns:
+            dict: Response data including success flag and URL
+        """
+        extra_args = dict(extra_args or {})
+        if "ContentType" not in extra_args:
+            content_type, _ = mimetypes.guess_type(object_key)
+            if content_type:
+                extra_args["ContentType"] = content_type
+        if public and "ACL" not in extra_args:
+            extra_args["ACL"] = "public-read"
+
+        uploader = StreamingUploader(
+            object_key,
+            s3_client=self,
+            upload=upload,
+            extra_args=extra_args,
+            **uploader_options,
+        )
+        return uploader.upload(chunks)
+
     def download_file(self, object_key: str, destination: str) -> dict[str, Any]:
         """
         Download a file from S3.
@@ -243,6 +308,37 @@ class S3Client:
             logger.error(f"Failed to download file from S3: {str(e)}")
             return {"success": False, "error": str(e)}
 
+    def open_object(self, object_key: str) -> dict[str, Any]:
+        """
+        Open an S3 object for streaming reads without downloading it to disk.
+
+        Args:
+            object_key: S3 object key to read
+
+        Returns:
+            dict: Response data including success flag, a streaming `body`
+                  (call `iter_chunks()` or `read(n)` on it) and `content_length`
+        """
+        if not self._validate_client():
+            return {"success": False, "error": "S3 client not configured"}
+
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.bucket_name, Key=object_key
+            )
+
+            return {
+                "success": True,
+                "body": response["Body"],
+                "content_length": response.get("ContentLength"),
+                "content_type": response.get("ContentType"),
+                "key": object_key,
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to open object in S3: {str(e)}")
+            return {"success": False, "error": str(e)}
+
     def get_object_metadata(self, object_key: str) -> dict[str, Any]:
         """
         Get metadata for an S3 object.
@@ -329,7 +425,7 @@ class S3Client:
                             "key": obj.get("Key"),
                             "size": obj.get("Size"),
                             "last_modified": obj.get("LastModified"),
-                            "url": f"https://{self.bucket_name}.s3.amazonaws.com/{obj.get('Key')}",
+                            "url": self.get_public_url(obj.get("Key")),
                         }
                     )
 
@@ -440,7 +536,7 @@ class S3Client:
             )
 
             # Calculate file URL
-            file_url = f"https://{self.bucket_name}.s3.amazonaws.com/{object_key}"
+            file_url = self.get_public_url(object_key)
 
             # Extract and format form fields for easy use
             form_fields = response.get("fields", {})
@@ -468,8 +564,24 @@ class S3Client:
 
         Returns:
             str: Public URL for the object
+
+        The URL is path-style on a custom endpoint (settings.AWS_S3_ENDPOINT_URL)
+        and for bucket names with dots, which don't match the certificate of
+        virtual-hosted URLs. Regions other than us-east-1 use their regional
+        host.
         """
-        return f"https://{self.bucket_name}.s3.amazonaws.com/{object_key}"
+        key = quote(object_key, safe="/~")
+        endpoint_url = getattr(settings, "AWS_S3_ENDPOINT_URL", "")
+        if endpoint_url:
+            return f"{endpoint_url.rstrip('/')}/{self.bucket_name}/{key}"
+
+        if self.region_name in ("", "us-east-1"):
+            host = "s3.amazonaws.com"
+        else:
+            host = f"s3.{self.region_name}.amazonaws.com"
+        if "." in self.bucket_name:
+            return f"https://{host}/{self.bucket_name}/{key}"
+        return f"https://{self.bucket_name}.{host}/{key}"
 
     def parse_s3_url(self, url: str) -> tuple[str, str]:
         """
@@ -482,15 +594,20 @@ class S3Client:
             tuple: (bucket_name, object_key)
         """
         parsed_url = urlparse(url)
-
-        if parsed_url.netloc.endswith("s3.amazonaws.com"):
-            # URL format: https://bucket-name.s3.amazonaws.com/key
-            bucket_name = parsed_url.netloc.replace(".s3.amazonaws.com", "")
-            object_key = parsed_url.path.lstrip("/")
-        elif parsed_url.netloc == "s3.amazonaws.com":
-            # URL format: https://s3.amazonaws.com/bucket-name/key
-            path_parts = parsed_url.path.strip("/").split("/", 1)
-            bucket_name = path_parts[0] if path_parts else ""
+        path = unquote(parsed_url.path).lstrip("/")
+        endpoint_url = getattr(settings, "AWS_S3_ENDPOINT_URL", "")
+        match = S3_HOST_PATTERN.fullmatch(parsed_url.netloc)
+
+        if match and match.group("bucket"):
+            # Virtual-hosted: https://bucket-name.s3[.region].amazonaws.com/key
+            bucket_name, object_key = match.group("bucket"), path
+        elif match or (
+            endpoint_url and parsed_url.netloc == urlparse(endpoint_url).netloc
+        ):
+            # Path-style: https://s3[.region].amazonaws.com/bucket-name/key,
+            # or on the custom endpoint (settings.AWS_S3_ENDPOINT_URL)
+            path_parts = path.split("/", 1)
+            bucket_name = path_parts[0]
             object_key = path_parts[1] if len(path_parts) > 1 else ""
         else:
             # Not an S3 URL
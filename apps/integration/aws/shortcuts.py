@@ -12,6 +12,7 @@ import os
 from typing import Any
 
 from apps.common.models.upload import Upload
+from apps.integration.aws.image_variants import queue_variants
 from apps.integration.aws.s3 import S3Client, generate_unique_filename
 
 logger = logging.getLogger(__name__)
@@ -165,6 +166,10 @@ def complete_upload(
                     f"Error updating metadata for upload {upload_id}: {str(e)}"
                 )
 
+        # Queue thumbnail/variant generation for images
+        if status == Upload.STATUS_COMPLETE:
+            queue_variants(upload)
+
         # Save changes
         upload.save()
 
@@ -0,0 +1,129 @@
+"""
+In-memory stand-in for the boto3 S3 client used by the transfer and image
+variant tests and the upload benchmark.
+
+Implements the object and multipart calls the AWS integration makes, is safe
+to call from several threads, and can simulate per-request latency and
+failures.
+"""
+
+import hashlib
+import io
+import threading
+import time
+import uuid
+
+
+class FakeS3Client:
+    """Thread-safe in-memory S3 client with optional simulated latency."""
+
+    def __init__(self, latency: float = 0.0, bytes_per_second: float | None = None):
+        """
+        Args:
+            latency: Seconds added to every request
+            bytes_per_second: Simulated bandwidth per connection for request bodies
+        """
+        self.latency = latency
+        self.bytes_per_second = bytes_per_second
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.extra_args: dict[tuple[str, str], dict] = {}
+        self.multipart: dict[str, dict] = {}
+        self.fail_parts: set[int] = set()
+        self.calls: list[str] = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def _request(self, name: str, body: bytes = b"") -> None:
+        with self._lock:
+            self.calls.append(name)
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            delay = self.latency
+            if self.bytes_per_second:
+                delay += len(body) / self.bytes_per_second
+            if delay:
+                time.sleep(delay)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self._request("put_object", Body)
+        with self._lock:
+            self.objects[(Bucket, Key)] = bytes(Body)
+        return {"ETag": f'"{hashlib.md5(Body).hexdigest()}"'}
+
+    def get_object(self, Bucket, Key, **kwargs):
+        self._request("get_object")
+        with self._lock:
+            if (Bucket, Key) not in self.objects:
+                raise KeyError(f"NoSuchKey: {Key}")
+            body = self.objects[(Bucket, Key)]
+        return {"Body": FakeStreamingBody(body), "ContentLength": len(body)}
+
+    def upload_fileobj(self, Fileobj, Bucket, Key, ExtraArgs=None, **kwargs):
+        body = Fileobj.read()
+        self.put_object(Bucket=Bucket, Key=Key, Body=body, **(ExtraArgs or {}))
+        with self._lock:
+            self.extra_args[(Bucket, Key)] = dict(ExtraArgs or {})
+
+    def create_multipart_upload(self, Bucket, Key, **kwargs):
+        self._request("create_multipart_upload")
+        upload_id = uuid.uuid4().hex
+        with self._lock:
+            self.multipart[upload_id] = {"bucket": Bucket, "key": Key, "parts": {}}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self._request("upload_part", Body)
+        if PartNumber in self.fail_parts:
+            raise ConnectionError(f"Simulated failure for part {PartNumber}")
+        etag = f'"{hashlib.md5(Body).hexdigest()}"'
+        with self._lock:
+            self.multipart[UploadId]["parts"][PartNumber] = (etag, bytes(Body))
+        return {"ETag": etag}
+
+    def list_parts(self, Bucket, Key, UploadId, PartNumberMarker=0, MaxParts=1000):
+        self._request("list_parts")
+        with self._lock:
+            parts = sorted(self.multipart[UploadId]["parts"].items())
+        parts = [p for p in parts if p[0] > PartNumberMarker]
+        page = parts[:MaxParts]
+        response = {
+            "Parts": [
+                {"PartNumber": number, "ETag": etag, "Size": len(data)}
+                for number, (etag, data) in page
+            ],
+            "IsTruncated": len(parts) > MaxParts,
+        }
+        if response["IsTruncated"]:
+            response["NextPartNumberMarker"] = page[-1][0]
+        return response
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self._request("complete_multipart_upload")
+        with self._lock:
+            stored = self.multipart.pop(UploadId)["parts"]
+            body = b""
+            for part in MultipartUpload["Parts"]:
+                etag, data = stored[part["PartNumber"]]
+                if etag != part["ETag"]:
+                    raise ValueError(f"ETag mismatch for part {part['PartNumber']}")
+                body += data
+            self.objects[(Bucket, Key)] = body
+        return {"Bucket": Bucket, "Key": Key}
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self._request("abort_multipart_upload")
+        with self._lock:
+            self.multipart.pop(UploadId, None)
+        return {}
+
+
+class FakeStreamingBody(io.BytesIO):
+    """Minimal botocore StreamingBody."""
+
+    def iter_chunks(self, chunk_size=1024):
+        return iter(lambda: self.read(chunk_size), b"")
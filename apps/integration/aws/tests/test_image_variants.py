@@ -0,0 +1,231 @@
+"""
+Tests for the image variant pipeline.
+"""
+
+import io
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from PIL import Image as PILImage
+from PIL.JpegImagePlugin import JpegImageFile
+
+from apps.common.models import Image, Upload
+from apps.common.utilities.compression.image_variants import render_variants
+from apps.integration.aws.image_variants import (
+    VARIANTS_COMPLETE,
+    VARIANTS_ERROR,
+    VARIANTS_PENDING,
+    VARIANTS_PROCESSING,
+    generate_variants,
+    process_image_variants,
+    requeue_stale_variants,
+    variant_object_key,
+)
+from apps.integration.aws.shortcuts import complete_upload
+from apps.integration.aws.tests.fake_s3 import FakeS3Client
+
+SPECS = {
+    "thumbnail": {"width": 100, "height": 100, "crop": True},
+    "small": {"width": 300},
+}
+
+
+def make_jpeg(width, height, orientation=None):
+    image = PILImage.new("RGB", (width, height), (200, 40, 40))
+    exif = PILImage.Exif()
+    if orientation:
+        exif[0x0112] = orientation
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", exif=exif)
+    return buffer.getvalue()
+
+
+class RenderVariantsTestCase(TestCase):
+    """Test cases for render_variants."""
+
+    def test_renders_fitted_and_cropped_variants(self):
+        """Test that variants are resized to their specs and encoded as WebP."""
+        result = render_variants(make_jpeg(1200, 600), SPECS)
+
+        self.assertEqual(
+            result["meta"], {"width": 1200, "height": 600, "format": "JPEG"}
+        )
+        thumbnail = result["variants"]["thumbnail"]
+        small = result["variants"]["small"]
+        self.assertEqual((thumbnail["width"], thumbnail["height"]), (100, 100))
+        self.assertEqual((small["width"], small["height"]), (300, 150))
+        self.assertEqual(small["content_type"], "image/webp")
+        with PILImage.open(io.BytesIO(small["data"])) as decoded:
+            self.assertEqual(decoded.format, "WEBP")
+            self.assertEqual(decoded.size, (300, 150))
+
+    def test_exif_rotation_swaps_dimensions(self):
+        """Test that dimensions are reported as displayed, after EXIF rotation."""
+        result = render_variants(make_jpeg(400, 200, orientation=6), SPECS)
+
+        self.assertEqual(result["meta"]["width"], 200)
+        self.assertEqual(result["meta"]["height"], 400)
+        self.assertEqual(result["variants"]["thumbnail"]["height"], 100)
+        small = result["variants"]["small"]
+        self.assertEqual((small["width"], small["height"]), (200, 400))
+
+    def test_does_not_upscale(self):
+        """Test that fitted variants of small images keep their size."""
+        result = render_variants(make_jpeg(120, 80), SPECS)
+
+        self.assertEqual(result["variants"]["small"]["width"], 120)
+
+    def test_uses_draft_mode_for_jpeg(self):
+        """Test that JPEGs are decoded at a reduced scale when possible."""
+        with patch.object(
+            JpegImageFile, "draft", autospec=True, side_effect=JpegImageFile.draft
+        ) as mock_draft:
+            render_variants(make_jpeg(2400, 1200), {"small": {"width": 300}})
+
+        mock_draft.assert_called_once()
+        self.assertEqual(mock_draft.call_args[0][2], (300, 150))
+
+
+@override_settings(
+    AWS_ACCESS_KEY_ID="test_key",
+    AWS_SECRET_ACCESS_KEY="test_secret",
+    AWS_S3_BUCKET_NAME="test-bucket",
+    IMAGE_VARIANTS=SPECS,
+)
+class GenerateVariantsTestCase(TestCase):
+    """Test cases for generating and storing variants."""
+
+    def setUp(self):
+        self.fake = FakeS3Client()
+        patchers = [
+            patch("apps.integration.aws.s3.boto3.client", return_value=self.fake),
+            patch("apps.integration.aws.s3.boto3.resource"),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def create_upload(self, key, width=800, height=600):
+        self.fake.objects[("test-bucket", key)] = make_jpeg(width, height)
+        return Upload.objects.create(
+            s3_bucket="test-bucket",
+            s3_key=key,
+            content_type="image/jpeg",
+            status=Upload.STATUS_COMPLETE,
+        )
+
+    def test_generate_variants(self):
+        """Test that variants are stored in S3 and described in meta_data."""
+        upload = self.create_upload("uploads/photo.jpg")
+        image = Image.objects.create(upload=upload)
+
+        stats = generate_variants([upload], workers=1)
+
+        self.assertEqual(stats.processed, 1)
+        self.assertEqual(stats.variants, 2)
+        upload.refresh_from_db()
+        self.assertEqual(upload.variants_status, VARIANTS_COMPLETE)
+        self.assertEqual((upload.width, upload.height), (800, 600))
+        self.assertEqual(
+            upload.variant_key("thumbnail"), "uploads/photo_thumbnail.webp"
+        )
+        stored_key = ("test-bucket", "uploads/photo_small.webp")
+        self.assertIn(stored_key, self.fake.objects)
+        self.assertEqual(self.fake.extra_args[stored_key]["ContentType"], "image/webp")
+        self.assertNotIn("ACL", self.fake.extra_args[stored_key])
+
+        # Variants are private, so the thumbnail is linked with a pre-signed URL
+        image.refresh_from_db()
+        self.assertEqual(image.thumbnail_url, "")
+        with patch(
+            "apps.integration.aws.presigned_urls.presign",
+            return_value="https://signed/thumbnail",
+        ) as mock_presign:
+            self.assertEqual(image.get_thumbnail_url(), "https://signed/thumbnail")
+        mock_presign.assert_called_once_with(
+            "test-bucket", "uploads/photo_thumbnail.webp", expiration=3600
+        )
+
+    def test_process_pool_and_failures(self):
+        """Test a batch in worker processes where one original is missing."""
+        uploads = [self.create_upload(f"uploads/{i}.jpg") for i in range(3)]
+        missing = Upload.objects.create(
+            s3_bucket="test-bucket",
+            s3_key="uploads/gone.jpg",
+            content_type="image/jpeg",
+        )
+
+        stats = generate_variants(uploads + [missing], workers=2)
+
+        self.assertEqual(stats.processed, 3)
+        self.assertEqual(stats.failed, 1)
+        missing.refresh_from_db()
+        self.assertEqual(missing.variants_status, VARIANTS_ERROR)
+        for upload in uploads:
+            upload.refresh_from_db()
+            self.assertEqual(upload.variants_status, VARIANTS_COMPLETE)
+
+    def test_complete_upload_queues_images(self):
+        """Test that completed image uploads are queued and then processed."""
+        upload = self.create_upload("uploads/queued.jpg")
+        document = Upload.objects.create(
+            s3_bucket="test-bucket",
+            s3_key="uploads/doc.pdf",
+            content_type="application/pdf",
+        )
+        self.fake.objects[("test-bucket", "uploads/doc.pdf")] = b"%PDF"
+
+        with patch(
+            "apps.integration.aws.shortcuts.S3Client.get_object_metadata",
+            return_value={"success": False},
+        ):
+            complete_upload(upload.id)
+            complete_upload(document.id)
+
+        upload.refresh_from_db()
+        document.refresh_from_db()
+        self.assertEqual(upload.variants_status, VARIANTS_PENDING)
+        self.assertEqual(document.variants_status, "")
+
+        stats = process_image_variants(workers=1)
+
+        self.assertEqual(stats.claimed, 1)
+        upload.refresh_from_db()
+        self.assertEqual(upload.variants_status, VARIANTS_COMPLETE)
+        self.assertIsNone(upload.variants_claimed_at)
+
+    @override_settings(IMAGE_VARIANTS_PROCESSING_TIMEOUT=600)
+    def test_requeue_stale_variants(self):
+        """Test that only uploads claimed before the timeout are requeued."""
+        stale = self.create_upload("uploads/stale.jpg")
+        fresh = self.create_upload("uploads/fresh.jpg")
+        now = timezone.now()
+        Upload.objects.filter(pk=stale.pk).update(
+            variants_status=VARIANTS_PROCESSING,
+            variants_claimed_at=now - timedelta(minutes=20),
+        )
+        Upload.objects.filter(pk=fresh.pk).update(
+            variants_status=VARIANTS_PROCESSING,
+            variants_claimed_at=now - timedelta(minutes=5),
+        )
+
+        with self.assertNumQueries(1):
+            self.assertEqual(requeue_stale_variants(), 1)
+
+        stale.refresh_from_db()
+        fresh.refresh_from_db()
+        self.assertEqual(stale.variants_status, VARIANTS_PENDING)
+        self.assertIsNone(stale.variants_claimed_at)
+        self.assertEqual(fresh.variants_status, VARIANTS_PROCESSING)
+
+    def test_variant_object_key(self):
+        """Test that variant keys sit next to the original."""
+        self.assertEqual(
+            variant_object_key("uploads/a.b/photo.png", "small", "WEBP"),
+            "uploads/a.b/photo_small.webp",
+        )
+        self.assertEqual(
+            variant_object_key("photo", "large", "JPEG"), "photo_large.jpg"
+        )
@@ -0,0 +1,132 @@
+"""
+Tests for the pre-signed URL cache.
+"""
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from apps.common.models.upload import Upload
+from apps.common.utilities.cache import invalidate_namespace
+from apps.integration.aws.presigned_urls import (
+    NAMESPACE,
+    expiry_bucket,
+    presign,
+    presign_many,
+)
+
+
+@override_settings(
+    AWS_ACCESS_KEY_ID="test_key",
+    AWS_SECRET_ACCESS_KEY="test_secret",
+    AWS_S3_BUCKET_NAME="test-bucket",
+    AWS_PRESIGNED_URL_EXPIRY_STEP=300,
+    AWS_PRESIGNED_URL_MIN_VALIDITY=300,
+)
+class PresignedURLCacheTestCase(TestCase):
+    """Test cases for presign and presign_many."""
+
+    def setUp(self):
+        cache.clear()
+        patcher = mock.patch("apps.integration.aws.s3.S3Client")
+        self.mock_s3_client_cls = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.mock_client = mock.MagicMock()
+        self.mock_client.generate_presigned_url.side_effect = (
+            lambda object_key, expiration: {
+                "success": True,
+                "url": f"https://signed/{object_key}?expires={expiration}",
+            }
+        )
+        self.mock_s3_client_cls.return_value = self.mock_client
+
+    def test_expiry_bucket(self):
+        """Test that expirations are rounded up to the step."""
+        self.assertEqual(expiry_bucket(1), 300)
+        self.assertEqual(expiry_bucket(300), 300)
+        self.assertEqual(expiry_bucket(3500), 3600)
+        self.assertEqual(expiry_bucket(3600), 3600)
+
+    def test_presign_is_cached_per_expiry_bucket(self):
+        """Test that a URL is signed once per (bucket, key, expiry bucket)."""
+        first = presign("test-bucket", "a.jpg", expiration=3600)
+        second = presign("test-bucket", "a.jpg", expiration=3500)
+        other_bucket = presign("test-bucket", "a.jpg", expiration=7200)
+
+        self.assertEqual(first, "https://signed/a.jpg?expires=3600")
+        self.assertEqual(second, first)
+        self.assertEqual(other_bucket, "https://signed/a.jpg?expires=7200")
+        self.assertEqual(self.mock_client.generate_presigned_url.call_count, 2)
+
+    def test_short_expiration_is_not_cached(self):
+        """Test that URLs without room for the minimum validity are not cached."""
+        presign("test-bucket", "a.jpg", expiration=60)
+        presign("test-bucket", "a.jpg", expiration=60)
+
+        self.assertEqual(self.mock_client.generate_presigned_url.call_count, 2)
+
+    def test_failed_signature_is_not_cached(self):
+        """Test that failures are retried on the next call."""
+        self.mock_client.generate_presigned_url.side_effect = None
+        self.mock_client.generate_presigned_url.return_value = {
+            "success": False,
+            "error": "Test error",
+        }
+        self.assertIsNone(presign("test-bucket", "a.jpg"))
+        self.assertIsNone(presign("test-bucket", "a.jpg"))
+
+        self.assertEqual(self.mock_client.generate_presigned_url.call_count, 2)
+
+    def test_invalidate_namespace(self):
+        """Test that bumping the namespace version forces new signatures."""
+        presign("test-bucket", "a.jpg")
+        invalidate_namespace(NAMESPACE)
+        presign("test-bucket", "a.jpg")
+
+        self.assertEqual(self.mock_client.generate_presigned_url.call_count, 2)
+
+    def test_presign_many(self):
+        """Test bulk presigning with one client per bucket."""
+        s3_uploads = [
+            Upload.objects.create(s3_bucket="test-bucket", s3_key=f"file{i}.jpg")
+            for i in range(3)
+        ]
+        external = Upload.objects.create(original="https://example.com/x.jpg")
+        presign("test-bucket", "file0.jpg")
+        self.mock_s3_client_cls.reset_mock()
+        self.mock_client.generate_presigned_url.reset_mock()
+
+        urls = presign_many(s3_uploads + [external])
+
+        self.assertEqual(urls[external.pk], "https://example.com/x.jpg")
+        for upload in s3_uploads:
+            self.assertEqual(
+                urls[upload.pk], f"https://signed/{upload.s3_key}?expires=3600"
+            )
+        # file0 was cached, the other two share one client
+        self.mock_s3_client_cls.assert_called_once_with(
+            aws_s3_bucket_name="test-bucket"
+        )
+        self.assertEqual(self.mock_client.generate_presigned_url.call_count, 2)
+
+    def test_presign_many_variant(self):
+        """Test that uploads with the requested variant link to it."""
+        with_thumbnail = Upload.objects.create(
+            s3_bucket="test-bucket",
+            s3_key="photo.jpg",
+            meta_data={"variants": {"thumbnail": {"key": "photo_thumbnail.webp"}}},
+        )
+        without = Upload.objects.create(s3_bucket="test-bucket", s3_key="other.jpg")
+
+        urls = presign_many([with_thumbnail, without], variant="thumbnail")
+
+        self.assertEqual(
+            urls[with_thumbnail.pk], "https://signed/photo_thumbnail.webp?expires=3600"
+        )
+        self.assertEqual(urls[without.pk], "https://signed/other.jpg?expires=3600")
+        self.mock_s3_client_cls.assert_called_once_with(
+            aws_s3_bucket_name="test-bucket"
+        )
+        self.assertEqual(self.mock_client.generate_presigned_url.call_count, 2)
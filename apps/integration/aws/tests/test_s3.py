@@ -2,11 +2,13 @@
 Unit tests for the AWS S3 integration.
 """
 
+import io
 import os
 import tempfile
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
+import requests
 from botocore.exceptions import ClientError
 from django.test import TestCase, override_settings
 
@@ -15,6 +17,7 @@ from apps.integration.aws.s3 import (
     generate_unique_filename,
     get_file_upload_presigned_post,
 )
+from tools.loadtest import fakes
 
 
 @override_settings(
@@ -434,6 +437,45 @@ class S3ClientTestCase(TestCase):
         url = self.client.get_public_url("test/file.txt")
         self.assertEqual(url, "https://test-bucket.s3.amazonaws.com/test/file.txt")
 
+    def test_get_public_url_endpoints(self):
+        """Test public URLs for other regions, dotted buckets and endpoints."""
+        client = S3Client(aws_s3_bucket_name="test-bucket", region_name="eu-west-1")
+        self.assertEqual(
+            client.get_public_url("test/my file.txt"),
+            "https://test-bucket.s3.eu-west-1.amazonaws.com/test/my%20file.txt",
+        )
+
+        client = S3Client(aws_s3_bucket_name="assets.example.com")
+        self.assertEqual(
+            client.get_public_url("test/file.txt"),
+            "https://s3.amazonaws.com/assets.example.com/test/file.txt",
+        )
+
+        with override_settings(AWS_S3_ENDPOINT_URL="http://localhost:9000/"):
+            self.assertEqual(
+                self.client.get_public_url("test/file.txt"),
+                "http://localhost:9000/test-bucket/test/file.txt",
+            )
+
+    def test_parse_s3_url_round_trip(self):
+        """Test that every form get_public_url produces parses back."""
+        clients = [
+            self.client,
+            S3Client(aws_s3_bucket_name="test-bucket", region_name="eu-west-1"),
+            S3Client(aws_s3_bucket_name="assets.example.com", region_name="eu-west-1"),
+        ]
+        for client in clients:
+            url = client.get_public_url("test/my file.txt")
+            self.assertEqual(
+                client.parse_s3_url(url), (client.bucket_name, "test/my file.txt")
+            )
+
+        with override_settings(AWS_S3_ENDPOINT_URL="http://localhost:9000"):
+            url = self.client.get_public_url("test/file.txt")
+            self.assertEqual(
+                self.client.parse_s3_url(url), ("test-bucket", "test/file.txt")
+            )
+
     def test_parse_s3_url(self):
         """Test parsing an S3 URL."""
         # Test standard format
@@ -503,3 +545,43 @@ class UtilityFunctionsTestCase(TestCase):
             self.assertIn(
                 ["content-length-range", 1, 10485760], call_args["conditions"]
             )
+
+
+class S3EndpointURLTestCase(TestCase):
+    """Test cases for S3Client against the load-test fake via AWS_S3_ENDPOINT_URL."""
+
+    def setUp(self):
+        self.endpoint_url = self.enterContext(fakes.running("s3"))["s3"]
+        self.enterContext(
+            override_settings(
+                AWS_ACCESS_KEY_ID="test_key",
+                AWS_SECRET_ACCESS_KEY="test_secret",
+                AWS_S3_BUCKET_NAME="test-bucket",
+                AWS_S3_ENDPOINT_URL=self.endpoint_url,
+            )
+        )
+        self.client = S3Client()
+
+    def test_upload_and_head_object(self):
+        """Test that uploads and metadata use path-style URLs on the endpoint."""
+        result = self.client.upload_fileobj(io.BytesIO(b"a,b\n1,2\n"), "data.csv")
+        self.assertTrue(result["success"])
+        self.assertEqual(result["url"], f"{self.endpoint_url}/test-bucket/data.csv")
+
+        metadata = self.client.get_object_metadata("data.csv")
+        self.assertTrue(metadata["success"])
+        self.assertEqual(metadata["metadata"]["content_length"], 8)
+
+    def test_presigned_post_upload(self):
+        """Test that a browser-style POST to the presigned form is stored."""
+        post = self.client.generate_presigned_post("uploads/photo.jpg")
+        self.assertTrue(post["post_url"].startswith(f"{self.endpoint_url}/test-bucket"))
+
+        response = requests.post(
+            post["post_url"],
+            data=post["form_fields"],
+            files={"file": ("photo.jpg", b"jpeg bytes", "image/jpeg")},
+            timeout=5,
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(self.client.get_object_metadata("uploads/photo.jpg")["success"])
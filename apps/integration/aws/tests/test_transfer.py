@@ -0,0 +1,200 @@
+"""
+Tests for the streaming/multipart upload engine.
+"""
+
+import io
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from apps.common.models import Upload
+from apps.integration.aws import transfer
+from apps.integration.aws.s3 import S3Client
+from apps.integration.aws.tests.fake_s3 import FakeS3Client
+from apps.integration.aws.transfer import (
+    StreamingUploader,
+    UploadProgress,
+    get_transfer_config,
+    iter_parts,
+)
+
+PART_SIZE = 1024
+
+
+def stream(size, chunk_size=300):
+    """Yield `size` bytes in uneven chunks."""
+    data = bytes(i % 251 for i in range(size))
+    for start in range(0, size, chunk_size):
+        yield data[start : start + chunk_size]
+
+
+@override_settings(
+    AWS_ACCESS_KEY_ID="test_key",
+    AWS_SECRET_ACCESS_KEY="test_secret",
+    AWS_S3_BUCKET_NAME="test-bucket",
+    AWS_S3_PROGRESS_INTERVAL_MS=0,
+)
+class StreamingUploaderTestCase(TestCase):
+    """Test cases for StreamingUploader against an in-memory S3."""
+
+    def setUp(self):
+        self.fake = FakeS3Client(latency=0.01)
+        patchers = [
+            patch("apps.integration.aws.s3.boto3.client", return_value=self.fake),
+            patch("apps.integration.aws.s3.boto3.resource"),
+            # Allow tiny parts so tests don't move megabytes around
+            patch.object(transfer, "MIN_PART_SIZE", 1),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = S3Client()
+        self.upload = Upload.objects.create(name="report.csv")
+
+    def uploader(self, **kwargs):
+        kwargs.setdefault("part_size", PART_SIZE)
+        kwargs.setdefault("max_concurrency", 4)
+        return StreamingUploader(
+            "exports/report.csv", s3_client=self.client, upload=self.upload, **kwargs
+        )
+
+    def test_iter_parts(self):
+        """Test that chunks are re-sliced into exact part sizes."""
+        parts = list(iter_parts(stream(2500), PART_SIZE))
+
+        self.assertEqual([len(p) for p in parts], [1024, 1024, 452])
+        self.assertEqual(b"".join(parts), b"".join(stream(2500)))
+
+    def test_small_stream_uses_single_put(self):
+        """Test that a stream smaller than one part is sent with put_object."""
+        result = self.uploader().upload(stream(500))
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["parts"], 1)
+        self.assertEqual(self.fake.calls, ["put_object"])
+        self.upload.refresh_from_db()
+        self.assertEqual(self.upload.size, 500)
+        self.assertEqual(self.upload.status, Upload.STATUS_COMPLETE)
+        self.assertEqual(self.upload.s3_key, "exports/report.csv")
+
+    def test_multipart_upload_in_parallel(self):
+        """Test that parts are uploaded concurrently and reassembled in order."""
+        result = self.uploader().upload(stream(10 * PART_SIZE + 10))
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["parts"], 11)
+        self.assertEqual(
+            self.fake.objects[("test-bucket", "exports/report.csv")],
+            b"".join(stream(10 * PART_SIZE + 10)),
+        )
+        self.assertGreater(self.fake.max_in_flight, 1)
+        self.assertLessEqual(self.fake.max_in_flight, 4)
+
+        self.upload.refresh_from_db()
+        self.assertEqual(self.upload.size, 10 * PART_SIZE + 10)
+        self.assertEqual(self.upload.status, Upload.STATUS_COMPLETE)
+        self.assertNotIn("multipart", self.upload.meta_data)
+
+    def test_resume_interrupted_upload(self):
+        """Test that a failed upload resumes without re-sending finished parts."""
+        self.fake.fail_parts = {3}
+        # One part at a time, so exactly parts 1 and 2 finish before the failure
+        result = self.uploader(max_concurrency=1).upload(stream(5 * PART_SIZE))
+
+        self.assertFalse(result["success"])
+        self.assertTrue(result["resumable"])
+        self.upload.refresh_from_db()
+        self.assertEqual(self.upload.status, Upload.STATUS_ERROR)
+        self.assertEqual(
+            self.upload.meta_data["multipart"]["upload_id"],
+            result["multipart_upload_id"],
+        )
+
+        self.fake.fail_parts = set()
+        self.fake.calls.clear()
+        result = self.uploader().upload(stream(5 * PART_SIZE))
+
+        self.assertTrue(result["success"])
+        self.assertNotIn("create_multipart_upload", self.fake.calls)
+        self.assertEqual(self.fake.calls.count("upload_part"), 3)
+        self.assertEqual(
+            self.fake.objects[("test-bucket", "exports/report.csv")],
+            b"".join(stream(5 * PART_SIZE)),
+        )
+
+    def test_abort(self):
+        """Test that abort discards the multipart upload and its resume state."""
+        self.fake.fail_parts = {2}
+        self.uploader().upload(stream(3 * PART_SIZE))
+
+        result = self.uploader().abort()
+
+        self.assertTrue(result["success"])
+        self.assertEqual(self.fake.multipart, {})
+        self.upload.refresh_from_db()
+        self.assertNotIn("multipart", self.upload.meta_data)
+
+    def test_upload_stream(self):
+        """Test S3Client.upload_stream sets content type and ACL."""
+        result = self.client.upload_stream(
+            stream(500), "exports/report.csv", part_size=PART_SIZE
+        )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(
+            result["url"], "https://test-bucket.s3.amazonaws.com/exports/report.csv"
+        )
+
+
+@override_settings(
+    AWS_S3_MULTIPART_PART_SIZE=16 * 1024 * 1024,
+    AWS_S3_MAX_CONCURRENCY=3,
+)
+class TransferConfigTestCase(TestCase):
+    """Test cases for transfer configuration and progress reporting."""
+
+    def test_transfer_config_from_settings(self):
+        """Test that TransferConfig uses settings and the S3 part size minimum."""
+        config = get_transfer_config()
+        self.assertEqual(config.multipart_chunksize, 16 * 1024 * 1024)
+        self.assertEqual(config.max_concurrency, 3)
+
+        config = get_transfer_config(part_size=1024, max_concurrency=8)
+        self.assertEqual(config.multipart_chunksize, transfer.MIN_PART_SIZE)
+        self.assertEqual(config.max_concurrency, 8)
+
+    def test_progress_is_throttled(self):
+        """Test that the Upload row is written at most once per interval."""
+        upload = Upload.objects.create(name="video.mp4")
+        reported = []
+        progress = UploadProgress(
+            upload,
+            interval_ms=60_000,
+            on_progress=lambda sent, total: reported.append(sent),
+        )
+
+        for _ in range(100):
+            progress(10)
+        progress.flush(status=Upload.STATUS_COMPLETE)
+
+        self.assertEqual(progress.updates, 2)
+        self.assertEqual(reported, [10, 1000])
+        upload.refresh_from_db()
+        self.assertEqual(upload.size, 1000)
+        self.assertEqual(upload.status, Upload.STATUS_COMPLETE)
+
+    @override_settings(
+        AWS_ACCESS_KEY_ID="test_key",
+        AWS_SECRET_ACCESS_KEY="test_secret",
+        AWS_S3_BUCKET_NAME="test-bucket",
+    )
+    @patch("apps.integration.aws.s3.boto3.resource")
+    @patch("apps.integration.aws.s3.boto3.client")
+    def test_upload_fileobj_passes_transfer_config(self, mock_client, mock_resource):
+        """Test that upload_fileobj forwards the TransferConfig and callback."""
+        progress = UploadProgress()
+        S3Client().upload_fileobj(io.BytesIO(b"data"), "a.txt", progress=progress)
+
+        call_args = mock_client.return_value.upload_fileobj.call_args[1]
+        self.assertEqual(call_args["Config"].max_concurrency, 3)
+        self.assertIs(call_args["Callback"], progress)
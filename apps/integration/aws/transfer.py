@@ -0,0 +1,389 @@
+"""
+Upload engine for large and streamed S3 uploads.
+
+- `get_transfer_config()` builds a boto3 `TransferConfig` from settings
+  (multipart threshold, part size, concurrency) for `S3Client.upload_file` and
+  `S3Client.upload_fileobj`.
+- `UploadProgress` is a boto3-compatible progress callback that writes the
+  bytes transferred so far to an `Upload` row, at most once every N ms.
+- `StreamingUploader` uploads a generator/iterator of bytes as a multipart
+  upload without buffering the whole file: parts are cut from the stream and
+  sent in parallel, with at most `max_concurrency` parts in memory. If the
+  upload is interrupted, the multipart upload id is kept in
+  `Upload.meta_data["multipart"]` and a later call with the same stream
+  resumes it, skipping the parts S3 already has.
+
+Example:
+    ```python
+    from apps.integration.aws.transfer import StreamingUploader
+
+    def chunks():
+        for row in export_rows():
+            yield row.encode()
+
+    result = StreamingUploader("exports/report.csv", upload=upload).upload(chunks())
+    ```
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any
+
+from boto3.s3.transfer import TransferConfig
+from django.conf import settings
+from django.db import connection
+
+from apps.common.models import Upload
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+MIN_PART_SIZE = 5 * MB  # S3 minimum for every part except the last
+
+
+def get_transfer_config(
+    part_size: int | None = None,
+    max_concurrency: int | None = None,
+    multipart_threshold: int | None = None,
+) -> TransferConfig:
+    """
+    Build a boto3 TransferConfig from arguments or settings.
+
+    Args:
+        part_size: Multipart chunk size in bytes (default: AWS_S3_MULTIPART_PART_SIZE)
+        max_concurrency: Parallel part uploads (default: AWS_S3_MAX_CONCURRENCY)
+        multipart_threshold: Size above which multipart is used
+                             (default: AWS_S3_MULTIPART_THRESHOLD)
+    """
+    return TransferConfig(
+        multipart_threshold=multipart_threshold
+        or getattr(settings, "AWS_S3_MULTIPART_THRESHOLD", 8 * MB),
+        multipart_chunksize=max(
+            part_size or getattr(settings, "AWS_S3_MULTIPART_PART_SIZE", 8 * MB),
+            MIN_PART_SIZE,
+        ),
+        max_concurrency=max_concurrency
+        or getattr(settings, "AWS_S3_MAX_CONCURRENCY", 10),
+    )
+
+
+class UploadProgress:
+    """
+    Thread-safe progress callback that records transferred bytes on an Upload.
+
+    boto3 calls it from its worker threads with the number of bytes sent since
+    the previous call. The Upload row is updated with a single UPDATE at most
+    once every `interval_ms` milliseconds, plus once more on `flush()`.
+    """
+
+    def __init__(
+        self,
+        upload=None,
+        interval_ms: int | None = None,
+        total_size: int | None = None,
+        on_progress=None,
+    ):
+        self.upload = upload
+        self.interval = (
+            interval_ms
+            if interval_ms is not None
+            else getattr(settings, "AWS_S3_PROGRESS_INTERVAL_MS", 500)
+        ) / 1000
+        self.total_size = total_size
+        self.on_progress = on_progress
+        self.bytes_transferred = 0
+        self.updates = 0
+        self._last_update = 0.0
+        self._lock = threading.Lock()
+        self._owner = threading.get_ident()
+
+    def __call__(self, bytes_amount: int) -> None:
+        with self._lock:
+            self.bytes_transferred += bytes_amount
+            now = time.monotonic()
+            if now - self._last_update < self.interval:
+                return
+            self._last_update = now
+            transferred = self.bytes_transferred
+        self._report(transferred)
+
+    def flush(self, status: str | None = None) -> None:
+        """Write the final byte count (and optionally a new status)."""
+        with self._lock:
+            transferred = self.bytes_transferred
+        self._report(transferred, status=status)
+
+    def _report(self, transferred: int, status: str | None = None) -> None:
+        if self.on_progress:
+            self.on_progress(transferred, self.total_size)
+        if self.upload is None:
+            return
+
+        fields = {
+            "size": transferred,
+            "status": status or Upload.STATUS_PROCESSING,
+        }
+        Upload.objects.filter(pk=self.upload.pk).update(**fields)
+        for field, value in fields.items():
+            setattr(self.upload, field, value)
+        self.updates += 1
+        if threading.get_ident() != self._owner:
+            # boto3 worker threads are short-lived; don't leak their connections
+            connection.close()
+
+
+def iter_parts(chunks: Iterable[bytes], part_size: int) -> Iterator[bytes]:
+    """Re-slice an iterable of byte chunks into parts of exactly `part_size`."""
+    buffer = bytearray()
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer += chunk
+        while len(buffer) >= part_size:
+            yield bytes(buffer[:part_size])
+            del buffer[:part_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+class StreamingUploader:
+    """Parallel, resumable multipart upload of a byte stream to S3."""
+
+    def __init__(
+        self,
+        object_key: str,
+        s3_client=None,
+        upload=None,
+        part_size: int | None = None,
+        max_concurrency: int | None = None,
+        progress_interval_ms: int | None = None,
+        content_type: str | None = None,
+        extra_args: dict[str, Any] | None = None,
+        on_progress=None,
+    ):
+        """
+        Args:
+            object_key: S3 object key to write
+            s3_client: S3Client to use (defaults to one for the upload's bucket)
+            upload: Optional Upload row to report progress and resume state on
+            part_size: Part size in bytes (default: AWS_S3_MULTIPART_PART_SIZE)
+            max_concurrency: Parts uploaded in parallel (default: AWS_S3_MAX_CONCURRENCY)
+            progress_interval_ms: Minimum time between Upload row updates
+            content_type: Content type of the object
+            extra_args: Extra arguments for create_multipart_upload / put_object
+            on_progress: Optional callable(bytes_transferred, total_size)
+        """
+        if s3_client is None:
+            from apps.integration.aws.s3 import S3Client
+
+            s3_client = S3Client(
+                aws_s3_bucket_name=getattr(upload, "s3_bucket", None) or None
+            )
+        self.client = s3_client
+        self.object_key = object_key
+        self.upload_instance = upload
+        config = get_transfer_config(part_size, max_concurrency)
+        self.part_size = config.multipart_chunksize
+        self.max_concurrency = config.max_concurrency
+        self.extra_args = dict(extra_args or {})
+        if content_type:
+            self.extra_args.setdefault("ContentType", content_type)
+        self.progress = UploadProgress(
+            upload, interval_ms=progress_interval_ms, on_progress=on_progress
+        )
+        self.multipart_upload_id = None
+
+    @property
+    def bucket(self) -> str:
+        return self.client.bucket_name
+
+    def _saved_state(self) -> dict | None:
+        if self.upload_instance is None or not self.upload_instance.meta_data:
+            return None
+        state = self.upload_instance.meta_data.get("multipart")
+        if state and state.get("key") == self.object_key:
+            return state
+        return None
+
+    def _save_state(self, state: dict | None) -> None:
+        if self.upload_instance is None:
+            return
+        meta_data = dict(self.upload_instance.meta_data or {})
+        if state:
+            meta_data["multipart"] = state
+        else:
+            meta_data.pop("multipart", None)
+        self.upload_instance.meta_data = meta_data
+        Upload.objects.filter(pk=self.upload_instance.pk).update(meta_data=meta_data)
+
+    def _uploaded_parts(self) -> dict[int, dict]:
+        """Parts S3 already has for the multipart upload being resumed."""
+        parts = {}
+        kwargs = {
+            "Bucket": self.bucket,
+            "Key": self.object_key,
+            "UploadId": self.multipart_upload_id,
+        }
+        while True:
+            response = self.client.s3_client.list_parts(**kwargs)
+            for part in response.get("Parts", []):
+                parts[part["PartNumber"]] = part
+            if not response.get("IsTruncated"):
+                return parts
+            kwargs["PartNumberMarker"] = response["NextPartNumberMarker"]
+
+    def _upload_part(self, part_number: int, data: bytes) -> dict:
+        response = self.client.s3_client.upload_part(
+            Bucket=self.bucket,
+            Key=self.object_key,
+            UploadId=self.multipart_upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        return {"PartNumber": part_number, "ETag": response["ETag"], "Size": len(data)}
+
+    def _collect(self, futures, completed: list) -> None:
+        # Progress is reported from the calling thread only, so worker threads
+        # never open database connections of their own
+        for future in futures:
+            part = future.result()
+            self.progress(part.pop("Size"))
+            completed.append(part)
+
+    def _start(self) -> dict[int, dict]:
+        state = self._saved_state()
+        if state and state.get("part_size") == self.part_size:
+            self.multipart_upload_id = state["upload_id"]
+            try:
+                return self._uploaded_parts()
+            except Exception as e:
+                logger.warning(
+                    f"Cannot resume multipart upload {self.multipart_upload_id}: "
+                    f"{str(e)}"
+                )
+
+        response = self.client.s3_client.create_multipart_upload(
+            Bucket=self.bucket, Key=self.object_key, **self.extra_args
+        )
+        self.multipart_upload_id = response["UploadId"]
+        self._save_state(
+            {
+                "upload_id": self.multipart_upload_id,
+                "key": self.object_key,
+                "part_size": self.part_size,
+            }
+        )
+        return {}
+
+    def upload(self, chunks: Iterable[bytes]) -> dict[str, Any]:
+        """
+        Upload (or resume uploading) a stream of bytes.
+
+        When resuming, pass the same stream from the beginning: parts S3
+        already has are read and skipped instead of being sent again.
+
+        Returns:
+            dict: Response data including success flag, URL, size and part count
+        """
+        if not self.client._validate_client():
+            return {"success": False, "error": "S3 client not configured"}
+
+        parts = iter_parts(chunks, self.part_size)
+        try:
+            first = next(parts, b"")
+            second = next(parts, None)
+            if second is None and not self._saved_state():
+                # Small enough for a single request
+                self.client.s3_client.put_object(
+                    Bucket=self.bucket,
+                    Key=self.object_key,
+                    Body=first,
+                    **self.extra_args,
+                )
+                self.progress(len(first))
+                return self._finish(len(first), part_count=1)
+
+            done = self._start()
+            completed = []
+            pending = set()
+            size = 0
+
+            def all_parts():
+                yield first
+                if second is not None:
+                    yield second
+                    yield from parts
+
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                for part_number, data in enumerate(all_parts(), start=1):
+                    size += len(data)
+                    existing = done.get(part_number)
+                    if existing and existing.get("Size") == len(data):
+                        completed.append(
+                            {"PartNumber": part_number, "ETag": existing["ETag"]}
+                        )
+                        self.progress(len(data))
+                        continue
+
+                    # Bound memory: wait for a slot before reading more parts
+                    while len(pending) >= self.max_concurrency:
+                        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        self._collect(finished, completed)
+                    pending.add(executor.submit(self._upload_part, part_number, data))
+                self._collect(pending, completed)
+
+            completed.sort(key=lambda part: part["PartNumber"])
+            self.client.s3_client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=self.object_key,
+                UploadId=self.multipart_upload_id,
+                MultipartUpload={"Parts": completed},
+            )
+            self._save_state(None)
+            return self._finish(size, part_count=len(completed))
+
+        except Exception as e:
+            logger.error(f"Failed to upload stream to S3: {str(e)}")
+            self.progress.flush(status=Upload.STATUS_ERROR)
+            if self.upload_instance is not None:
+                Upload.objects.filter(pk=self.upload_instance.pk).update(error=str(e))
+            return {
+                "success": False,
+                "error": str(e),
+                "multipart_upload_id": self.multipart_upload_id,
+                "resumable": self.multipart_upload_id is not None,
+            }
+
+    def abort(self) -> dict[str, Any]:
+        """Abort the multipart upload and discard its parts."""
+        state = self._saved_state()
+        upload_id = self.multipart_upload_id or (state or {}).get("upload_id")
+        if not upload_id:
+            return {"success": False, "error": "No multipart upload to abort"}
+        try:
+            self.client.s3_client.abort_multipart_upload(
+                Bucket=self.bucket, Key=self.object_key, UploadId=upload_id
+            )
+            self._save_state(None)
+            return {"success": True, "multipart_upload_id": upload_id}
+        except Exception as e:
+            logger.error(f"Failed to abort multipart upload: {str(e)}")
+            return {"success": False, "error": str(e)}
+
+    def _finish(self, size: int, part_count: int) -> dict[str, Any]:
+        self.progress.flush(status=Upload.STATUS_COMPLETE)
+        if self.upload_instance is not None and not self.upload_instance.s3_key:
+            Upload.objects.filter(pk=self.upload_instance.pk).update(
+                s3_bucket=self.bucket, s3_key=self.object_key
+            )
+        return {
+            "success": True,
+            "url": self.client.get_public_url(self.object_key),
+            "bucket": self.bucket,
+            "key": self.object_key,
+            "size": size,
+            "parts": part_count,
+        }
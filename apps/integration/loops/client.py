@@ -1,6 +1,7 @@
 import logging
 
 import requests
+from django.conf import settings
 from icecream import ic
 
 from settings import DEBUG, LOOPS_API_KEY
@@ -11,9 +12,21 @@ logger = logging.getLogger(__name__)
 class LoopsClient:
     BASE_URL = "https://app.loops.so/api/v1"
 
-    def __init__(self, api_key: str | None = None, debug_mode: bool | None = None):
-        self.api_key = api_key or LOOPS_API_KEY
-        # Use provided debug_mode if specified, otherwise use Django's DEBUG setting
+    def __init__(
+        self,
+        api_key: str | None = None,
+        debug_mode: bool | None = None,
+        base_url: str | None = None,
+    ):
+        self.api_key = api_key or getattr(settings, "LOOPS_API_KEY", LOOPS_API_KEY)
+        self.base_url = base_url or getattr(
+            settings, "LOOPS_API_BASE_URL", self.BASE_URL
+        )
+        # Use provided debug_mode if specified, then settings.LOOPS_DEBUG_MODE,
+        # otherwise the environment's DEBUG (settings.env; tests run with
+        # Django's DEBUG off, but must not send real requests)
+        if debug_mode is None:
+            debug_mode = getattr(settings, "LOOPS_DEBUG_MODE", None)
         self.debug_mode = debug_mode if debug_mode is not None else DEBUG
 
     def _make_request(
@@ -42,7 +55,7 @@ class LoopsClient:
             logger.info(f"[DEBUG MODE] JSON: {json}")
             return {"success": True}
 
-        url = f"{self.BASE_URL}{endpoint}"
+        url = f"{self.base_url}{endpoint}"
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -6,9 +6,10 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from apps.integration.loops.client import LoopsAPIError, LoopsClient
+from tools.loadtest import fakes
 
 
 class LoopsClientDebugModeTestCase(TestCase):
@@ -36,6 +37,14 @@ class LoopsClientDebugModeTestCase(TestCase):
         )
         assert result == {"success": True}
 
+    @patch("apps.integration.loops.client.DEBUG", True)
+    def test_debug_mode_default(self):
+        """Test that debug mode follows the environment, not Django's DEBUG"""
+        with override_settings(DEBUG=False):
+            self.assertTrue(LoopsClient(api_key="test_key").debug_mode)
+        with override_settings(LOOPS_DEBUG_MODE=False):
+            self.assertFalse(LoopsClient(api_key="test_key").debug_mode)
+
 
 class LoopsClientLiveTestCase(TestCase):
     """Test LoopsClient in live mode with mocked requests"""
@@ -135,3 +144,19 @@ class LoopsClientLiveTestCase(TestCase):
         call_args = mock_request.call_args
         assert call_args[0][0] == "GET"
         assert call_args[0][1].endswith("/api-key")
+
+
+class LoopsClientBaseURLTestCase(TestCase):
+    """Test LoopsClient against the load-test fake via LOOPS_API_BASE_URL"""
+
+    def test_requests_go_to_base_url(self):
+        """Test that a configured base URL replaces the Loops API host"""
+        with fakes.running("loops") as urls:
+            with override_settings(LOOPS_API_BASE_URL=f"{urls['loops']}/api/v1"):
+                client = LoopsClient(api_key="test_key", debug_mode=False)
+                result = client.transactional_email(
+                    to_email="test@example.com", transactional_id="welcome"
+                )
+
+        assert client.base_url == f"{urls['loops']}/api/v1"
+        assert result["success"] is True
@@ -47,6 +47,10 @@ class StripeClient:
         # Initialize stripe library if available
         if STRIPE_AVAILABLE and self.api_key:
             stripe.api_key = self.api_key
+            # e.g. a local fake for load tests (tools/loadtest/)
+            api_base = getattr(settings, "STRIPE_API_BASE", "")
+            if api_base:
+                stripe.api_base = api_base
 
     def _validate_client(self) -> bool:
         """
@@ -452,10 +456,15 @@ class StripeClient:
                 payload=payload, sig_header=signature, secret=self.webhook_secret
             )
 
+            # Handlers expect plain dicts; event.data is a StripeObject
+            if isinstance(payload, bytes):
+                payload = payload.decode("utf-8")
+            data = json.loads(payload).get("data", {})
+
             return {
                 "success": True,
                 "verified": True,
-                "event": {"id": event.id, "type": event.type, "data": event.data},
+                "event": {"id": event.id, "type": event.type, "data": data},
             }
         except stripe.error.SignatureVerificationError as e:
             logger.error(f"Stripe signature verification failed: {str(e)}")
@@ -5,7 +5,8 @@ Unit tests for the StripeClient class.
 import json
 from unittest.mock import MagicMock
 
-from django.test import TestCase
+import stripe
+from django.test import TestCase, override_settings
 
 from apps.integration.stripe.client import StripeClient
 from apps.integration.stripe.tests.stripe_test_utils import (
@@ -13,6 +14,7 @@ from apps.integration.stripe.tests.stripe_test_utils import (
     setup_live_mode,
     teardown_patches,
 )
+from tools.loadtest import fakes
 
 
 class StripeClientDebugModeTestCase(TestCase):
@@ -312,7 +314,10 @@ class StripeClientLiveTestCase(TestCase):
         self.client.webhook_secret = "test_secret"
 
         # Call the method
-        payload = b'{"type":"checkout.session.completed"}'
+        payload = (
+            b'{"type":"checkout.session.completed",'
+            b'"data":{"object":{"id":"cs_test123"}}}'
+        )
         signature = "test_signature"
 
         result = self.client.verify_webhook_signature(
@@ -324,6 +329,8 @@ class StripeClientLiveTestCase(TestCase):
         self.assertTrue(result["verified"])
         self.assertEqual(result["event"]["id"], "evt_test123")
         self.assertEqual(result["event"]["type"], "checkout.session.completed")
+        # Event data is returned as plain dicts, as the handlers expect
+        self.assertEqual(result["event"]["data"], {"object": {"id": "cs_test123"}})
 
         # Verify Stripe was called correctly
         self.mock_stripe.Webhook.construct_event.assert_called_once_with(
@@ -355,3 +362,29 @@ class StripeClientLiveTestCase(TestCase):
         self.assertFalse(result["success"])
         self.assertFalse(result["verified"])
         self.assertEqual(result["error"], "Invalid signature")
+
+
+class StripeClientAPIBaseTestCase(TestCase):
+    """Test StripeClient against the load-test fake via STRIPE_API_BASE."""
+
+    def setUp(self):
+        super().setUp()
+        # stripe.api_base is global, so put it back for other tests
+        self.addCleanup(setattr, stripe, "api_base", stripe.api_base)
+        self.addCleanup(setattr, stripe, "api_key", stripe.api_key)
+        api_base = self.enterContext(fakes.running("stripe"))["stripe"]
+        self.enterContext(
+            override_settings(
+                DEBUG=False, STRIPE_ENABLED=True, STRIPE_API_BASE=api_base
+            )
+        )
+        self.client = StripeClient(api_key="sk_test_key", webhook_secret="test_secret")
+
+    def test_create_customer(self):
+        """Test that API calls go to the configured base URL."""
+        result = self.client.create_customer(email="test@example.com", name="Test User")
+
+        self.assertTrue(result["success"])
+        self.assertTrue(result["customer"]["id"].startswith("cus_"))
+        self.assertEqual(result["customer"]["email"], "test@example.com")
+        self.assertEqual(result["customer"]["name"], "Test User")
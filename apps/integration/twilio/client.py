@@ -1,5 +1,6 @@
 import logging
 from typing import Any
+from urllib.parse import urlsplit
 
 from django.conf import settings
 
@@ -11,6 +12,7 @@ logger = logging.getLogger(__name__)
 # Import Twilio client class only if TWILIO_ENABLED
 try:
     from twilio.base.exceptions import TwilioRestException
+    from twilio.http.http_client import TwilioHttpClient
     from twilio.rest import Client as TwilioRestClient
 
     TWILIO_AVAILABLE = True
@@ -18,6 +20,25 @@ except ImportError:
     TWILIO_AVAILABLE = False
     logger.warning("Twilio package not installed. Install with 'pip install twilio'")
 
+if TWILIO_AVAILABLE:
+
+    class BaseURLHttpClient(TwilioHttpClient):
+        """
+        Sends requests for every Twilio domain (api, lookups, verify) to one
+        base URL, e.g. a local fake for load tests (tools/loadtest/).
+        """
+
+        def __init__(self, base_url: str, **kwargs):
+            super().__init__(**kwargs)
+            self.base_url = base_url.rstrip("/")
+
+        def request(self, method: str, url: str, *args, **kwargs):
+            parts = urlsplit(url)
+            url = f"{self.base_url}{parts.path}"
+            if parts.query:
+                url = f"{url}?{parts.query}"
+            return super().request(method, url, *args, **kwargs)
+
 
 class TwilioClient:
     """
@@ -48,7 +69,12 @@ class TwilioClient:
         self.client = None
         if TWILIO_AVAILABLE and self.enabled and self.account_sid and self.auth_token:
             try:
-                self.client = TwilioRestClient(self.account_sid, self.auth_token)
+                base_url = getattr(settings, "TWILIO_API_BASE_URL", "")
+                self.client = TwilioRestClient(
+                    self.account_sid,
+                    self.auth_token,
+                    http_client=BaseURLHttpClient(base_url) if base_url else None,
+                )
             except Exception as e:
                 logger.error(f"Failed to initialize Twilio client: {str(e)}")
 
@@ -79,7 +105,10 @@ class TwilioClient:
 
         # Attempt actual API call
         try:
-            func = getattr(self.client, func_name, None)
+            # Dotted names reach nested resources, e.g. "messages.create"
+            func = self.client
+            for name in func_name.split("."):
+                func = getattr(func, name, None)
             if not func:
                 error_msg = f"Function {func_name} not found in Twilio client"
                 logger.error(error_msg)
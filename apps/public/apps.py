@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+
+
+class PublicConfig(AppConfig):
+    """Configuration for the public web front-end app."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.public"
+    verbose_name = "Public"
+
+    def ready(self):
+        # Register component cache key hooks and their invalidation signals
+        from apps.public.views import components  # noqa: F401
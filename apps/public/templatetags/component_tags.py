@@ -1,5 +1,7 @@
 from django import template
 
+from apps.public.views.helpers.component_cache import render_component
+
 register = template.Library()
 
 
@@ -7,3 +9,48 @@ register = template.Library()
 def component_css_dependencies():
     """Placeholder for component CSS dependencies. Not used in this project."""
     return ""
+
+
+class CachedComponentNode(template.Node):
+    def __init__(self, name, vary_on, nodelist):
+        self.name = name
+        self.vary_on = vary_on
+        self.nodelist = nodelist
+
+    def render(self, context):
+        name = self.name.resolve(context)
+        extra = tuple(var.resolve(context) for var in self.vary_on)
+        return render_component(
+            name,
+            context.get("request"),
+            context,
+            lambda: self.nodelist.render(context),
+            extra=extra,
+        )
+
+
+@register.tag
+def cachedcomponent(parser, token):
+    """
+    Cache the enclosed markup as a registered component.
+
+    Usage:
+        {% cachedcomponent "navbar" %}
+            {% include "layout/nav/navbar.html" %}
+        {% endcachedcomponent %}
+
+    Any further arguments are resolved and added to the cache key, on top of
+    what the component's `cache_key` hook returns.
+    """
+    bits = token.split_contents()
+    if len(bits) < 2:
+        raise template.TemplateSyntaxError(
+            f"'{bits[0]}' tag requires at least one argument (the component name)."
+        )
+    nodelist = parser.parse(("endcachedcomponent",))
+    parser.delete_first_token()
+    return CachedComponentNode(
+        parser.compile_filter(bits[1]),
+        [parser.compile_filter(bit) for bit in bits[2:]],
+        nodelist,
+    )
@@ -0,0 +1,155 @@
+"""
+Tests for the layout component fragment cache.
+"""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase, override_settings
+
+from apps.common.models import Team, TeamMember
+from apps.common.utilities.cache import reset_cache_stats
+from apps.public.views.components.navbar import get_navbar_cache_key
+from apps.public.views.helpers.component_cache import (
+    get_component_stats,
+    register_component,
+)
+
+User = get_user_model()
+
+counter = {"renders": 0}
+
+
+@register_component("test-component", models=("common.Team",))
+def get_test_cache_key(request, context):
+    if context.get("skip_cache"):
+        return None
+    return (context.get("active_section"),)
+
+
+class CountingNode:
+    """Context value that counts how often the component body renders."""
+
+    def __str__(self):
+        counter["renders"] += 1
+        return f"render {counter['renders']}"
+
+
+TEMPLATE = Template(
+    "{% load component_tags %}"
+    '{% cachedcomponent "test-component" variant %}'
+    "{{ section }} {{ body }}"
+    "{% endcachedcomponent %}"
+)
+
+
+class ComponentCacheTestCase(TestCase):
+    """Test cases for {% cachedcomponent %} and the cache key hooks."""
+
+    def setUp(self):
+        cache.clear()
+        reset_cache_stats()
+        counter["renders"] = 0
+        self.request = RequestFactory().get("/")
+        self.request.user = AnonymousUser()
+
+    def render(self, **context):
+        context.setdefault("body", CountingNode())
+        return TEMPLATE.render(Context({"request": self.request, **context}))
+
+    def test_cached_until_key_changes(self):
+        """Test that the body renders once per distinct cache key."""
+        first = self.render(active_section="home", section="home")
+        second = self.render(active_section="home", section="home")
+        other = self.render(active_section="blog", section="blog")
+        variant = self.render(active_section="blog", section="blog", variant="x")
+
+        self.assertEqual(first, "home render 1")
+        self.assertEqual(second, first)
+        self.assertEqual(other, "blog render 2")
+        self.assertEqual(variant, "blog render 3")
+
+    def test_hook_can_skip_cache(self):
+        """Test that a None key renders every time."""
+        self.render(skip_cache=True)
+        self.render(skip_cache=True)
+
+        self.assertEqual(counter["renders"], 2)
+
+    def test_model_save_invalidates(self):
+        """Test that saving a registered model drops cached copies."""
+        self.render(active_section="home")
+        Team.objects.create(name="Invalidation")
+        html = self.render(active_section="home")
+
+        self.assertEqual(html, " render 2")
+
+    @override_settings(COMPONENT_CACHE_ENABLED=False)
+    def test_disabled(self):
+        """Test that the cache can be switched off."""
+        self.render()
+        self.render()
+
+        self.assertEqual(counter["renders"], 2)
+
+    def test_stats(self):
+        """Test hit ratio and render time per component."""
+        self.render()
+        self.render()
+        self.render()
+
+        component_stats = get_component_stats()["test-component"]
+        self.assertEqual(component_stats["hits"], 2)
+        self.assertEqual(component_stats["misses"], 1)
+        self.assertAlmostEqual(component_stats["hit_ratio"], 2 / 3)
+        self.assertEqual(component_stats["renders"], 1)
+        self.assertGreater(component_stats["render_ms_avg"], 0)
+
+
+class NavbarCacheKeyTestCase(TestCase):
+    """Test cases for the navbar cache key hook."""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(username="navuser", password="pw")
+
+    def test_anonymous_users_share_a_key(self):
+        """Test that the anonymous navbar only varies on the section."""
+        request = self.factory.get("/")
+        request.user = AnonymousUser()
+
+        self.assertEqual(
+            get_navbar_cache_key(request, {"active_section": "home"}),
+            (None, None, "home", "anonymous"),
+        )
+
+    def test_signed_in_users_need_a_csrf_secret(self):
+        """Test that menus with a CSRF token are only cached per secret."""
+        request = self.factory.get("/")
+        request.user = self.user
+
+        self.assertIsNone(get_navbar_cache_key(request, {}))
+
+        request.META["CSRF_COOKIE"] = "secret"
+        self.assertEqual(
+            get_navbar_cache_key(request, {"active_section": "teams"}),
+            (self.user.pk, None, "teams", self.user.pk, "secret"),
+        )
+
+    def test_team_membership_invalidates_navbar(self):
+        """Test that joining a team re-renders the navbar."""
+        request = self.factory.get("/")
+        request.user = self.user
+        request.META["CSRF_COOKIE"] = "secret"
+        navbar = Template(
+            "{% load component_tags %}"
+            '{% cachedcomponent "navbar" %}{{ user.teams.exists }}{% endcachedcomponent %}'
+        )
+        context = {"request": request, "user": self.user}
+        self.assertEqual(navbar.render(Context(context)), "False")
+
+        team = Team.objects.create(name="Navbar Team")
+        TeamMember.objects.create(team=team, user=self.user)
+
+        self.assertEqual(navbar.render(Context(context)), "True")
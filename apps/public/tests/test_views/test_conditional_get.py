@@ -0,0 +1,138 @@
+"""
+Tests for conditional GET (ETag/Last-Modified) support in MainContentView.
+"""
+
+from datetime import datetime
+from datetime import timezone as dt_timezone
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils.http import http_date
+
+from apps.public.views.helpers.main_content_view import MainContentView
+
+User = get_user_model()
+
+MODIFIED = datetime(2025, 1, 1, 12, 0, tzinfo=dt_timezone.utc)
+
+
+class VersionedView(MainContentView):
+    """View whose data version is controlled by the test."""
+
+    version = "v1"
+    renders = 0
+
+    def get(self, request, *args, **kwargs):
+        VersionedView.renders += 1
+        return HttpResponse(f"content {self.version}")
+
+    def get_etag(self, request, *args, **kwargs):
+        return self.version
+
+    def get_last_modified(self, request, *args, **kwargs):
+        return MODIFIED
+
+
+class PlainView(MainContentView):
+    def get(self, request, *args, **kwargs):
+        return HttpResponse("plain")
+
+
+@override_settings(CONDITIONAL_GET_ENABLED=True)
+class ConditionalGetTestCase(TestCase):
+    """Test cases for MainContentView conditional responses."""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        VersionedView.renders = 0
+
+    def request(self, user=None, **headers):
+        request = self.factory.get("/page/", headers=headers)
+        SessionMiddleware(lambda r: None).process_request(request)
+        request.user = user or AnonymousUser()
+        request._messages = FallbackStorage(request)
+        request.htmx = headers.get("HX-Request") == "true"
+        return request
+
+    def get(self, view=VersionedView, **kwargs):
+        request = kwargs.pop("request", None) or self.request(**kwargs)
+        return view.as_view()(request)
+
+    def test_sets_validators_and_vary(self):
+        """Test that declared validators are sent with the response."""
+        response = self.get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"].startswith('W/"'))
+        self.assertEqual(response["Last-Modified"], http_date(MODIFIED.timestamp()))
+        self.assertIn("HX-Request", response["Vary"])
+        self.assertIn("no-cache", response["Cache-Control"])
+        self.assertIn("private", response["Cache-Control"])
+
+    def test_matching_etag_skips_rendering(self):
+        """Test that a matching If-None-Match gets a 304 without calling get()."""
+        etag = self.get()["ETag"]
+
+        response = self.get(**{"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertIn("HX-Request", response["Vary"])
+        self.assertEqual(VersionedView.renders, 1)
+
+    def test_changed_data_renders(self):
+        """Test that a new data version invalidates the old ETag."""
+        etag = self.get()["ETag"]
+
+        VersionedView.version = "v2"
+        self.addCleanup(setattr, VersionedView, "version", "v1")
+        response = self.get(**{"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_etag_varies_on_htmx_and_user(self):
+        """Test that partials and other users' pages have their own ETags."""
+        user = User.objects.create_user(username="etaguser", password="pw")
+        page = self.get()["ETag"]
+        partial = self.get(**{"HX-Request": "true"})["ETag"]
+        signed_in = self.get(user=user)["ETag"]
+
+        self.assertEqual(len({page, partial, signed_in}), 3)
+        response = self.get(user=user, **{"If-None-Match": page})
+        self.assertEqual(response.status_code, 200)
+
+    def test_if_modified_since(self):
+        """Test that an unchanged Last-Modified gets a 304."""
+        response = self.get(**{"If-Modified-Since": http_date(MODIFIED.timestamp())})
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_pending_messages_render(self):
+        """Test that pages with messages to show are never 304s."""
+        etag = self.get()["ETag"]
+        request = self.request(**{"If-None-Match": etag})
+        request._messages.add(20, "Saved")
+
+        response = self.get(request=request)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_views_without_validators(self):
+        """Test that views without validators are unchanged apart from Vary."""
+        response = self.get(view=PlainView, **{"If-None-Match": "*"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("ETag"))
+        self.assertIn("HX-Request", response["Vary"])
+
+    @override_settings(CONDITIONAL_GET_ENABLED=False)
+    def test_disabled(self):
+        """Test that the setting turns conditional responses off."""
+        response = self.get()
+
+        self.assertFalse(response.has_header("ETag"))
@@ -0,0 +1,156 @@
+"""
+Tests for the docs index and the /docs views.
+"""
+
+import gzip
+import json
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from django.http import Http404
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from apps.public.views.docs import search_docs, serve_docs_index, serve_markdown_file
+from apps.public.views.helpers.docs_index import DocsIndex
+
+FILES = {
+    "README.md": "# Overview\n\nProject overview and setup.\n",
+    "guides/SETUP_GUIDE.md": "# Setup Guide\n\nInstall postgres and redis. Run the server.\n",
+    "advanced/CACHING.md": "# Caching\n\nRedis caching of templates. Redis keys expire.\n",
+    "plans/roadmap.md": "# Roadmap\n\nFuture work on caching.\n",
+    "notes.txt": "not markdown",
+}
+
+
+@override_settings(DOCS_INDEX_CHECK_INTERVAL=0)
+class DocsIndexTestCase(SimpleTestCase):
+    """Test cases for DocsIndex and the docs views."""
+
+    def setUp(self):
+        self.base_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.base_path)
+        for name, text in FILES.items():
+            self.write(name, text)
+        self.index = DocsIndex(self.base_path)
+        patcher = patch(
+            "apps.public.views.docs.get_docs_index", return_value=self.index
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.factory = RequestFactory()
+
+    def write(self, name, text):
+        path = os.path.join(self.base_path, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    def test_grouped_index(self):
+        """Test that the listing matches the original grouping."""
+        response = serve_docs_index(self.factory.get("/docs/"))
+
+        self.assertJSONEqual(
+            response.content,
+            {
+                "root": ["README", "plans/roadmap"],
+                "advanced": ["advanced/CACHING"],
+                "guides": ["guides/SETUP_GUIDE"],
+            },
+        )
+        etag = response["ETag"]
+        response = serve_docs_index(
+            self.factory.get("/docs/", headers={"If-None-Match": etag})
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_resolve(self):
+        """Test bare names, nested names and the .md suffix."""
+        self.assertEqual(self.index.resolve("CACHING").slug, "advanced/CACHING")
+        self.assertEqual(
+            self.index.resolve("SETUP_GUIDE.md").slug, "guides/SETUP_GUIDE"
+        )
+        self.assertEqual(self.index.resolve("plans/roadmap").slug, "plans/roadmap")
+        self.assertIsNone(self.index.resolve("roadmap"))
+        self.assertIsNone(self.index.resolve("../README"))
+
+    def test_serve_file_from_cache(self):
+        """Test that files are read once and served with validators."""
+        request = self.factory.get("/docs/README")
+        with patch.object(self.index, "_load", wraps=self.index._load) as mock_load:
+            first = serve_markdown_file(request, "README")
+            second = serve_markdown_file(request, "README")
+
+        mock_load.assert_called_once()
+        self.assertEqual(first.content, FILES["README.md"].encode())
+        self.assertEqual(second["ETag"], first["ETag"])
+        self.assertEqual(first["Content-Type"], "text/markdown; charset=utf-8")
+
+        response = serve_markdown_file(
+            self.factory.get("/docs/README", headers={"If-None-Match": first["ETag"]}),
+            "README",
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_gzip_variant(self):
+        """Test that gzip is negotiated, compressed once and has its own ETag."""
+        request = self.factory.get("/docs/README", headers={"Accept-Encoding": "gzip"})
+        plain = serve_markdown_file(self.factory.get("/docs/README"), "README")
+        with patch("gzip.compress", wraps=gzip.compress) as mock_compress:
+            first = serve_markdown_file(request, "README")
+            serve_markdown_file(request, "README")
+
+        mock_compress.assert_called_once()
+        self.assertEqual(first["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(first.content), FILES["README.md"].encode())
+        self.assertNotEqual(first["ETag"], plain["ETag"])
+        self.assertIn("Accept-Encoding", first["Vary"])
+
+    def test_refresh_on_change(self):
+        """Test that edited, added and removed files are picked up."""
+        before = serve_markdown_file(self.factory.get("/"), "README")
+        path = self.write("README.md", "# Overview\n\nRewritten.\n")
+        os.utime(path, ns=(1, 1))
+        self.write("guides/NEW.md", "# New\n")
+
+        after = serve_markdown_file(self.factory.get("/"), "README")
+
+        self.assertEqual(after.content, b"# Overview\n\nRewritten.\n")
+        self.assertNotEqual(after["ETag"], before["ETag"])
+        self.assertEqual(self.index.resolve("NEW").slug, "guides/NEW")
+
+        os.remove(os.path.join(self.base_path, "guides", "NEW.md"))
+        with self.assertRaises(Http404):
+            serve_markdown_file(self.factory.get("/"), "NEW")
+
+    def test_search(self):
+        """Test that all terms must match and better matches rank first."""
+        results = self.index.search("redis caching")
+
+        self.assertEqual([r["slug"] for r in results], ["advanced/CACHING"])
+        self.assertEqual(results[0]["title"], "Caching")
+        self.assertIn("Redis", results[0]["snippet"])
+
+        slugs = [r["slug"] for r in self.index.search("caching")]
+        self.assertEqual(slugs, ["advanced/CACHING", "plans/roadmap"])
+        self.assertEqual(self.index.search("kubernetes"), [])
+
+    def test_search_view(self):
+        """Test the search endpoint."""
+        response = search_docs(self.factory.get("/docs/search/", {"q": "postgres"}))
+
+        self.assertEqual(response.status_code, 200)
+        results = json.loads(response.content)["results"]
+        self.assertEqual([r["slug"] for r in results], ["guides/SETUP_GUIDE"])
+
+    def test_lru_is_bounded(self):
+        """Test that the content cache evicts least recently used files."""
+        index = DocsIndex(self.base_path, max_bytes=100)
+        for name in ("README", "SETUP_GUIDE", "CACHING"):
+            index.get(index.resolve(name))
+
+        self.assertLessEqual(index._cache_bytes, 100)
+        self.assertIn("advanced/CACHING", index._cache)
+        self.assertNotIn("README", index._cache)
@@ -7,8 +7,17 @@ These tests verify that:
 - The pages are accessible without authentication
 """
 
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
 from django.test import Client, TestCase
 from django.urls import reverse
+from django.utils import timezone
+
+from apps.common.models import BlogPost
+from apps.common.tests.factories import UserFactory
+from apps.public.views.pages import BlogView
 
 
 class ExamplePagesTestCase(TestCase):
@@ -17,6 +26,13 @@ class ExamplePagesTestCase(TestCase):
     def setUp(self):
         """Set up test data."""
         self.client = Client()
+        BlogPost.objects.create(
+            title="Sample Blog Post",
+            slug="sample-post",
+            content="<p>A sample blog post.</p>",
+            author=UserFactory.create(),
+            published_at=timezone.now() - timedelta(days=2),
+        )
 
     def test_landing_page_renders(self):
         """Test that the landing page renders correctly with expected content."""
@@ -75,3 +91,115 @@ class ExamplePagesTestCase(TestCase):
         content = response.content.decode("utf-8")
         self.assertIn("Sample Blog Post", content)
         self.assertIn("Published", content)
+
+
+class BlogViewTestCase(TestCase):
+    """Test the database-backed blog pages."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = UserFactory.create()
+        now = timezone.now()
+        cls.posts = [
+            BlogPost.objects.create(
+                title=f"Post {i}",
+                content="Content",
+                author=cls.author,
+                category="Tutorials" if i % 2 else "News",
+                tags="tips, python" if i % 2 else "news",
+                published_at=now - timedelta(days=i + 1),
+            )
+            for i in range(5)
+        ]
+        cls.draft = BlogPost.objects.create(
+            title="Draft", content="Content", author=cls.author, category="News"
+        )
+        cls.expired = BlogPost.objects.create(
+            title="Expired",
+            content="Content",
+            author=cls.author,
+            published_at=now - timedelta(days=10),
+            expired_at=now - timedelta(days=1),
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def titles(self, response) -> list[str]:
+        return [post.title for post in response.context["posts"]]
+
+    def test_lists_live_posts_with_keyset_pages(self):
+        """Test that posts are listed newest first, two pages of 3 and 2."""
+        with patch.object(BlogView, "page_size", 3):
+            first = self.client.get(reverse("public:blog"))
+            self.assertEqual(self.titles(first), ["Post 0", "Post 1", "Post 2"])
+            self.assertIsNone(first.context.get("first_page_query"))
+
+            second = self.client.get(
+                f"{reverse('public:blog')}?{first.context['next_page_query']}"
+            )
+        self.assertEqual(self.titles(second), ["Post 3", "Post 4"])
+        self.assertNotIn("next_page_query", second.context)
+        self.assertEqual(second.context["first_page_query"], "")
+
+    def test_invalid_cursor_is_not_found(self):
+        """Test that a malformed ?after= cursor returns 404."""
+        response = self.client.get(reverse("public:blog"), {"after": "nonsense"})
+        self.assertEqual(response.status_code, 404)
+
+    def test_filters(self):
+        """Test that ?category= and ?tag= filter the posts."""
+        response = self.client.get(reverse("public:blog"), {"category": "News"})
+        self.assertEqual(self.titles(response), ["Post 0", "Post 2", "Post 4"])
+
+        response = self.client.get(reverse("public:blog"), {"tag": "python"})
+        self.assertEqual(self.titles(response), ["Post 1", "Post 3"])
+
+    def test_sidebar_counts_live_posts(self):
+        """Test that the sidebar aggregates live posts and is cached."""
+        self.client.get(reverse("public:blog"))
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("public:blog"))
+
+        self.assertEqual(
+            response.context["categories"],
+            [{"name": "News", "count": 3}, {"name": "Tutorials", "count": 2}],
+        )
+        self.assertEqual(response.context["tags"][0], {"name": "news", "count": 3})
+        self.assertEqual(
+            [post["title"] for post in response.context["recent_posts"]],
+            ["Post 0", "Post 1", "Post 2"],
+        )
+
+    def test_saving_a_post_refreshes_the_sidebar(self):
+        """Test that saving a post invalidates the cached sidebar."""
+        self.client.get(reverse("public:blog"))
+        self.draft.published_at = timezone.now() - timedelta(minutes=1)
+        self.draft.save()
+
+        response = self.client.get(reverse("public:blog"))
+        self.assertEqual(
+            response.context["categories"][0], {"name": "News", "count": 4}
+        )
+
+    def test_sidebar_tags_follow_expiry(self):
+        """Test that sidebar tag counts drop when a post expires unsaved."""
+        BlogPost.objects.filter(pk=self.posts[0].pk).update(
+            expired_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        response = self.client.get(reverse("public:blog"))
+        self.assertIn({"name": "news", "count": 2}, response.context["tags"])
+
+    def test_post_page(self):
+        """Test that live posts render with related posts and others are 404."""
+        response = self.client.get(reverse("public:blog-post", args=["post-0"]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [post.title for post in response.context["related_posts"]],
+            ["Post 2", "Post 4"],
+        )
+
+        for post in (self.draft, self.expired):
+            response = self.client.get(reverse("public:blog-post", args=[post.slug]))
+            self.assertEqual(response.status_code, 404)
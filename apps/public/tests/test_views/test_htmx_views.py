@@ -156,7 +156,8 @@ class HTMXViewTestCase(TestCase):
 
         # Mock the actual rendering to avoid template errors
         with patch(
-            "django.template.loader.render_to_string", return_value="Mocked template"
+            "apps.public.views.helpers.htmx_view.render_fragments",
+            return_value="Mocked template",
         ):
             with patch("django.template.loader.get_template"):
                 # We're testing that the view correctly detects the message and adds it to oob_templates
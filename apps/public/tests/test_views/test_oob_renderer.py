@@ -0,0 +1,147 @@
+"""
+Tests for the compiled OOB fragment renderer used by HTMXView.
+"""
+
+from unittest.mock import patch
+
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from apps.public.views.helpers.htmx_view import HTMXView
+from apps.public.views.helpers.oob_renderer import (
+    clear_fragment_cache,
+    compile_fragment,
+    render_fragments,
+)
+
+TEMPLATE_SOURCES = {
+    "main.html": "<main>{{ title }} oob={{ is_oob|default:'no' }}</main>",
+    "stats.html": '{% comment %}Stats{% endcomment %}\n<div id="team-stats" class="card">{{ count }}</div>',
+    "toast.html": '<div id="toast-container" hx-swap-oob="true">{{ count }}</div>',
+    "dynamic.html": '<div id="{{ target }}">{{ count }} oob={{ is_oob }}</div>',
+    "nested.html": '<section><span id="badge">{% for i in items %}{{ i }}{% endfor %}</span></section>',
+    "processor.html": "{{ processor_value }}",
+}
+
+
+def counting_processor(request):
+    request.processor_calls = getattr(request, "processor_calls", 0) + 1
+    return {"processor_value": "from-processor"}
+
+
+TEST_TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "OPTIONS": {
+            "context_processors": [
+                "apps.public.tests.test_views.test_oob_renderer.counting_processor"
+            ],
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [("django.template.loaders.locmem.Loader", TEMPLATE_SOURCES)],
+                )
+            ],
+        },
+    }
+]
+
+
+@override_settings(TEMPLATES=TEST_TEMPLATES)
+class OOBRendererTestCase(SimpleTestCase):
+    """Tests for compile_fragment and render_fragments."""
+
+    def setUp(self):
+        clear_fragment_cache()
+        self.request = RequestFactory().get("/")
+
+    def test_injects_oob_attribute_at_compile_time(self):
+        """Test that hx-swap-oob is written into the target element's markup."""
+        fragment = compile_fragment("stats.html", "team-stats")
+
+        self.assertFalse(fragment.wrapped)
+        html = render_fragments(
+            self.request, {"count": 3}, oob_templates={"team-stats": "stats.html"}
+        )
+        self.assertEqual(
+            html.strip(), '<div id="team-stats" hx-swap-oob="true" class="card">3</div>'
+        )
+
+    def test_existing_oob_attribute_is_kept(self):
+        """Test that templates already carrying hx-swap-oob are not changed."""
+        html = render_fragments(
+            self.request, {"count": 1}, oob_templates={"toast-container": "toast.html"}
+        )
+
+        self.assertEqual(html, '<div id="toast-container" hx-swap-oob="true">1</div>')
+
+    def test_nested_target_id(self):
+        """Test that a target id below the root element gets the attribute."""
+        html = render_fragments(
+            self.request, {"items": [1, 2]}, oob_templates={"badge": "nested.html"}
+        )
+
+        self.assertEqual(
+            html, '<section><span id="badge" hx-swap-oob="true">12</span></section>'
+        )
+
+    def test_dynamic_id_is_wrapped(self):
+        """Test that fragments without a literal target id are wrapped."""
+        fragment = compile_fragment("dynamic.html", "chat")
+        html = render_fragments(
+            self.request,
+            {"target": "chat", "count": 2},
+            oob_templates={"chat": "dynamic.html"},
+            oob_context={"is_oob": True},
+        )
+
+        self.assertTrue(fragment.wrapped)
+        self.assertEqual(
+            html,
+            '<div id="chat" hx-swap-oob="true"><div id="chat">2 oob=True</div></div>',
+        )
+
+    def test_compiled_once_without_touching_the_loader_template(self):
+        """Test that fragments are cached and the shared template stays as-is."""
+        first = compile_fragment("stats.html", "team-stats")
+        second = compile_fragment("stats.html", "team-stats")
+
+        self.assertIs(first, second)
+        with patch("apps.public.views.helpers.oob_renderer._inject") as mock_inject:
+            compile_fragment("stats.html", "team-stats")
+        mock_inject.assert_not_called()
+
+        plain = render_fragments(self.request, {"count": 1}, "stats.html")
+        self.assertNotIn("hx-swap-oob", plain)
+
+    def test_shared_context(self):
+        """Test one context for all templates, with OOB-only variables on top."""
+        html = render_fragments(
+            self.request,
+            {"title": "Home", "count": 5},
+            template_name="main.html",
+            oob_templates={"team-stats": "stats.html", "p": "processor.html"},
+            oob_context={"is_oob": True},
+        )
+
+        self.assertTrue(html.startswith("<main>Home oob=no</main>"))
+        self.assertIn('hx-swap-oob="true" class="card">5</div>', html)
+        self.assertTrue(html.endswith("from-processor</div>"))
+        self.assertEqual(self.request.processor_calls, 1)
+
+    def test_htmx_view_does_not_mutate_class_oob_templates(self):
+        """Test that standard components aren't added to the class attribute."""
+
+        class ModalView(HTMXView):
+            template_name = "main.html"
+            oob_templates = {"team-stats": "stats.html"}
+            include_modals = True
+            show_toast = False
+
+        view = ModalView()
+        with patch(
+            "apps.public.views.helpers.htmx_view.render_fragments", return_value=""
+        ) as mock_render:
+            view.render(self.request)
+
+        self.assertEqual(ModalView.oob_templates, {"team-stats": "stats.html"})
+        self.assertIn("modal-container", mock_render.call_args[1]["oob_templates"])
@@ -184,14 +184,17 @@ class TestHTMXOOBViews(TestCase):
                 # To capture the templates being rendered
                 rendered_templates = []
 
-                # Override render_to_string to capture templates
-                def capture_templates(template_name, *args, **kwargs):
+                # Override render_fragments to capture templates
+                def capture_templates(
+                    request, context, template_name=None, oob_templates=None, **kwargs
+                ):
                     rendered_templates.append(template_name)
+                    rendered_templates.extend((oob_templates or {}).values())
                     return f"Rendered {template_name}"
 
                 # Apply the patched function
                 with patch(
-                    "apps.public.views.helpers.htmx_view.render_to_string",
+                    "apps.public.views.helpers.htmx_view.render_fragments",
                     side_effect=capture_templates,
                 ):
                     # Call method
@@ -222,14 +225,17 @@ class TestHTMXOOBViews(TestCase):
                 # To capture the templates being rendered
                 rendered_templates = []
 
-                # Override render_to_string to capture templates
-                def capture_templates(template_name, *args, **kwargs):
+                # Override render_fragments to capture templates
+                def capture_templates(
+                    request, context, template_name=None, oob_templates=None, **kwargs
+                ):
                     rendered_templates.append(template_name)
+                    rendered_templates.extend((oob_templates or {}).values())
                     return f"Rendered {template_name}"
 
                 # Apply the patched function
                 with patch(
-                    "apps.public.views.helpers.htmx_view.render_to_string",
+                    "apps.public.views.helpers.htmx_view.render_fragments",
                     side_effect=capture_templates,
                 ):
                     # Call method
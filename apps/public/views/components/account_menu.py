@@ -4,6 +4,8 @@ Account menu context function.
 
 from django.http import HttpRequest
 
+from apps.public.views.helpers.component_cache import register_component
+
 
 def get_account_menu_context(request: HttpRequest):
     """
@@ -19,3 +21,28 @@ def get_account_menu_context(request: HttpRequest):
         dict: Context variables for the account menu template
     """
     return {}
+
+
+@register_component("account_menu", models=("common.User",))
+def get_account_menu_cache_key(request: HttpRequest, context):
+    """
+    Cache key hook for the account menu.
+
+    The menu of a signed-in user contains a CSRF token, so it is only reused
+    while the CSRF secret stays the same. Renders before a CSRF cookie is set
+    are not cached.
+
+    Args:
+        request: The HttpRequest object
+        context: The template context
+
+    Returns:
+        tuple | None: Key parts, or None to render without caching
+    """
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        return ("anonymous",)
+    csrf_secret = request.META.get("CSRF_COOKIE")
+    if not csrf_secret:
+        return None
+    return (user.pk, csrf_secret)
@@ -3,6 +3,9 @@ Footer context function.
 """
 
 from django.http import HttpRequest
+from django.utils import timezone
+
+from apps.public.views.helpers.component_cache import register_component
 
 
 def get_footer_context(request: HttpRequest):
@@ -19,3 +22,28 @@ def get_footer_context(request: HttpRequest):
         dict: Context variables for the footer template
     """
     return {}
+
+
+@register_component("footer", models=("common.User", "common.TeamMember"))
+def get_footer_cache_key(request: HttpRequest, context):
+    """
+    Cache key hook for the footer.
+
+    The footer shows staff and team links, the copyright year and, outside
+    production, the debug toolbar toggle.
+
+    Args:
+        request: The HttpRequest object
+        context: The template context
+
+    Returns:
+        tuple: Key parts
+    """
+    user = getattr(request, "user", None)
+    user_id = user.pk if user is not None and user.is_authenticated else None
+    return (
+        user_id,
+        timezone.now().year,
+        context.get("show_debug_toolbar_toggle"),
+        context.get("debug_toolbar_enabled"),
+    )
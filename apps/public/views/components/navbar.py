@@ -4,6 +4,12 @@ Navigation bar context function.
 
 from django.http import HttpRequest
 
+from apps.public.views.components.account_menu import get_account_menu_cache_key
+from apps.public.views.helpers.component_cache import (
+    default_cache_key,
+    register_component,
+)
+
 
 def get_navbar_context(request: HttpRequest, active_thing_id=None):
     """
@@ -17,3 +23,26 @@ def get_navbar_context(request: HttpRequest, active_thing_id=None):
         dict: Context variables for the navbar template
     """
     return {}
+
+
+@register_component(
+    "navbar", models=("common.User", "common.Team", "common.TeamMember")
+)
+def get_navbar_cache_key(request: HttpRequest, context):
+    """
+    Cache key hook for the navbar.
+
+    Varies on the user, team and active section, and on everything the
+    embedded account menu varies on.
+
+    Args:
+        request: The HttpRequest object
+        context: The template context
+
+    Returns:
+        tuple | None: Key parts, or None to render without caching
+    """
+    account_menu_key = get_account_menu_cache_key(request, context)
+    if account_menu_key is None:
+        return None
+    return default_cache_key(request, context) + account_menu_key
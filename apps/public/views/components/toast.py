@@ -4,6 +4,8 @@ Toast notifications context function.
 
 from django.http import HttpRequest
 
+from apps.public.views.helpers.component_cache import register_component
+
 
 def get_toast_context(request: HttpRequest):
     """
@@ -20,3 +22,23 @@ def get_toast_context(request: HttpRequest):
         dict: Context variables for the toast template
     """
     return {}
+
+
+@register_component("toast")
+def get_toast_cache_key(request: HttpRequest, context):
+    """
+    Cache key hook for toast notifications.
+
+    Only the empty toast container is cached (and shared by everyone);
+    containers with messages are always rendered.
+
+    Args:
+        request: The HttpRequest object
+        context: The template context
+
+    Returns:
+        tuple | None: Key parts, or None to render without caching
+    """
+    if context.get("messages"):
+        return None
+    return ("empty",)
@@ -0,0 +1,71 @@
+"""
+Views serving the markdown files in `docs/` (see helpers/docs_index.py).
+"""
+
+import re
+
+from django.http import Http404, HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+
+from apps.public.views.helpers.docs_index import brotli, get_docs_index
+
+ACCEPT_ENCODING = re.compile(r"\b(br|gzip)\b(?!\s*;\s*q=0(?:\.0*)?\b)")
+
+
+def _preferred_encoding(request) -> str | None:
+    accepted = set(ACCEPT_ENCODING.findall(request.headers.get("Accept-Encoding", "")))
+    if "br" in accepted and brotli is not None:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def serve_docs_index(request):
+    """Serve an index of available markdown documentation files."""
+    index = get_docs_index()
+    grouped = index.grouped()
+    response = get_conditional_response(request, etag=index.grouped_etag)
+    if response is None:
+        response = JsonResponse(grouped)
+    response["ETag"] = index.grouped_etag
+    return response
+
+
+def serve_markdown_file(request, filename):
+    """Serve a markdown file from the docs directory as plain text."""
+    index = get_docs_index()
+    doc = index.resolve(filename)
+    if doc is None:
+        raise Http404(f"Markdown file '{filename}' not found")
+
+    cached = index.get(doc)
+    encoding = _preferred_encoding(request)
+    # Each encoding is its own representation, with its own ETag
+    etag = f'{cached.etag[:-1]}-{encoding}"' if encoding else cached.etag
+    response = get_conditional_response(
+        request, etag=etag, last_modified=int(cached.last_modified)
+    )
+    if response is None:
+        body = index.encoded(doc, cached, encoding) if encoding else cached.content
+        # Set proper content type for markdown
+        response = HttpResponse(body, content_type="text/markdown; charset=utf-8")
+        if encoding:
+            response["Content-Encoding"] = encoding
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(cached.last_modified)
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+def search_docs(request):
+    """Full-text search over the docs: /docs/search/?q=...&limit=10"""
+    query = request.GET.get("q", "")
+    try:
+        limit = min(max(int(request.GET.get("limit", 10)), 1), 50)
+    except ValueError:
+        limit = 10
+    return JsonResponse(
+        {"query": query, "results": get_docs_index().search(query, limit=limit)}
+    )
@@ -0,0 +1,189 @@
+"""
+Fragment cache for layout components (navbar, footer, account menu, toast).
+
+Each cacheable component registers a `cache_key` hook:
+
+    @register_component("navbar", models=("common.User", "common.TeamMember"))
+    def get_navbar_cache_key(request, context):
+        return default_cache_key(request, context)
+
+The hook returns the parts of the key the rendered HTML depends on, or None
+when this render must not be cached. Templates wrap the component markup
+in `{% cachedcomponent "navbar" %}...{% endcachedcomponent %}` (from
+`component_tags`), which renders through `render_component()`.
+
+Every component has its own versioned cache namespace, `component:<name>`.
+Saving or deleting an instance of one of the component's `models` bumps
+that version, so every cached copy of the component is dropped at once.
+
+Hits, misses and render time per component come from
+`get_component_stats()`. Under the development server, editing any template
+drops all cached components.
+"""
+
+import hashlib
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.autoreload import file_changed
+
+from apps.common.utilities.cache import get_cache_stats, get_or_compute
+from apps.common.utilities.cache import invalidate_namespace as bump_version
+from apps.common.utilities.cache import stats
+
+logger = logging.getLogger(__name__)
+
+NAMESPACE_PREFIX = "component:"
+DEFAULT_TTL = 300
+
+KeyFunction = Callable[..., tuple | None]
+
+
+@dataclass(frozen=True)
+class Component:
+    """A cacheable component and its cache key hook."""
+
+    name: str
+    cache_key: KeyFunction
+    models: tuple[str, ...] = ()
+    ttl: int | None = None
+
+    @property
+    def namespace(self) -> str:
+        return f"{NAMESPACE_PREFIX}{self.name}"
+
+
+_components: dict[str, Component] = {}
+
+
+def default_cache_key(request, context) -> tuple:
+    """
+    Key parts shared by most components: user, current team, active section.
+    """
+    user = getattr(request, "user", None)
+    user_id = user.pk if user is not None and user.is_authenticated else None
+    session = getattr(request, "session", None)
+    team_id = session.get("team_id") if session is not None else None
+    return (user_id, team_id, context.get("active_section"))
+
+
+def register_component(
+    name: str, models: tuple[str, ...] = (), ttl: int | None = None
+) -> Callable[[KeyFunction], KeyFunction]:
+    """
+    Decorator registering a function as the cache key hook of a component.
+
+    Args:
+        name: Component name used in `{% cachedcomponent %}`
+        models: "app_label.ModelName" strings whose saves and deletes
+                invalidate the component
+        ttl: Time to live in seconds (defaults to COMPONENT_CACHE_TTL)
+    """
+
+    def decorator(cache_key: KeyFunction) -> KeyFunction:
+        component = Component(name=name, cache_key=cache_key, models=models, ttl=ttl)
+        _components[name] = component
+
+        def invalidate(sender, **kwargs):
+            invalidate_component(name)
+
+        for model in models:
+            for signal in (post_save, post_delete):
+                signal.connect(
+                    invalidate,
+                    sender=model,
+                    weak=False,
+                    dispatch_uid=f"{component.namespace}:{model}",
+                )
+        return cache_key
+
+    return decorator
+
+
+def get_component(name: str) -> Component | None:
+    return _components.get(name)
+
+
+def invalidate_component(name: str) -> None:
+    """Drop every cached copy of a component."""
+    bump_version(f"{NAMESPACE_PREFIX}{name}")
+
+
+def invalidate_all_components() -> None:
+    for name in _components:
+        invalidate_component(name)
+
+
+@receiver(file_changed, dispatch_uid="component_cache_template_changed")
+def template_changed(sender, file_path, **kwargs):
+    if file_path.suffix == ".html":
+        invalidate_all_components()
+
+
+def render_component(
+    name: str, request, context, render: Callable[[], str], extra: tuple = ()
+) -> str:
+    """
+    Render a component through the fragment cache.
+
+    Args:
+        name: Registered component name
+        request: The current HttpRequest
+        context: Template context the component renders with
+        render: Zero-argument callable producing the component's HTML
+        extra: Additional values to vary the cache key on
+
+    Returns:
+        str: The component's HTML
+    """
+    component = _components.get(name)
+    if component is None:
+        logger.warning(f"Component {name} is not registered, rendering uncached")
+        return render()
+
+    parts = None
+    if request is not None and getattr(settings, "COMPONENT_CACHE_ENABLED", True):
+        parts = component.cache_key(request, context)
+    if parts is None:
+        # Not cacheable: still counted towards the component's render time
+        started = time.perf_counter()
+        html = render()
+        stats.incr(component.namespace, "computes")
+        stats.incr(
+            component.namespace, "compute_seconds", time.perf_counter() - started
+        )
+        return html
+
+    digest = hashlib.sha1(repr((parts, extra)).encode()).hexdigest()
+    ttl = component.ttl or getattr(settings, "COMPONENT_CACHE_TTL", DEFAULT_TTL)
+    return get_or_compute(digest, render, ttl=ttl, namespace=component.namespace)
+
+
+def get_component_stats() -> dict[str, dict[str, float]]:
+    """
+    Cache counters per component.
+
+    Returns:
+        dict: {component name: {"hits", "misses", "hit_ratio", "renders",
+               "render_ms_total", "render_ms_avg"}}
+    """
+    result = {}
+    for namespace, counters in get_cache_stats().items():
+        if not namespace.startswith(NAMESPACE_PREFIX):
+            continue
+        renders = counters["computes"]
+        render_ms = counters["compute_seconds"] * 1000
+        result[namespace[len(NAMESPACE_PREFIX) :]] = {
+            "hits": counters["hits"],
+            "misses": counters["misses"],
+            "hit_ratio": counters["hit_ratio"],
+            "renders": renders,
+            "render_ms_total": render_ms,
+            "render_ms_avg": render_ms / renders if renders else 0.0,
+        }
+    return result
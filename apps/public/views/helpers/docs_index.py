@@ -0,0 +1,319 @@
+"""
+In-memory index of the markdown files in `docs/`, used by the /docs endpoints.
+
+- The tree is scanned once, in the background when a server starts (see
+  `warm_docs_index()`, called from settings/asgi.py and wsgi.py) or on first
+  use, and rescanned only when a file or directory mtime changes. Mtimes
+  are checked at most every `DOCS_INDEX_CHECK_INTERVAL` seconds.
+- File contents are kept in an LRU bounded by `DOCS_CACHE_MAX_BYTES`,
+  together with their ETag and gzip (and brotli, when installed) encodings.
+  A cached file is reloaded once the index sees its mtime or size change.
+- `search()` ranks documents with an inverted index (term -> {doc: count})
+  that is built during the scan.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+
+from django.conf import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Directories whose files are listed (and can be requested) by bare name
+GROUPS = ("advanced", "guides")
+TOKEN_PATTERN = re.compile(r"[a-z0-9_]{2,}")
+TITLE_BOOST = 3
+SNIPPET_RADIUS = 80
+
+
+def get_docs_base_path() -> str:
+    """Return the absolute path to the docs directory."""
+    return str(settings.BASE_DIR / "docs")
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+@dataclass
+class DocFile:
+    """A markdown file in the docs tree."""
+
+    slug: str  # path relative to docs/, without the .md extension
+    path: str
+    title: str
+    mtime_ns: int
+    size: int
+
+
+@dataclass
+class CachedDoc:
+    """File contents with precomputed validators and encodings."""
+
+    content: bytes
+    etag: str
+    mtime_ns: int
+    size: int
+    encodings: dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def last_modified(self) -> float:
+        return self.mtime_ns / 1e9
+
+    @property
+    def cost(self) -> int:
+        return len(self.content) + sum(map(len, self.encodings.values()))
+
+
+def _title(text: str, slug: str) -> str:
+    for line in text.splitlines():
+        if line.startswith("# "):
+            return line[2:].strip()
+    return slug.rsplit("/", 1)[-1]
+
+
+class DocsIndex:
+    """Index, content cache and search over a docs directory."""
+
+    def __init__(self, base_path: str, max_bytes: int | None = None):
+        self.base_path = base_path
+        self.max_bytes = max_bytes or getattr(
+            settings, "DOCS_CACHE_MAX_BYTES", 8 * 1024 * 1024
+        )
+        self.check_interval = getattr(settings, "DOCS_INDEX_CHECK_INTERVAL", 2.0)
+        self._lock = threading.RLock()
+        self._files: dict[str, DocFile] = {}
+        self._directories: dict[str, int] = {}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._lengths: dict[str, int] = {}
+        self._grouped: dict[str, list[str]] = {}
+        self.grouped_etag = ""
+        self._cache: OrderedDict[str, CachedDoc] = OrderedDict()
+        self._cache_bytes = 0
+        self._checked_at = None
+
+    # Index
+
+    def _scan(self) -> None:
+        files, directories = {}, {}
+        postings: dict[str, dict[str, int]] = {}
+        lengths = {}
+        for root, _, names in os.walk(self.base_path):
+            directories[root] = os.stat(root).st_mtime_ns
+            for name in names:
+                if not name.endswith(".md"):
+                    continue
+                path = os.path.join(root, name)
+                slug = os.path.relpath(path, self.base_path)[:-3].replace(os.sep, "/")
+                stat = os.stat(path)
+                with open(path, encoding="utf-8", errors="replace") as f:
+                    text = f.read()
+                title = _title(text, slug)
+                files[slug] = DocFile(slug, path, title, stat.st_mtime_ns, stat.st_size)
+
+                counts = Counter(tokenize(text))
+                for term in tokenize(title):
+                    counts[term] += TITLE_BOOST
+                for term, count in counts.items():
+                    postings.setdefault(term, {})[slug] = count
+                lengths[slug] = sum(counts.values())
+
+        grouped = {"root": [], **{group: [] for group in GROUPS}}
+        for slug in sorted(files):
+            directory = slug.split("/", 1)[0] if "/" in slug else "root"
+            grouped[directory if directory in grouped else "root"].append(slug)
+
+        listing = json.dumps(grouped, sort_keys=True).encode()
+        self.grouped_etag = (
+            f'"{hashlib.md5(listing, usedforsecurity=False).hexdigest()}"'
+        )
+        self._files, self._directories = files, directories
+        self._postings, self._lengths, self._grouped = postings, lengths, grouped
+        logger.info(f"Indexed {len(files)} docs in {self.base_path}")
+
+    def _tree_changed(self) -> bool:
+        # Directory mtimes change when files are added, removed or renamed;
+        # file mtimes when a file is edited in place
+        paths = [*self._directories.items()]
+        paths += [(doc.path, doc.mtime_ns) for doc in self._files.values()]
+        for path, mtime_ns in paths:
+            try:
+                if os.stat(path).st_mtime_ns != mtime_ns:
+                    return True
+            except FileNotFoundError:
+                return True
+        return False
+
+    def refresh(self, force: bool = False) -> None:
+        """Build the index, or rebuild it if the docs tree changed."""
+        now = time.monotonic()
+        if (
+            not force
+            and self._checked_at is not None
+            and now - self._checked_at < self.check_interval
+        ):
+            return
+        with self._lock:
+            if force or self._checked_at is None or self._tree_changed():
+                self._scan()
+            self._checked_at = now
+
+    def grouped(self) -> dict[str, list[str]]:
+        """Slugs grouped by top-level directory, as served by /docs/."""
+        self.refresh()
+        return self._grouped
+
+    def resolve(self, filename: str) -> DocFile | None:
+        """
+        Find the file for a requested name.
+
+        Nested names ("guides/SETUP_GUIDE") must match exactly; bare names
+        are looked up in the root, then advanced/, then guides/.
+        """
+        self.refresh()
+        if filename.endswith(".md"):
+            filename = filename[:-3]
+        if "/" in filename:
+            return self._files.get(filename)
+        for slug in (filename, *(f"{group}/{filename}" for group in GROUPS)):
+            if slug in self._files:
+                return self._files[slug]
+        return None
+
+    # Content
+
+    def _load(self, doc: DocFile) -> CachedDoc:
+        with open(doc.path, "rb") as f:
+            content = f.read()
+        stat = os.stat(doc.path)
+        digest = hashlib.md5(content, usedforsecurity=False).hexdigest()
+        return CachedDoc(content, f'"{digest}"', stat.st_mtime_ns, stat.st_size)
+
+    def get(self, doc: DocFile) -> CachedDoc:
+        """Get a file's contents, from the LRU unless the index saw it change."""
+        with self._lock:
+            cached = self._cache.get(doc.slug)
+            if cached is not None and (cached.mtime_ns, cached.size) == (
+                doc.mtime_ns,
+                doc.size,
+            ):
+                self._cache.move_to_end(doc.slug)
+                return cached
+
+        cached = self._load(doc)
+        self._store(doc.slug, cached)
+        return cached
+
+    def encoded(self, doc: DocFile, cached: CachedDoc, encoding: str) -> bytes:
+        """Get the gzip or br encoding of a cached file, compressing once."""
+        body = cached.encodings.get(encoding)
+        if body is None:
+            if encoding == "br":
+                body = brotli.compress(cached.content, quality=11)
+            else:
+                body = gzip.compress(cached.content, compresslevel=9, mtime=0)
+            cached.encodings[encoding] = body
+            self._store(doc.slug, cached)
+        return body
+
+    def _store(self, slug: str, cached: CachedDoc) -> None:
+        with self._lock:
+            previous = self._cache.pop(slug, None)
+            if previous is not None:
+                self._cache_bytes -= previous.cost
+            if cached.cost > self.max_bytes:
+                return
+            self._cache[slug] = cached
+            self._cache_bytes += cached.cost
+            while self._cache_bytes > self.max_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= evicted.cost
+
+    # Search
+
+    def search(self, query: str, limit: int = 10) -> list[dict]:
+        """
+        Find docs containing every term of `query`, best matches first.
+
+        Scores are tf-idf, normalised by document length; title words count
+        extra.
+        """
+        self.refresh()
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        postings = [self._postings.get(term, {}) for term in terms]
+        if not all(postings):
+            return []
+
+        total = len(self._files)
+        matches = set.intersection(*(set(p) for p in postings))
+        scores = {}
+        for slug in matches:
+            score = 0.0
+            for term_postings in postings:
+                idf = math.log(1 + total / len(term_postings))
+                score += term_postings[slug] * idf
+            scores[slug] = score / math.sqrt(self._lengths[slug])
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [
+            {
+                "slug": slug,
+                "title": self._files[slug].title,
+                "score": round(score, 4),
+                "snippet": self._snippet(self._files[slug], terms),
+            }
+            for slug, score in ranked
+        ]
+
+    def _snippet(self, doc: DocFile, terms: list[str]) -> str:
+        text = self.get(doc).content.decode("utf-8", errors="replace")
+        lowered = text.lower()
+        position = min(
+            (i for i in (lowered.find(term) for term in terms) if i >= 0), default=0
+        )
+        start = max(position - SNIPPET_RADIUS, 0)
+        snippet = " ".join(text[start : position + SNIPPET_RADIUS].split())
+        return f"…{snippet}…" if start else f"{snippet}…"
+
+
+_index: DocsIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_docs_index() -> DocsIndex:
+    """The process-wide index of the project's docs directory."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = DocsIndex(get_docs_base_path())
+    return _index
+
+
+def warm_docs_index() -> None:
+    """
+    Build the docs index in a background thread, so the first /docs request
+    doesn't wait for the scan. Called by the server entry points only, not
+    by management commands.
+    """
+    if getattr(settings, "TESTING", False):
+        return
+    threading.Thread(
+        target=get_docs_index().refresh, name="docs-index", daemon=True
+    ).start()
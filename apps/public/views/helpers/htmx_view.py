@@ -1,9 +1,9 @@
 from django.contrib import messages
 from django.http import HttpRequest, HttpResponse
-from django.template.loader import render_to_string
 from django_htmx import http as htmx
 
 from apps.public.views.helpers.main_content_view import MainContentView
+from apps.public.views.helpers.oob_renderer import render_fragments
 
 
 class HTMXView(MainContentView):
@@ -62,15 +62,12 @@ class HTMXView(MainContentView):
 
         # Use class attributes as defaults if not explicitly provided
         template_name = template_name or self.template_name
-        oob_templates = oob_templates or self.oob_templates or {}
+        # Copy so the standard components below don't leak into the class attribute
+        oob_templates = dict(oob_templates or self.oob_templates or {})
         push_url = push_url or self.push_url
 
-        # Render the main template if provided
-        main_html = (
-            render_to_string(template_name, combined_context, request=request)
-            if template_name
-            else ""
-        )
+        # Variables that only apply to the OOB fragments
+        oob_context = {}
 
         # Add standard OOB components based on view settings
         if self.has_oob:
@@ -85,7 +82,7 @@ class HTMXView(MainContentView):
             # Add navigation active state if explicitly specified in the view
             # This will override the context processor's value
             if self.active_nav:
-                combined_context["active_section"] = self.active_nav
+                oob_context["active_section"] = self.active_nav
 
             # Add modal container if enabled
             if self.include_modals:
@@ -93,33 +90,17 @@ class HTMXView(MainContentView):
 
         # Set context flag for OOB templates
         if len(oob_templates):
-            combined_context["is_oob"] = True
-
-        # Render each OOB template and wrap it in the OOB structure
-        oob_html = ""
-        for oob_target_id, oob_template in oob_templates.items():
-            # Render the template with the same context
-            template_html = render_to_string(
-                oob_template, combined_context, request=request
-            )
-
-            # Wrap with OOB attribute for HTMX
-            # Format: <div id="target-id" hx-swap-oob="true">content</div>
-            if (
-                "<div" in template_html
-                and 'id="' + oob_target_id + '"' in template_html
-            ):
-                # If the template already has the target ID, just add hx-swap-oob
-                oob_html += template_html.replace(
-                    'id="' + oob_target_id + '"',
-                    'id="' + oob_target_id + '" hx-swap-oob="true"',
-                )
-            else:
-                # Otherwise wrap the entire template in a div with OOB attributes
-                oob_html += f'<div id="{oob_target_id}" hx-swap-oob="true">{template_html}</div>'
-
-        # Combine main content and OOB content
-        combined_html = main_html + oob_html
+            oob_context["is_oob"] = True
+
+        # Render the main template and the OOB fragments (each carrying
+        # hx-swap-oob on its target element) in one pass
+        combined_html = render_fragments(
+            request,
+            combined_context,
+            template_name=template_name,
+            oob_templates=oob_templates,
+            oob_context=oob_context,
+        )
 
         # Create the response with the combined HTML output
         response = HttpResponse(combined_html)
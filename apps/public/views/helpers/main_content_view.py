@@ -1,7 +1,17 @@
+import hashlib
 import logging
+from datetime import datetime
 
+from django.conf import settings
+from django.contrib import messages
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render as django_render
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date
 from django.views import View
 
 
@@ -9,6 +19,11 @@ class MainContentView(View):
     """
     Base view class for general views in the project.
     Implements a standardized block structure for consistent layouts.
+
+    Conditional GET is opt-in: override `get_etag()` and/or
+    `get_last_modified()` to describe the data the page reads. Matching
+    If-None-Match/If-Modified-Since requests then get a 304 before `get()`
+    runs, so nothing is queried or rendered.
     """
 
     url: str = ""
@@ -37,7 +52,81 @@ class MainContentView(View):
             self.context["base_template"] = self.base_template
 
         self.context["just_logged_in"] = request.session.get("just_logged_in", False)
-        return super().dispatch(request, *args, **kwargs)
+
+        etag, last_modified = self.get_response_validators(request, *args, **kwargs)
+        response = None
+        if etag or last_modified:
+            response = get_conditional_response(
+                request,
+                etag=etag,
+                last_modified=int(last_modified.timestamp()) if last_modified else None,
+            )
+        if response is None:
+            response = super().dispatch(request, *args, **kwargs)
+
+        # Full pages and HTMX partials are different representations of a URL
+        patch_vary_headers(response, ("HX-Request",))
+        if (etag or last_modified) and response.status_code in (200, 304):
+            if etag and not response.has_header("ETag"):
+                response["ETag"] = etag
+            if last_modified and not response.has_header("Last-Modified"):
+                response["Last-Modified"] = http_date(last_modified.timestamp())
+            # Always revalidate; pages include user-specific navigation
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def get_etag(self, request, *args, **kwargs) -> str | None:
+        """
+        Override to enable conditional GET.
+
+        Return a string that changes whenever the data shown on the page
+        changes, e.g. the latest `modified_at` of the objects listed.
+        Returning None renders the page as usual.
+        """
+        return None
+
+    def get_last_modified(self, request, *args, **kwargs) -> datetime | None:
+        """
+        Override to enable conditional GET based on a modification time.
+        """
+        return None
+
+    def get_response_validators(
+        self, request, *args, **kwargs
+    ) -> tuple[str | None, datetime | None]:
+        """
+        Get the (ETag, Last-Modified) pair for this request.
+
+        The view's ETag is combined with everything else the rendered page
+        depends on: full page or HTMX partial, the user and their CSRF
+        secret (for the navigation and form tokens) and the deployed
+        release. Requests with pending messages are never answered with a
+        304, so the messages are shown.
+        """
+        if request.method not in ("GET", "HEAD") or not getattr(
+            settings, "CONDITIONAL_GET_ENABLED", True
+        ):
+            return None, None
+
+        view_etag = self.get_etag(request, *args, **kwargs)
+        last_modified = self.get_last_modified(request, *args, **kwargs)
+        if view_etag is None and last_modified is None:
+            return None, None
+        if messages.get_messages(request):
+            return None, None
+
+        user = getattr(request, "user", None)
+        parts = (
+            view_etag,
+            last_modified.isoformat() if last_modified else None,
+            self.context["base_template"],
+            user.pk if user is not None and user.is_authenticated else None,
+            request.META.get("CSRF_COOKIE"),
+            getattr(settings, "PAGE_ETAG_VERSION", ""),
+        )
+        digest = hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+        # Weak: the markup contains per-render CSRF token masks
+        return f'W/"{digest}"', last_modified
 
     def get(self, request, *args, **kwargs):
         logging.warning("GET method not implemented.")
@@ -0,0 +1,169 @@
+"""
+Rendering engine for HTMX out-of-band (OOB) fragments.
+
+Each (template, target id) pair is compiled once, the first time it is used
+(and again only if the template loader returns a new template, e.g. after an
+autoreload in development):
+
+- If the target id appears literally in the template's own markup, e.g.
+  `<div id="toast-container" class="...">`, a private copy of the template is
+  made with `hx-swap-oob="true"` already written after that attribute, unless
+  the tag has it already. Rendering then produces the final HTML directly.
+- Otherwise (the id is built from a variable, or comes from an include or
+  a parent template) the fragment is wrapped in
+  `<div id="..." hx-swap-oob="true">...</div>`.
+
+Rendered output is never searched or patched. The main template and every
+fragment render against one shared `RequestContext`, so context processors
+run once per response. Each fragment renders in its own context push, and
+the parts are joined once at the end.
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+
+from django.template import loader
+from django.template.base import Template, TextNode
+from django.template.context import make_context
+from django.template.loader_tags import ExtendsNode
+from django.utils.html import escape
+
+OOB_ATTRIBUTE = ' hx-swap-oob="true"'
+
+
+@dataclass(frozen=True)
+class OOBFragment:
+    """A template compiled for OOB rendering into a given target id."""
+
+    template: Template
+    target_id: str
+    source: Template  # the loader's template this was compiled from
+    prefix: str = ""
+    suffix: str = ""
+
+    @property
+    def wrapped(self) -> bool:
+        return bool(self.prefix)
+
+
+_fragments: dict[tuple[str, str], OOBFragment] = {}
+_lock = threading.Lock()
+
+
+def _opening_tag(text: str, position: int) -> tuple[int, int]:
+    """Bounds of the opening tag around `position` within one text node."""
+    start = text.rfind("<", 0, position)
+    end = text.find(">", position)
+    return start, len(text) if end == -1 else end
+
+
+def _inject(source: Template, target_id: str) -> Template | None:
+    """
+    Compile a copy of `source` with hx-swap-oob set on the element whose id
+    is `target_id`, or return None if that element isn't in its own markup.
+    """
+    if any(isinstance(node, ExtendsNode) for node in source.nodelist):
+        return None
+
+    attribute = re.compile(r"""\bid=(["'])""" + re.escape(target_id) + r"\1")
+    template = Template(source.source, source.origin, source.name, source.engine)
+    for index, node in enumerate(template.nodelist):
+        if not isinstance(node, TextNode):
+            continue
+        match = attribute.search(node.s)
+        if not match:
+            continue
+
+        start, end = _opening_tag(node.s, match.start())
+        if "hx-swap-oob" in node.s[start:end]:
+            return template
+        text = node.s[: match.end()] + OOB_ATTRIBUTE + node.s[match.end() :]
+        patched = TextNode(text)
+        patched.origin, patched.token = node.origin, node.token
+        template.nodelist[index] = patched
+        return template
+    return None
+
+
+def compile_fragment(template_name: str, target_id: str) -> OOBFragment:
+    """
+    Get the compiled OOB fragment for a template and target id.
+
+    Compiled fragments are cached per process and rebuilt only when the
+    template loader hands out a different template object.
+    """
+    source = loader.get_template(template_name).template
+    key = (template_name, target_id)
+    fragment = _fragments.get(key)
+    if fragment is not None and fragment.source is source:
+        return fragment
+
+    template = _inject(source, target_id)
+    if template is not None:
+        fragment = OOBFragment(template=template, target_id=target_id, source=source)
+    else:
+        fragment = OOBFragment(
+            template=source,
+            target_id=target_id,
+            source=source,
+            prefix=f'<div id="{escape(target_id)}"{OOB_ATTRIBUTE}>',
+            suffix="</div>",
+        )
+    with _lock:
+        _fragments[key] = fragment
+    return fragment
+
+
+def clear_fragment_cache() -> None:
+    """Forget all compiled fragments."""
+    with _lock:
+        _fragments.clear()
+
+
+def render_fragments(
+    request,
+    context: dict,
+    template_name: str | None = None,
+    oob_templates: dict[str, str] | None = None,
+    oob_context: dict | None = None,
+) -> str:
+    """
+    Render a main template followed by its OOB fragments.
+
+    Args:
+        request: The current HttpRequest (used for context processors)
+        context: Template context shared by every template
+        template_name: Main template, if any
+        oob_templates: {target id: template name}
+        oob_context: Extra variables for the OOB fragments only
+
+    Returns:
+        str: The combined HTML
+    """
+    templates = []
+    if template_name:
+        templates.append(loader.get_template(template_name).template)
+    fragments = [
+        compile_fragment(oob_template, target_id)
+        for target_id, oob_template in (oob_templates or {}).items()
+    ]
+    if not templates and not fragments:
+        return ""
+
+    first = templates[0] if templates else fragments[0].template
+    render_context = make_context(context, request, autoescape=first.engine.autoescape)
+    parts = []
+    # Binding the first template runs the context processors; the rest render
+    # inside that binding without running them again
+    with render_context.bind_template(first):
+        for template in templates:
+            with render_context.push():
+                parts.append(template.render(render_context))
+        with render_context.push(oob_context or {}):
+            for fragment in fragments:
+                with render_context.push():
+                    parts.append(fragment.prefix)
+                    parts.append(fragment.template.render(render_context))
+                    parts.append(fragment.suffix)
+    return "".join(parts)
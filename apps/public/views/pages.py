@@ -5,11 +5,26 @@ These views demonstrate best practices for rendering different types of pages,
 including authentication-optional pages and content-driven pages.
 """
 
+import base64
+import binascii
+import time
+import uuid
+from datetime import datetime
+
+from django.db.models import Count, Q
 from django.http import Http404
-from django.utils import timezone
+from django.shortcuts import get_object_or_404
 
+from apps.common.models import BlogPost, BlogPostTag, Tag
+from apps.common.models.blog_post import BLOG_CACHE_NAMESPACE
+from apps.common.utilities.cache import cached, namespace_version
 from apps.public.views.helpers.main_content_view import MainContentView
 
+# Seconds the blog sidebar and ETags are reused for; scheduled posts appear
+# within this time
+BLOG_CACHE_TTL = 300
+BLOG_SIDEBAR_TAGS = 10
+
 
 class LandingView(MainContentView):
     """Landing page for the site."""
@@ -22,6 +37,10 @@ class LandingView(MainContentView):
         self.context.update(self.get_context_data())
         return self.render(request)
 
+    def get_etag(self, request, *args, **kwargs):
+        """The landing page content is static between releases."""
+        return self.template_name
+
     def get_context_data(self, **kwargs):
         """Add additional context for the landing page."""
         context = {}
@@ -78,6 +97,10 @@ class PricingView(MainContentView):
         self.context.update(self.get_context_data())
         return self.render(request)
 
+    def get_etag(self, request, *args, **kwargs):
+        """Pricing plans are static between releases."""
+        return self.template_name
+
     def get_context_data(self, **kwargs):
         """Add pricing plans to the context."""
         context = {}
@@ -159,97 +182,76 @@ class PricingView(MainContentView):
 
 
 class BlogView(MainContentView):
-    """Blog index page."""
+    """
+    Blog index page.
+
+    Lists live posts newest first, optionally filtered by `?category=` or
+    `?tag=`. Pages are keyset paginated: `?after=<cursor>` continues after
+    the last post of the previous page, so deep pages cost the same as the
+    first one (no OFFSET) and posts published meanwhile don't shift them.
+    """
 
     template_name = "pages/blog.html"
     active_nav = "blog"  # Add this to active_navigation context processor
+    page_size = 10
 
     def get(self, request, *args, **kwargs):
         """Get method to load blog content into context."""
         self.context.update(self.get_context_data())
         return self.render(request)
 
+    def get_etag(self, request, *args, **kwargs):
+        """
+        Changes when any post is saved, and every BLOG_CACHE_TTL seconds
+        so that scheduled posts appear.
+        """
+        return (
+            f"{self.template_name}:{namespace_version(BLOG_CACHE_NAMESPACE)}:"
+            f"{int(time.time() // BLOG_CACHE_TTL)}:{request.GET.urlencode()}"
+        )
+
+    def get_queryset(self):
+        """Live posts matching the category/tag filters, newest first."""
+        posts = BlogPost.objects.live().select_related(
+            "author", "featured_image__upload"
+        )
+        category = self.request.GET.get("category")
+        if category:
+            posts = posts.filter(category=category)
+        tag = self.request.GET.get("tag")
+        if tag:
+            posts = posts.filter(post_tags__tag__name=Tag.normalize(tag))
+        return posts.order_by("-published_at", "-id")
+
     def get_context_data(self, **kwargs):
-        """Add blog posts to the context."""
+        """Add a page of blog posts and the sidebar to the context."""
         context = {}
-
-        # Example blog posts - in a real app, these would come from a database
-        context["posts"] = [
-            {
-                "title": "Getting Started with Our Platform",
-                "slug": "getting-started",
-                "excerpt": "Learn how to get up and running with our platform in just a few minutes.",
-                "published_at": timezone.now() - timezone.timedelta(days=2),
-                "author": "Jane Smith",
-                "image": "https://placehold.co/800x450/354a96/FFFFFF/png?text=Getting+Started",
-                "tags": ["tutorial", "beginners"],
-                "category": "Tutorials",
-            },
-            {
-                "title": "Advanced Features You Might Have Missed",
-                "slug": "advanced-features",
-                "excerpt": "Discover these powerful but often overlooked features to supercharge your workflow.",
-                "published_at": timezone.now() - timezone.timedelta(days=7),
-                "author": "John Davis",
-                "image": "https://placehold.co/800x450/2a6546/FFFFFF/png?text=Advanced+Features",
-                "tags": ["advanced", "tips"],
-                "category": "Tips & Tricks",
-            },
-            {
-                "title": "Customer Success Story: How Company X Increased Productivity by 200%",
-                "slug": "success-story-company-x",
-                "excerpt": "See how Company X used our platform to revolutionize their workflow and achieve amazing results.",
-                "published_at": timezone.now() - timezone.timedelta(days=14),
-                "author": "Sarah Johnson",
-                "image": "https://placehold.co/800x450/8b4513/FFFFFF/png?text=Success+Story",
-                "tags": ["case study", "success story"],
-                "category": "Case Studies",
-            },
-            {
-                "title": "Upcoming Features: What's New in Q2 2025",
-                "slug": "upcoming-features-q2-2025",
-                "excerpt": "Get a sneak peek at the exciting new features we're launching in the next quarter.",
-                "published_at": timezone.now() - timezone.timedelta(days=21),
-                "author": "Michael Brown",
-                "image": "https://placehold.co/800x450/793963/FFFFFF/png?text=New+Features",
-                "tags": ["roadmap", "features"],
-                "category": "Announcements",
-            },
-            {
-                "title": "5 Tips to Optimize Your Workflow",
-                "slug": "optimize-workflow",
-                "excerpt": "Simple but effective strategies to make the most of our platform and boost your productivity.",
-                "published_at": timezone.now() - timezone.timedelta(days=30),
-                "author": "Lisa Chen",
-                "image": "https://placehold.co/800x450/3d5a80/FFFFFF/png?text=5+Tips",
-                "tags": ["productivity", "tips"],
-                "category": "Tips & Tricks",
-            },
-        ]
-
-        # Categories for sidebar filtering
-        context["categories"] = [
-            {"name": "Tutorials", "count": 12},
-            {"name": "Tips & Tricks", "count": 8},
-            {"name": "Case Studies", "count": 5},
-            {"name": "Announcements", "count": 3},
-            {"name": "Industry News", "count": 7},
-        ]
-
-        # Recent posts for sidebar
-        context["recent_posts"] = context["posts"][:3]
-
-        # Popular tags for sidebar
-        context["tags"] = [
-            {"name": "tutorial", "count": 15},
-            {"name": "tips", "count": 12},
-            {"name": "productivity", "count": 9},
-            {"name": "case study", "count": 6},
-            {"name": "features", "count": 5},
-            {"name": "beginners", "count": 8},
-            {"name": "advanced", "count": 7},
-        ]
-
+        posts = self.get_queryset()
+
+        after = self.request.GET.get("after")
+        if after:
+            try:
+                published_at, pk = decode_cursor(after)
+            except ValueError:
+                raise Http404("Invalid page")
+            posts = posts.filter(
+                Q(published_at__lt=published_at)
+                | Q(published_at=published_at, id__lt=pk)
+            )
+
+        # One extra row tells whether there is a next page
+        page = list(posts[: self.page_size + 1])
+        context["posts"] = page[: self.page_size]
+        if len(page) > self.page_size:
+            query = self.request.GET.copy()
+            query["after"] = encode_cursor(context["posts"][-1])
+            context["next_page_query"] = query.urlencode()
+        if after:
+            query = self.request.GET.copy()
+            query.pop("after")
+            context["first_page_query"] = query.urlencode()
+
+        context.update(get_blog_sidebar())
         return context
 
 
@@ -258,6 +260,7 @@ class BlogPostView(MainContentView):
 
     template_name = "pages/blog_post.html"
     active_nav = "blog"  # Add this to active_navigation context processor
+    related_posts_count = 3
 
     def get(self, request, *args, **kwargs):
         """
@@ -270,92 +273,96 @@ class BlogPostView(MainContentView):
 
         Returns:
             HttpResponse: Rendered response
-        """
-        slug = kwargs.get("slug")
-        self.context["post"] = self._get_post_by_slug(slug)
-        return self.render(request)
-
-    def _get_post_by_slug(self, slug):
-        """
-        Get blog post data based on slug.
-
-        Args:
-            slug: Post slug from URL
-
-        Returns:
-            dict: Post data
 
         Raises:
-            Http404: If post not found
+            Http404: If there is no live post with this slug
         """
-        # In a real app, you would fetch the post from the database
-        # Here we'll use dummy data based on the slug
-        if slug == "sample-post":
-            return {
-                "title": "Sample Blog Post",
-                "slug": "sample-post",
-                "excerpt": "A sample blog post demonstrating the formatting and structure.",
-                "content": """
-                <p>This is a sample blog post with multiple paragraphs and formatting.</p>
-
-                <h2>Section Heading</h2>
-                <p>Lorem ipsum dolor sit amet, consectetur adipiscing elit. Nullam euismod,
-                nisl eget aliquam ultricies, nunc nisl aliquet nunc, quis aliquam nisl
-                nunc quis nisl. Nullam euismod, nisl eget aliquam ultricies, nunc nisl
-                aliquet nunc, quis aliquam nisl nunc quis nisl.</p>
-
-                <p>Nulla facilisi. Nullam euismod, nisl eget aliquam ultricies, nunc nisl
-                aliquet nunc, quis aliquam nisl nunc quis nisl. Nullam euismod, nisl eget
-                aliquam ultricies, nunc nisl aliquet nunc, quis aliquam nisl nunc quis nisl.</p>
-
-                <h2>Another Section</h2>
-                <p>Here's some code example:</p>
-                <pre><code>def hello_world():
-    print("Hello, world!")
-                </code></pre>
-
-                <p>And here's a list of key points:</p>
-                <ul>
-                    <li>First important point</li>
-                    <li>Second important point</li>
-                    <li>Third important point with more detail and explanation</li>
-                </ul>
-
-                <blockquote>
-                    This is a blockquote with an important insight or quote from an expert.
-                </blockquote>
-
-                <h2>Conclusion</h2>
-                <p>In conclusion, this is a sample blog post that demonstrates the formatting
-                and structure of blog posts on our platform.</p>
-                """,
-                "published_at": timezone.now() - timezone.timedelta(days=2),
-                "author": {
-                    "name": "Jane Smith",
-                    "avatar": "https://placehold.co/48x48/555555/FFFFFF/png?text=JS",
-                    "bio": "Jane is a senior developer and technical writer with over 10 years of experience.",
-                },
-                "image": "https://placehold.co/1200x600/4a5859/FFFFFF/png?text=Sample+Blog+Post",
-                "tags": ["tutorial", "beginners"],
-                "category": "Tutorials",
-                "related_posts": [
-                    {
-                        "title": "Getting Started with Our Platform",
-                        "slug": "getting-started",
-                        "image": "https://placehold.co/400x225/354a96/FFFFFF/png?text=Getting+Started",
-                    },
-                    {
-                        "title": "5 Tips to Optimize Your Workflow",
-                        "slug": "optimize-workflow",
-                        "image": "https://placehold.co/400x225/3d5a80/FFFFFF/png?text=5+Tips",
-                    },
-                    {
-                        "title": "Advanced Features You Might Have Missed",
-                        "slug": "advanced-features",
-                        "image": "https://placehold.co/400x225/2a6546/FFFFFF/png?text=Advanced+Features",
-                    },
-                ],
+        post = get_object_or_404(
+            BlogPost.objects.live().select_related("author", "featured_image__upload"),
+            slug=kwargs.get("slug"),
+        )
+        self.context["post"] = post
+        self.context["related_posts"] = self.get_related_posts(post)
+        return self.render(request)
+
+    def get_etag(self, request, *args, **kwargs):
+        """Changes when any post is saved, or a scheduled post goes live."""
+        return (
+            f"{kwargs.get('slug')}:{namespace_version(BLOG_CACHE_NAMESPACE)}:"
+            f"{int(time.time() // BLOG_CACHE_TTL)}"
+        )
+
+    def get_related_posts(self, post):
+        """The latest other live posts in the post's category."""
+        related = BlogPost.objects.live().exclude(pk=post.pk)
+        if post.category:
+            related = related.filter(category=post.category)
+        return list(
+            related.select_related("featured_image__upload").order_by(
+                "-published_at", "-id"
+            )[: self.related_posts_count]
+        )
+
+
+def encode_cursor(post) -> str:
+    """Opaque cursor pointing just after `post` in (-published_at, -id) order."""
+    value = f"{post.published_at.isoformat()}|{post.pk}"
+    return base64.urlsafe_b64encode(value.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Inverse of `encode_cursor()`; raises ValueError for invalid cursors."""
+    try:
+        value = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        published_at, pk = value.split("|")
+        return datetime.fromisoformat(published_at), uuid.UUID(pk)
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {str(e)}")
+
+
+@cached(lambda: "sidebar", ttl=BLOG_CACHE_TTL, namespace=BLOG_CACHE_NAMESPACE)
+def get_blog_sidebar() -> dict:
+    """
+    Categories and tags with their live post counts, and the recent posts.
+
+    Cached until a post is saved or deleted (see `invalidate_blog_cache`),
+    or for BLOG_CACHE_TTL seconds so that scheduled and expired posts are
+    counted correctly. Tag counts are computed here rather than read from
+    Tag.post_count, which only changes when posts are saved.
+    """
+    live = BlogPost.objects.live()
+
+    categories = (
+        live.exclude(category="")
+        .values("category")
+        .annotate(count=Count("id"))
+        .order_by("-count", "category")
+    )
+
+    tags = (
+        BlogPostTag.objects.filter(post__in=live)
+        .values("tag__name")
+        .annotate(count=Count("post_id"))
+        .order_by("-count", "tag__name")[:BLOG_SIDEBAR_TAGS]
+    )
+
+    recent_posts = live.select_related("featured_image__upload").order_by(
+        "-published_at", "-id"
+    )[:3]
+
+    return {
+        "categories": [
+            {"name": row["category"], "count": row["count"]} for row in categories
+        ],
+        "tags": [{"name": row["tag__name"], "count": row["count"]} for row in tags],
+        # Plain values, so the cached sidebar doesn't hold model instances
+        "recent_posts": [
+            {
+                "title": post.title,
+                "slug": post.slug,
+                "image": post.featured_image.url if post.featured_image else None,
+                "published_at": post.published_at,
             }
-        else:
-            # If we don't have a post for this slug, return 404
-            raise Http404("Blog post not found")
+            for post in recent_posts
+        ],
+    }
@@ -17,6 +17,7 @@ from django.views.generic import (
 )
 
 from apps.common.models.team import Role, Team, TeamMember
+from apps.common.utilities.database.replicas import read_from_replica
 from apps.public.views.helpers.main_content_view import MainContentView
 
 
@@ -31,13 +32,16 @@ class TeamListView(LoginRequiredMixin, MainContentView, ListView):
         """Return only teams that the user is a member of."""
         return self.request.user.teams.all().order_by("name")
 
+    @read_from_replica
     def get(self, request, *args, **kwargs):
         """Handle GET request - redirect to team detail if user has a team."""
         user_teams = self.get_queryset()
 
-        # If user has no teams, show empty team list
+        # If user has no teams, show empty team list. Rendered here, so its
+        # queries run inside the replica block too
         if not user_teams.exists():
-            return super().get(request, *args, **kwargs)
+            self.object_list = user_teams
+            return self.render(request, context=self.get_context_data())
 
         # If user has exactly one team, redirect to that team's detail page
         if user_teams.count() == 1:
@@ -51,20 +55,29 @@ class TeamListView(LoginRequiredMixin, MainContentView, ListView):
 
     def get_context_data(self, **kwargs):
         """Add additional context data for team list."""
+        # Evaluate the teams here, where the replica block applies, rather
+        # than lazily in the template
+        kwargs.setdefault("object_list", list(self.object_list))
         context = super().get_context_data(**kwargs)
 
         # Group teams by the user's role
         user = self.request.user
         context.update(
             {
-                "owned_teams": Team.objects.filter(
-                    teammember__user=user, teammember__role=Role.OWNER.value
+                "owned_teams": list(
+                    Team.objects.filter(
+                        teammember__user=user, teammember__role=Role.OWNER.value
+                    )
                 ),
-                "admin_teams": Team.objects.filter(
-                    teammember__user=user, teammember__role=Role.ADMIN.value
+                "admin_teams": list(
+                    Team.objects.filter(
+                        teammember__user=user, teammember__role=Role.ADMIN.value
+                    )
                 ),
-                "member_teams": Team.objects.filter(
-                    teammember__user=user, teammember__role=Role.MEMBER.value
+                "member_teams": list(
+                    Team.objects.filter(
+                        teammember__user=user, teammember__role=Role.MEMBER.value
+                    )
                 ),
             }
         )
@@ -0,0 +1,7 @@
+"""
+Benchmarks for the project's hot paths.
+
+Each bench_*.py module registers benchmarks with `runner.benchmark`; data
+comes from `benchmarks.data`, which builds on apps/common/tests/factories.py.
+Run with `python -m benchmarks` (see __main__.py for options).
+"""
@@ -0,0 +1,126 @@
+"""
+Run the benchmark suite.
+
+Usage:
+    python -m benchmarks                      # run everything
+    python -m benchmarks -k code_execution    # names containing a substring
+    python -m benchmarks --list
+    python -m benchmarks --output results.json
+    python -m benchmarks --save-baseline      # write benchmarks/baseline.json
+    python -m benchmarks --compare            # fail on >20% regressions
+    python -m benchmarks --compare other.json --tolerance 0.1
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test.utils import (  # noqa: E402
+    setup_test_environment,
+    teardown_test_environment,
+)
+
+from benchmarks import runner  # noqa: E402
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def print_result(name: str, stats: dict) -> None:
+    print(
+        f"  {name:<45} {format_seconds(stats['median']):>10} "
+        f"± {format_seconds(stats['stdev']):>9}  "
+        f"({stats['repeat']}×{stats['number']})",
+        flush=True,
+    )
+
+
+def print_comparison(rows: list[dict]) -> None:
+    print("\nCompared with baseline:")
+    for row in rows:
+        if row["status"] == "new":
+            change = "new"
+        else:
+            change = f"{(row['ratio'] - 1) * 100:+.1f}%"
+        marker = "  <-- regressed" if row["status"] == "regressed" else ""
+        print(f"  {row['name']:<45} {change:>8}{marker}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the benchmark suite.")
+    parser.add_argument("-k", dest="pattern", help="only names containing this")
+    parser.add_argument("--list", action="store_true", help="list benchmarks")
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    parser.add_argument(
+        "--save-baseline",
+        nargs="?",
+        type=Path,
+        const=runner.DEFAULT_BASELINE,
+        help=f"write results as the baseline (default {runner.DEFAULT_BASELINE})",
+    )
+    parser.add_argument(
+        "--compare",
+        nargs="?",
+        type=Path,
+        const=runner.DEFAULT_BASELINE,
+        help="compare with a baseline and exit 1 on regressions",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=runner.DEFAULT_TOLERANCE,
+        help="allowed slowdown before a benchmark counts as regressed",
+    )
+    parser.add_argument("--keepdb", action="store_true", help="reuse the test database")
+    args = parser.parse_args()
+
+    benchmarks = runner.discover()
+    if args.pattern:
+        benchmarks = {k: v for k, v in benchmarks.items() if args.pattern in k}
+    if args.list:
+        print("\n".join(benchmarks))
+        return
+    if not benchmarks:
+        raise SystemExit("No benchmarks selected")
+    baseline = runner.load(args.compare) if args.compare else None
+
+    # Benchmarks run against a fresh test database, like the test suite
+    setup_test_environment(debug=False)
+    old_name = connection.creation.create_test_db(verbosity=0, keepdb=args.keepdb)
+    try:
+        print(f"Running {len(benchmarks)} benchmarks ({connection.vendor})")
+        results = runner.run(benchmarks, on_result=print_result)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=args.keepdb)
+        teardown_test_environment()
+
+    results["database"] = settings.DATABASES["default"]["ENGINE"].rsplit(".", 1)[-1]
+    if args.output:
+        runner.save(results, args.output)
+    if args.save_baseline:
+        runner.save(results, args.save_baseline)
+        print(f"\nSaved baseline to {args.save_baseline}")
+    if baseline is not None:
+        rows = runner.compare(results, baseline, args.tolerance)
+        print_comparison(rows)
+        if any(row["status"] == "regressed" for row in rows):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
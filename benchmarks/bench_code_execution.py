@@ -0,0 +1,54 @@
+"""
+Benchmarks for safe code execution (apps/ai/code_execution).
+"""
+
+from apps.ai.code_execution import CodeExecutor
+from apps.ai.code_execution.validators import ASTValidator, OutputValidator
+from benchmarks import data
+from benchmarks.runner import benchmark
+
+ANALYSIS_SNIPPET = """
+values = [i * 0.5 for i in range(2000)]
+buckets = {}
+for value in values:
+    key = int(value) % 10
+    buckets[key] = buckets.get(key, 0) + value
+print(sorted(buckets.items())[:3])
+result = sum(values) / len(values)
+"""
+
+
+@benchmark()
+def execute_snippet():
+    """Full pipeline: syntax and AST checks, sandbox, output validation."""
+    executor = CodeExecutor(log_executions=False)
+    return lambda: executor.execute(ANALYSIS_SNIPPET)
+
+
+@benchmark(repeat=3)
+def execute_large_module():
+    executor = CodeExecutor(log_executions=False)
+    executor.ast_validator.max_operations = 10**7
+    code = data.python_source(functions=200)
+    return lambda: executor.execute(code)
+
+
+@benchmark()
+def ast_validate_large_module():
+    validator = ASTValidator(max_operations=10**7)
+    code = data.python_source(functions=1000)
+    return lambda: validator.validate(code)
+
+
+@benchmark()
+def output_validate_clean():
+    validator = OutputValidator(max_output_bytes=10**7)
+    output = data.program_output(kilobytes=512, secret_every=0)
+    return lambda: validator.validate(output)
+
+
+@benchmark()
+def output_redact_sensitive():
+    validator = OutputValidator(max_output_bytes=10**7, redact=True)
+    output = data.program_output(kilobytes=512, secret_every=50)
+    return lambda: validator.validate(output)
@@ -0,0 +1,61 @@
+"""
+Benchmarks for Stripe webhook handling: signature verification, event
+routing and the handler's database work.
+"""
+
+from itertools import count
+
+from django.test import override_settings
+
+from apps.integration.stripe.webhook import handle_stripe_webhook
+from benchmarks import data
+from benchmarks.runner import benchmark
+
+WEBHOOK_SECRET = "whsec_benchmark"
+STRIPE_SETTINGS = {
+    "DEBUG": False,
+    "STRIPE_ENABLED": True,
+    "STRIPE_API_KEY": "sk_test_benchmark",
+    "STRIPE_WEBHOOK_SECRET": WEBHOOK_SECRET,
+}
+
+
+def _handler(make_event):
+    """Sign and handle a new event per call, as Stripe would deliver it."""
+    sessions = (f"cs_benchmark_{n}" for n in count())
+
+    def handle():
+        payload, signature = data.signed_stripe_payload(
+            make_event(next(sessions)), WEBHOOK_SECRET
+        )
+        with override_settings(**STRIPE_SETTINGS):
+            result = handle_stripe_webhook(payload, signature)
+        assert result["success"], result
+        return result
+
+    return handle
+
+
+@benchmark()
+def webhook_checkout_completed():
+    """checkout.session.completed: user lookup by metadata."""
+    [user] = data.create_users(1, prefix="stripe")
+    user.stripe_customer_id = "cus_benchmark"
+    user.save(update_fields=["stripe_customer_id"])
+    return _handler(
+        lambda session_id: data.checkout_completed_event(
+            session_id, user.pk, "cus_benchmark"
+        )
+    )
+
+
+@benchmark()
+def webhook_unhandled_event():
+    """An event type without a handler: verification and routing only."""
+    return _handler(
+        lambda session_id: {
+            "id": f"evt_{session_id}",
+            "type": "invoice.created",
+            "data": {"object": {"id": session_id}},
+        }
+    )
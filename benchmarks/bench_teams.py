@@ -0,0 +1,49 @@
+"""
+Benchmarks for team permission checks.
+"""
+
+from apps.common.models import Team
+from benchmarks import data
+from benchmarks.runner import benchmark
+
+
+def _team_with_members(members: int = 200):
+    users = data.create_users(members, prefix="perm")
+    [team] = data.create_teams(users, count=1, max_members=members)
+    return team, list(team.members.all())
+
+
+@benchmark()
+def permission_checks():
+    """The checks a team page makes for the current user."""
+    team, members = _team_with_members()
+    user = members[len(members) // 2]
+
+    def check():
+        return (
+            team.user_is_member(user),
+            team.user_can_edit(user),
+            team.user_can_delete(user),
+        )
+
+    return check
+
+
+@benchmark(repeat=3)
+def permission_checks_per_member():
+    """Role checks for every row of a member list (one query per member)."""
+    team, members = _team_with_members()
+    return lambda: [team.user_can_manage(member) for member in members]
+
+
+@benchmark()
+def teams_for_user():
+    """A user's teams with their role, as listed on the teams page."""
+    users = data.create_users(500, prefix="teams")
+    data.create_teams(users, count=200, max_members=25)
+    user = users[0]
+    return lambda: list(
+        Team.objects.filter(teammember__user=user).values(
+            "name", "slug", "teammember__role"
+        )
+    )
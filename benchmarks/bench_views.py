@@ -0,0 +1,54 @@
+"""
+Benchmarks for view rendering: HTMX responses with OOB swaps and the admin
+dashboard.
+"""
+
+from django.contrib import messages
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django_htmx.middleware import HtmxDetails
+
+from apps.common.admin_dashboard import get_admin_dashboard
+from apps.public.views.helpers.htmx_view import HTMXView
+from benchmarks import data
+from benchmarks.runner import benchmark
+
+
+class AlertWithOOBView(HTMXView):
+    """An alert swapped into the page, plus toast and modal OOB fragments."""
+
+    template_name = "layout/alerts/alert.html"
+    include_modals = True
+
+    def get(self, request, *args, **kwargs) -> HttpResponse:
+        messages.success(request, "Saved.")
+        self.context.update(
+            {"alert_type": "info", "alert_message": "Saved.", "dismissible": True}
+        )
+        return self.render(request)
+
+
+def htmx_request(user):
+    request = RequestFactory().get("/alerts/", headers={"HX-Request": "true"})
+    request.htmx = HtmxDetails(request)
+    request.user = user
+    request.session = {}
+    request._messages = CookieStorage(request)
+    return request
+
+
+@benchmark()
+def htmx_render_with_oob():
+    [user] = data.create_users(1, prefix="htmx")
+    view = AlertWithOOBView.as_view()
+    return lambda: view(htmx_request(user))
+
+
+@benchmark(repeat=3)
+def admin_dashboard():
+    users = data.seed_dashboard(scale=1)
+    staff = next(user for user in users if user.is_staff)
+    request = RequestFactory().get("/admin/")
+    request.user = staff
+    return lambda: get_admin_dashboard(request, {})
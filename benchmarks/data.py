@@ -0,0 +1,232 @@
+"""
+Data generators for benchmarks.
+
+Model rows are built with the factories in apps/common/tests/factories.py
+and saved with bulk_create, so seeding thousands of rows takes seconds.
+Everything is deterministic for a given seed, so runs are comparable.
+"""
+
+import hashlib
+import hmac
+import json
+import random
+import time
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.utils import timezone
+
+from apps.common.models import Payment, Subscription
+from apps.common.models.team import Role
+from apps.common.tests.factories import (
+    EmailFactory,
+    SMSFactory,
+    TeamFactory,
+    TeamMemberFactory,
+    UserFactory,
+)
+
+BATCH_SIZE = 500
+
+
+def create_users(count: int, prefix: str = "bench", seed: int = 0) -> list:
+    """Users with unique names, spread over the last 60 days."""
+    rng = random.Random(seed)
+    password = make_password("benchmark")
+    now = timezone.now()
+    users = []
+    for i in range(count):
+        joined = now - timedelta(days=rng.randint(0, 60))
+        users.append(
+            UserFactory.build(
+                username=f"{prefix}_{i}",
+                email=f"{prefix}_{i}@example.com",
+                password=password,
+                is_staff=i % 50 == 0,
+                date_joined=joined,
+                last_login=joined + timedelta(days=rng.randint(0, 5)),
+            )
+        )
+    User = UserFactory.model_class
+    User.objects.bulk_create(users, batch_size=BATCH_SIZE)
+    return list(User.objects.filter(username__startswith=f"{prefix}_"))
+
+
+def create_teams(users: list, count: int, max_members: int = 25, seed: int = 0):
+    """Teams with 0..max_members members each; the first member owns the team."""
+    rng = random.Random(seed)
+    teams = TeamFactory.model_class.objects.bulk_create(
+        [
+            TeamFactory.build(
+                name=f"Bench Team {i}", slug=f"bench-team-{i}", is_active=i % 4 != 0
+            )
+            for i in range(count)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    memberships = []
+    for team in teams:
+        members = rng.sample(users, min(rng.randint(0, max_members), len(users)))
+        for position, user in enumerate(members):
+            role = (
+                Role.OWNER if position == 0 else rng.choice([Role.ADMIN, Role.MEMBER])
+            )
+            memberships.append(
+                TeamMemberFactory.build(team=team, user=user, role=role.value)
+            )
+    TeamMemberFactory.model_class.objects.bulk_create(
+        memberships, batch_size=BATCH_SIZE
+    )
+    return teams
+
+
+def create_messages(count: int, seed: int = 0) -> None:
+    """Emails and SMS in a mix of delivery states."""
+    rng = random.Random(seed)
+    now = timezone.now()
+    emails, texts = [], []
+    for i in range(count):
+        sent = now - timedelta(hours=rng.randint(1, 500)) if i % 3 else None
+        emails.append(
+            EmailFactory.build(
+                to_address=f"recipient_{i}@example.com",
+                from_address="sender@example.com",
+                subject="Benchmark",
+                body="Benchmark email body.",
+                type=1,
+                sent_at=sent,
+                read_at=sent if sent and i % 2 else None,
+            )
+        )
+        texts.append(
+            SMSFactory.build(
+                to_number=f"+1555{i:07d}",
+                from_number="+15551234567",
+                body="Benchmark SMS.",
+                status=rng.choice(["delivered", "failed", "sent"]),
+            )
+        )
+    EmailFactory.model_class.objects.bulk_create(emails, batch_size=BATCH_SIZE)
+    SMSFactory.model_class.objects.bulk_create(texts, batch_size=BATCH_SIZE)
+
+
+def create_billing(users: list, seed: int = 0) -> None:
+    """A subscription for every fourth user and a few payments for every user."""
+    rng = random.Random(seed)
+    now = timezone.now()
+    subscriptions = [
+        Subscription(
+            user=user,
+            stripe_id=f"sub_bench_{user.pk}",
+            stripe_customer_id=f"cus_bench_{user.pk}",
+            plan_name="Pro",
+            price=2900,
+            status=rng.choice(["active", "active", "trialing", "past_due", "canceled"]),
+            current_period_start=now - timedelta(days=10),
+            current_period_end=now + timedelta(days=20),
+        )
+        for user in users[::4]
+    ]
+    Subscription.objects.bulk_create(subscriptions, batch_size=BATCH_SIZE)
+    payments = [
+        Payment(
+            user=user,
+            stripe_id=f"pi_bench_{user.pk}_{n}",
+            stripe_customer_id=f"cus_bench_{user.pk}",
+            amount=rng.choice([900, 2900, 9900]),
+            status=rng.choice(["succeeded", "succeeded", "pending", "failed"]),
+            paid_at=now - timedelta(days=rng.randint(0, 90)),
+        )
+        for user in users
+        for n in range(rng.randint(0, 3))
+    ]
+    Payment.objects.bulk_create(payments, batch_size=BATCH_SIZE)
+
+
+def seed_dashboard(scale: int = 1) -> list:
+    """Everything the admin dashboard counts, about 1000 users per `scale`."""
+    users = create_users(1000 * scale)
+    create_teams(users, count=100 * scale)
+    create_messages(2000 * scale)
+    create_billing(users)
+    return users
+
+
+def python_source(functions: int = 200, seed: int = 0) -> str:
+    """A large, valid module of the kind an LLM writes for data analysis."""
+    rng = random.Random(seed)
+    lines = ["import math", "import statistics", "from collections import Counter", ""]
+    for i in range(functions):
+        n = rng.randint(5, 50)
+        lines += [
+            f"def summarize_{i}(values, scale={n}):",
+            f'    """Summary statistics for series {i}."""',
+            "    cleaned = [v * scale for v in values if v is not None]",
+            "    counts = Counter(round(v) for v in cleaned)",
+            "    total = 0",
+            "    for index, value in enumerate(cleaned):",
+            "        if index % 2 == 0 and value > 0:",
+            "            total += math.sqrt(value)",
+            "        else:",
+            "            total -= value / (index + 1)",
+            "    return {",
+            f'        "name": "series_{i}",',
+            '        "mean": statistics.fmean(cleaned) if cleaned else 0,',
+            '        "top": counts.most_common(3),',
+            '        "total": round(total, 4),',
+            "    }",
+            "",
+        ]
+    lines += [
+        "results = [summarize_0(list(range(100)))]",
+        "print(results[0]['name'], len(results))",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def program_output(kilobytes: int = 256, secret_every: int = 50, seed: int = 0) -> str:
+    """Tabular output with an email or key every `secret_every` lines."""
+    rng = random.Random(seed)
+    secrets = [
+        "contact: analyst_{i}@example.com",
+        "key AKIA" + "ABCDEFGHIJKLMNOP",
+        "ssn 123-45-6789",
+    ]
+    lines, size, i = [], 0, 0
+    while size < kilobytes * 1024:
+        if secret_every and i % secret_every == secret_every - 1:
+            line = secrets[i % len(secrets)].format(i=i)
+        else:
+            values = " | ".join(f"{rng.random() * 1000:10.3f}" for _ in range(6))
+            line = f"row {i:06d} | {values}"
+        lines.append(line)
+        size += len(line) + 1
+        i += 1
+    return "\n".join(lines)
+
+
+def signed_stripe_payload(event: dict, secret: str) -> tuple[bytes, str]:
+    """A webhook body and its Stripe-Signature header, signed with `secret`."""
+    payload = json.dumps(event).encode()
+    timestamp = int(time.time())
+    signature = hmac.new(
+        secret.encode(), f"{timestamp}.".encode() + payload, hashlib.sha256
+    ).hexdigest()
+    return payload, f"t={timestamp},v1={signature}"
+
+
+def checkout_completed_event(session_id: str, user_id: int, customer_id: str):
+    return {
+        "id": f"evt_{session_id}",
+        "object": "event",
+        "type": "checkout.session.completed",
+        "data": {
+            "object": {
+                "id": session_id,
+                "object": "checkout.session",
+                "customer": customer_id,
+                "mode": "subscription",
+                "metadata": {"user_id": str(user_id), "plan_name": "Pro"},
+            }
+        },
+    }
@@ -0,0 +1,194 @@
+"""
+Registry, timer and baseline comparison for the benchmark suite.
+
+A benchmark is a setup function, registered with `@benchmark`, that prepares
+its data and returns the callable to time:
+
+    @benchmark(repeat=5)
+    def validate_large_module():
+        code = data.python_source(functions=500)
+        validator = ASTValidator(max_operations=10**6)
+        return lambda: validator.validate(code)
+
+Setup runs inside a transaction that is rolled back afterwards, so
+benchmarks don't see each other's data.
+"""
+
+import importlib
+import json
+import logging
+import os
+import pkgutil
+import platform
+import statistics
+import subprocess
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCHMARKS_DIR / "baseline.json"
+DEFAULT_TOLERANCE = 0.2  # 20% slower than the baseline is a regression
+
+
+@dataclass
+class Benchmark:
+    """A registered benchmark."""
+
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    repeat: int
+    min_time: float
+
+
+_benchmarks: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str | None = None, repeat: int = 5, min_time: float = 0.2):
+    """
+    Register a benchmark setup function.
+
+    Args:
+        name: Defaults to "<module without bench_>.<function>"
+        repeat: Number of timed rounds; the median round is reported
+        min_time: Each round runs the callable enough times to take this long
+    """
+
+    def decorator(setup):
+        module = setup.__module__.rsplit(".", 1)[-1].removeprefix("bench_")
+        key = name or f"{module}.{setup.__name__}"
+        _benchmarks[key] = Benchmark(key, setup, repeat, min_time)
+        return setup
+
+    return decorator
+
+
+def discover() -> dict[str, Benchmark]:
+    """
+    Import every benchmarks/bench_*.py module and return the registry.
+
+    A module whose dependencies aren't installed is skipped with a warning.
+    """
+    for module in pkgutil.iter_modules([str(BENCHMARKS_DIR)]):
+        if not module.name.startswith("bench_"):
+            continue
+        try:
+            importlib.import_module(f"benchmarks.{module.name}")
+        except ImportError as e:
+            logger.warning(f"Skipping {module.name}: {str(e)}")
+    return dict(sorted(_benchmarks.items()))
+
+
+def _calibrate(func: Callable[[], Any], min_time: float) -> int:
+    """Number of calls per round so that a round takes at least `min_time`."""
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - started >= min_time or number >= 1_000_000:
+            return number
+        number *= 2 if number < 10 else 10
+
+
+def run_benchmark(bench: Benchmark) -> dict[str, Any]:
+    """Time one benchmark; durations are seconds per call."""
+    with transaction.atomic():
+        func = bench.setup()
+        func()  # Warm caches (templates, compiled regexes, query plans)
+        number = _calibrate(func, bench.min_time)
+        rounds = []
+        for _ in range(bench.repeat):
+            started = time.perf_counter()
+            for _ in range(number):
+                func()
+            rounds.append((time.perf_counter() - started) / number)
+        transaction.set_rollback(True)
+
+    return {
+        "number": number,
+        "repeat": bench.repeat,
+        "min": min(rounds),
+        "median": statistics.median(rounds),
+        "mean": statistics.fmean(rounds),
+        "stdev": statistics.stdev(rounds) if len(rounds) > 1 else 0.0,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCHMARKS_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(
+    benchmarks: dict[str, Benchmark],
+    on_result: Callable[[str, dict], None] | None = None,
+) -> dict[str, Any]:
+    """Run benchmarks and return JSON-serialisable results."""
+    results = {}
+    for name, bench in benchmarks.items():
+        results[name] = run_benchmark(bench)
+        if on_result:
+            on_result(name, results[name])
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()} ({os.cpu_count()} CPUs)",
+        "benchmarks": results,
+    }
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], tolerance: float
+) -> list[dict[str, Any]]:
+    """
+    Compare median timings with a baseline.
+
+    Each row has a status: "regressed" (slower than the baseline by more than
+    `tolerance`), "improved" (faster by more than `tolerance`), "ok" or "new".
+    """
+    rows = []
+    previous = baseline.get("benchmarks", {})
+    for name, stats in results["benchmarks"].items():
+        row = {"name": name, "median": stats["median"], "baseline": None}
+        if name not in previous:
+            row["status"] = "new"
+        else:
+            row["baseline"] = previous[name]["median"]
+            row["ratio"] = stats["median"] / row["baseline"]
+            if row["ratio"] > 1 + tolerance:
+                row["status"] = "regressed"
+            elif row["ratio"] < 1 - tolerance:
+                row["status"] = "improved"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
+
+
+def load(path: Path) -> dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def save(results: dict[str, Any], path: Path) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
@@ -11,6 +11,16 @@ import warnings
 import django
 import pytest
 from django.conf import settings
+from django.db import connections
+
+from apps.common.utilities.database.query_patterns import QueryPatternDetector
+from tools.testing.sharding import (
+    DURATIONS_FILE,
+    load_durations,
+    parse_shard,
+    save_durations,
+    select_shard,
+)
 
 # Optional Selenium import (skip if not installed)
 try:
@@ -46,10 +56,83 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "form: mark test related to forms")
     config.addinivalue_line("markers", "workflow: mark test related to user workflows")
     config.addinivalue_line("markers", "component: mark test related to UI components")
+    config.addinivalue_line(
+        "markers",
+        "max_queries(n, max_repeats=None): fail if the test runs more than n "
+        "queries, or repeats one query shape more than max_repeats times",
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """
+    Enforce @pytest.mark.max_queries(n, max_repeats=None).
+
+    Queries are counted while the test runs (including setUp for TestCase
+    classes; pytest fixtures run before and aren't counted). On failure the
+    repeated query shapes are reported with the code that issued them.
+    """
+    marker = item.get_closest_marker("max_queries")
+    if marker is None:
+        return (yield)
+
+    max_queries = marker.args[0] if marker.args else marker.kwargs.get("n")
+    max_repeats = marker.kwargs.get("max_repeats")
+    detector = QueryPatternDetector(threshold=(max_repeats or 4) + 1)
+    with detector:
+        result = yield
+
+    if max_queries is not None and detector.total > max_queries:
+        pytest.fail(
+            f"Expected at most {max_queries} queries\n{detector.report()}",
+            pytrace=False,
+        )
+    if max_repeats is not None and detector.repeated():
+        pytest.fail(
+            f"Query shapes repeated more than {max_repeats} times "
+            f"(possible N+1)\n{detector.report()}",
+            pytrace=False,
+        )
+    return result
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Keep only one shard of the tests when TEST_SHARD is set, e.g. "2/4".
+
+    Shards are balanced with the timings in TEST_DURATIONS_FILE; see
+    tools/testing/sharding.py.
+    """
+    shard = os.environ.get("TEST_SHARD")
+    if not shard:
+        return
+    index, count = parse_shard(shard)
+    durations = load_durations(os.environ.get("TEST_DURATIONS_FILE", DURATIONS_FILE))
+    selected = select_shard([item.nodeid for item in items], index, count, durations)
+    config.hook.pytest_deselected(
+        items=[item for item in items if item.nodeid not in selected]
+    )
+    items[:] = [item for item in items if item.nodeid in selected]
+
+
+# Seconds per test (setup + call + teardown), saved when TEST_DURATIONS_OUTPUT is set
+test_durations: dict[str, float] = {}
+
+
+def pytest_runtest_logreport(report):
+    test_durations[report.nodeid] = (
+        test_durations.get(report.nodeid, 0.0) + report.duration
+    )
+
+
+def pytest_sessionfinish(session):
+    output = os.environ.get("TEST_DURATIONS_OUTPUT")
+    if output and test_durations:
+        save_durations(test_durations, output)
 
 
 @pytest.fixture(scope="session")
-def django_db_setup():
+def django_db_setup(django_db_blocker):
     """Configure database for testing."""
     settings.DATABASES = {
         "default": {
@@ -63,6 +146,28 @@ def django_db_setup():
         }
     }
 
+    # Parallel workers use a migrated copy of the test database (see
+    # tools/testing/parallel.py)
+    worker_database = os.environ.get("TEST_WORKER_DATABASE")
+    if worker_database:
+        connections["default"].close()
+        connections["default"].settings_dict["NAME"] = worker_database
+
+    # Replica routing is tested against a copy of the test database under the
+    # replica_1 alias (see apps/common/tests/test_replicas.py)
+    creation = connections["default"].creation
+    with django_db_blocker.unblock():
+        creation.clone_test_db(suffix="replica", verbosity=0)
+    replica = creation.get_test_db_clone_settings("replica")
+    settings.DATABASES["replica_1"] = replica
+    connections.settings["replica_1"] = replica
+
+    yield
+
+    connections["replica_1"].close()
+    with django_db_blocker.unblock():
+        creation.destroy_test_db(verbosity=0, suffix="replica")
+
 
 if SELENIUM_AVAILABLE:
 
@@ -12,5 +12,13 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+# Each request runs in a new thread, so persistent connections would never
+# be reused; use DB_POOL instead (settings/database.py)
+os.environ.setdefault("DB_CONN_MAX_AGE", "0")
 
 application = get_asgi_application()
+
+# Serving only: other processes (migrate, shell, workers) never need it
+from apps.public.views.helpers.docs_index import warm_docs_index  # noqa: E402
+
+warm_docs_index()
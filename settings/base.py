@@ -2,10 +2,14 @@
 Core Django settings common to all environments.
 """
 
+import hashlib
 import mimetypes
+import os
+import subprocess
 
 # Detect if we are in a test environment
 import sys
+import tempfile
 
 from settings.env import BASE_DIR, LOCAL, PRODUCTION, STAGE
 
@@ -28,6 +32,7 @@ DJANGO_APPS = [
     "django.contrib.staticfiles",
     "django.contrib.humanize",
     "django.contrib.sites",
+    "django.contrib.postgres",
 ]
 
 THIRD_PARTY_APPS = [
@@ -63,6 +68,7 @@ SITE_ID = 1
 
 # Middleware configuration
 MIDDLEWARE = [
+    "apps.common.utilities.django.middleware.PerformanceMiddleware",
     "apps.common.utilities.django.middleware.APIHeaderMiddleware",
     # "django_user_agents.middleware.UserAgentMiddleware",
     "django.middleware.gzip.GZipMiddleware",
@@ -72,6 +78,7 @@ MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
+    "apps.common.utilities.django.middleware.ReplicaStickinessMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -121,6 +128,65 @@ TEMPLATES = [
     },
 ]
 
+# Fragment cache for layout components ({% cachedcomponent %})
+COMPONENT_CACHE_ENABLED = True
+COMPONENT_CACHE_TTL = 300  # seconds
+
+
+def _release_version() -> str:
+    """
+    An id of the deployed release that every worker agrees on: the commit
+    from RENDER_GIT_COMMIT or git, else the hash of the static files manifest.
+    Empty if none is available.
+    """
+    commit = os.environ.get("RENDER_GIT_COMMIT")
+    if commit:
+        return commit
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=BASE_DIR,
+            capture_output=True,
+            text=True,
+            timeout=2,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        pass
+    try:
+        manifest = (BASE_DIR / "staticfiles" / "staticfiles.json").read_bytes()
+    except OSError:
+        return ""
+    return hashlib.md5(manifest, usedforsecurity=False).hexdigest()
+
+
+# Part of every page ETag, so a deploy with new templates invalidates them.
+# Set it explicitly where neither git nor collected static files are there.
+PAGE_ETAG_VERSION = os.environ.get("PAGE_ETAG_VERSION") or _release_version()
+# Conditional GET (ETag/Last-Modified) for views that declare validators;
+# off without a release id, which would keep pages cached across deploys
+CONDITIONAL_GET_ENABLED = not LOCAL and bool(PAGE_ETAG_VERSION)
+
+# /docs endpoints: in-memory index and content cache of docs/*.md
+DOCS_CACHE_MAX_BYTES = 8 * 1024 * 1024
+DOCS_INDEX_CHECK_INTERVAL = 2.0  # seconds between mtime checks
+
+# Request instrumentation (PerformanceMiddleware)
+PERFORMANCE_INSTRUMENTATION_ENABLED = True
+PERFORMANCE_SERVER_TIMING = True  # Server-Timing response header
+PERFORMANCE_SLOW_REQUEST_MS = int(os.environ.get("PERFORMANCE_SLOW_REQUEST_MS", 1000))
+# Fraction of requests run under cProfile; profiles of slow ones are kept
+PERFORMANCE_PROFILE_SAMPLE_RATE = float(
+    os.environ.get("PERFORMANCE_PROFILE_SAMPLE_RATE", 0.01)
+)
+PERFORMANCE_PROFILE_DIR = os.environ.get(
+    "PERFORMANCE_PROFILE_DIR", os.path.join(tempfile.gettempdir(), "profiles")
+)
+# Log query shapes repeated this many times in one request (0 = off)
+PERFORMANCE_N_PLUS_ONE_THRESHOLD = int(
+    os.environ.get("PERFORMANCE_N_PLUS_ONE_THRESHOLD", 10 if LOCAL or STAGE else 0)
+)
+
 # Static files (CSS, JavaScript, Images)
 STATIC_ROOT = BASE_DIR / "staticfiles"
 STATIC_URL = "/static/"
@@ -29,6 +29,77 @@ else:
         }
     }
 
+# Connection management
+# - DB_CONN_MAX_AGE: seconds a connection is reused across requests (0 closes
+#   it after each request). settings/asgi.py defaults it to 0: under ASGI each
+#   request runs in a new thread, so use DB_POOL there instead.
+# - DB_POOL: psycopg 3's connection pool (pip install ".[pool]"). Connections
+#   are returned to the pool after each request; see DB_POOL_* for sizing.
+# - DB_PGBOUNCER: connecting through PgBouncer in transaction pooling mode,
+#   which can't keep server-side cursors open across transactions.
+# Pool usage is logged with each request (see PerformanceMiddleware).
+DB_CONN_MAX_AGE = int(os.environ.get("DB_CONN_MAX_AGE", 60))
+DB_CONN_HEALTH_CHECKS = (
+    os.environ.get("DB_CONN_HEALTH_CHECKS", "true").lower() == "true"
+)
+DB_POOL = os.environ.get("DB_POOL", "false").lower() == "true"
+DB_POOL_MIN_SIZE = int(os.environ.get("DB_POOL_MIN_SIZE", 2))
+DB_POOL_MAX_SIZE = int(os.environ.get("DB_POOL_MAX_SIZE", 10))
+DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", 10))
+DB_PGBOUNCER = os.environ.get("DB_PGBOUNCER", "false").lower() == "true"
+
+if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+    DATABASES["default"]["CONN_HEALTH_CHECKS"] = DB_CONN_HEALTH_CHECKS
+    if DB_POOL:
+        # The pool keeps connections open, so Django mustn't as well
+        DATABASES["default"]["CONN_MAX_AGE"] = 0
+        DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+            "min_size": DB_POOL_MIN_SIZE,
+            "max_size": DB_POOL_MAX_SIZE,
+            "timeout": DB_POOL_TIMEOUT,
+        }
+    else:
+        DATABASES["default"]["CONN_MAX_AGE"] = DB_CONN_MAX_AGE
+    if DB_PGBOUNCER:
+        DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = True
+
+# Read replicas (apps/common/utilities/database/replicas.py)
+# - DATABASE_REPLICA_URLS: comma-separated database URLs. Reads inside
+#   read_from_replica() go to one of them.
+# - DATABASE_REPLICA_MAX_LAG: seconds behind the primary before a replica is
+#   skipped; DATABASE_REPLICA_LAG_CHECK_INTERVAL: how often lag is measured.
+# - DATABASE_REPLICA_STICKY_SECONDS: reads stay on the primary this long
+#   after a write, so users see their own changes.
+DATABASE_REPLICAS = []
+for number, url in enumerate(
+    filter(None, os.environ.get("DATABASE_REPLICA_URLS", "").split(",")), start=1
+):
+    alias = f"replica_{number}"
+    DATABASES[alias] = {
+        **dj_database_url.parse(url.strip()),
+        "CONN_MAX_AGE": DATABASES["default"].get("CONN_MAX_AGE", 0),
+        "CONN_HEALTH_CHECKS": DB_CONN_HEALTH_CHECKS,
+        "OPTIONS": dict(DATABASES["default"].get("OPTIONS", {})),
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_REPLICA_MAX_LAG = float(os.environ.get("DATABASE_REPLICA_MAX_LAG", 5))
+DATABASE_REPLICA_LAG_CHECK_INTERVAL = float(
+    os.environ.get("DATABASE_REPLICA_LAG_CHECK_INTERVAL", 5)
+)
+DATABASE_REPLICA_STICKY_SECONDS = float(
+    os.environ.get("DATABASE_REPLICA_STICKY_SECONDS", 5)
+)
+if DATABASE_REPLICAS:
+    DATABASE_ROUTERS = ["apps.common.utilities.database.replicas.ReplicaRouter"]
+
+# Full-text search (apps/common/utilities/database/search.py)
+# - SEARCH_CONFIG: PostgreSQL text search configuration. The search triggers
+#   are created with it, so changing it needs a migration re-adding them.
+# - ADMIN_SEARCH_BACKEND: backend of SearchableAdminMixin admins
+SEARCH_CONFIG = "english"
+ADMIN_SEARCH_BACKEND = "apps.common.utilities.django.admin_search.FullTextSearchBackend"
+
 # Supabase configuration
 SUPABASE_PROJECT_URL = os.environ.get("SUPABASE_PROJECT_URL")
 SUPABASE_SERVICE_ROLE_KEY = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
@@ -54,6 +125,32 @@ else:
         }
     }
 
+# Sessions (apps/common/utilities/django/sessions.py) are cached in Redis
+# when it's available. Without Redis they're read from the database, since
+# a per-process cache would serve stale sessions to other workers.
+SESSION_ENGINE = "apps.common.utilities.django.sessions"
+if REDIS_URL:
+    SESSION_CACHE_ALIAS = "default"
+else:
+    CACHES["sessions"] = {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}
+    SESSION_CACHE_ALIAS = "sessions"
+# Sessions slide: every request may extend them, but the engine only writes
+# when the data changed or the expiry is SESSION_TOUCH_INTERVAL seconds old.
+# Expiry-only updates are written together every SESSION_TOUCH_FLUSH_INTERVAL
+# seconds or SESSION_TOUCH_BATCH_SIZE sessions.
+SESSION_SAVE_EVERY_REQUEST = True
+SESSION_TOUCH_INTERVAL = int(os.environ.get("SESSION_TOUCH_INTERVAL", 300))
+SESSION_TOUCH_FLUSH_INTERVAL = int(os.environ.get("SESSION_TOUCH_FLUSH_INTERVAL", 60))
+SESSION_TOUCH_BATCH_SIZE = int(os.environ.get("SESSION_TOUCH_BATCH_SIZE", 500))
+
+# Currencies, countries and cities are held in memory by each process
+# (apps/common/utilities/reference_data.py). Saves bump a version in the
+# cache, checked every REFERENCE_DATA_CHECK_INTERVAL seconds. Without Redis
+# that version is per process, so copies are also reloaded after
+# REFERENCE_DATA_MAX_AGE seconds.
+REFERENCE_DATA_CHECK_INTERVAL = 5
+REFERENCE_DATA_MAX_AGE = 300
+
 # For development environment tracking
 SIMULATED_ENV = LOCAL is True
 
@@ -35,6 +35,7 @@ AWS_STORAGE_BUCKET_NAME = AWS_S3_BUCKET_NAME = os.environ.get(
     "AWS_STORAGE_BUCKET_NAME", ""
 )
 AWS_REGION = os.environ.get("AWS_REGION", "us-east-1")
+AWS_S3_ENDPOINT_URL = os.environ.get("AWS_S3_ENDPOINT_URL", "")  # tools/loadtest fakes
 AWS_OPTIONS = {
     "AWS_ACCESS_KEY_ID": AWS_ACCESS_KEY_ID,
     "AWS_SECRET_ACCESS_KEY": AWS_SECRET_ACCESS_KEY,
@@ -54,6 +55,37 @@ AWS_MAX_UPLOAD_SIZE = int(
 AWS_UPLOAD_BUCKET = os.environ.get("AWS_UPLOAD_BUCKET", AWS_S3_BUCKET_NAME)
 AWS_UPLOAD_PREFIX = os.environ.get("AWS_UPLOAD_PREFIX", "uploads")
 
+# Pre-signed URL cache (see apps/integration/aws/presigned_urls.py)
+AWS_PRESIGNED_URL_EXPIRY_STEP = 300  # expirations are rounded up to this
+AWS_PRESIGNED_URL_MIN_VALIDITY = int(
+    os.environ.get("AWS_PRESIGNED_URL_MIN_VALIDITY", 300)
+)  # cached URLs are served while valid for at least this many seconds
+
+# Multipart / streaming uploads (see apps/integration/aws/transfer.py)
+AWS_S3_MULTIPART_THRESHOLD = int(
+    os.environ.get("AWS_S3_MULTIPART_THRESHOLD", 8 * 1024 * 1024)
+)
+AWS_S3_MULTIPART_PART_SIZE = int(
+    os.environ.get("AWS_S3_MULTIPART_PART_SIZE", 8 * 1024 * 1024)
+)  # S3 requires at least 5MB per part
+AWS_S3_MAX_CONCURRENCY = int(os.environ.get("AWS_S3_MAX_CONCURRENCY", 10))
+AWS_S3_PROGRESS_INTERVAL_MS = 500  # min time between Upload progress writes
+
+# Image variants (see apps/integration/aws/image_variants.py)
+IMAGE_VARIANTS = {
+    "thumbnail": {"width": 200, "height": 200, "crop": True, "quality": 75},
+    "small": {"width": 480},
+    "medium": {"width": 1024},
+    "large": {"width": 1920},
+}  # rendered as WebP unless a spec sets "format"
+IMAGE_VARIANTS_BATCH_SIZE = 20
+IMAGE_VARIANT_WORKERS = int(
+    os.environ.get("IMAGE_VARIANT_WORKERS", os.cpu_count() or 1)
+)
+IMAGE_VARIANT_IO_WORKERS = 8  # threads for S3 reads and writes
+IMAGE_VARIANT_MAX_SOURCE_SIZE = 50 * 1024 * 1024
+IMAGE_VARIANTS_PROCESSING_TIMEOUT = 600  # requeue images a crashed worker left
+
 # S3 for static files in production
 if not LOCAL and AWS_S3_BUCKET_NAME:
     STATIC_URL = AWS_STATIC_URL
@@ -64,18 +96,37 @@ if not LOCAL and AWS_S3_BUCKET_NAME:
 DEFAULT_FROM_EMAIL = os.environ.get("DEFAULT_FROM_EMAIL", "noreply@example.com")
 SERVER_EMAIL = os.environ.get("SERVER_EMAIL", "server@example.com")
 
+# Email outbox (see apps/common/utilities/email.py)
+EMAIL_OUTBOX_BATCH_SIZE = int(os.environ.get("EMAIL_OUTBOX_BATCH_SIZE", 50))
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.environ.get("EMAIL_OUTBOX_MAX_ATTEMPTS", 5))
+EMAIL_OUTBOX_RETRY_BACKOFF = 60  # seconds, doubled after every failed attempt
+EMAIL_OUTBOX_MAX_BACKOFF = 3600  # 1 hour
+EMAIL_OUTBOX_SENDING_TIMEOUT = 600  # requeue emails stuck in "sending" (crashed worker)
+EMAIL_ATTACHMENT_MAX_SIZE = int(
+    os.environ.get("EMAIL_ATTACHMENT_MAX_SIZE", 10485760)
+)  # 10MB default
+EMAIL_ATTACHMENTS_MAX_TOTAL_SIZE = int(
+    os.environ.get("EMAIL_ATTACHMENTS_MAX_TOTAL_SIZE", 26214400)
+)  # 25MB default
+EMAIL_ATTACHMENT_FETCH_WORKERS = 8
+
 # Loops integration
 LOOPS_API_KEY = os.environ.get("LOOPS_API_KEY", "")
+LOOPS_API_BASE_URL = os.environ.get("LOOPS_API_BASE_URL", "https://app.loops.so/api/v1")
+# Log instead of sending; None follows the environment's DEBUG (settings/env.py)
+LOOPS_DEBUG_MODE = None
 
 # Twilio integration
 TWILIO_ENABLED = os.environ.get("TWILIO_ENABLED", "False").lower() == "true"
 TWILIO_ACCOUNT_SID = os.environ.get("TWILIO_ACCOUNT_SID", "")
 TWILIO_AUTH_TOKEN = os.environ.get("TWILIO_AUTH_TOKEN", "")
 TWILIO_PHONE_NUMBER = os.environ.get("TWILIO_PHONE_NUMBER", "")
+TWILIO_API_BASE_URL = os.environ.get("TWILIO_API_BASE_URL", "")  # all Twilio domains
 
 # Stripe integration
 STRIPE_API_KEY = os.environ.get("STRIPE_API_KEY", "")
 STRIPE_WEBHOOK_SECRET = os.environ.get("STRIPE_WEBHOOK_SECRET", "")
+STRIPE_API_BASE = os.environ.get("STRIPE_API_BASE", "")
 STRIPE_ENABLED = os.environ.get("STRIPE_ENABLED", "False").lower() == "true" or (
     STRIPE_API_KEY and STRIPE_WEBHOOK_SECRET
 )
@@ -89,5 +140,6 @@ SOCIAL_AUTH_GOOGLE_OAUTH2_SECRET = os.environ.get(
 # AI Integration Settings
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
 OPENAI_ORG_ID = os.environ.get("OPENAI_ORG_ID", "")
+OPENAI_BASE_URL = os.environ.get("OPENAI_BASE_URL", "")
 ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY", "")
 ANTHROPIC_VERSION = os.environ.get("ANTHROPIC_VERSION", "2023-06-01")
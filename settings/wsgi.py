@@ -5,3 +5,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
 
 application = get_wsgi_application()
+
+# Serving only: other processes (migrate, shell, workers) never need it
+from apps.public.views.helpers.docs_index import warm_docs_index  # noqa: E402
+
+warm_docs_index()
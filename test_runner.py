@@ -17,6 +17,9 @@ Examples:
     # Run with coverage
     ./test_runner.py --coverage
 
+    # Run in parallel, one process per CPU (or --parallel 4)
+    ./test_runner.py --parallel
+
     # Run specific test types
     ./test_runner.py --type unit
     ./test_runner.py --type e2e --no-headless
@@ -76,7 +79,25 @@ def parse_args():
         "--xml-report", action="store_true", help="Generate XML coverage report"
     )
 
-    return parser.parse_args()
+    # Parallel options
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        nargs="?",
+        const=0,
+        metavar="WORKERS",
+        help="Run tests in parallel shards (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--rebuild-db",
+        action="store_true",
+        help="Recreate the parallel template database before running",
+    )
+
+    args = parser.parse_args()
+    if args.parallel is not None and args.coverage:
+        parser.error("--parallel can't be combined with --coverage")
+    return args
 
 
 def get_pytest_args(args):
@@ -144,6 +165,12 @@ def main():
 
     # Build and run pytest command
     pytest_args = get_pytest_args(args)
+    if args.parallel is not None:
+        from tools.testing.parallel import run_parallel
+
+        return run_parallel(
+            pytest_args[3:], workers=args.parallel, rebuild_db=args.rebuild_db
+        )
     return run_tests(pytest_args)
 
 
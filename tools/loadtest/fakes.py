@@ -0,0 +1,709 @@
+#!/usr/bin/env python
+"""
+Local stand-ins for the external services the app calls, for load tests.
+
+Each fake is a threaded HTTP server that answers like the real API after a
+configurable delay, so throughput and tail latency can be measured on one
+machine with no network:
+
+    python -m tools.loadtest.fakes
+    python -m tools.loadtest.fakes --latency openai=1.5 --latency s3=0
+
+    openai  :8901  /v1/chat/completions, plain or streamed
+    stripe  :8902  /v1/<resource>[/<id>[/<action>]]
+    twilio  :8903  Messages, Lookups and Verify
+    loops   :8904  /api/v1/*
+    s3      :8905  path-style objects, browser POST uploads and multipart
+
+tools/loadtest/settings.py points the integrations at these ports. The fakes
+only use the standard library, so they can run on a separate machine.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from email.parser import BytesParser
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlencode, urlsplit
+from xml.sax.saxutils import escape
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORTS = {
+    "openai": 8901,
+    "stripe": 8902,
+    "twilio": 8903,
+    "loops": 8904,
+    "s3": 8905,
+}
+# Seconds before a response, roughly what each service takes in production
+DEFAULT_LATENCY = {
+    "openai": 0.8,
+    "stripe": 0.25,
+    "twilio": 0.15,
+    "loops": 0.1,
+    "s3": 0.03,
+}
+DEFAULT_JITTER = 0.25  # latency varies by +/- this fraction
+
+
+class FakeServer(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 1024
+
+    def __init__(self, address, handler, latency: float, jitter: float):
+        super().__init__(address, handler)
+        self.latency = latency
+        self.jitter = jitter
+        self.lock = threading.Lock()
+        self.objects: OrderedDict = OrderedDict()  # S3 objects by (bucket, key)
+        self.uploads: dict = {}  # S3 multipart uploads by upload id
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    """Reads the request, waits the configured latency, then routes it."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real APIs
+    server: FakeServer
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.dispatch()
+
+    do_POST = do_PUT = do_DELETE = do_HEAD = do_GET
+
+    def dispatch(self):
+        parts = urlsplit(self.path)
+        self.route = unquote(parts.path)
+        self.query = {k: v[0] for k, v in parse_qs(parts.query, True).items()}
+        self.body = self.read_body()
+        latency = self.server.latency
+        if latency:
+            jitter = self.server.jitter
+            time.sleep(latency * random.uniform(1 - jitter, 1 + jitter))
+        self.handle_request()
+
+    def read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            body = bytearray()
+            while size := int(self.rfile.readline().split(b";")[0], 16):
+                body += self.rfile.read(size)
+                self.rfile.readline()
+            while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                pass  # trailers
+            return bytes(body)
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def form(self) -> dict[str, str]:
+        return {k: v[0] for k, v in parse_qs(self.body.decode(), True).items()}
+
+    def handle_request(self):
+        raise NotImplementedError
+
+    def send(
+        self,
+        status: int,
+        body: bytes = b"",
+        content_type: str = "application/json",
+        headers: dict[str, str] | None = None,
+    ):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def send_json(self, status: int, payload, headers: dict[str, str] | None = None):
+        self.send(status, json.dumps(payload).encode(), headers=headers)
+
+
+class OpenAIHandler(FakeHandler):
+    """Chat completions with a canned reply; latency is time to first token."""
+
+    reply = (
+        "Here is a short answer from the local OpenAI stand-in. It has about "
+        "as many tokens as a typical chat reply."
+    )
+    token_interval = 0.01  # seconds between streamed chunks
+
+    def handle_request(self):
+        if self.command != "POST" or not self.route.endswith("/chat/completions"):
+            return self.send_json(
+                404,
+                {
+                    "error": {
+                        "message": f"Unknown URL {self.route}",
+                        "type": "invalid_request_error",
+                    }
+                },
+            )
+        request = json.loads(self.body or b"{}")
+        words = self.reply.split()
+        prompt_tokens = sum(
+            len(str(message.get("content") or "").split())
+            for message in request.get("messages", [])
+        )
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": len(words),
+            "total_tokens": prompt_tokens + len(words),
+        }
+        completion = {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "created": int(time.time()),
+            "model": request.get("model", "gpt-4.1"),
+        }
+        if request.get("stream"):
+            return self.stream(completion, words, usage)
+        self.send_json(
+            200,
+            {
+                **completion,
+                "object": "chat.completion",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": self.reply},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": usage,
+            },
+        )
+
+    def stream(self, completion: dict, words: list[str], usage: dict):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        def event(delta: dict, finish_reason=None, **extra):
+            chunk = {
+                **completion,
+                "object": "chat.completion.chunk",
+                "choices": [
+                    {"index": 0, "delta": delta, "finish_reason": finish_reason}
+                ],
+                **extra,
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.flush()
+
+        event({"role": "assistant", "content": ""})
+        for i, word in enumerate(words):
+            time.sleep(self.token_interval)
+            event({"content": word if i == 0 else f" {word}"})
+        event({}, finish_reason="stop", usage=usage)
+        self.wfile.write(b"data: [DONE]\n\n")
+
+
+class StripeHandler(FakeHandler):
+    """Echoes form-encoded parameters back as a Stripe object."""
+
+    ID_PREFIXES = {
+        "checkout.session": "cs_test",
+        "customer": "cus",
+        "invoice": "in",
+        "payment_intent": "pi",
+        "payment_method": "pm",
+        "price": "price",
+        "product": "prod",
+        "refund": "re",
+        "subscription": "sub",
+    }
+    # Fields the real API always returns (null when unset), with defaults
+    FIELDS = {
+        "checkout.session": {
+            "customer": None,
+            "customer_email": None,
+            "mode": "payment",
+            "payment_intent": None,
+            "subscription": None,
+            "status": "open",
+            "client_secret": None,
+        },
+        "customer": {"email": None, "name": None, "description": None},
+        "payment_intent": {
+            "amount": 0,
+            "currency": "usd",
+            "customer": None,
+            "status": "succeeded",
+        },
+        "subscription": {
+            "customer": None,
+            "status": "active",
+            "cancel_at_period_end": False,
+            "canceled_at": None,
+        },
+    }
+    OBJECT_ID = re.compile(r"^[a-z]+(_test)?_[A-Za-z0-9]*[0-9A-Z][A-Za-z0-9]*$")
+
+    def handle_request(self):
+        segments = [s for s in self.route.removeprefix("/v1/").split("/") if s]
+        ids = [i for i, segment in enumerate(segments) if self.OBJECT_ID.match(segment)]
+        resource = segments[: ids[0]] if ids else segments
+        if not resource:
+            return self.send_json(
+                404,
+                {"error": {"type": "invalid_request_error", "message": "Not found"}},
+            )
+        name = ".".join(resource).removesuffix("s")
+        object_id = segments[ids[0]] if ids else None
+
+        if self.command == "GET" and object_id is None:
+            return self.send_json(
+                200,
+                {
+                    "object": "list",
+                    "data": [],
+                    "has_more": False,
+                    "url": f"/v1/{'/'.join(resource)}",
+                },
+            )
+        if self.command == "DELETE":
+            return self.send_json(
+                200, {"id": object_id, "object": name, "deleted": True}
+            )
+
+        params = self.params()
+        object_id = object_id or (
+            f"{self.ID_PREFIXES.get(name, name.split('.')[-1][:4])}_"
+            f"{uuid.uuid4().hex[:24].upper()}"
+        )
+        payload = {
+            "id": object_id,
+            "object": name,
+            "created": int(time.time()),
+            "livemode": False,
+            "metadata": {},
+            **params,
+        }
+        for field, default in self.FIELDS.get(name, {}).items():
+            payload.setdefault(field, default)
+        if name == "checkout.session":
+            payload["url"] = f"https://checkout.stripe.com/c/pay/{object_id}"
+        elif name == "subscription":
+            now = int(time.time())
+            payload.setdefault("current_period_start", now)
+            payload.setdefault("current_period_end", now + 30 * 24 * 3600)
+        self.send_json(200, payload)
+
+    def params(self) -> dict:
+        """Form parameters, with `metadata[key]=value` as a nested dict."""
+        params: dict = {}
+        for key, value in self.form().items():
+            match = re.fullmatch(r"(\w+)\[(\w+)\]", key)
+            if match:
+                params.setdefault(match[1], {})[match[2]] = value
+            elif "[" not in key:
+                params[key] = value
+        return params
+
+
+class TwilioHandler(FakeHandler):
+    """Messages (api.twilio.com), Lookups and Verify, all on one port."""
+
+    def handle_request(self):
+        params = self.form()
+        path = self.route
+        now = formatdate(usegmt=True)
+        if "/Messages" in path:
+            account_sid = path.split("/Accounts/")[-1].split("/")[0]
+            sent = self.command == "POST"
+            sid = (
+                f"SM{uuid.uuid4().hex}"
+                if sent
+                else path.rsplit("/", 1)[-1].removesuffix(".json")
+            )
+            return self.send_json(
+                201 if sent else 200,
+                {
+                    "sid": sid,
+                    "account_sid": account_sid,
+                    "to": params.get("To"),
+                    "from": params.get("From"),
+                    "body": params.get("Body"),
+                    "status": "queued" if sent else "delivered",
+                    "direction": "outbound-api",
+                    "num_segments": "1",
+                    "date_created": now,
+                    "date_updated": now,
+                    "date_sent": None if sent else now,
+                    "error_code": None,
+                    "error_message": None,
+                    "uri": path,
+                },
+            )
+        if "/PhoneNumbers/" in path:
+            number = path.rsplit("/", 1)[-1]
+            return self.send_json(
+                200,
+                {
+                    "phone_number": number,
+                    "national_format": number,
+                    "country_code": "US",
+                    "carrier": {"name": "Fake Carrier", "type": "mobile"},
+                    "valid": True,
+                    "url": path,
+                },
+            )
+        if path.endswith("/Verifications"):
+            return self.send_json(
+                201,
+                {
+                    "sid": f"VE{uuid.uuid4().hex}",
+                    "to": params.get("To"),
+                    "channel": params.get("Channel", "sms"),
+                    "status": "pending",
+                    "valid": False,
+                },
+            )
+        if path.endswith("/VerificationCheck"):
+            return self.send_json(
+                200,
+                {
+                    "sid": f"VE{uuid.uuid4().hex}",
+                    "to": params.get("To"),
+                    "status": "approved",
+                    "valid": True,
+                },
+            )
+        self.send_json(
+            404,
+            {
+                "code": 20404,
+                "message": f"The requested resource {path} was not found",
+                "status": 404,
+            },
+        )
+
+
+class LoopsHandler(FakeHandler):
+    """Accepts every Loops API call."""
+
+    def handle_request(self):
+        if not self.route.startswith("/api/v1/"):
+            return self.send_json(404, {"success": False, "message": "Not found"})
+        self.send_json(200, {"success": True, "id": uuid.uuid4().hex})
+
+
+S3_NAMESPACE = "http://s3.amazonaws.com/doc/2006-03-01/"
+S3_MAX_OBJECTS = 10_000  # oldest objects are dropped beyond this
+
+
+def decode_aws_chunked(body: bytes) -> bytes:
+    """Strip aws-chunked framing (chunk sizes, signatures, trailers)."""
+    data = bytearray()
+    position = 0
+    while True:
+        end = body.index(b"\r\n", position)
+        size = int(body[position:end].split(b";")[0], 16)
+        position = end + 2
+        if size == 0:
+            return bytes(data)
+        data += body[position : position + size]
+        position += size + 2
+
+
+class S3Handler(FakeHandler):
+    """A path-style S3 API backed by an in-memory dict."""
+
+    def handle_request(self):
+        bucket, _, key = self.route.lstrip("/").partition("/")
+        if not bucket:
+            return self.xml(200, "ListAllMyBucketsResult", "<Buckets/>")
+        if "aws-chunked" in self.headers.get("Content-Encoding", "") or (
+            "x-amz-decoded-content-length" in self.headers
+        ):
+            self.body = decode_aws_chunked(self.body)
+
+        if not key:
+            if self.command == "POST":
+                return self.post_object(bucket)
+            if self.command == "GET":
+                return self.list_objects(bucket)
+            return self.send(200 if self.command == "HEAD" else 204)
+        if "uploadId" in self.query or "uploads" in self.query:
+            return self.multipart(bucket, key)
+        if self.command == "PUT":
+            copy_source = self.headers.get("x-amz-copy-source")
+            if copy_source:
+                source_bucket, _, source_key = (
+                    unquote(copy_source).lstrip("/").partition("/")
+                )
+                source = self.objects.get((source_bucket, source_key))
+                if source is None:
+                    return self.error(404, "NoSuchKey")
+                etag = self.store(bucket, key, source["body"], source["content_type"])
+                return self.xml(200, "CopyObjectResult", f"<ETag>{escape(etag)}</ETag>")
+            etag = self.store(
+                bucket,
+                key,
+                self.body,
+                self.headers.get("Content-Type", "binary/octet-stream"),
+                self.amz_metadata(self.headers.items()),
+            )
+            return self.send(200, headers={"ETag": etag})
+        if self.command == "DELETE":
+            with self.server.lock:
+                self.objects.pop((bucket, key), None)
+            return self.send(204)
+
+        stored = self.objects.get((bucket, key))
+        if stored is None:
+            return self.error(404, "NoSuchKey")
+        headers = {
+            "ETag": stored["etag"],
+            "Last-Modified": stored["last_modified"],
+            **{f"x-amz-meta-{k}": v for k, v in stored["metadata"].items()},
+        }
+        self.send(200, stored["body"], stored["content_type"], headers)
+
+    @property
+    def objects(self) -> OrderedDict:
+        return self.server.objects
+
+    @staticmethod
+    def amz_metadata(items) -> dict[str, str]:
+        return {
+            name.lower().removeprefix("x-amz-meta-"): value
+            for name, value in items
+            if name.lower().startswith("x-amz-meta-")
+        }
+
+    def store(self, bucket, key, body, content_type, metadata=None) -> str:
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        with self.server.lock:
+            self.objects[(bucket, key)] = {
+                "body": body,
+                "content_type": content_type,
+                "metadata": metadata or {},
+                "etag": etag,
+                "last_modified": formatdate(usegmt=True),
+            }
+            self.objects.move_to_end((bucket, key))
+            while len(self.objects) > S3_MAX_OBJECTS:
+                self.objects.popitem(last=False)
+        return etag
+
+    def post_object(self, bucket: str):
+        """Browser upload with a pre-signed POST form."""
+        message = BytesParser().parsebytes(
+            f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode() + self.body
+        )
+        fields, file_body, filename = {}, b"", ""
+        for part in message.get_payload():
+            name = part.get_param("name", header="content-disposition")
+            if name == "file":
+                file_body = part.get_payload(decode=True) or b""
+                filename = part.get_filename() or ""
+            else:
+                fields[name] = part.get_payload(decode=True).decode()
+        key = fields.get("key", "").replace("${filename}", filename)
+        if not key:
+            return self.error(400, "InvalidArgument")
+        etag = self.store(
+            bucket,
+            key,
+            file_body,
+            fields.get("Content-Type", "binary/octet-stream"),
+            self.amz_metadata(fields.items()),
+        )
+        if fields.get("success_action_redirect"):
+            query = urlencode({"bucket": bucket, "key": key, "etag": etag})
+            return self.send(
+                303,
+                headers={"Location": f"{fields['success_action_redirect']}?{query}"},
+            )
+        if fields.get("success_action_status") == "201":
+            return self.xml(
+                201,
+                "PostResponse",
+                f"<Location>{escape(f'{self.server.url}/{bucket}/{key}')}</Location>"
+                f"<Bucket>{escape(bucket)}</Bucket><Key>{escape(key)}</Key>"
+                f"<ETag>{escape(etag)}</ETag>",
+            )
+        self.send(int(fields.get("success_action_status") or 204))
+
+    def list_objects(self, bucket: str):
+        prefix = self.query.get("prefix", "")
+        limit = int(self.query.get("max-keys", 1000))
+        matches = [
+            (key, stored)
+            for (b, key), stored in list(self.objects.items())
+            if b == bucket and key.startswith(prefix)
+        ][:limit]
+        contents = "".join(
+            f"<Contents><Key>{escape(key)}</Key>"
+            f"<Size>{len(stored['body'])}</Size>"
+            f"<ETag>{escape(stored['etag'])}</ETag>"
+            f"<LastModified>{time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())}"
+            "</LastModified><StorageClass>STANDARD</StorageClass></Contents>"
+            for key, stored in matches
+        )
+        self.xml(
+            200,
+            "ListBucketResult",
+            f"<Name>{escape(bucket)}</Name><Prefix>{escape(prefix)}</Prefix>"
+            f"<KeyCount>{len(matches)}</KeyCount><MaxKeys>{limit}</MaxKeys>"
+            f"<IsTruncated>false</IsTruncated>{contents}",
+        )
+
+    def multipart(self, bucket: str, key: str):
+        uploads = self.server.uploads
+        if self.command == "POST" and "uploads" in self.query:
+            upload_id = uuid.uuid4().hex
+            uploads[upload_id] = {
+                "parts": {},
+                "content_type": self.headers.get("Content-Type", "binary/octet-stream"),
+                "metadata": self.amz_metadata(self.headers.items()),
+            }
+            return self.xml(
+                200,
+                "InitiateMultipartUploadResult",
+                f"<Bucket>{escape(bucket)}</Bucket><Key>{escape(key)}</Key>"
+                f"<UploadId>{upload_id}</UploadId>",
+            )
+        upload = uploads.get(self.query["uploadId"])
+        if upload is None:
+            return self.error(404, "NoSuchUpload")
+        if self.command == "PUT":
+            upload["parts"][int(self.query["partNumber"])] = self.body
+            etag = f'"{hashlib.md5(self.body).hexdigest()}"'
+            return self.send(200, headers={"ETag": etag})
+        if self.command == "DELETE":
+            uploads.pop(self.query["uploadId"], None)
+            return self.send(204)
+        uploads.pop(self.query["uploadId"], None)
+        body = b"".join(upload["parts"][n] for n in sorted(upload["parts"]))
+        etag = self.store(bucket, key, body, upload["content_type"], upload["metadata"])
+        self.xml(
+            200,
+            "CompleteMultipartUploadResult",
+            f"<Location>{escape(f'{self.server.url}/{bucket}/{key}')}</Location>"
+            f"<Bucket>{escape(bucket)}</Bucket><Key>{escape(key)}</Key>"
+            f"<ETag>{escape(etag)}</ETag>",
+        )
+
+    def xml(self, status: int, root: str, content: str):
+        body = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            f'<{root} xmlns="{S3_NAMESPACE}">{content}</{root}>'
+        ).encode()
+        self.send(status, body, "application/xml")
+
+    def error(self, status: int, code: str):
+        if self.command == "HEAD":
+            return self.send(status, content_type="application/xml")
+        self.send(
+            status,
+            f"<?xml version='1.0' encoding='UTF-8'?><Error><Code>{code}</Code>"
+            f"<Message>{code}</Message><Resource>{escape(self.route)}</Resource>"
+            "</Error>".encode(),
+            "application/xml",
+        )
+
+
+HANDLERS = {
+    "openai": OpenAIHandler,
+    "stripe": StripeHandler,
+    "twilio": TwilioHandler,
+    "loops": LoopsHandler,
+    "s3": S3Handler,
+}
+
+
+def start(
+    service: str,
+    host: str = DEFAULT_HOST,
+    port: int | None = None,
+    latency: float | None = None,
+    jitter: float = DEFAULT_JITTER,
+) -> FakeServer:
+    """Start a fake in a daemon thread; port 0 picks a free port."""
+    server = FakeServer(
+        (host, DEFAULT_PORTS[service] if port is None else port),
+        HANDLERS[service],
+        latency=DEFAULT_LATENCY[service] if latency is None else latency,
+        jitter=jitter,
+    )
+    threading.Thread(
+        target=server.serve_forever, name=f"fake-{service}", daemon=True
+    ).start()
+    return server
+
+
+@contextmanager
+def running(*services: str, latency: float = 0.0):
+    """Run fakes on free ports for a block; yields {service: base URL}."""
+    servers = {
+        service: start(service, port=0, latency=latency)
+        for service in services or HANDLERS
+    }
+    try:
+        yield {service: server.url for service, server in servers.items()}
+    finally:
+        for server in servers.values():
+            server.shutdown()
+            server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument(
+        "--only", help=f"Comma-separated services ({', '.join(HANDLERS)})"
+    )
+    parser.add_argument(
+        "--latency",
+        action="append",
+        default=[],
+        metavar="SERVICE=SECONDS",
+        help="Response delay for a service (repeatable)",
+    )
+    parser.add_argument("--jitter", type=float, default=DEFAULT_JITTER)
+    args = parser.parse_args(argv)
+
+    latency = dict(DEFAULT_LATENCY)
+    for option in args.latency:
+        service, _, seconds = option.partition("=")
+        if service not in HANDLERS:
+            parser.error(f"Unknown service: {service}")
+        latency[service] = float(seconds)
+    services = args.only.split(",") if args.only else list(HANDLERS)
+
+    servers = [
+        start(service, args.host, latency=latency[service], jitter=args.jitter)
+        for service in services
+    ]
+    for service, server in zip(services, servers):
+        print(f"{service:<7} {server.url}  latency {latency[service]}s")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        for server in servers:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Locust scenarios for the main user journeys: login, team pages, chat
+send/poll, uploads and Stripe webhooks.
+
+Seed users with `manage.py seed_perf_data`, start tools/loadtest/fakes.py and
+the app with tools/loadtest/settings.py (see tools/loadtest/README.md), then:
+
+    locust -f tools/loadtest/locustfile.py --host http://127.0.0.1:8000
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import random
+import re
+import time
+import uuid
+
+from locust import HttpUser, between, task
+
+# Users seeded by seed_perf_data: <prefix>_0 .. <prefix>_<n-1>
+USERS = int(os.environ.get("LOADTEST_USERS", 1000))
+PREFIX = os.environ.get("LOADTEST_PREFIX", "perf")
+PASSWORD = os.environ.get("LOADTEST_PASSWORD", "perf-password")
+WEBHOOK_SECRET = os.environ.get("LOADTEST_STRIPE_WEBHOOK_SECRET", "whsec_loadtest")
+UPLOAD_SIZE = int(os.environ.get("LOADTEST_UPLOAD_SIZE", 256 * 1024))
+
+TEAM_LINK = re.compile(r'href="/team/((?!create/)[\w-]+)/"')
+POLL_LINK = re.compile(r'hx-get="(/ai/chat/poll/[\w-]+/)"')
+MAX_POLLS = 10
+PROMPTS = (
+    "Summarize what my team did this week.",
+    "What is 17% of 2,340?",
+    "Draft a short welcome message for a new team member.",
+    "Which plan should a team of twelve pick?",
+)
+
+
+class AppUser(HttpUser):
+    """A signed-in user browsing team pages, chatting and uploading files."""
+
+    wait_time = between(1, 5)
+    weight = 10
+
+    def on_start(self):
+        self.teams: list[str] = []
+        self.chat_started = False
+        self.login()
+
+    def headers(self, htmx: bool = False) -> dict[str, str]:
+        headers = {
+            "X-CSRFToken": self.client.cookies.get("csrftoken", ""),
+            "Referer": f"{self.host}/",
+        }
+        if htmx:
+            headers["HX-Request"] = "true"
+        return headers
+
+    def login(self):
+        self.client.get("/account/login", name="login page")
+        username = f"{PREFIX}_{random.randrange(USERS)}"
+        with self.client.post(
+            "/account/login",
+            {"username": username, "password": PASSWORD},
+            headers=self.headers(),
+            allow_redirects=False,
+            catch_response=True,
+            name="login",
+        ) as response:
+            if response.status_code != 302:
+                response.failure(f"Login as {username} failed")
+
+    @task(1)
+    def home(self):
+        self.client.get("/", name="home")
+
+    @task(4)
+    def team_pages(self):
+        response = self.client.get("/team/", name="team list")
+        self.teams = TEAM_LINK.findall(response.text) or self.teams
+        if self.teams:
+            slug = random.choice(self.teams)
+            self.client.get(f"/team/{slug}/", name="team detail")
+
+    @task(3)
+    def chat(self):
+        if not self.chat_started:
+            self.client.post(
+                "/ai/chat/new-session/",
+                headers=self.headers(htmx=True),
+                name="chat new session",
+            )
+            self.chat_started = True
+        response = self.client.post(
+            "/ai/chat/send/",
+            {"message": random.choice(PROMPTS)},
+            headers=self.headers(htmx=True),
+            name="chat send",
+        )
+        # Replies still being generated are polled until they're done
+        for url in POLL_LINK.findall(response.text):
+            for _ in range(MAX_POLLS):
+                poll = self.client.get(
+                    url, headers=self.headers(htmx=True), name="chat poll"
+                )
+                if "poll-message" not in poll.headers.get("HX-Trigger", ""):
+                    break
+                time.sleep(0.5)
+        self.client.get("/ai/chat/", name="chat page")
+
+    @task(1)
+    def upload(self):
+        response = self.client.post(
+            "/loadtest/uploads/",
+            {"filename": f"report-{uuid.uuid4().hex[:8]}.csv"},
+            headers=self.headers(),
+            name="upload start",
+        )
+        if not response.ok:
+            return
+        upload = response.json()
+        # The browser sends the file straight to S3 (here, the fake)
+        self.client.post(
+            upload["form_url"],
+            data=upload["form_fields"],
+            files={"file": ("report.csv", os.urandom(UPLOAD_SIZE), "text/csv")},
+            name="s3 upload (fake)",
+        )
+        self.client.post(
+            f"/loadtest/uploads/{upload['upload_id']}/complete/",
+            headers=self.headers(),
+            name="upload complete",
+        )
+
+
+class StripeWebhookUser(HttpUser):
+    """Stripe delivering signed webhooks."""
+
+    wait_time = between(0.5, 2)
+    weight = 1
+
+    def post_event(self, event: dict):
+        payload = json.dumps(event)
+        timestamp = int(time.time())
+        signature = hmac.new(
+            WEBHOOK_SECRET.encode(),
+            f"{timestamp}.{payload}".encode(),
+            hashlib.sha256,
+        ).hexdigest()
+        self.client.post(
+            "/loadtest/stripe/webhook/",
+            data=payload,
+            headers={
+                "Content-Type": "application/json",
+                "Stripe-Signature": f"t={timestamp},v1={signature}",
+            },
+            name=f"stripe webhook {event['type']}",
+        )
+
+    @task(3)
+    def checkout_completed(self):
+        session_id = f"cs_test_{uuid.uuid4().hex}"
+        self.post_event(
+            {
+                "id": f"evt_{uuid.uuid4().hex}",
+                "object": "event",
+                "type": "checkout.session.completed",
+                "data": {
+                    "object": {
+                        "id": session_id,
+                        "object": "checkout.session",
+                        "customer": f"cus_{uuid.uuid4().hex[:14]}",
+                        "customer_email": (
+                            f"{PREFIX}_{random.randrange(USERS)}@example.com"
+                        ),
+                        "mode": "subscription",
+                        "metadata": {},
+                    }
+                },
+            }
+        )
+
+    @task(1)
+    def unhandled_event(self):
+        self.post_event(
+            {
+                "id": f"evt_{uuid.uuid4().hex}",
+                "object": "event",
+                "type": "invoice.created",
+                "data": {"object": {"id": f"in_{uuid.uuid4().hex[:14]}"}},
+            }
+        )
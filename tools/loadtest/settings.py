@@ -0,0 +1,61 @@
+"""
+Settings for running the app under load against the local fakes.
+
+Every integration is enabled and pointed at tools/loadtest/fakes.py, and the
+URLs the load scenarios need are added (see tools/loadtest/urls.py):
+
+    DJANGO_SETTINGS_MODULE=tools.loadtest.settings gunicorn settings.wsgi ...
+
+Set LOADTEST_FAKES_HOST when the fakes run on another machine.
+"""
+
+import os
+
+from settings import *  # noqa: F401, F403
+from settings import MIDDLEWARE
+from tools.loadtest.fakes import DEFAULT_PORTS
+
+FAKES_HOST = os.environ.get("LOADTEST_FAKES_HOST", "127.0.0.1")
+
+
+def fake_url(service: str, path: str = "") -> str:
+    return f"http://{FAKES_HOST}:{DEFAULT_PORTS[service]}{path}"
+
+
+# Measure the app as it runs in production
+DEBUG = False
+MIDDLEWARE = [
+    middleware
+    for middleware in MIDDLEWARE
+    if middleware
+    not in (
+        "debug_toolbar.middleware.DebugToolbarMiddleware",
+        "django_browser_reload.middleware.BrowserReloadMiddleware",
+    )
+]
+ROOT_URLCONF = "tools.loadtest.urls"
+
+OPENAI_API_KEY = "sk-loadtest"
+OPENAI_BASE_URL = fake_url("openai", "/v1")
+
+STRIPE_ENABLED = True
+STRIPE_API_KEY = "sk_test_loadtest"
+STRIPE_WEBHOOK_SECRET = os.environ.get(
+    "LOADTEST_STRIPE_WEBHOOK_SECRET", "whsec_loadtest"
+)
+STRIPE_API_BASE = fake_url("stripe")
+
+TWILIO_ENABLED = True
+TWILIO_ACCOUNT_SID = "AC" + "0" * 32
+TWILIO_AUTH_TOKEN = "loadtest"
+TWILIO_PHONE_NUMBER = "+15005550006"
+TWILIO_API_BASE_URL = fake_url("twilio")
+
+LOOPS_API_KEY = "loadtest"
+LOOPS_API_BASE_URL = fake_url("loops", "/api/v1")
+LOOPS_DEBUG_MODE = False  # send to the fake, whatever the environment's DEBUG
+
+AWS_ACCESS_KEY_ID = "loadtest"
+AWS_SECRET_ACCESS_KEY = "loadtest"
+AWS_STORAGE_BUCKET_NAME = AWS_S3_BUCKET_NAME = AWS_UPLOAD_BUCKET = "loadtest"
+AWS_S3_ENDPOINT_URL = fake_url("s3")
@@ -0,0 +1,50 @@
+"""
+URLs for load tests: the project's URLs plus the chat views (not yet routed
+in apps/ai/urls.py) and JSON endpoints for uploads and Stripe webhooks.
+"""
+
+from django.urls import include, path
+
+from apps.ai import urls as ai_urls
+from apps.ai.views.chat import (
+    ChatClearView,
+    ChatIndexView,
+    ChatLoadSessionView,
+    ChatNewSessionView,
+    ChatPollMessageView,
+    ChatSendMessageView,
+)
+from settings import urls as project_urls
+from tools.loadtest import views
+
+ai_urlpatterns = ai_urls.urlpatterns + [
+    path("chat/", ChatIndexView.as_view(), name="chat-index"),
+    path("chat/send/", ChatSendMessageView.as_view(), name="chat-send"),
+    path(
+        "chat/poll/<str:message_id>/",
+        ChatPollMessageView.as_view(),
+        name="chat-poll",
+    ),
+    path("chat/new-session/", ChatNewSessionView.as_view(), name="chat-new-session"),
+    path(
+        "chat/load/<str:session_id>/",
+        ChatLoadSessionView.as_view(),
+        name="chat-load-session",
+    ),
+    path("chat/clear/", ChatClearView.as_view(), name="chat-clear"),
+]
+
+urlpatterns = [
+    path("ai/", include((ai_urlpatterns, "ai"))),
+    path("loadtest/stripe/webhook/", views.stripe_webhook, name="loadtest-webhook"),
+    path("loadtest/uploads/", views.start_upload, name="loadtest-upload"),
+    path(
+        "loadtest/uploads/<int:upload_id>/complete/",
+        views.finish_upload,
+        name="loadtest-upload-complete",
+    ),
+] + [
+    pattern
+    for pattern in project_urls.urlpatterns
+    if getattr(pattern, "namespace", None) != "ai"
+]
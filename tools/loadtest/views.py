@@ -0,0 +1,47 @@
+"""
+JSON endpoints for the load scenarios that have no route in settings/urls.py.
+
+They are thin wrappers around the integration shortcuts the app uses.
+"""
+
+from django.conf import settings
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from apps.integration.aws.shortcuts import complete_upload, get_direct_upload_form_data
+from apps.integration.stripe.webhook import handle_stripe_webhook
+
+
+def _json(result: dict) -> JsonResponse:
+    return JsonResponse(result, status=200 if result.get("success") else 400)
+
+
+@csrf_exempt
+@require_POST
+def stripe_webhook(request):
+    """Verify and process a Stripe webhook."""
+    return _json(
+        handle_stripe_webhook(request.body, request.headers.get("Stripe-Signature", ""))
+    )
+
+
+@login_required
+@require_POST
+def start_upload(request):
+    """Create an Upload and a pre-signed POST form for a direct S3 upload."""
+    return _json(
+        get_direct_upload_form_data(
+            request.POST.get("filename", "upload.bin"),
+            content_type=request.POST.get("content_type"),
+            max_file_size=settings.AWS_MAX_UPLOAD_SIZE,
+        )
+    )
+
+
+@login_required
+@require_POST
+def finish_upload(request, upload_id: int):
+    """Mark an Upload complete after the browser has sent the file to S3."""
+    return _json(complete_upload(upload_id))
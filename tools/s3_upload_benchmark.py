@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+Benchmark streaming S3 uploads against a local in-memory S3 stand-in.
+
+Compares serial part uploads with parallel ones for a simulated link, so
+part size and concurrency settings can be tuned without touching AWS.
+
+Usage:
+    python tools/s3_upload_benchmark.py --size-mb 64 --latency 0.05 --mbps 20
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.test import override_settings  # noqa: E402
+
+from apps.integration.aws.s3 import S3Client  # noqa: E402
+from apps.integration.aws.tests.fake_s3 import FakeS3Client  # noqa: E402
+from apps.integration.aws.transfer import MB, StreamingUploader  # noqa: E402
+
+
+def generate(size: int, chunk_size: int = 64 * 1024):
+    """Yield `size` bytes in fixed-size chunks without holding them all."""
+    chunk = os.urandom(chunk_size)
+    sent = 0
+    while sent < size:
+        yield chunk[: min(chunk_size, size - sent)]
+        sent += chunk_size
+
+
+def run(size: int, part_size: int, concurrency: int, latency: float, mbps: float):
+    fake = FakeS3Client(latency=latency, bytes_per_second=mbps * MB)
+    with (
+        override_settings(
+            AWS_ACCESS_KEY_ID="benchmark",
+            AWS_SECRET_ACCESS_KEY="benchmark",
+            AWS_S3_BUCKET_NAME="benchmark",
+        ),
+        patch("apps.integration.aws.s3.boto3.client", return_value=fake),
+        patch("apps.integration.aws.s3.boto3.resource"),
+    ):
+        client = S3Client()
+        uploader = StreamingUploader(
+            "benchmark.bin",
+            s3_client=client,
+            part_size=part_size,
+            max_concurrency=concurrency,
+        )
+        started = time.perf_counter()
+        result = uploader.upload(generate(size))
+        elapsed = time.perf_counter() - started
+
+    if not result["success"]:
+        raise SystemExit(f"Upload failed: {result['error']}")
+    return {
+        "concurrency": concurrency,
+        "seconds": elapsed,
+        "mb_per_second": size / MB / elapsed,
+        "parts": result["parts"],
+        "max_in_flight": fake.max_in_flight,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--part-size-mb", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 10])
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds/request")
+    parser.add_argument("--mbps", type=float, default=20, help="MB/s per connection")
+    args = parser.parse_args()
+
+    print(
+        f"Uploading {args.size_mb}MB in {args.part_size_mb}MB parts "
+        f"({args.latency * 1000:.0f}ms latency, {args.mbps}MB/s per connection)"
+    )
+    baseline = None
+    for concurrency in args.concurrency:
+        stats = run(
+            args.size_mb * MB,
+            args.part_size_mb * MB,
+            concurrency,
+            args.latency,
+            args.mbps,
+        )
+        baseline = baseline or stats["seconds"]
+        print(
+            f"  concurrency={concurrency:<3} {stats['seconds']:6.2f}s "
+            f"{stats['mb_per_second']:7.1f}MB/s  "
+            f"speedup={baseline / stats['seconds']:.1f}x  "
+            f"parts={stats['parts']} max_in_flight={stats['max_in_flight']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+"""
+Run the test suite in parallel, one pytest process per shard.
+
+The test database is migrated once and kept between runs as a template.
+Each worker gets a copy of it (CREATE DATABASE ... TEMPLATE on PostgreSQL),
+so no worker runs migrations. Shards are balanced with the timings of the
+previous run, which are saved to .test_durations.json afterwards.
+
+Examples:
+    python tools/testing/parallel.py                  # one worker per CPU
+    python tools/testing/parallel.py -n 4 apps/common -x
+    python tools/testing/parallel.py --rebuild-db     # after editing a migration
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tools.testing.sharding import (  # noqa: E402
+    DURATIONS_FILE,
+    load_durations,
+    save_durations,
+)
+
+# pytest's exit code when no tests were collected, e.g. a small shard
+NO_TESTS_COLLECTED = 5
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def default_connection():
+    """The default database connection, with Django set up."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+    import django
+
+    django.setup()
+    from django.db import connections
+
+    return connections["default"]
+
+
+def prepare_databases(workers: int, rebuild: bool = False, verbosity: int = 1):
+    """
+    Migrate the template test database and clone one per worker.
+
+    Returns the connection and the worker database names.
+    """
+    connection = default_connection()
+    # keepdb only applies migrations the template doesn't have yet
+    connection.creation.create_test_db(
+        verbosity=verbosity, autoclobber=True, serialize=False, keepdb=not rebuild
+    )
+    if connection.vendor == "sqlite" and connection.is_in_memory_db():
+        raise RuntimeError(
+            "Parallel runs need PostgreSQL or a file-based SQLite test database"
+        )
+    connection.close()
+    names = []
+    for worker in range(1, workers + 1):
+        connection.creation.clone_test_db(
+            suffix=str(worker), verbosity=verbosity, keepdb=False
+        )
+        names.append(
+            connection.creation.get_test_db_clone_settings(str(worker))["NAME"]
+        )
+    return connection, names
+
+
+def drop_databases(connection, workers: int, verbosity: int = 1):
+    for worker in range(1, workers + 1):
+        connection.creation.destroy_test_db(verbosity=verbosity, suffix=str(worker))
+
+
+def run_parallel(
+    pytest_args: list[str],
+    workers: int | None = None,
+    rebuild_db: bool = False,
+    durations_file: Path | str = DURATIONS_FILE,
+    verbosity: int = 1,
+) -> int:
+    """Run pytest with `pytest_args` in `workers` shards; returns the exit code."""
+    workers = workers or default_workers()
+    started = time.perf_counter()
+    connection, databases = prepare_databases(workers, rebuild_db, verbosity)
+    print(f"Prepared {workers} databases in {time.perf_counter() - started:.1f}s")
+
+    processes = {}
+    try:
+        results = run_shards(pytest_args, databases, durations_file, processes)
+    finally:
+        for process, log, _ in processes.values():
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            log.close()
+        drop_databases(connection, workers, verbosity)
+
+    print("\nShard  Exit  Seconds")
+    for worker, (returncode, seconds) in sorted(results.items()):
+        print(f"{worker:>5}  {returncode:>4}  {seconds:7.1f}")
+    print(f"Total wall time: {time.perf_counter() - started:.1f}s")
+
+    failures = [
+        code for code, _ in results.values() if code not in (0, NO_TESTS_COLLECTED)
+    ]
+    return max(failures, default=0)
+
+
+def run_shards(
+    pytest_args: list[str],
+    databases: list[str],
+    durations_file: Path | str,
+    processes: dict,
+) -> dict[int, tuple[int, float]]:
+    """Start one pytest per database and wait; returns (exit code, seconds)."""
+    workers = len(databases)
+    with tempfile.TemporaryDirectory(prefix="test-shards-") as tmp:
+        for worker, database in enumerate(databases, start=1):
+            env = {
+                **os.environ,
+                "TEST_SHARD": f"{worker}/{workers}",
+                "TEST_WORKER_DATABASE": database,
+                "TEST_DURATIONS_FILE": str(durations_file),
+                "TEST_DURATIONS_OUTPUT": f"{tmp}/durations-{worker}.json",
+            }
+            log = open(f"{tmp}/shard-{worker}.log", "w+")
+            process = subprocess.Popen(
+                [sys.executable, "-m", "pytest", *pytest_args],
+                cwd=PROJECT_ROOT,
+                env=env,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+            )
+            processes[worker] = (process, log, time.perf_counter())
+
+        # Show each shard's output as it finishes
+        results = {}
+        while len(results) < workers:
+            for worker, (process, log, shard_started) in processes.items():
+                if worker in results or process.poll() is None:
+                    continue
+                results[worker] = (
+                    process.returncode,
+                    time.perf_counter() - shard_started,
+                )
+                log.seek(0)
+                print(f"\n===== shard {worker}/{workers} =====")
+                print(log.read(), end="")
+            time.sleep(0.1)
+
+        # Keep timings of tests that didn't run this time
+        durations = load_durations(durations_file)
+        for worker in range(1, workers + 1):
+            durations.update(load_durations(f"{tmp}/durations-{worker}.json"))
+        if durations:
+            save_durations(durations, durations_file)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run pytest in parallel shards",
+        epilog="Other arguments are passed to pytest.",
+    )
+    parser.add_argument(
+        "-n",
+        "--workers",
+        type=int,
+        default=default_workers(),
+        help="Number of pytest processes (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--rebuild-db",
+        action="store_true",
+        help="Recreate the template database instead of migrating it",
+    )
+    parser.add_argument(
+        "--durations-file",
+        default=str(DURATIONS_FILE),
+        help="Timings used to balance the shards",
+    )
+    args, pytest_args = parser.parse_known_args()
+    return run_parallel(
+        pytest_args,
+        workers=args.workers,
+        rebuild_db=args.rebuild_db,
+        durations_file=args.durations_file,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+Split a test suite into shards of similar duration.
+
+Timings come from previous runs (see `tools/testing/parallel.py`). Tests
+in the same TestCase class stay together, since they share setUpClass and
+setUpTestData; test functions stay with their module. Groups are handed
+out longest first to the least loaded shard. Tests without a recorded time
+count as the average of the ones that have one.
+
+Any pytest run can select a shard with `TEST_SHARD`, e.g. for CI jobs:
+
+    TEST_SHARD=2/4 pytest
+"""
+
+import json
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+DURATIONS_FILE = PROJECT_ROOT / ".test_durations.json"
+
+# Seconds assumed per test when there are no timings at all
+DEFAULT_DURATION = 1.0
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """Parse "index/count" (1-based), e.g. "2/4" -> (2, 4)."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard {value!r}, expected e.g. 2/4") from None
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard {value!r}, index must be 1 to {count}")
+    return index, count
+
+
+def load_durations(path: Path | str = DURATIONS_FILE) -> dict[str, float]:
+    """Seconds per test node id from a previous run, or {} if there is none."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_durations(durations: dict[str, float], path: Path | str = DURATIONS_FILE):
+    with open(path, "w") as f:
+        json.dump(dict(sorted(durations.items())), f, indent=1)
+
+
+def group_key(nodeid: str) -> str:
+    """The module, or module::Class, that a test has to run with."""
+    parts = nodeid.split("::")
+    return "::".join(parts[:2]) if len(parts) > 2 else parts[0]
+
+
+def balance(
+    nodeids: list[str], count: int, durations: dict[str, float]
+) -> list[list[str]]:
+    """Split node ids into `count` shards with similar total durations."""
+    default = (
+        sum(durations.values()) / len(durations) if durations else DEFAULT_DURATION
+    )
+    groups: dict[str, list[str]] = {}
+    for nodeid in nodeids:
+        groups.setdefault(group_key(nodeid), []).append(nodeid)
+    weights = {
+        key: sum(durations.get(nodeid, default) for nodeid in members)
+        for key, members in groups.items()
+    }
+
+    shards: list[list[str]] = [[] for _ in range(count)]
+    loads = [0.0] * count
+    for key in sorted(groups, key=lambda key: (-weights[key], key)):
+        lightest = loads.index(min(loads))
+        shards[lightest].extend(groups[key])
+        loads[lightest] += weights[key]
+    return shards
+
+
+def select_shard(
+    nodeids: list[str], index: int, count: int, durations: dict[str, float]
+) -> set[str]:
+    """Node ids in shard `index` (1-based) of `count`."""
+    return set(balance(nodeids, count, durations)[index - 1])
@@ -115,8 +115,10 @@ class TestManager:
                         if rel_path not in self.test_files[TestCategory.E2E]:
                             self.test_files[TestCategory.E2E].append(rel_path)
 
-    def run_tests(self, category: str, xml_report: bool = False) -> TestReport:
-        """Run tests for a specific category."""
+    def run_tests(
+        self, category: str, xml_report: bool = False, parallel: int | None = None
+    ) -> TestReport:
+        """Run tests for a specific category, optionally in parallel shards."""
         if self.verbose:
             print(f"Running {category} tests...")
 
@@ -143,6 +145,12 @@ class TestManager:
 
         # Prepare pytest command
         cmd = ["DJANGO_SETTINGS_MODULE=settings", "pytest", "-v"]
+        if parallel is not None:
+            cmd[1:2] = [
+                sys.executable,
+                str(PROJECT_ROOT / "tools/testing/parallel.py"),
+                f"--workers={parallel or os.cpu_count() or 1}",
+            ]
 
         # Add coverage reporting if requested
         if xml_report:
@@ -290,8 +298,18 @@ def main():
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose output"
     )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        nargs="?",
+        const=0,
+        metavar="WORKERS",
+        help="Run tests in parallel shards (default: one per CPU)",
+    )
 
     args = parser.parse_args()
+    if args.parallel is not None and args.xml:
+        parser.error("--parallel can't be combined with --xml")
 
     manager = TestManager(verbose=args.verbose)
 
@@ -299,7 +317,9 @@ def main():
         manager.list_tests(args.category)
 
     elif args.action == "run":
-        report = manager.run_tests(args.category, xml_report=args.xml)
+        report = manager.run_tests(
+            args.category, xml_report=args.xml, parallel=args.parallel
+        )
         print(report.summary())
 
     elif args.action == "report":